@@ -0,0 +1,78 @@
+"""Add share_counts rollup table for buffered share ingestion
+
+Revision ID: h1jn00k97l2i
+Revises: g0im99j86k1h
+Create Date: 2026-10-18
+
+- share_counts holds per-minute (idea_id, platform) share counters
+- Backfilled from the existing share_events log
+- share_events becomes an optional, sampled raw log
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "h1jn00k97l2i"
+down_revision: str | None = "g0im99j86k1h"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    op.create_table(
+        "share_counts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("idea_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "platform",
+            sa.Enum(
+                "TWITTER",
+                "FACEBOOK",
+                "LINKEDIN",
+                "WHATSAPP",
+                "COPY_LINK",
+                name="shareplatform",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "bucket_start",
+            sa.DateTime(),
+            nullable=False,
+            comment="UTC minute the shares were recorded in",
+        ),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["idea_id"], ["ideas.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "idea_id", "platform", "bucket_start", name="uq_share_count_bucket"
+        ),
+    )
+    op.create_index(op.f("ix_share_counts_id"), "share_counts", ["id"], unique=False)
+    op.create_index("ix_share_counts_bucket_start", "share_counts", ["bucket_start"])
+
+    # Backfill the rollup from the raw event log
+    if is_postgresql:
+        bucket = "date_trunc('minute', created_at)"
+    else:
+        bucket = "strftime('%Y-%m-%d %H:%M:00.000000', created_at)"
+    op.execute(
+        f"""
+        INSERT INTO share_counts (idea_id, platform, bucket_start, count)
+        SELECT idea_id, platform, {bucket}, COUNT(*)
+        FROM share_events
+        GROUP BY idea_id, platform, {bucket}
+        """  # nosec B608 - bucket is a fixed expression, not user input
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_share_counts_bucket_start", table_name="share_counts")
+    op.drop_index(op.f("ix_share_counts_id"), table_name="share_counts")
+    op.drop_table("share_counts")
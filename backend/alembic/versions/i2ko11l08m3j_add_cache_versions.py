@@ -0,0 +1,42 @@
+"""Add cache_versions change counters for HTTP response caching
+
+Revision ID: i2ko11l08m3j
+Revises: h1jn00k97l2i
+Create Date: 2026-10-18
+
+- cache_versions holds one change counter per cached entity group
+- Counters are bumped on writes and used to build ETags for anonymous GETs
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "i2ko11l08m3j"
+down_revision: str | None = "h1jn00k97l2i"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    cache_versions = op.create_table(
+        "cache_versions",
+        sa.Column("entity", sa.String(length=50), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("entity"),
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    op.bulk_insert(
+        cache_versions,
+        [
+            {"entity": entity, "version": 0, "updated_at": now}
+            for entity in ("ideas", "categories", "tags")
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cache_versions")
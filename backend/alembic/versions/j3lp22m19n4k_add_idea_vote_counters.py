@@ -0,0 +1,65 @@
+"""Add denormalized vote counters and score to ideas
+
+Revision ID: j3lp22m19n4k
+Revises: i2ko11l08m3j
+Create Date: 2026-10-18
+
+- ideas.upvote_count / downvote_count / score are maintained on each vote
+- ix_ideas_status_score serves score-ordered listings (sitemap priority)
+- Existing rows are backfilled from the votes table
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "j3lp22m19n4k"
+down_revision: str | None = "i2ko11l08m3j"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ideas",
+        sa.Column("upvote_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "ideas",
+        sa.Column("downvote_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "ideas",
+        sa.Column(
+            "score",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="upvote_count - downvote_count",
+        ),
+    )
+
+    op.execute(
+        """
+        UPDATE ideas SET
+            upvote_count = (
+                SELECT COUNT(*) FROM votes
+                WHERE votes.idea_id = ideas.id AND votes.vote_type = 'UPVOTE'
+            ),
+            downvote_count = (
+                SELECT COUNT(*) FROM votes
+                WHERE votes.idea_id = ideas.id AND votes.vote_type = 'DOWNVOTE'
+            )
+        """
+    )
+    op.execute("UPDATE ideas SET score = upvote_count - downvote_count")
+
+    op.create_index("ix_ideas_status_score", "ideas", ["status", "score"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ideas_status_score", table_name="ideas")
+    op.drop_column("ideas", "score")
+    op.drop_column("ideas", "downvote_count")
+    op.drop_column("ideas", "upvote_count")
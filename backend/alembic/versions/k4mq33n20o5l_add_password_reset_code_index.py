@@ -0,0 +1,48 @@
+"""Add keyed HMAC lookup index to password reset tokens
+
+Revision ID: k4mq33n20o5l
+Revises: j3lp22m19n4k
+Create Date: 2026-10-18
+
+- password_reset_tokens.code_index holds HMAC-SHA256 of the code, keyed
+  with SECRET_KEY, so verification bcrypt-checks one token instead of
+  every active token of the user
+- Existing tokens keep NULL: they expire within minutes and are still
+  checked by bcrypt alone until then
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "k4mq33n20o5l"
+down_revision: str | None = "j3lp22m19n4k"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "password_reset_tokens",
+        sa.Column(
+            "code_index",
+            sa.String(length=64),
+            nullable=True,
+            comment="HMAC-SHA256 lookup index of reset code (keyed with SECRET_KEY)",
+        ),
+    )
+    op.create_index(
+        "ix_password_reset_tokens_user_code_index",
+        "password_reset_tokens",
+        ["user_id", "code_index"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_password_reset_tokens_user_code_index",
+        table_name="password_reset_tokens",
+    )
+    op.drop_column("password_reset_tokens", "code_index")
@@ -0,0 +1,62 @@
+"""Add scheduler leader lease and job run history tables
+
+Revision ID: l5nr44o21p6m
+Revises: k4mq33n20o5l
+Create Date: 2026-10-18
+
+- scheduler_leases holds the leader lease of the background job runner
+  on SQLite (PostgreSQL uses an advisory lock instead)
+- job_runs records each leader job run with its timing and outcome
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "l5nr44o21p6m"
+down_revision: str | None = "k4mq33n20o5l"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column(
+            "holder",
+            sa.String(length=100),
+            nullable=False,
+            comment="host:pid of the worker holding it",
+        ),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.create_table(
+        "job_runs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_id", sa.String(length=100), nullable=False),
+        sa.Column(
+            "worker",
+            sa.String(length=100),
+            nullable=False,
+            comment="host:pid of the worker that ran it",
+        ),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=False),
+        sa.Column(
+            "status", sa.String(length=20), nullable=False, comment="success or failed"
+        ),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_job_runs_job_started", "job_runs", ["job_id", "started_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_runs_job_started", table_name="job_runs")
+    op.drop_table("job_runs")
+    op.drop_table("scheduler_leases")
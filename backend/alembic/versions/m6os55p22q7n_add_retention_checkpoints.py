@@ -0,0 +1,33 @@
+"""Add retention purge checkpoints
+
+Revision ID: m6os55p22q7n
+Revises: l5nr44o21p6m
+Create Date: 2026-10-18
+
+- retention_checkpoints stores the last primary key reached by each
+  chunked retention purge, so an interrupted run resumes where it stopped
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "m6os55p22q7n"
+down_revision: str | None = "l5nr44o21p6m"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "retention_checkpoints",
+        sa.Column("purge", sa.String(length=50), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("purge"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("retention_checkpoints")
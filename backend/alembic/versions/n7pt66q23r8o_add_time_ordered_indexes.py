@@ -0,0 +1,57 @@
+"""Add time-ordered indexes to activity tables
+
+Revision ID: n7pt66q23r8o
+Revises: m6os55p22q7n
+Create Date: 2026-10-19
+
+- Analytics trends count ideas, votes, comments, users and vote qualities
+  in created_at ranges: each table gets a created_at index (ideas lead
+  with deleted_at, which trends filter on IS NULL; votes add idea_id)
+- login_events lookups by user, IP or event type are always bounded or
+  ordered by created_at: the single-column indexes become
+  (column, created_at) composites, which still serve the column alone
+- security_audit_logs already has (event_type, created_at) and
+  (ip_address, created_at)
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "n7pt66q23r8o"
+down_revision: str | None = "m6os55p22q7n"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, columns)
+NEW_INDEXES = [
+    ("ix_users_created", "users", ["created_at"]),
+    ("ix_ideas_deleted_created", "ideas", ["deleted_at", "created_at"]),
+    ("ix_votes_created_idea", "votes", ["created_at", "idea_id"]),
+    ("ix_comments_created", "comments", ["created_at"]),
+    ("ix_vote_qualities_created", "vote_qualities", ["created_at"]),
+    ("ix_login_events_user_created", "login_events", ["user_id", "created_at"]),
+    ("ix_login_events_ip_created", "login_events", ["ip_address", "created_at"]),
+    ("ix_login_events_type_created", "login_events", ["event_type", "created_at"]),
+]
+
+# Superseded by the login_events composites above
+REPLACED_INDEXES = [
+    ("ix_login_events_user_id", "login_events", ["user_id"]),
+    ("ix_login_events_ip_address", "login_events", ["ip_address"]),
+    ("ix_login_events_event_type", "login_events", ["event_type"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in NEW_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for name, table, _columns in REPLACED_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REPLACED_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for name, table, _columns in reversed(NEW_INDEXES):
+        op.drop_index(name, table_name=table)
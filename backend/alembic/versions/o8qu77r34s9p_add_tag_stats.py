@@ -0,0 +1,53 @@
+"""Add tag_stats counters of public ideas per tag
+
+Revision ID: o8qu77r34s9p
+Revises: n7pt66q23r8o
+Create Date: 2026-10-19
+
+- tag_stats holds the number of approved, non-deleted ideas per tag,
+  maintained on every flush that changes it (see TagService)
+- Popular tags read it in idea_count order through ix_tag_stats_idea_count
+- Backfilled from idea_tags
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "o8qu77r34s9p"
+down_revision: str | None = "n7pt66q23r8o"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tag_stats",
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.Column("idea_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["tag_id"], ["tags.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tag_id"),
+    )
+    op.create_index(
+        "ix_tag_stats_idea_count", "tag_stats", ["idea_count", "tag_id"], unique=False
+    )
+
+    # Backfill the counters from the tag associations
+    op.execute(
+        """
+        INSERT INTO tag_stats (tag_id, idea_count)
+        SELECT tags.id, COUNT(ideas.id)
+        FROM tags
+        LEFT JOIN idea_tags ON idea_tags.tag_id = tags.id
+        LEFT JOIN ideas ON ideas.id = idea_tags.idea_id
+            AND ideas.status = 'APPROVED'
+            AND ideas.deleted_at IS NULL
+        GROUP BY tags.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tag_stats_idea_count", table_name="tag_stats")
+    op.drop_table("tag_stats")
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 import models.schemas as schemas
 import repositories.db_models as db_models
+from core.crypto_executor import run_crypto
 from models.config import settings
 from models.exceptions import (
     AuthenticationException,
@@ -26,11 +27,23 @@ optional_oauth2_scheme = HTTPBearer(auto_error=False)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    """
+    Check a password against its bcrypt hash on the crypto executor.
+
+    Raises:
+        CryptoBusyException: If the crypto executor's queue is full.
+    """
+    return run_crypto(bcrypt.checkpw, plain_password.encode(), hashed_password.encode())
 
 
 def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    """
+    Hash a password with bcrypt on the crypto executor.
+
+    Raises:
+        CryptoBusyException: If the crypto executor's queue is full.
+    """
+    return run_crypto(bcrypt.hashpw, password.encode(), bcrypt.gensalt()).decode()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
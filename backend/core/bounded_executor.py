@@ -0,0 +1,116 @@
+"""
+Bounded executor shared by the crypto thread pool and the image process pool.
+
+A BoundedExecutor wraps a lazily created concurrent.futures pool with a
+cap on jobs running plus waiting. Past that cap, admit raises the caller's
+busy exception (a 503 with Retry-After) at once rather than queueing the
+request behind work it would time out waiting for.
+
+The pool is created on first use, after gunicorn has forked the worker,
+and forgotten in forked children: its threads or processes belong to the
+parent. Queue depth (running plus waiting) is exported as
+background_queue_depth{queue=<name>}.
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Generic, TypeVar
+
+from core.metrics import set_queue_depth
+
+E = TypeVar("E", bound=Executor)
+
+
+class BoundedExecutor(Generic[E]):
+    """
+    Lazily created pool with a cap on pending jobs.
+
+    Limits are read from settings on each call (through callables), so
+    they follow runtime changes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        create_pool: Callable[[], E],
+        max_pending: Callable[[], int],
+        busy: Callable[[], Exception],
+        on_reject: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Initialize the executor (no pool is started yet).
+
+        Args:
+            name: Queue name for background_queue_depth
+            create_pool: Builds the underlying pool
+            max_pending: Returns the cap on jobs running plus waiting
+            busy: Builds the exception raised when the cap is reached
+            on_reject: Called for each rejected job (metrics)
+        """
+        self.name = name
+        self._create_pool = create_pool
+        self._max_pending = max_pending
+        self._busy = busy
+        self._on_reject = on_reject
+        self._lock = threading.Lock()
+        self._pool: E | None = None
+        self._pending = 0
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def admit(self) -> E:
+        """
+        Reserve a slot for one job.
+
+        Returns:
+            The pool to submit the job to
+
+        Raises:
+            Exception: The busy exception, if the pending cap is reached
+        """
+        with self._lock:
+            if self._pending >= self._max_pending():
+                if self._on_reject is not None:
+                    self._on_reject()
+                raise self._busy()
+            self._pending += 1
+            set_queue_depth(self.name, self._pending)
+            if self._pool is None:
+                self._pool = self._create_pool()
+            return self._pool
+
+    def release(self) -> None:
+        """Give back the slot reserved by admit."""
+        with self._lock:
+            self._pending -= 1
+            set_queue_depth(self.name, self._pending)
+
+    def discard(self, pool: E) -> None:
+        """
+        Drop a broken pool so the next job starts a new one.
+
+        Args:
+            pool: Pool returned by admit
+        """
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def pending_count(self) -> int:
+        """Jobs running or waiting in this process."""
+        return self._pending
+
+    def shutdown(self) -> None:
+        """Stop the pool (a later job starts a new one)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _reset_after_fork(self) -> None:
+        """Forget a pool inherited from the parent."""
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pending = 0
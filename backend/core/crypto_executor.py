@@ -0,0 +1,82 @@
+"""
+Bounded executor for password and reset-code hashing.
+
+bcrypt is deliberately slow (about 250ms at cost 12) and releases the GIL
+while it works. Every bcrypt call goes through run_crypto, which runs it
+on a small dedicated thread pool instead of the caller's thread:
+
+- CRYPTO_WORKERS caps how many hashes run at once, so a login storm
+  cannot take every request thread (or every CPU) away from cheap requests.
+- CRYPTO_MAX_PENDING caps hashes running plus waiting. Past that,
+  run_crypto raises CryptoBusyException (503 with Retry-After) at once
+  rather than queueing the request behind minutes of hashing.
+
+The callers are sync services, so endpoints that hash must be plain
+`def` endpoints (run in the threadpool), never `async def`: waiting on
+the executor would otherwise block the event loop.
+
+Queue depth (running plus waiting) is exported as
+background_queue_depth{queue="crypto"}, alongside the time spent waiting
+for a worker and the number of rejected calls.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from core.bounded_executor import BoundedExecutor
+from core.metrics import observe_crypto_wait, record_crypto_rejected
+from models.config import settings
+from models.exceptions import CryptoBusyException
+
+T = TypeVar("T")
+
+QUEUE_NAME = "crypto"
+
+_executor = BoundedExecutor(
+    QUEUE_NAME,
+    create_pool=lambda: ThreadPoolExecutor(
+        max_workers=settings.CRYPTO_WORKERS, thread_name_prefix="crypto"
+    ),
+    max_pending=lambda: settings.CRYPTO_MAX_PENDING,
+    busy=CryptoBusyException,
+    on_reject=record_crypto_rejected,
+)
+
+
+def run_crypto(func: Callable[..., T], *args: object) -> T:
+    """
+    Run a hashing function on the crypto executor and wait for its result.
+
+    Args:
+        func: Function to run (e.g. bcrypt.checkpw)
+        *args: Arguments for func
+
+    Returns:
+        The function's return value
+
+    Raises:
+        CryptoBusyException: If the executor's queue is full
+    """
+    pool = _executor.admit()
+    submitted = time.perf_counter()
+
+    def timed() -> T:
+        observe_crypto_wait(time.perf_counter() - submitted)
+        return func(*args)
+
+    try:
+        return pool.submit(timed).result()
+    finally:
+        _executor.release()
+
+
+def pending_count() -> int:
+    """Calls running or waiting on the executor in this process."""
+    return _executor.pending_count()
+
+
+def shutdown_crypto_executor() -> None:
+    """Stop the executor's threads (a later call starts a new pool)."""
+    _executor.shutdown()
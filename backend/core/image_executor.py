@@ -0,0 +1,86 @@
+"""
+Bounded process pool for image decoding and resizing.
+
+Decoding and resampling an upload is CPU-bound Python/C work that holds
+the GIL for most of its runtime, so it runs in separate processes rather
+than the request thread. Every image job goes through run_image_task:
+
+- IMAGE_WORKERS caps how many images render at once per worker process.
+- IMAGE_MAX_PENDING caps images rendering plus waiting. Past that,
+  run_image_task raises ImageBusyException (503 with Retry-After) at once
+  rather than queueing the request behind a burst of uploads.
+
+Pool processes are started with "spawn": forking a multi-threaded
+gunicorn worker can copy held locks into the child. Job functions must
+be importable module-level functions with picklable arguments (see
+helpers.avatar_images.render_avatar_variants).
+
+The callers are sync services, so endpoints that render images must be
+plain `def` endpoints (run in the threadpool), never `async def`.
+
+Queue depth (running plus waiting) is exported as
+background_queue_depth{queue="image"}.
+"""
+
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TypeVar
+
+from loguru import logger
+
+from core.bounded_executor import BoundedExecutor
+from models.config import settings
+from models.exceptions import ImageBusyException
+
+T = TypeVar("T")
+
+QUEUE_NAME = "image"
+
+_executor = BoundedExecutor(
+    QUEUE_NAME,
+    create_pool=lambda: ProcessPoolExecutor(
+        max_workers=settings.IMAGE_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    ),
+    max_pending=lambda: settings.IMAGE_MAX_PENDING,
+    busy=ImageBusyException,
+)
+
+
+def run_image_task(func: Callable[..., T], *args: object) -> T:
+    """
+    Run an image job in the process pool and wait for its result.
+
+    Args:
+        func: Module-level function to run
+        *args: Picklable arguments for func
+
+    Returns:
+        The function's return value
+
+    Raises:
+        ImageBusyException: If the executor's queue is full
+        BrokenProcessPool: If a pool process died (the pool is replaced)
+    """
+    pool = _executor.admit()
+    try:
+        return pool.submit(func, *args).result()
+    except BrokenProcessPool:
+        # A process was killed (e.g. out of memory): start a fresh pool
+        logger.error("Image executor process died, restarting the pool")
+        _executor.discard(pool)
+        raise
+    finally:
+        _executor.release()
+
+
+def pending_count() -> int:
+    """Jobs running or waiting on the executor in this process."""
+    return _executor.pending_count()
+
+
+def shutdown_image_executor() -> None:
+    """Stop the pool's processes (a later call starts a new pool)."""
+    _executor.shutdown()
@@ -0,0 +1,345 @@
+"""
+Single-leader runner for scheduled background jobs.
+
+Every gunicorn worker runs the same APScheduler schedule, but a job
+marked leader_only only executes in the worker holding the leader lease,
+so each run happens exactly once across the server:
+
+- PostgreSQL: a session-level advisory lock held on a dedicated
+  connection. It is released by the server the moment the holding
+  process or connection dies.
+- SQLite: a row in scheduler_leases with an expiry, renewed by the
+  leader's heartbeat and taken over by another worker once it lapses.
+
+Jobs that act on per-process state (the share buffer) run in every
+worker. Leader job runs are recorded in job_runs with their timings.
+"""
+
+import hashlib
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from models.config import settings
+from repositories.job_repository import JobRunRepository, SchedulerLeaseRepository
+
+LEASE_NAME = "scheduler"
+
+
+@dataclass(frozen=True)
+class Job:
+    """
+    A scheduled background job.
+
+    Attributes:
+        id: Stable job id (APScheduler id and job_runs.job_id)
+        name: Human-readable name
+        func: Function to run, taking no arguments
+        trigger: APScheduler trigger
+        leader_only: Run in the leader worker only (False: in every worker)
+        options: Extra APScheduler add_job options
+    """
+
+    id: str
+    name: str
+    func: Callable[[], Any]
+    trigger: Any
+    leader_only: bool = True
+    options: dict[str, Any] | None = None
+
+
+def worker_id() -> str:
+    """Id of this worker process (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _advisory_lock_key(name: str) -> int:
+    """Map a lease name to a signed 64-bit advisory lock key."""
+    digest = hashlib.sha256(f"opencitivibes:{name}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class AdvisoryLockLease:
+    """Leader lease backed by a PostgreSQL session-level advisory lock."""
+
+    def __init__(self, engine: Engine, name: str = LEASE_NAME):
+        """
+        Initialize the lease.
+
+        Args:
+            engine: PostgreSQL engine (one pooled connection is kept while leading)
+            name: Lease name
+        """
+        self._engine = engine
+        self._key = _advisory_lock_key(name)
+        self._conn: Connection | None = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """
+        Take the lock, or confirm it is still held.
+
+        Returns:
+            True if this worker is the leader
+        """
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute(text("SELECT 1"))
+                    self._conn.commit()
+                    return True
+                except SQLAlchemyError:
+                    logger.warning("Lost the scheduler advisory lock connection")
+                    self._close()
+            conn = self._engine.connect()
+            try:
+                acquired = conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key}
+                ).scalar()
+                conn.commit()
+            except SQLAlchemyError:
+                conn.close()
+                raise
+            if acquired:
+                self._conn = conn
+                return True
+            conn.close()
+            return False
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        text("SELECT pg_advisory_unlock(:key)"), {"key": self._key}
+                    )
+                    self._conn.commit()
+                except SQLAlchemyError:
+                    pass
+                self._close()
+
+    def _close(self) -> None:
+        """Drop the lock connection (the server releases the lock with it)."""
+        if self._conn is not None:
+            try:
+                self._conn.invalidate()
+                self._conn.close()
+            except SQLAlchemyError:
+                pass
+            self._conn = None
+
+
+class RowLease:
+    """Leader lease backed by an expiring scheduler_leases row."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        holder: str,
+        name: str = LEASE_NAME,
+        ttl_seconds: int | None = None,
+    ):
+        """
+        Initialize the lease.
+
+        Args:
+            session_factory: Creates database sessions
+            holder: Id of this worker
+            name: Lease name
+            ttl_seconds: Lease lifetime (defaults to SCHEDULER_LEASE_SECONDS)
+        """
+        self._session_factory = session_factory
+        self._holder = holder
+        self._name = name
+        self._ttl = ttl_seconds or settings.SCHEDULER_LEASE_SECONDS
+
+    def acquire(self) -> bool:
+        """
+        Take or renew the lease.
+
+        Returns:
+            True if this worker is the leader
+        """
+        db = self._session_factory()
+        try:
+            acquired = SchedulerLeaseRepository(db).try_acquire(
+                self._name, self._holder, self._ttl
+            )
+            db.commit()
+            return acquired
+        finally:
+            db.close()
+
+    def release(self) -> None:
+        """Release the lease if this worker holds it."""
+        db = self._session_factory()
+        try:
+            SchedulerLeaseRepository(db).release(self._name, self._holder)
+            db.commit()
+        finally:
+            db.close()
+
+
+class JobRunner:
+    """Runs registered jobs, gating leader jobs on the leader lease."""
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Any] | Callable[[], Session],
+        lease: AdvisoryLockLease | RowLease,
+        worker: str,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            session_factory: Creates database sessions (for run history)
+            lease: Leader lease shared by all leader jobs
+            worker: Id of this worker
+        """
+        self.session_factory = session_factory
+        self.lease = lease
+        self.worker = worker
+        self.is_leader = False
+
+    @classmethod
+    def for_engine(
+        cls, engine: Engine, session_factory: Callable[[], Session]
+    ) -> "JobRunner":
+        """
+        Create a runner with the lease suited to the database.
+
+        Args:
+            engine: Database engine
+            session_factory: Creates database sessions
+
+        Returns:
+            Runner using an advisory lock on PostgreSQL, a lease row otherwise
+        """
+        worker = worker_id()
+        lease: AdvisoryLockLease | RowLease
+        if engine.dialect.name == "postgresql":
+            lease = AdvisoryLockLease(engine)
+        else:
+            lease = RowLease(session_factory, worker)
+        return cls(session_factory, lease, worker)
+
+    def heartbeat(self) -> bool:
+        """
+        Take or keep the leader lease.
+
+        Runs in every worker: the leader renews its lease, the others
+        take over once the leader is gone.
+
+        Returns:
+            True if this worker is the leader
+        """
+        try:
+            leader = self.lease.acquire()
+        except SQLAlchemyError as e:
+            logger.error(f"Scheduler lease check failed: {e}")
+            leader = False
+        if leader != self.is_leader:
+            logger.info(
+                f"Worker {self.worker} "
+                f"{'became' if leader else 'is no longer'} the scheduler leader"
+            )
+        self.is_leader = leader
+        return leader
+
+    def run(self, job: Job) -> None:
+        """
+        Run a job in this worker if it should run here.
+
+        Leader jobs check the lease first (so a stale leader cannot run
+        them), then record the run with its timing. Errors are logged and
+        recorded, not raised, so one failing job never stops the schedule.
+
+        Args:
+            job: Job to run
+        """
+        if job.leader_only and not self.heartbeat():
+            return
+
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        error = None
+        try:
+            job.func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.error(f"Job {job.id} failed: {error}")
+        duration_ms = round((time.perf_counter() - start) * 1000)
+
+        if job.leader_only:
+            self._record(job, started_at, duration_ms, error)
+
+    def _record(
+        self, job: Job, started_at: datetime, duration_ms: int, error: str | None
+    ) -> None:
+        """Store a leader job run in the run history."""
+        db = self.session_factory()
+        try:
+            JobRunRepository(db).record(
+                job.id,
+                self.worker,
+                started_at,
+                duration_ms,
+                error,
+                keep=settings.JOB_RUN_HISTORY_LIMIT,
+            )
+            db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Could not record run of job {job.id}: {e}")
+        finally:
+            db.close()
+
+    def recent_runs(self, job_ids: list[str], limit: int = 10) -> dict[str, list]:
+        """
+        Get the latest recorded runs of each job.
+
+        Args:
+            job_ids: Jobs to look up
+            limit: Runs per job
+
+        Returns:
+            Dict mapping job id to run dicts, newest first
+        """
+        db = self.session_factory()
+        try:
+            runs = JobRunRepository(db).get_recent(job_ids, limit)
+        finally:
+            db.close()
+        return {
+            job_id: [
+                {
+                    "worker": run.worker,
+                    "started_at": run.started_at.isoformat(),
+                    "duration_ms": run.duration_ms,
+                    "status": run.status,
+                    "error": run.error,
+                }
+                for run in job_runs
+            ]
+            for job_id, job_runs in runs.items()
+        }
+
+    def shutdown(self) -> None:
+        """Give up leadership so another worker takes over at once."""
+        if self.is_leader:
+            try:
+                self.lease.release()
+            except SQLAlchemyError as e:
+                logger.warning(f"Could not release scheduler lease: {e}")
+            self.is_leader = False
@@ -34,12 +34,14 @@ def correlation_filter(record: "Record") -> bool:
     return True
 
 
-def configure_logging(environment: str = "development") -> None:
+def configure_logging(environment: str = "development", enqueue: bool = False) -> None:
     """
     Configure Loguru for the application.
 
     Args:
         environment: "development" for console, "production" for JSON.
+        enqueue: Hand records to a background thread that writes them, so
+            log calls never block on stderr or file I/O.
     """
     # Remove default handler
     logger.remove()
@@ -61,6 +63,7 @@ def configure_logging(environment: str = "development") -> None:
             level="DEBUG",
             filter=correlation_filter,
             colorize=True,
+            enqueue=enqueue,
         )
     else:
         # JSON format for production (machine-parseable)
@@ -70,6 +73,7 @@ def configure_logging(environment: str = "development") -> None:
             level="INFO",
             filter=correlation_filter,
             serialize=True,  # JSON output
+            enqueue=enqueue,
         )
 
     # Ensure logs directory exists
@@ -85,4 +89,5 @@ def configure_logging(environment: str = "development") -> None:
         rotation="10 MB",
         retention="7 days",
         serialize=(environment != "development"),
+        enqueue=enqueue,
     )
@@ -0,0 +1,308 @@
+"""
+Prometheus metrics.
+
+Defines the application metrics and the helpers that feed them:
+
+- Per-route HTTP latency, and DB query count/time per request
+  (observed by RequestContextMiddleware)
+- DB query events and pool checkout time (instrument_engine and
+  repositories.database)
+- Cache hit/miss counters, background queue depths and search latency
+- Crypto executor wait time and rejections (core.crypto_executor)
+
+Under gunicorn, each worker is a separate process. Setting
+PROMETHEUS_MULTIPROC_DIR (done by gunicorn.conf.py) switches
+prometheus_client to multiprocess mode: every worker writes its samples
+to files in that directory, and /metrics aggregates all of them, so a
+scrape sees the whole server whichever worker answers it.
+"""
+
+import os
+import time
+from contextvars import ContextVar, Token
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import Engine, event
+
+# Route label for requests that matched no route (404s, static files)
+UNMATCHED_ROUTE = "unmatched"
+
+_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Database statements executed per HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_query_seconds_per_request",
+    "Total database statement time per HTTP request",
+    ["route"],
+    buckets=_LATENCY_BUCKETS,
+)
+DB_POOL_CHECKOUT = Histogram(
+    "db_pool_checkout_seconds",
+    "Time to check a connection out of the pool (queue wait plus connect)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "In-process cache lookups by cache and result (hit/miss)",
+    ["cache", "result"],
+)
+QUEUE_DEPTH = Gauge(
+    "background_queue_depth",
+    "Items waiting in in-process background queues",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+CRYPTO_WAIT = Histogram(
+    "crypto_queue_wait_seconds",
+    "Time a hashing call waited for a crypto executor thread",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+CRYPTO_REJECTED = Counter(
+    "crypto_rejected_total",
+    "Hashing calls refused because the crypto executor queue was full",
+)
+SEARCH_DURATION = Histogram(
+    "search_duration_seconds",
+    "Search latency by operation",
+    ["operation"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+
+class RequestStats:
+    """DB statement count and time for the current request."""
+
+    __slots__ = ("db_time", "queries")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_time = 0.0
+
+
+# Mutable per-request stats. Sync endpoints run in a worker thread with a
+# copy of the context, so the object is shared rather than re-set there.
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def start_request() -> Token[RequestStats | None]:
+    """
+    Start collecting DB stats for the current request.
+
+    Returns:
+        Token for finish_request
+    """
+    return _request_stats.set(RequestStats())
+
+
+def finish_request(
+    token: Token[RequestStats | None],
+    method: str,
+    route: str,
+    status_code: int,
+    duration: float,
+) -> None:
+    """
+    Record a finished request and stop collecting its DB stats.
+
+    Args:
+        token: Token returned by start_request
+        method: HTTP method
+        route: Route template (e.g. /api/ideas/{idea_id}) or UNMATCHED_ROUTE
+        status_code: Response status code
+        duration: Request duration in seconds
+    """
+    stats = _request_stats.get()
+    _request_stats.reset(token)
+    HTTP_REQUEST_DURATION.labels(method, route, f"{status_code // 100}xx").observe(
+        duration
+    )
+    if stats is not None:
+        DB_QUERIES_PER_REQUEST.labels(route).observe(stats.queries)
+        DB_TIME_PER_REQUEST.labels(route).observe(stats.db_time)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Remember when the statement started."""
+    conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Add the statement to the current request's stats."""
+    started = conn.info["metrics_query_start"].pop()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - started
+
+
+def _handle_error(exception_context: Any) -> None:
+    """Drop the start time of a statement that raised."""
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("metrics_query_start"):
+        conn.info["metrics_query_start"].pop()
+
+
+def _pool_checkout(dbapi_connection: Any, connection_record: Any, proxy: Any) -> None:
+    """Count a connection handed out by the pool."""
+    DB_POOL_CHECKED_OUT.inc()
+
+
+def _pool_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+    """Count a connection returned to the pool."""
+    DB_POOL_CHECKED_OUT.dec()
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """
+    Attach query and pool metrics hooks to an engine.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        The same engine, for chaining
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    event.listen(engine, "checkout", _pool_checkout)
+    event.listen(engine, "checkin", _pool_checkin)
+    return engine
+
+
+def observe_pool_checkout(seconds: float) -> None:
+    """
+    Record how long a pool checkout took.
+
+    Args:
+        seconds: Checkout time in seconds
+    """
+    DB_POOL_CHECKOUT.observe(seconds)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Count a cache lookup.
+
+    Args:
+        cache: Cache name (e.g. "rendered_response")
+        hit: Whether the lookup was a hit
+    """
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def set_queue_depth(queue: str, depth: int) -> None:
+    """
+    Report the current depth of a background queue in this process.
+
+    Args:
+        queue: Queue name
+        depth: Items waiting
+    """
+    QUEUE_DEPTH.labels(queue).set(depth)
+
+
+def observe_crypto_wait(seconds: float) -> None:
+    """
+    Record how long a hashing call waited for a crypto executor thread.
+
+    Args:
+        seconds: Wait time in seconds
+    """
+    CRYPTO_WAIT.observe(seconds)
+
+
+def record_crypto_rejected() -> None:
+    """Count a hashing call refused by crypto executor admission control."""
+    CRYPTO_REJECTED.inc()
+
+
+def search_timer(operation: str) -> Any:
+    """
+    Time a search operation.
+
+    Usable as a decorator or a context manager.
+
+    Args:
+        operation: Operation label (e.g. "ideas", "autocomplete")
+
+    Returns:
+        Timer observing SEARCH_DURATION
+    """
+    return SEARCH_DURATION.labels(operation).time()
+
+
+def is_multiprocess() -> bool:
+    """Check whether metrics are shared across worker processes."""
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format.
+
+    In multiprocess mode the samples of every worker are aggregated.
+
+    Returns:
+        Tuple of (body, content type)
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
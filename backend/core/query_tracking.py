@@ -0,0 +1,218 @@
+"""
+SQL statement tracking and N+1 detection.
+
+Every statement is reduced to a fingerprint (literals, parameters and IN
+lists collapsed), so the per-item queries of an N+1 loop all share one
+fingerprint. Used in two places:
+
+- Per request, by RequestContextMiddleware, when QUERY_REPEAT_ACTION is
+  "log" or "raise": a fingerprint repeated QUERY_REPEAT_THRESHOLD times
+  in one request is logged at the end of the request, or raises
+  RepeatedQueryError at the offending statement (development only).
+- In tests, through count_queries (the ``query_budget`` marker and the
+  ``query_counter`` fixture in tests/conftest.py).
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Engine, event
+
+from models.config import settings
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class RepeatedQueryError(RuntimeError):
+    """Raised when a statement repeats enough to look like an N+1 loop."""
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so repeated lookups compare equal.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        Statement with literals and parameters replaced by ``?`` and
+        parameter lists collapsed to ``(?+)``
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class QueryTracker:
+    """Statement count and fingerprint histogram for one unit of work."""
+
+    __slots__ = ("count", "fingerprints", "raise_at")
+
+    def __init__(self, raise_at: int = 0) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            raise_at: Raise RepeatedQueryError when a fingerprint reaches
+                this many executions (0 never raises)
+        """
+        self.count = 0
+        self.fingerprints: Counter[str] = Counter()
+        self.raise_at = raise_at
+
+    def record(self, statement: str) -> None:
+        """
+        Record one executed statement.
+
+        Raises:
+            RepeatedQueryError: If the statement reached raise_at
+        """
+        self.count += 1
+        key = fingerprint(statement)
+        self.fingerprints[key] += 1
+        if self.raise_at and self.fingerprints[key] == self.raise_at:
+            raise RepeatedQueryError(
+                f"Statement executed {self.raise_at} times in one request "
+                f"(likely N+1): {key}"
+            )
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Get the fingerprints executed at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum executions
+
+        Returns:
+            (fingerprint, count) pairs, most repeated first
+        """
+        return [
+            (key, count)
+            for key, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def summary(self, limit: int = 5) -> str:
+        """Describe the most repeated statements, for failure messages."""
+        return "\n".join(
+            f"  {count}x {key[:200]}"
+            for key, count in self.fingerprints.most_common(limit)
+        )
+
+
+_tracker: ContextVar[QueryTracker | None] = ContextVar("query_tracker", default=None)
+
+
+def _record_statement(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Record a statement for the current request, if tracked."""
+    tracker = _tracker.get()
+    if tracker is not None:
+        tracker.record(statement)
+
+
+def track_engine(engine: Engine) -> Engine:
+    """
+    Attach per-request statement tracking to an engine.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        The same engine, for chaining
+    """
+    event.listen(engine, "before_cursor_execute", _record_statement)
+    return engine
+
+
+def start_request() -> Token[QueryTracker | None] | None:
+    """
+    Start tracking statements for the current request.
+
+    Returns:
+        Token for finish_request, or None when QUERY_REPEAT_ACTION is off
+    """
+    action = settings.QUERY_REPEAT_ACTION
+    if action == "off":
+        return None
+    raise_at = (
+        settings.QUERY_REPEAT_THRESHOLD
+        if action == "raise" and settings.ENVIRONMENT != "production"
+        else 0
+    )
+    return _tracker.set(QueryTracker(raise_at=raise_at))
+
+
+def finish_request(token: Token[QueryTracker | None], method: str, route: str) -> None:
+    """
+    Stop tracking and log statements repeated often enough to be an N+1.
+
+    Args:
+        token: Token returned by start_request
+        method: HTTP method
+        route: Route template or path
+    """
+    tracker = _tracker.get()
+    _tracker.reset(token)
+    if tracker is None:
+        return
+    for key, count in tracker.repeated(settings.QUERY_REPEAT_THRESHOLD):
+        logger.warning(
+            "Possible N+1 in {method} {route}: {count}x {statement}",
+            method=method,
+            route=route,
+            count=count,
+            statement=key[:500],
+        )
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryTracker]:
+    """
+    Record every statement the engine executes inside the block.
+
+    Engine-wide rather than per context, so statements run by a test
+    client in another thread are included.
+
+    Args:
+        engine: Engine to watch
+
+    Yields:
+        Tracker filled in as statements run
+    """
+    tracker = QueryTracker()
+
+    def record(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        tracker.record(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield tracker
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -1,19 +1,30 @@
 """
-Background Task Scheduler for Retention Jobs.
+Background Task Scheduler for Retention and Maintenance Jobs.
 
 Uses APScheduler for reliable scheduled task execution.
 Law 25 Compliance: Automated data retention enforcement.
+
+Every gunicorn worker runs this scheduler. Jobs are listed in
+build_job_registry and run through core.job_runner.JobRunner: leader jobs
+run in the one worker holding the leader lease, so each run happens once
+across the server; the share buffer flush runs in every worker.
 """
 
+import json
+
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from loguru import logger
 
-from repositories.database import SessionLocal
+from core.job_runner import Job, JobRunner
+from models.config import settings
+from repositories.database import SessionLocal, engine
 
 
 # Global scheduler instance
 scheduler: BackgroundScheduler | None = None
+runner: JobRunner | None = None
 
 
 def retention_cleanup_job() -> None:
@@ -30,73 +41,353 @@ def retention_cleanup_job() -> None:
     try:
         results = RetentionService.run_all_cleanup_jobs(db)
         logger.info(f"Retention cleanup completed: {results}")
-    except Exception as e:
-        logger.error(f"Retention cleanup failed: {e}")
-        raise
     finally:
         db.close()
 
 
-def setup_scheduler() -> None:
+def share_counts_flush_job() -> None:
     """
-    Configure and start the background scheduler.
+    Scheduled job to flush this worker's buffered share counts.
+
+    Runs in every worker: each process owns its own in-memory buffer.
+    """
+    from services.share_service import ShareService
+
+    db = SessionLocal()
+    try:
+        ShareService.flush_share_buffer(db)
+    finally:
+        db.close()
+
+
+def vote_counts_sync_job() -> None:
+    """
+    Scheduled job to recompute the denormalized idea vote counters.
+
+    Votes keep the counters current; this repairs any drift left by
+    writes that bypass VoteService.
+    """
+    from services.vote_service import VoteService
+
+    db = SessionLocal()
+    try:
+        updated = VoteService.resync_vote_counts(db)
+        logger.info(f"Vote counters resynced for {updated} ideas")
+    finally:
+        db.close()
+
+
+def comment_like_counts_sync_job() -> None:
+    """
+    Scheduled job to recompute the denormalized comment like counters.
+
+    Likes keep the counters current; this repairs any drift left by
+    writes that bypass CommentLikeService.
+    """
+    from services.comment_like_service import CommentLikeService
+
+    db = SessionLocal()
+    try:
+        updated = CommentLikeService.resync_like_counts(db)
+        logger.info(f"Like counters corrected for {updated} comments")
+    finally:
+        db.close()
+
+
+def tag_stats_sync_job() -> None:
+    """
+    Scheduled job to recompute the per-tag public idea counters.
+
+    Flushes keep the counters current; this repairs any drift left by
+    bulk statements that bypass the ORM.
+    """
+    from services.tag_service import TagService
+
+    db = SessionLocal()
+    try:
+        corrected = TagService.resync_tag_stats(db)
+        logger.info(f"Tag counters corrected for {corrected} tags")
+    finally:
+        db.close()
+
+
+def avatar_sweep_job() -> None:
+    """
+    Scheduled job to delete avatar variants no user points at any more.
+
+    Replaced avatars keep their files until this sweep: identical uploads
+    share them, so deleting at replacement time could race a new upload.
+    """
+    from services.avatar_service import AvatarService
+
+    db = SessionLocal()
+    try:
+        AvatarService.sweep_unused_variants(db)
+    finally:
+        db.close()
+
+
+def security_monitoring_job() -> None:
+    """
+    Scheduled job to check for suspicious activity patterns.
+
+    Required by Law 25 Article 3.5 for breach detection. Critical alerts
+    open an incident and send an immediate notification.
+    """
+    from models.notification_types import NotificationType
+    from services.incident_service import IncidentService
+    from services.notification_service import NotificationService
+    from services.security_audit_service import SecurityAuditService
+
+    db = SessionLocal()
+    try:
+        alerts = SecurityAuditService.detect_suspicious_patterns(db)
+        if alerts:
+            logger.warning(f"Security monitoring detected {len(alerts)} alerts")
+
+        for alert in alerts:
+            if alert.get("severity") == "critical":
+                # Auto-create incident for critical alerts
+                IncidentService.create_incident(
+                    db=db,
+                    incident_type="suspicious_activity",
+                    severity="high",
+                    title=f"Automated alert: {alert.get('type')}",
+                    description=json.dumps(alert, indent=2),
+                )
+
+                # Send immediate notification
+                NotificationService.send_fire_and_forget(
+                    NotificationType.CRITICAL,
+                    f"SECURITY: {alert.get('type')}",
+                    json.dumps(alert),
+                    priority_override="max",
+                )
+    finally:
+        db.close()
+
+
+def penalty_expiry_job() -> None:
+    """Scheduled job to lift temporary bans that have run out."""
+    from services.penalty_service import PenaltyService
+
+    db = SessionLocal()
+    try:
+        expired = PenaltyService.expire_penalties(db)
+        if expired:
+            logger.info(f"Expired {expired} penalties")
+    finally:
+        db.close()
+
+
+def trusted_device_cleanup_job() -> None:
+    """Scheduled job to expire trusted devices and purge old revoked ones."""
+    from tasks.cleanup_trusted_devices import cleanup_trusted_devices
+
+    cleanup_trusted_devices()
+
+
+def password_reset_cleanup_job() -> None:
+    """Scheduled job to delete password reset tokens expired over a day ago."""
+    from services.password_reset_service import PasswordResetService
+
+    db = SessionLocal()
+    try:
+        PasswordResetService.cleanup_expired_tokens(db, older_than_hours=24)
+    finally:
+        db.close()
+
+
+def build_job_registry() -> list[Job]:
+    """
+    List every scheduled job.
 
     Schedules:
     - Retention cleanup: Daily at 2:00 AM
+    - Vote counters resync: Daily at 3:30 AM
+    - Comment like counters resync: Daily at 3:45 AM
+    - Tag counters resync: Daily at 4:00 AM
+    - Unused avatar sweep: Daily at 4:15 AM
+    - Security monitoring: Every 15 minutes
+    - Penalty expiry: Every 5 minutes
+    - Trusted device cleanup: Hourly
+    - Password reset token cleanup: Hourly
+    - Share counts flush: Every SHARE_FLUSH_INTERVAL_SECONDS, in every worker
+
+    Returns:
+        The jobs, in scheduling order
     """
-    global scheduler
+    daily = {"misfire_grace_time": 3600}  # 1 hour grace for missed jobs
+    return [
+        Job(
+            "retention_cleanup",
+            "Data Retention Cleanup",
+            retention_cleanup_job,
+            CronTrigger(hour=2, minute=0),
+            options=daily,
+        ),
+        Job(
+            "vote_counts_sync",
+            "Idea Vote Counters Resync",
+            vote_counts_sync_job,
+            CronTrigger(hour=3, minute=30),
+            options=daily,
+        ),
+        Job(
+            "comment_like_counts_sync",
+            "Comment Like Counters Resync",
+            comment_like_counts_sync_job,
+            CronTrigger(hour=3, minute=45),
+            options=daily,
+        ),
+        Job(
+            "tag_stats_sync",
+            "Tag Counters Resync",
+            tag_stats_sync_job,
+            CronTrigger(hour=4, minute=0),
+            options=daily,
+        ),
+        Job(
+            "avatar_sweep",
+            "Unused Avatar Sweep",
+            avatar_sweep_job,
+            CronTrigger(hour=4, minute=15),
+            options=daily,
+        ),
+        Job(
+            "security_monitoring",
+            "Security Monitoring",
+            security_monitoring_job,
+            IntervalTrigger(minutes=15),
+        ),
+        Job(
+            "penalty_expiry",
+            "Penalty Expiry",
+            penalty_expiry_job,
+            IntervalTrigger(minutes=5),
+        ),
+        Job(
+            "trusted_device_cleanup",
+            "Trusted Device Cleanup",
+            trusted_device_cleanup_job,
+            IntervalTrigger(hours=1),
+        ),
+        Job(
+            "password_reset_cleanup",
+            "Password Reset Token Cleanup",
+            password_reset_cleanup_job,
+            IntervalTrigger(hours=1),
+        ),
+        # Each worker owns its own in-memory share buffer
+        Job(
+            "share_counts_flush",
+            "Share Counts Flush",
+            share_counts_flush_job,
+            IntervalTrigger(seconds=settings.SHARE_FLUSH_INTERVAL_SECONDS),
+            leader_only=False,
+        ),
+    ]
+
+
+def setup_scheduler() -> None:
+    """
+    Configure and start the background scheduler.
+
+    Adds every job of build_job_registry, plus the leader lease heartbeat
+    every SCHEDULER_HEARTBEAT_SECONDS.
+    """
+    global scheduler, runner
 
     if scheduler is not None:
         logger.warning("Scheduler already initialized")
         return
 
+    runner = JobRunner.for_engine(engine, SessionLocal)
     scheduler = BackgroundScheduler()
 
-    # Add retention cleanup job - runs daily at 2 AM
     scheduler.add_job(
-        retention_cleanup_job,
-        CronTrigger(hour=2, minute=0),
-        id="retention_cleanup",
-        name="Data Retention Cleanup",
+        runner.heartbeat,
+        IntervalTrigger(seconds=settings.SCHEDULER_HEARTBEAT_SECONDS),
+        id="leader_heartbeat",
+        name="Scheduler Leader Heartbeat",
         replace_existing=True,
-        misfire_grace_time=3600,  # 1 hour grace for missed jobs
+        coalesce=True,
+        max_instances=1,
     )
+    for job in build_job_registry():
+        scheduler.add_job(
+            runner.run,
+            job.trigger,
+            args=[job],
+            id=job.id,
+            name=job.name,
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+            **(job.options or {}),
+        )
 
     # Start scheduler
     scheduler.start()
-    logger.info("Background scheduler started with retention cleanup job at 2:00 AM")
+    runner.heartbeat()
+    logger.info(
+        f"Background scheduler started (worker {runner.worker}, "
+        f"leader={runner.is_leader})"
+    )
 
 
 def shutdown_scheduler() -> None:
     """Gracefully shutdown the scheduler."""
-    global scheduler
+    global scheduler, runner
 
     if scheduler is not None and scheduler.running:
         scheduler.shutdown(wait=True)
+        # Drain buffered shares so a restart doesn't lose them
+        share_counts_flush_job()
+        if runner is not None:
+            runner.shutdown()
         logger.info("Background scheduler stopped")
         scheduler = None
+        runner = None
 
 
 def get_scheduler_status() -> dict:
-    """Get current scheduler status for monitoring."""
-    global scheduler
+    """
+    Get current scheduler status for monitoring.
 
-    if scheduler is None:
+    Includes whether the answering worker is the leader and, for leader
+    jobs, their latest runs (from any worker) with timings.
+    """
+    if scheduler is None or runner is None:
         return {"running": False, "jobs": []}
 
+    registry = {job.id: job for job in build_job_registry()}
+    leader_jobs = [job.id for job in registry.values() if job.leader_only]
+    runs = runner.recent_runs(leader_jobs, limit=settings.SCHEDULER_STATUS_RUNS)
+
     jobs = []
-    for job in scheduler.get_jobs():
+    for scheduled in scheduler.get_jobs():
+        job = registry.get(scheduled.id)
         jobs.append(
             {
-                "id": job.id,
-                "name": job.name,
+                "id": scheduled.id,
+                "name": scheduled.name,
                 "next_run_time": (
-                    job.next_run_time.isoformat() if job.next_run_time else None
+                    scheduled.next_run_time.isoformat()
+                    if scheduled.next_run_time
+                    else None
                 ),
+                "leader_only": job.leader_only if job else False,
+                "recent_runs": runs.get(scheduled.id, []),
             }
         )
 
-    return {"running": scheduler.running, "jobs": jobs}
+    return {
+        "running": scheduler.running,
+        "worker": runner.worker,
+        "is_leader": runner.is_leader,
+        "jobs": jobs,
+    }
 
 
 def trigger_retention_cleanup_now() -> dict:
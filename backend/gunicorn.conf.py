@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration (loaded automatically from the working directory).
+
+Enables prometheus_client multiprocess mode so /metrics aggregates the
+samples of every worker (see core.metrics). The directory must be set
+before any worker imports the app, and emptied when the server starts so
+samples from a previous run are not reported again.
+"""
+
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+
+def on_starting(server) -> None:  # type: ignore[no-untyped-def]
+    """Reset the metrics directory before the workers start."""
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker) -> None:  # type: ignore[no-untyped-def]
+    """Drop the live gauges of an exited worker."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,150 @@
+"""
+Avatar image rendering and content-addressed avatar paths.
+
+An uploaded avatar is decoded once, cropped to a square and rendered as
+fixed-size WebP and JPEG variants without any metadata (EXIF, GPS, ICC).
+Variants are stored under the SHA-256 of the uploaded bytes:
+
+    data/uploads/avatars/<hash[:2]>/<hash>/<size>.webp (and .jpg)
+
+so identical uploads share one set of files and a variant URL never
+changes content (it can be cached as immutable). A user's avatar_url
+points at the largest WebP variant; the other URLs derive from it.
+
+render_avatar_variants only depends on Pillow, so it can run in a worker
+process of core.image_executor.
+"""
+
+import hashlib
+import io
+import re
+
+from PIL import Image, ImageOps
+
+AVATAR_DIR = "data/uploads/avatars"
+
+# Variant file extension -> Pillow format
+AVATAR_FORMATS = {"webp": "WEBP", "jpg": "JPEG"}
+
+# Response keys for the formats in avatar_variant_urls
+_FORMAT_KEYS = {"webp": "webp", "jpg": "jpeg"}
+
+_VARIANT_URL = re.compile(
+    rf"^/?{AVATAR_DIR}/[0-9a-f]{{2}}/(?P<hash>[0-9a-f]{{64}})/\d+\.(?:webp|jpg)$"
+)
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+
+def content_hash(content: bytes) -> str:
+    """SHA-256 hex digest of uploaded image bytes (the storage key)."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def avatar_dir(digest: str) -> str:
+    """Directory holding the variants of one uploaded image."""
+    return f"{AVATAR_DIR}/{digest[:2]}/{digest}"
+
+
+def variant_path(digest: str, size: int, extension: str) -> str:
+    """Path (and URL path) of one avatar variant."""
+    return f"{avatar_dir(digest)}/{size}.{extension}"
+
+
+def variant_digest(avatar_url: str) -> str | None:
+    """
+    Get the content hash of a variant URL.
+
+    Args:
+        avatar_url: Stored avatar URL or request path
+
+    Returns:
+        The hash, or None for legacy (non content-addressed) avatars
+    """
+    match = _VARIANT_URL.match(avatar_url)
+    return match.group("hash") if match else None
+
+
+def avatar_variant_urls(
+    avatar_url: str | None, sizes: list[int]
+) -> dict[str, dict[str, str]] | None:
+    """
+    Get the per-size variant URLs of an avatar.
+
+    Args:
+        avatar_url: Stored avatar URL (largest WebP variant)
+        sizes: Variant sizes
+
+    Returns:
+        {"32": {"webp": url, "jpeg": url}, ...}, or None if the avatar is
+        missing or predates variants
+    """
+    digest = variant_digest(avatar_url) if avatar_url else None
+    if digest is None:
+        return None
+    return {
+        str(size): {
+            key: variant_path(digest, size, extension)
+            for extension, key in _FORMAT_KEYS.items()
+        }
+        for size in sizes
+    }
+
+
+def _encode(image: Image.Image, extension: str) -> bytes:
+    """Encode a square RGBA variant, JPEG flattened onto white."""
+    buffer = io.BytesIO()
+    if extension == "jpg":
+        flat = Image.new("RGB", image.size, (255, 255, 255))
+        flat.paste(image, mask=image.getchannel("A"))
+        flat.save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    else:
+        image.save(buffer, AVATAR_FORMATS[extension], quality=WEBP_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def render_avatar_variants(
+    content: bytes, sizes: list[int], max_pixels: int
+) -> dict[str, bytes]:
+    """
+    Decode an image once and render every avatar variant.
+
+    The image is rotated per its EXIF orientation, center-cropped to a
+    square and resized from the largest variant down. Only pixels are
+    kept: no EXIF, GPS, comments or color profile reach the variants.
+    Animated images use their first frame.
+
+    Args:
+        content: Uploaded image bytes
+        sizes: Square variant sizes in pixels
+        max_pixels: Largest width x height accepted for decoding
+
+    Returns:
+        Dict mapping variant file names ("32.webp", "32.jpg", ...) to bytes
+
+    Raises:
+        ValueError: If the image cannot be decoded or is too large
+    """
+    try:
+        with Image.open(io.BytesIO(content)) as source:
+            if source.width * source.height > max_pixels:
+                raise ValueError("Image dimensions are too large")
+            image = ImageOps.exif_transpose(source).convert("RGBA")
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise ValueError("Could not decode image") from e
+
+    largest = max(sizes)
+    square = ImageOps.fit(image, (largest, largest), Image.Resampling.LANCZOS)
+    square.info = {}
+
+    variants: dict[str, bytes] = {}
+    for size in sorted(sizes, reverse=True):
+        variant = (
+            square
+            if size == largest
+            else square.resize((size, size), Image.Resampling.LANCZOS)
+        )
+        for extension in AVATAR_FORMATS:
+            variants[f"{size}.{extension}"] = _encode(variant, extension)
+    return variants
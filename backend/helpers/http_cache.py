@@ -0,0 +1,266 @@
+"""
+HTTP caching helpers for public GET endpoints.
+
+Builds version-based ETags from the cache_versions change counters,
+answers conditional requests with 304 Not Modified, and serves response
+bodies from an in-process rendered cache. Routers pass the cache in
+(services.response_cache_service.ResponseCacheService), so this module
+does not depend on the service layer. Content-addressed uploads (avatar
+variants) are served as immutable.
+"""
+
+import hashlib
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Protocol
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.staticfiles import StaticFiles
+from sqlalchemy.orm import Session
+from starlette.types import Scope
+
+from helpers.avatar_images import variant_digest
+from helpers.language import parse_accept_language
+from helpers.serialization import dump_json, type_adapter
+from models.config import settings
+
+# Content-addressed files never change under the same URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ResponseCache(Protocol):
+    """Version counters and rendered-bodies cache used by the responses."""
+
+    def get_versions(
+        self, db: Session, entities: Iterable[str]
+    ) -> dict[str, tuple[int, datetime | None]]: ...
+
+    def get_rendered(self, etag: str) -> bytes | None: ...
+
+    def store_rendered(
+        self, etag: str, body: bytes, entities: Iterable[str]
+    ) -> None: ...
+
+
+def _cache_control(public: bool) -> str:
+    """Build the Cache-Control header value."""
+    if not public:
+        return "private, no-cache"
+    return (
+        f"public, max-age={settings.RESPONSE_CACHE_MAX_AGE_SECONDS}, "
+        f"stale-while-revalidate={settings.RESPONSE_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+    )
+
+
+def _is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None
+) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since (RFC 9110 precedence).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag
+        last_modified: Current Last-Modified (UTC, naive or aware)
+
+    Returns:
+        True if the client's copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: ignore W/ prefixes
+        current = etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == current
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+        return modified <= since
+    return False
+
+
+def _conditional_headers(
+    request: Request,
+    cache: ResponseCache,
+    db: Session | None,
+    entities: tuple[str, ...],
+    version_key: str,
+) -> tuple[str, dict[str, str], bool]:
+    """
+    Compute the ETag and caching headers of a response.
+
+    The ETag covers the path, query string, preferred language and the
+    current versions of ``entities``, so it changes exactly when a write
+    to those entities commits. Requests carrying an Authorization header
+    get the same ETag but a private Cache-Control, keeping per-user
+    responses out of shared caches.
+
+    Args:
+        request: Incoming request
+        cache: Response cache holding the versions
+        db: Database session (may be None when entities is empty)
+        entities: Sorted entity groups the response depends on
+        version_key: Extra version component
+
+    Returns:
+        Tuple of (etag, headers, whether the client's copy is current)
+    """
+    versions = cache.get_versions(db, entities) if entities else {}
+    language = parse_accept_language(request.headers.get("accept-language", ""))
+    key = "|".join(
+        [
+            request.url.path,
+            str(sorted(request.query_params.multi_items())),
+            language,
+            version_key,
+            *(f"{entity}:{versions[entity][0]}" for entity in entities),
+        ]
+    )
+    etag = f'W/"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+    modified_times = [ts for _, ts in versions.values() if ts is not None]
+    last_modified = max(modified_times) if modified_times else None
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": _cache_control("authorization" not in request.headers),
+        "Vary": "Accept-Language, Authorization",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.replace(tzinfo=timezone.utc), usegmt=True
+        )
+    return etag, headers, _is_not_modified(request, etag, last_modified)
+
+
+def cached_json_response(
+    request: Request,
+    cache: ResponseCache,
+    db: Session | None,
+    entities: Iterable[str],
+    render: Callable[[], Any],
+    response_model: Any,
+    version_key: str = "",
+    row_type: Any = None,
+) -> Response:
+    """
+    Serve a JSON GET response with ETag revalidation and body caching.
+
+    Args:
+        request: Incoming request
+        cache: Response cache (ResponseCacheService)
+        db: Database session (may be None when entities is empty)
+        entities: Entity groups the response depends on
+        render: Callable producing the response data on a cache miss
+        response_model: Type used to validate and serialize the data
+        version_key: Extra version component for data not tracked in
+            cache_versions (e.g. the platform config fingerprint)
+        row_type: Type of the rows ``render`` returns when it builds them
+            in the response shape (e.g. list[IdeaWithScoreRow]); they are
+            then serialized directly (see helpers.serialization)
+
+    Returns:
+        200 response with the JSON body, or 304 Not Modified
+    """
+
+    def render_body() -> bytes:
+        if row_type is not None:
+            return dump_json(render(), row_type, response_model)
+        adapter = type_adapter(response_model)
+        data = adapter.validate_python(render(), from_attributes=True)
+        return adapter.dump_json(data)
+
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return Response(render_body(), media_type="application/json")
+
+    entities = tuple(sorted(set(entities)))
+    etag, headers, not_modified = _conditional_headers(
+        request, cache, db, entities, version_key
+    )
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    body = cache.get_rendered(etag)
+    if body is None:
+        body = render_body()
+        cache.store_rendered(etag, body, entities)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def cached_stream_response(
+    request: Request,
+    cache: ResponseCache,
+    db: Session | None,
+    entities: Iterable[str],
+    render: Callable[[], Iterator[bytes]],
+    media_type: str,
+    version_key: str = "",
+) -> Response:
+    """
+    Serve a streamed GET response with ETag revalidation and body caching.
+
+    On a cache miss the body is streamed chunk by chunk as ``render``
+    produces it, and stored in the rendered cache once complete; later
+    requests for the same versions are answered from memory.
+
+    Args:
+        request: Incoming request
+        cache: Response cache (ResponseCacheService)
+        db: Database session (may be None when entities is empty)
+        entities: Entity groups the response depends on
+        render: Callable returning an iterator of body chunks
+        media_type: Response content type
+        version_key: Extra version component
+
+    Returns:
+        Streaming or cached 200 response, or 304 Not Modified
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return StreamingResponse(render(), media_type=media_type)
+
+    entities = tuple(sorted(set(entities)))
+    etag, headers, not_modified = _conditional_headers(
+        request, cache, db, entities, version_key
+    )
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    body = cache.get_rendered(etag)
+    if body is not None:
+        return Response(body, media_type=media_type, headers=headers)
+
+    def stream() -> Iterator[bytes]:
+        chunks: list[bytes] = []
+        for chunk in render():
+            chunks.append(chunk)
+            yield chunk
+        cache.store_rendered(etag, b"".join(chunks), entities)
+
+    return StreamingResponse(stream(), media_type=media_type, headers=headers)
+
+
+class UploadStaticFiles(StaticFiles):
+    """Static uploads; avatar variants (named by content hash) are immutable."""
+
+    def file_response(
+        self,
+        full_path: Any,
+        stat_result: Any,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serve a file, marking content-addressed avatar variants immutable."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if variant_digest(scope["path"]) is not None:
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,194 @@
+"""
+Local store of breached-password hashes (Have I Been Pwned).
+
+The Pwned Passwords dump ("SHA1:COUNT" lines, uppercase hex) is imported
+into a SQLite file keyed like the HIBP range API: the first 5 hex
+characters of the SHA-1, then the remaining 35.
+
+    pwned_hashes(prefix, suffix, count) PRIMARY KEY (prefix, suffix)
+
+The table is WITHOUT ROWID, so a lookup is a single B-tree probe in a
+local file (microseconds) instead of an HTTPS round trip, and no password
+hash ever leaves the server. Recent lookups are kept in an LRU in front
+of the file.
+
+The file is written once by scripts/import_pwned_passwords.py and only
+read by the application, so it is opened read-only and immutable (no
+locking). An import builds a new file and renames it into place; worker
+processes keep reading the file they opened until restarted.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+from loguru import logger
+
+PREFIX_LENGTH = 5
+SHA1_HEX_LENGTH = 40
+
+
+def sha1_hex(password: str) -> str:
+    """Uppercase SHA-1 of a password, as used by HIBP (not for security)."""
+    return hashlib.sha1(password.encode(), usedforsecurity=False).hexdigest().upper()
+
+
+class PwnedPasswordStore:
+    """Read-only lookups in an imported Pwned Passwords file."""
+
+    def __init__(self, path: str, cache_size: int = 4096):
+        """
+        Args:
+            path: SQLite file written by import_pwned_passwords
+            cache_size: Lookups kept in the LRU
+        """
+        self.path = path
+        self._local = threading.local()
+        self._cached_count = lru_cache(maxsize=cache_size)(self._query_count)
+
+    @property
+    def available(self) -> bool:
+        """Whether a store has been imported at the configured path."""
+        return Path(self.path).is_file()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Read-only connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            uri = f"{Path(self.path).resolve().as_uri()}?mode=ro&immutable=1"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def _query_count(self, sha1_hash: str) -> int:
+        """Breach count of a hash read from the file (0 if absent)."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT count FROM pwned_hashes WHERE prefix = ? AND suffix = ?",
+                (sha1_hash[:PREFIX_LENGTH], sha1_hash[PREFIX_LENGTH:]),
+            )
+            .fetchone()
+        )
+        return row[0] if row else 0
+
+    def lookup(self, sha1_hash: str) -> int | None:
+        """
+        Get how often a password hash appears in breaches.
+
+        Args:
+            sha1_hash: Uppercase SHA-1 hex digest (see sha1_hex)
+
+        Returns:
+            Breach count (0 if not breached), or None if no store is
+            imported or it cannot be read
+        """
+        if not self.available:
+            return None
+        try:
+            return self._cached_count(sha1_hash)
+        except sqlite3.Error as e:
+            logger.warning(f"Pwned passwords store error: {e}")
+            return None
+
+    def cache_info(self):
+        """LRU statistics (hits, misses, maxsize, currsize)."""
+        return self._cached_count.cache_info()
+
+
+_store: PwnedPasswordStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_pwned_password_store(path: str, cache_size: int) -> PwnedPasswordStore:
+    """
+    Get the process-wide store, reopened if its path changed.
+
+    Args:
+        path: SQLite file of the store
+        cache_size: Lookups kept in the LRU
+
+    Returns:
+        The shared PwnedPasswordStore
+    """
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = PwnedPasswordStore(path, cache_size)
+        return _store
+
+
+def _parse_dump_line(line: str) -> tuple[str, str, int] | None:
+    """Split a "SHA1:COUNT" dump line into (prefix, suffix, count)."""
+    sha1_hash, _, count = line.strip().partition(":")
+    if len(sha1_hash) != SHA1_HEX_LENGTH or not count.isdigit():
+        return None
+    sha1_hash = sha1_hash.upper()
+    return sha1_hash[:PREFIX_LENGTH], sha1_hash[PREFIX_LENGTH:], int(count)
+
+
+def import_pwned_dump(
+    lines: Iterable[str],
+    path: str,
+    min_count: int = 1,
+    batch_size: int = 100_000,
+) -> dict[str, int]:
+    """
+    Build a store file from a Pwned Passwords dump.
+
+    The store is written to a temporary file next to path and renamed
+    over it at the end, so a failed import leaves the previous store.
+
+    Args:
+        lines: "SHA1:COUNT" lines (the downloaded dump or a fixture)
+        path: Store file to create or replace
+        min_count: Skip hashes seen fewer times (shrinks the file)
+        batch_size: Rows inserted per executemany call
+
+    Returns:
+        Counts of imported, skipped (below min_count) and invalid lines
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.tmp")
+    staging.unlink(missing_ok=True)
+
+    counts = {"imported": 0, "skipped": 0, "invalid": 0}
+    conn = sqlite3.connect(staging)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(
+            "CREATE TABLE pwned_hashes ("
+            "prefix TEXT NOT NULL, suffix TEXT NOT NULL, count INTEGER NOT NULL, "
+            "PRIMARY KEY (prefix, suffix)) WITHOUT ROWID"
+        )
+        insert = "INSERT OR REPLACE INTO pwned_hashes VALUES (?, ?, ?)"
+        batch: list[tuple[str, str, int]] = []
+        for line in lines:
+            row = _parse_dump_line(line)
+            if row is None:
+                counts["invalid"] += 1
+                continue
+            if row[2] < min_count:
+                counts["skipped"] += 1
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                conn.executemany(insert, batch)
+                counts["imported"] += len(batch)
+                batch.clear()
+        conn.executemany(insert, batch)
+        counts["imported"] += len(batch)
+        conn.commit()
+    except BaseException:
+        conn.close()
+        staging.unlink(missing_ok=True)
+        raise
+    conn.close()
+    os.replace(staging, target)
+    return counts
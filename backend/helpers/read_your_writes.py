@@ -0,0 +1,86 @@
+"""
+Read-your-writes middleware for read-replica routing.
+
+After a client writes (votes, comments, submits an idea...), its reads are
+pinned to the primary for DB_READ_YOUR_WRITES_SECONDS so it never sees a
+replica that has not replayed its own write yet. The pin travels in a
+short-lived cookie, so it holds across workers.
+
+Pure ASGI, like RequestContextMiddleware: the app runs in the same task, so
+the primary-reads flag set here is seen by the endpoint's session.
+"""
+
+from starlette.requests import cookie_parser
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from models.config import settings
+from repositories.database import force_primary_reads, reset_primary_reads
+
+READ_YOUR_WRITES_COOKIE = "ocv_primary"
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+_COOKIE_HEADER = b"cookie"
+
+
+def _build_set_cookie_header() -> tuple[bytes, bytes]:
+    """Build the Set-Cookie header marking a recent writer."""
+    response = Response()
+    response.set_cookie(
+        READ_YOUR_WRITES_COOKIE,
+        "1",
+        max_age=settings.DB_READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax",
+        secure=settings.ENVIRONMENT == "production",
+    )
+    return next(header for header in response.raw_headers if header[0] == b"set-cookie")
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin recent writers' reads to the primary database.
+
+    Only installed when read replicas are configured.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+        self.set_cookie_header = _build_set_cookie_header()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Force primary reads for recent writers and mark new writes."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        pinned = any(
+            name == _COOKIE_HEADER
+            and READ_YOUR_WRITES_COOKIE in cookie_parser(value.decode("latin-1"))
+            for name, value in scope["headers"]
+        )
+        is_write = scope["method"] in _WRITE_METHODS
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                is_write
+                and message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    self.set_cookie_header,
+                ]
+            await send(message)
+
+        token = force_primary_reads(pinned)
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            reset_primary_reads(token)
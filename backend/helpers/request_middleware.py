@@ -0,0 +1,149 @@
+"""
+Request context middleware.
+
+One pure-ASGI middleware covering what every request needs: correlation
+ID, security headers, response timing, access logging and request
+metrics. Unlike
+BaseHTTPMiddleware it does not run the app in a separate task or wrap the
+response body in a memory stream, so streaming responses pass through
+untouched and the per-request overhead is a header rewrite.
+"""
+
+import random
+import time
+
+import sentry_sdk
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core import metrics, query_tracking
+from core.correlation import generate_correlation_id, set_correlation_id
+from helpers.security_headers import DEFAULT_CACHE_CONTROL, build_security_headers
+from models.config import settings
+
+_CORRELATION_HEADER = b"x-correlation-id"
+_CACHE_CONTROL_HEADER = b"cache-control"
+
+
+class RequestContextMiddleware:
+    """
+    Correlation ID, security headers, timing and sampled access logs.
+
+    - Reuses the client's X-Correlation-ID (or generates one), exposes it
+      to logs and Sentry, and echoes it in the response.
+    - Adds the security headers (built once) and a no-store Cache-Control
+      when the endpoint did not set one.
+    - Adds X-Response-Time (time until the response headers were sent).
+    - Logs one access line for ACCESS_LOG_SAMPLE_RATE of requests, and
+      always for server errors and requests slower than
+      SLOW_REQUEST_THRESHOLD. Log sinks are queued (see
+      core.logging_config), so logging never blocks the event loop.
+    - Records latency and DB query count/time per route template when
+      METRICS_ENABLED (see core.metrics).
+    - Flags statements repeated within the request (likely N+1) when
+      QUERY_REPEAT_ACTION is set (see core.query_tracking).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+        self.security_headers = build_security_headers()
+        self.security_header_names = frozenset(
+            name for name, _ in self.security_headers
+        )
+        self.default_cache_control = (
+            _CACHE_CONTROL_HEADER,
+            DEFAULT_CACHE_CONTROL.encode(),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        correlation_id = ""
+        for name, value in scope["headers"]:
+            if name == _CORRELATION_HEADER:
+                correlation_id = value.decode("latin-1")
+                break
+        correlation_id = correlation_id or generate_correlation_id()
+        # Left set after the request: exception handlers run outside this
+        # middleware and report the ID
+        set_correlation_id(correlation_id)
+        sentry_sdk.set_tag("correlation_id", correlation_id)
+
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    header
+                    for header in message.get("headers", ())
+                    if header[0] not in self.security_header_names
+                ]
+                headers.extend(self.security_headers)
+                if not any(name == _CACHE_CONTROL_HEADER for name, _ in headers):
+                    headers.append(self.default_cache_control)
+                headers.append((_CORRELATION_HEADER, correlation_id.encode()))
+                headers.append(
+                    (
+                        b"x-response-time",
+                        f"{time.perf_counter() - start:.3f}s".encode(),
+                    )
+                )
+                message["headers"] = headers
+            await send(message)
+
+        metrics_token = metrics.start_request() if settings.METRICS_ENABLED else None
+        tracking_token = query_tracking.start_request()
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            duration = time.perf_counter() - start
+            route = getattr(scope.get("route"), "path", metrics.UNMATCHED_ROUTE)
+            if metrics_token is not None:
+                metrics.finish_request(
+                    metrics_token, scope["method"], route, status_code, duration
+                )
+            if tracking_token is not None:
+                query_tracking.finish_request(tracking_token, scope["method"], route)
+            self._log(scope, status_code, duration)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, duration: float) -> None:
+        """Write the access log line and the slow request warning."""
+        slow = duration > settings.SLOW_REQUEST_THRESHOLD
+        if not (
+            slow
+            or status_code >= 500
+            or random.random() < settings.ACCESS_LOG_SAMPLE_RATE
+        ):
+            return
+
+        client = scope.get("client")
+        logger.info(
+            "{method} {path} status={status} duration={duration:.3f}s from {client}",
+            method=scope["method"],
+            path=scope["path"],
+            status=status_code,
+            duration=duration,
+            client=client[0] if client else "unknown",
+        )
+        if slow:
+            logger.warning(
+                "Slow request: {method} {path} took {duration:.2f}s "
+                "(threshold: {threshold}s)",
+                method=scope["method"],
+                path=scope["path"],
+                duration=duration,
+                threshold=settings.SLOW_REQUEST_THRESHOLD,
+            )
@@ -1,23 +1,22 @@
 """
-Security headers middleware for FastAPI.
+Security headers for API responses.
 
-Adds standard security headers to all responses to protect against
-common web vulnerabilities.
+Standard security headers protecting against common web vulnerabilities.
+They only depend on settings, so they are built once and added to every
+response by RequestContextMiddleware (see helpers.request_middleware).
 """
 
-from collections.abc import Awaitable, Callable
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-
 from models.config import settings
 
+# Cache-Control for API responses without one (no caching by default)
+DEFAULT_CACHE_CONTROL = "no-store, max-age=0"
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+def build_security_headers() -> list[tuple[bytes, bytes]]:
     """
-    Middleware that adds security headers to all responses.
+    Build the security headers added to all responses.
 
-    Headers added:
+    Headers:
     - X-Content-Type-Options: Prevents MIME type sniffing
     - X-Frame-Options: Prevents clickjacking attacks
     - X-XSS-Protection: Legacy XSS protection (for older browsers)
@@ -25,28 +24,21 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Permissions-Policy: Restricts browser features
     - Content-Security-Policy: Restricts resource loading
     - Strict-Transport-Security: Forces HTTPS (in production)
-    """
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Add security headers to the response."""
-        response = await call_next(request)
 
+    Returns:
+        Raw ASGI (name, value) header pairs, names lowercased
+    """
+    headers = {
         # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
+        "x-content-type-options": "nosniff",
         # Prevent clickjacking - allow same origin framing
-        response.headers["X-Frame-Options"] = "SAMEORIGIN"
-
+        "x-frame-options": "SAMEORIGIN",
         # Legacy XSS protection for older browsers
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
+        "x-xss-protection": "1; mode=block",
         # Control referrer information
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
+        "referrer-policy": "strict-origin-when-cross-origin",
         # Restrict browser features
-        response.headers["Permissions-Policy"] = (
+        "permissions-policy": (
             "accelerometer=(), "
             "camera=(), "
             "geolocation=(), "
@@ -55,12 +47,11 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "microphone=(), "
             "payment=(), "
             "usb=()"
-        )
-
+        ),
         # Content Security Policy
         # Allow self for scripts/styles, and data URIs for images
         # Adjust based on your frontend requirements
-        response.headers["Content-Security-Policy"] = (
+        "content-security-policy": (
             "default-src 'self'; "
             "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
             "style-src 'self' 'unsafe-inline'; "
@@ -68,18 +59,14 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "font-src 'self' data:; "
             "connect-src 'self'; "
             "frame-ancestors 'self'"
+        ),
+    }
+
+    # HSTS - only in production with HTTPS
+    # max-age=31536000 = 1 year
+    if settings.ENVIRONMENT == "production":
+        headers["strict-transport-security"] = (
+            "max-age=31536000; includeSubDomains; preload"
         )
 
-        # HSTS - only in production with HTTPS
-        # max-age=31536000 = 1 year
-        if settings.ENVIRONMENT == "production":
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
-
-        # Cache-Control for API responses (no caching by default)
-        # Static files handled separately by StaticFiles
-        if "Cache-Control" not in response.headers:
-            response.headers["Cache-Control"] = "no-store, max-age=0"
-
-        return response
+    return [(name.encode(), value.encode()) for name, value in headers.items()]
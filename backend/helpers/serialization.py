@@ -0,0 +1,72 @@
+"""
+Lean JSON serialization for hot list endpoints.
+
+FastAPI validates whatever an endpoint returns against its response_model
+and then serializes the validated copy. For list endpoints that already
+build their data in the exact response shape, that round trip costs as
+much as the SQL. The helpers here serialize rows (TypedDicts) or already
+validated models straight to JSON bytes with a cached Pydantic
+TypeAdapter, and return a Response, which FastAPI passes through
+untouched. The response_model stays on the route for the OpenAPI schema.
+
+Outside production the data is still validated against the response
+model, so a row builder drifting from the public schema fails the tests.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from models.config import settings
+
+
+@lru_cache(maxsize=64)
+def type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Get a cached TypeAdapter for a type."""
+    return TypeAdapter(tp)
+
+
+def dump_json(content: Any, content_type: Any, response_model: Any = None) -> bytes:
+    """
+    Serialize data to JSON bytes without building response models.
+
+    Args:
+        content: Rows or models to serialize
+        content_type: Type describing ``content`` (e.g. list[IdeaWithScoreRow])
+        response_model: Public schema ``content`` must match; checked
+            outside production only
+
+    Returns:
+        JSON body
+    """
+    if response_model is not None and settings.ENVIRONMENT != "production":
+        type_adapter(response_model).validate_python(content)
+    return type_adapter(content_type).dump_json(content)
+
+
+def lean_json_response(
+    content: Any,
+    content_type: Any,
+    response_model: Any = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Build a JSON response that skips FastAPI's response_model round trip.
+
+    Args:
+        content: Rows or models to serialize
+        content_type: Type describing ``content``
+        response_model: Public schema ``content`` must match (validated
+            outside production only)
+        headers: Extra response headers
+
+    Returns:
+        JSON response
+    """
+    return Response(
+        dump_json(content, content_type, response_model),
+        media_type="application/json",
+        headers=headers,
+    )
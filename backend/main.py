@@ -2,8 +2,6 @@
 # E402 disabled: load_dotenv() must run before other imports for Sentry DSN
 
 import os
-import time
-from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -12,24 +10,20 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import sentry_sdk
-from fastapi import FastAPI, Request, Response, status
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
 from loguru import logger
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from starlette.middleware.base import BaseHTTPMiddleware
 
-from core.correlation import (
-    generate_correlation_id,
-    get_correlation_id,
-    set_correlation_id,
-)
+from core.correlation import generate_correlation_id, get_correlation_id
 from core.logging_config import configure_logging
 from core.sentry_config import init_sentry
+from helpers.http_cache import UploadStaticFiles
 from helpers.rate_limiter import limiter
-from helpers.security_headers import SecurityHeadersMiddleware
+from helpers.read_your_writes import ReadYourWritesMiddleware
+from helpers.request_middleware import RequestContextMiddleware
 from models.config import settings
 from models.exceptions import (
     AdminNoteNotFoundException,
@@ -75,7 +69,7 @@ from routers import (
 init_sentry()
 
 # Configure logging with Loguru
-configure_logging(os.getenv("ENVIRONMENT", "development"))
+configure_logging(os.getenv("ENVIRONMENT", "development"), enqueue=settings.LOG_ENQUEUE)
 
 
 def check_schema_version() -> None:
@@ -89,9 +83,7 @@ def check_schema_version() -> None:
     from repositories.database import SessionLocal
 
     # Expected latest migration revision (update when adding new migrations)
-    EXPECTED_REVISION = (
-        "g0im99j86k1h"  # add_password_reset_tokens  # pragma: allowlist secret
-    )
+    EXPECTED_REVISION = "o8qu77r34s9p"  # add_tag_stats  # pragma: allowlist secret
 
     db = SessionLocal()
     try:
@@ -117,62 +109,6 @@ def check_schema_version() -> None:
         db.close()
 
 
-import asyncio
-
-# Security monitoring shutdown flag
-_security_monitor_shutdown = False
-
-
-async def _security_monitoring_task():
-    """
-    Background task for security monitoring.
-
-    Runs every 15 minutes to check for suspicious patterns.
-    Required by Law 25 Article 3.5 for breach detection.
-    """
-    from repositories.database import SessionLocal
-    from services.security_audit_service import SecurityAuditService
-    from services.incident_service import IncidentService
-    from services.notification_service import NotificationService
-    from models.notification_types import NotificationType
-    import json
-
-    while not _security_monitor_shutdown:
-        try:
-            db = SessionLocal()
-            try:
-                alerts = SecurityAuditService.detect_suspicious_patterns(db)
-
-                if alerts:
-                    logger.warning(f"Security monitoring detected {len(alerts)} alerts")
-
-                    for alert in alerts:
-                        if alert.get("severity") == "critical":
-                            # Auto-create incident for critical alerts
-                            IncidentService.create_incident(
-                                db=db,
-                                incident_type="suspicious_activity",
-                                severity="high",
-                                title=f"Automated alert: {alert.get('type')}",
-                                description=json.dumps(alert, indent=2),
-                            )
-
-                            # Send immediate notification
-                            NotificationService.send_fire_and_forget(
-                                NotificationType.CRITICAL,
-                                f"SECURITY: {alert.get('type')}",
-                                json.dumps(alert),
-                                priority_override="max",
-                            )
-            finally:
-                db.close()
-        except Exception as e:
-            logger.error(f"Security monitoring error: {e}")
-
-        # Wait 15 minutes before next check
-        await asyncio.sleep(15 * 60)
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler.
@@ -180,11 +116,9 @@ async def lifespan(app: FastAPI):
     - Verify database schema version matches expected migration.
     - Optionally create tables when `AUTO_CREATE_DB` is enabled (development).
     - Verify and rebuild search index if needed.
-    - Start background security monitoring task.
+    - Start the background job scheduler (incl. security monitoring).
     - Place other startup/shutdown tasks here.
     """
-    global _security_monitor_shutdown
-
     # Check schema version first
     check_schema_version()
 
@@ -218,12 +152,26 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize search service: {e}")
 
-    # Start security monitoring background task
-    _security_monitor_shutdown = False
-    security_task = asyncio.create_task(_security_monitoring_task())
-    logger.info("Security monitoring background task started")
+    # Load the reference data snapshot (categories, qualities, popular tags)
+    # so the first requests don't pay for it. Tests use their own databases.
+    if settings.ENVIRONMENT != "test":
+        try:
+            from repositories.database import SessionLocal
+            from services.reference_data_service import ReferenceDataService
+
+            db = SessionLocal()
+            try:
+                ReferenceDataService.load(db)
+                logger.info("Reference data snapshot loaded")
+            finally:
+                db.close()
+        except Exception as e:
+            logger.error(f"Failed to load reference data: {e}")
 
-    # Start retention scheduler (Law 25 Phase 3)
+    # Start the job scheduler: retention (Law 25 Phase 3), security
+    # monitoring and maintenance jobs, run by one leader worker
+    from core.crypto_executor import shutdown_crypto_executor
+    from core.image_executor import shutdown_image_executor
     from core.scheduler import setup_scheduler, shutdown_scheduler
 
     if settings.ENVIRONMENT != "test":
@@ -232,18 +180,12 @@ async def lifespan(app: FastAPI):
     try:
         yield
     finally:
-        # Shutdown retention scheduler
+        # Shutdown job scheduler (hands leadership to another worker)
         if settings.ENVIRONMENT != "test":
             shutdown_scheduler()
 
-        # Signal security monitoring to stop
-        _security_monitor_shutdown = True
-        security_task.cancel()
-        try:
-            await security_task
-        except asyncio.CancelledError:
-            pass
-        logger.info("Security monitoring background task stopped")
+        shutdown_crypto_executor()
+        shutdown_image_executor()
 
 
 def _get_api_title() -> str:
@@ -263,76 +205,13 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
-    """Inject correlation ID into request context and Sentry."""
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Process request with correlation ID tracking."""
-        # Check for incoming correlation ID (from frontend)
-        correlation_id = (
-            request.headers.get("X-Correlation-ID") or generate_correlation_id()
-        )
-        set_correlation_id(correlation_id)
-
-        # Add to Sentry context
-        sentry_sdk.set_tag("correlation_id", correlation_id)
-
-        response = await call_next(request)
-
-        # Include in response headers
-        response.headers["X-Correlation-ID"] = correlation_id
-
-        return response
-
+# Correlation ID, security headers, timing and access logging in a single
+# pure-ASGI layer (wrapped by CORS, added below)
+app.add_middleware(RequestContextMiddleware)
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Log all incoming requests with performance monitoring."""
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Process request and log timing information."""
-        start_time = time.perf_counter()
-
-        # Log request
-        client_host = request.client.host if request.client else "unknown"
-        logger.info(f"Request: {request.method} {request.url.path} from {client_host}")
-
-        response = await call_next(request)
-
-        # Calculate duration
-        duration = time.perf_counter() - start_time
-
-        # Log response
-        logger.info(
-            f"Response: {request.method} {request.url.path} "
-            f"status={response.status_code} duration={duration:.3f}s"
-        )
-
-        # Warn on slow requests (configurable threshold)
-        if duration > settings.SLOW_REQUEST_THRESHOLD:
-            logger.warning(
-                f"Slow request: {request.method} {request.url.path} "
-                f"took {duration:.2f}s (threshold: {settings.SLOW_REQUEST_THRESHOLD}s)"
-            )
-
-        # Add response time header for monitoring
-        response.headers["X-Response-Time"] = f"{duration:.3f}s"
-
-        return response
-
-
-# Add security headers middleware (runs last, so added first)
-# Note: Middleware runs in reverse order - security headers should wrap everything
-app.add_middleware(SecurityHeadersMiddleware)
-
-# Add correlation ID middleware (runs after security, before logging)
-app.add_middleware(CorrelationIdMiddleware)
-
-# Add request logging middleware
-app.add_middleware(RequestLoggingMiddleware)
+# Pin recent writers' reads to the primary when read replicas are in use
+if settings.DATABASE_REPLICA_URLS:
+    app.add_middleware(ReadYourWritesMiddleware)
 
 # Configure CORS from environment settings
 # In development, allow all origins for mobile/network testing
@@ -348,10 +227,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files directory for avatars
+# Mount static files directory for avatars (content-addressed avatar
+# variants are served as immutable)
 uploads_dir = Path("data/uploads")
 uploads_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/data/uploads", StaticFiles(directory="data/uploads"), name="uploads")
+app.mount("/data/uploads", UploadStaticFiles(directory="data/uploads"), name="uploads")
 
 
 # Global unhandled exception handler (returns generic 500 and logs details)
@@ -876,8 +756,12 @@ _register_trusted_device_handlers(app)
 
 
 def _register_rate_limit_handler(app_instance: FastAPI) -> None:
-    """Register rate limit exception handler with late import."""
-    from models.exceptions import RateLimitExceededException
+    """Register rate limit and executor busy exception handlers with late import."""
+    from models.exceptions import (
+        CryptoBusyException,
+        ImageBusyException,
+        RateLimitExceededException,
+    )
 
     @app_instance.exception_handler(RateLimitExceededException)
     async def rate_limit_exceeded_handler(
@@ -899,6 +783,34 @@ def _register_rate_limit_handler(app_instance: FastAPI) -> None:
             headers=headers,
         )
 
+    @app_instance.exception_handler(CryptoBusyException)
+    async def crypto_busy_handler(
+        request: Request, exc: CryptoBusyException
+    ) -> JSONResponse:
+        """Handle a hashing call refused by crypto executor admission control."""
+        logger.warning(
+            "Crypto executor saturated, request refused", path=str(request.url.path)
+        )
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exc.message, "correlation_id": exc.correlation_id},
+            headers={"Retry-After": str(settings.CRYPTO_RETRY_AFTER_SECONDS)},
+        )
+
+    @app_instance.exception_handler(ImageBusyException)
+    async def image_busy_handler(
+        request: Request, exc: ImageBusyException
+    ) -> JSONResponse:
+        """Handle an image job refused by image executor admission control."""
+        logger.warning(
+            "Image executor saturated, request refused", path=str(request.url.path)
+        )
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exc.message, "correlation_id": exc.correlation_id},
+            headers={"Retry-After": str(settings.IMAGE_RETRY_AFTER_SECONDS)},
+        )
+
 
 # Register rate limit handler
 _register_rate_limit_handler(app)
@@ -1434,6 +1346,11 @@ from routers import password_reset_router
 
 app.include_router(password_reset_router.router, prefix="/api")
 
+# Prometheus metrics, served at /metrics (outside /api, where scrapers look)
+from routers import metrics_router
+
+app.include_router(metrics_router.router)
+
 
 @app.get("/")
 def root() -> dict:
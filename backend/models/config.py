@@ -1,9 +1,9 @@
 import os
 import sys
-from typing import List
+from typing import Annotated, List, Literal
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 def _should_load_env_file() -> str | None:
@@ -73,6 +73,46 @@ class Settings(BaseSettings):
         description="Recycle connections after N seconds (30 min default)",
     )
 
+    # Read replicas (PostgreSQL): read-only routes may use these
+    DATABASE_REPLICA_URLS: Annotated[List[str], NoDecode] = Field(
+        default=[],
+        description="Read-replica database URLs (comma-separated in env var)",
+    )
+    DB_REPLICA_MAX_LAG_SECONDS: float = Field(
+        default=5.0,
+        description="Skip replicas lagging more than this behind the primary",
+    )
+    DB_REPLICA_LAG_CHECK_SECONDS: float = Field(
+        default=10.0,
+        description="How often each worker re-measures replica lag",
+    )
+    DB_READ_YOUR_WRITES_SECONDS: int = Field(
+        default=15,
+        description="After a write, route that client's reads to the primary this long",
+    )
+
+    # SQLite production profile (applied to every new connection)
+    SQLITE_JOURNAL_MODE: str = Field(
+        default="WAL",
+        description="SQLite journal_mode pragma (WAL lets readers run during writes)",
+    )
+    SQLITE_SYNCHRONOUS: str = Field(
+        default="NORMAL",
+        description="SQLite synchronous pragma (NORMAL is durable enough with WAL)",
+    )
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(
+        default=5000,
+        description="Milliseconds a writer waits for the SQLite write lock",
+    )
+    SQLITE_CACHE_SIZE_KB: int = Field(
+        default=20000,
+        description="SQLite page cache per connection, in KiB",
+    )
+    SQLITE_MMAP_SIZE: int = Field(
+        default=268435456,
+        description="Bytes of the SQLite database file to memory-map (0 disables)",
+    )
+
     # Safety: avoid creating DB schema automatically unless explicitly enabled.
     AUTO_CREATE_DB: bool = Field(
         default=False,
@@ -84,6 +124,169 @@ class Settings(BaseSettings):
         default=1.0,
         description="Log warning for requests slower than this (seconds)",
     )
+    ACCESS_LOG_SAMPLE_RATE: float = Field(
+        default=0.1,
+        description="Fraction of requests written to the access log (0-1); "
+        "server errors and slow requests are always logged",
+    )
+    LOG_ENQUEUE: bool = Field(
+        default=True,
+        description="Write logs from a background thread so logging never blocks requests",
+    )
+
+    # N+1 detection (see core.query_tracking)
+    QUERY_REPEAT_THRESHOLD: int = Field(
+        default=10,
+        description="Executions of the same statement in one request that "
+        "count as a likely N+1",
+    )
+    QUERY_REPEAT_ACTION: Literal["off", "log", "raise"] = Field(
+        default="off",
+        description="On a likely N+1: off, log a warning, or raise "
+        "(raise is downgraded to log in production)",
+    )
+
+    # Prometheus metrics (see core.metrics)
+    METRICS_ENABLED: bool = Field(
+        default=True,
+        description="Collect request/DB/cache metrics and serve them on /metrics",
+    )
+    METRICS_TOKEN: str = Field(
+        default="",
+        description="Bearer token required to scrape /metrics (empty: no token)",
+    )
+
+    # Background job runner (one leader worker runs maintenance jobs)
+    SCHEDULER_LEASE_SECONDS: int = Field(
+        default=60,
+        description="Leader lease lifetime without renewal (SQLite lease row)",
+    )
+    SCHEDULER_HEARTBEAT_SECONDS: int = Field(
+        default=15,
+        description="How often workers renew or try to take the leader lease",
+    )
+    JOB_RUN_HISTORY_LIMIT: int = Field(
+        default=50,
+        description="Recorded runs kept per job in job_runs",
+    )
+    SCHEDULER_STATUS_RUNS: int = Field(
+        default=5,
+        description="Latest runs per job shown in the scheduler status",
+    )
+
+    # Crypto executor (bcrypt password and reset-code hashing)
+    CRYPTO_WORKERS: int = Field(
+        default=4,
+        description="Threads hashing passwords at once, per worker process",
+    )
+    CRYPTO_MAX_PENDING: int = Field(
+        default=32,
+        description="Hashes running or queued before new ones are refused with 503",
+    )
+    CRYPTO_RETRY_AFTER_SECONDS: int = Field(
+        default=2,
+        description="Retry-After sent when the crypto executor is saturated",
+    )
+
+    # Avatar image pipeline (variants rendered in a process pool)
+    AVATAR_SIZES: list[int] = Field(
+        default=[32, 64, 128, 256],
+        description="Square avatar variant sizes in pixels (WebP and JPEG each)",
+    )
+    AVATAR_MAX_PIXELS: int = Field(
+        default=25_000_000,
+        description="Largest uploaded image (width x height) decoded for avatars",
+    )
+    AVATAR_SWEEP_GRACE_SECONDS: int = Field(
+        default=86_400,
+        description="Age before an unreferenced avatar variant directory is swept",
+    )
+    IMAGE_WORKERS: int = Field(
+        default=2,
+        description="Processes rendering images at once, per worker process",
+    )
+    IMAGE_MAX_PENDING: int = Field(
+        default=8,
+        description="Images rendering or queued before new ones are refused with 503",
+    )
+    IMAGE_RETRY_AFTER_SECONDS: int = Field(
+        default=5,
+        description="Retry-After sent when the image executor is saturated",
+    )
+
+    # Breached-password checks (local Pwned Passwords store)
+    PWNED_PASSWORDS_DB_PATH: str = Field(
+        default="data/pwned_passwords.db",
+        description="SQLite store imported by scripts/import_pwned_passwords.py",
+    )
+    PWNED_PASSWORDS_CACHE_SIZE: int = Field(
+        default=4096,
+        description="Breached-password lookups kept in the in-process LRU",
+    )
+    PWNED_PASSWORDS_REMOTE_FALLBACK: bool = Field(
+        default=True,
+        description="Query the HIBP range API when no local store is imported",
+    )
+
+    # Share tracking (buffered counter ingestion)
+    SHARE_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=10.0,
+        description="Flush buffered share counts to share_counts at least this often",
+    )
+    SHARE_BUFFER_MAX_KEYS: int = Field(
+        default=500,
+        description="Flush early once this many (idea, platform, minute) keys are buffered",
+    )
+    SHARE_EVENT_LOG_SAMPLE_RATE: float = Field(
+        default=0.0,
+        description="Fraction of shares also written to the raw share_events log (0-1)",
+    )
+
+    # HTTP response cache for anonymous GETs (ETag / Cache-Control)
+    RESPONSE_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Serve cacheable GETs with ETags and an in-process body cache",
+    )
+    RESPONSE_CACHE_MAX_AGE_SECONDS: int = Field(
+        default=15,
+        description="Cache-Control max-age for cacheable public responses",
+    )
+    RESPONSE_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = Field(
+        default=60,
+        description="Cache-Control stale-while-revalidate for public responses",
+    )
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(
+        default=512,
+        description="Maximum rendered response bodies kept per worker",
+    )
+    RESPONSE_CACHE_VERSION_TTL_SECONDS: float = Field(
+        default=1.0,
+        description="How long a worker trusts cache versions before re-reading them",
+    )
+
+    # Sitemap generation
+    SITEMAP_SHARD_SIZE: int = Field(
+        default=50000,
+        description="Idea id range per sitemap shard (sitemaps.org max is 50,000 URLs)",
+    )
+    SITEMAP_STREAM_BATCH_SIZE: int = Field(
+        default=1000,
+        description="Rows fetched per round trip when streaming sitemap data",
+    )
+
+    # In-process reference data snapshot (categories, qualities, tags)
+    REFERENCE_DATA_MAX_CATEGORIES: int = Field(
+        default=1000,
+        description="Maximum categories loaded into the reference data snapshot",
+    )
+    REFERENCE_DATA_POPULAR_TAGS: int = Field(
+        default=100,
+        description="Number of popular tags kept in the reference data snapshot",
+    )
+    REFERENCE_DATA_POPULAR_TAGS_MAX_AGE_SECONDS: int = Field(
+        default=300,
+        description="Maximum age of the popular tags snapshot before reloading",
+    )
 
     # Search configuration
     SEARCH_BACKEND: str | None = Field(
@@ -303,6 +506,18 @@ class Settings(BaseSettings):
         default=5,
         description="Years to keep security audit logs",
     )
+    LOGIN_EVENT_RETENTION_DAYS: int = Field(
+        default=90,
+        description="Days to keep login events",
+    )
+    RETENTION_PURGE_BATCH_SIZE: int = Field(
+        default=1000,
+        description="Rows deleted per transaction by retention purges",
+    )
+    RETENTION_PURGE_SLEEP_SECONDS: float = Field(
+        default=0.1,
+        description="Pause between retention purge chunks, letting other writers in",
+    )
 
     # Ntfy Push Notification Settings
     NTFY_URL: str = Field(
@@ -390,6 +605,14 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
 
+    @field_validator("DATABASE_REPLICA_URLS", mode="before")
+    @classmethod
+    def parse_replica_urls(cls, v: str | List[str]) -> List[str]:
+        """Parse replica URLs from comma-separated string."""
+        if isinstance(v, str):
+            return [url.strip() for url in v.split(",") if url.strip()]
+        return v
+
     model_config = SettingsConfigDict(
         env_file=_should_load_env_file(),
         env_file_encoding="utf-8",
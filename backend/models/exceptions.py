@@ -384,6 +384,26 @@ class RateLimitExceededException(DomainException):
         self.retry_after = retry_after
 
 
+class CryptoBusyException(DomainException):
+    """Raised when the crypto executor's queue is full (login storm)."""
+
+    def __init__(
+        self,
+        message: str = "The server is busy. Please try again in a moment.",
+    ):
+        super().__init__(message)
+
+
+class ImageBusyException(DomainException):
+    """Raised when the image executor's queue is full (upload burst)."""
+
+    def __init__(
+        self,
+        message: str = "The server is busy. Please try again in a moment.",
+    ):
+        super().__init__(message)
+
+
 # ============================================================================
 # Email Login Exceptions
 # ============================================================================
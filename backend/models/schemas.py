@@ -1,8 +1,10 @@
 from enum import Enum
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, computed_field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, TypedDict
+from helpers.avatar_images import avatar_variant_urls
+from models.config import settings
 from repositories.db_models import (
     AppealStatus,
     ContentType,
@@ -26,6 +28,18 @@ class CommentSortOrder(str, Enum):
 
 
 # User Schemas
+class AvatarVariantsMixin(BaseModel):
+    """Adds the pre-sized variant URLs derived from avatar_url."""
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def avatar_urls(self) -> Optional[dict[str, dict[str, str]]]:
+        """Variant URLs by size, then format (None for legacy avatars)."""
+        return avatar_variant_urls(
+            getattr(self, "avatar_url", None), settings.AVATAR_SIZES
+        )
+
+
 class UserBase(BaseModel):
     email: EmailStr
     username: str
@@ -51,7 +65,7 @@ class UserLogin(BaseModel):
     password: str
 
 
-class User(UserBase):
+class User(UserBase, AvatarVariantsMixin):
     id: int
     avatar_url: Optional[str] = None
     is_global_admin: bool
@@ -121,7 +135,7 @@ class UserListResponse(BaseModel):
     total_pages: int
 
 
-class UserPublic(BaseModel):
+class UserPublic(AvatarVariantsMixin):
     """Public user profile (visible to others)."""
 
     id: int
@@ -337,7 +351,7 @@ class UserStatistics(BaseModel):
     moderation: UserModerationStats
 
 
-class AvatarUploadResponse(BaseModel):
+class AvatarUploadResponse(AvatarVariantsMixin):
     """Response after uploading an avatar."""
 
     message: str
@@ -1206,6 +1220,86 @@ class QualityCounts(BaseModel):
     total_votes_with_qualities: int = 0
 
 
+# ============================================================================
+# Lean Row Types
+# ============================================================================
+# Plain-dict mirrors of hot list responses, serialized directly without
+# building models (see helpers.serialization). Keys are declared in the
+# same order as the matching model so both produce the same JSON.
+
+
+class TagRow(TypedDict):
+    """Row shape of Tag."""
+
+    display_name: str
+    id: int
+    name: str
+    created_at: datetime
+
+
+class QualityCountRow(TypedDict):
+    """Row shape of QualityCount."""
+
+    quality_id: int
+    quality_key: str
+    count: int
+
+
+class QualityCountsRow(TypedDict):
+    """Row shape of QualityCounts."""
+
+    counts: List[QualityCountRow]
+    total_votes_with_qualities: int
+
+
+class IdeaWithScoreRow(TypedDict):
+    """Row shape of IdeaWithScore."""
+
+    id: int
+    title: str
+    description: str
+    category_id: int
+    user_id: int
+    status: IdeaStatus
+    admin_comment: Optional[str]
+    created_at: datetime
+    validated_at: Optional[datetime]
+    author_username: str
+    author_display_name: str
+    category_name_en: str
+    category_name_fr: str
+    upvotes: int
+    downvotes: int
+    score: int
+    user_vote: Optional[VoteType]
+    comment_count: int
+    tags: List[TagRow]
+    quality_counts: Optional[QualityCountsRow]
+    language: str
+    edit_count: int
+    last_edit_at: Optional[datetime]
+    previous_status: Optional[str]
+
+
+class CommentRow(TypedDict):
+    """Row shape of Comment."""
+
+    content: str
+    id: int
+    idea_id: int
+    user_id: int
+    is_moderated: bool
+    created_at: datetime
+    author_username: str
+    author_display_name: str
+    is_deleted: Optional[bool]
+    deletion_reason: Optional[str]
+    is_hidden: Optional[bool]
+    like_count: int
+    user_has_liked: Optional[bool]
+    language: str
+
+
 # ============================================================================
 # Quality Signals Schemas (Phase 1: Backend Aggregation)
 # ============================================================================
@@ -1781,7 +1875,7 @@ class PrivacySettingsUpdate(BaseModel):
     show_join_date: Optional[bool] = None
 
 
-class UserPublicFiltered(BaseModel):
+class UserPublicFiltered(AvatarVariantsMixin):
     """
     Public user profile with privacy settings applied.
 
@@ -2206,6 +2300,23 @@ class DatabaseDiagnosticsResponse(BaseModel):
     error: Optional[str] = None
 
 
+class QueryPlanInfo(BaseModel):
+    """Execution plan of one hot query (index advisor)."""
+
+    name: str
+    statements: list[str]
+    plan: list[str]
+    full_scans: list[str]
+
+
+class IndexAdvisorResponse(BaseModel):
+    """Response for the index advisor endpoint."""
+
+    database_type: str
+    queries: list[QueryPlanInfo]
+    flagged_count: int
+
+
 class DiskUsageInfo(BaseModel):
     """Disk usage statistics."""
 
@@ -2307,7 +2418,10 @@ class ShareEventCreate(BaseModel):
 class ShareEventResponse(BaseModel):
     """Response schema for a share event."""
 
-    id: int
+    id: Optional[int] = Field(
+        None,
+        description="Raw share_events row id (None when the event was not sampled)",
+    )
     idea_id: int
     platform: SharePlatform
     created_at: datetime
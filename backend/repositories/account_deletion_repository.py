@@ -9,6 +9,8 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
+from repositories.tag_repository import TagStatRepository
+from repositories.vote_repository import VoteRepository
 
 from .base import BaseRepository
 
@@ -145,7 +147,7 @@ class AccountDeletionRepository(BaseRepository[db_models.User]):
 
     def delete_votes_by_user(self, user_id: int) -> int:
         """
-        Delete all votes for a user.
+        Delete all votes for a user and resync the affected idea counters.
 
         Args:
             user_id: User ID
@@ -153,11 +155,15 @@ class AccountDeletionRepository(BaseRepository[db_models.User]):
         Returns:
             Number of deleted records
         """
-        return (
+        vote_repo = VoteRepository(self.db)
+        idea_ids = vote_repo.get_voted_idea_ids(user_id)
+        count = (
             self.db.query(db_models.Vote)
             .filter(db_models.Vote.user_id == user_id)
             .delete(synchronize_session=False)
         )
+        vote_repo.sync_idea_vote_counts(idea_ids)
+        return count
 
     def delete_comment_likes_by_user(self, user_id: int) -> int:
         """
@@ -212,6 +218,9 @@ class AccountDeletionRepository(BaseRepository[db_models.User]):
         """
         Delete idea tags for given idea IDs.
 
+        The ideas are taken out of the tag counters first, since the bulk
+        delete bypasses the ORM flush hook maintaining them.
+
         Args:
             idea_ids: List of idea IDs
 
@@ -220,6 +229,7 @@ class AccountDeletionRepository(BaseRepository[db_models.User]):
         """
         if not idea_ids:
             return 0
+        TagStatRepository(self.db).remove_ideas(idea_ids)
         return (
             self.db.query(db_models.IdeaTag)
             .filter(db_models.IdeaTag.idea_id.in_(idea_ids))
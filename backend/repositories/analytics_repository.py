@@ -467,32 +467,34 @@ class AnalyticsRepository:
             .all()
         )
 
+        # Per-category vote, comment and score totals, one grouped query each
+        vote_counts = dict(
+            db.query(Idea.category_id, func.count(Vote.id))
+            .select_from(Vote)
+            .join(Idea, Vote.idea_id == Idea.id)
+            .filter(Idea.deleted_at.is_(None))
+            .group_by(Idea.category_id)
+            .all()
+        )
+        comment_counts = dict(
+            db.query(Idea.category_id, func.count(Comment.id))
+            .select_from(Comment)
+            .join(Idea, Comment.idea_id == Idea.id)
+            .filter(Idea.deleted_at.is_(None))
+            .group_by(Idea.category_id)
+            .all()
+        )
+        approved_scores = AnalyticsRepository._approved_score_by_category(db)
+
         result = []
         for cat in categories:
-            # Get vote and comment counts for this category
-            vote_count = (
-                db.query(func.count(Vote.id))
-                .join(Idea, Vote.idea_id == Idea.id)
-                .filter(and_(Idea.category_id == cat.id, Idea.deleted_at.is_(None)))
-                .scalar()
-                or 0
-            )
-
-            comment_count = (
-                db.query(func.count(Comment.id))
-                .join(Idea, Comment.idea_id == Idea.id)
-                .filter(and_(Idea.category_id == cat.id, Idea.deleted_at.is_(None)))
-                .scalar()
-                or 0
-            )
-
-            # Calculate average score for approved ideas in this category
-            avg_score = AnalyticsRepository._calculate_category_avg_score(db, cat.id)
-
-            # Calculate approval rate
             total = int(cat.total_ideas or 0)
             approved = int(cat.approved or 0)
             approval_rate = (approved / total) if total > 0 else 0.0
+            # Average vote score over approved ideas in this category
+            avg_score = (
+                approved_scores.get(cat.id, 0) / approved if approved > 0 else 0.0
+            )
 
             result.append(
                 {
@@ -503,8 +505,8 @@ class AnalyticsRepository:
                     "approved_ideas": approved,
                     "pending_ideas": int(cat.pending or 0),
                     "rejected_ideas": int(cat.rejected or 0),
-                    "total_votes": vote_count,
-                    "total_comments": comment_count,
+                    "total_votes": vote_counts.get(cat.id, 0),
+                    "total_comments": comment_counts.get(cat.id, 0),
                     "avg_score": round(avg_score, 2),
                     "approval_rate": round(approval_rate, 4),
                 }
@@ -513,48 +515,31 @@ class AnalyticsRepository:
         return result
 
     @staticmethod
-    def _calculate_category_avg_score(db: Session, category_id: int) -> float:
-        """Calculate average vote score for approved ideas in a category."""
-        # Get all approved ideas in this category
-        ideas_in_category = (
-            db.query(Idea.id)
-            .filter(
-                and_(
-                    Idea.category_id == category_id,
-                    Idea.status == IdeaStatus.APPROVED,
-                    Idea.deleted_at.is_(None),
-                )
-            )
-            .all()
-        )
-
-        if not ideas_in_category:
-            return 0.0
-
-        idea_ids = [idea.id for idea in ideas_in_category]
-
-        # Calculate scores for all ideas at once
-        scores = (
+    def _approved_score_by_category(db: Session) -> dict[int, int]:
+        """Sum of vote scores (+1/-1) of approved ideas, per category."""
+        rows = (
             db.query(
-                Vote.idea_id,
+                Idea.category_id,
                 func.sum(
                     case(
                         (Vote.vote_type == VoteType.UPVOTE, 1),
                         (Vote.vote_type == VoteType.DOWNVOTE, -1),
                         else_=0,
                     )
-                ).label("score"),
+                ),
             )
-            .filter(Vote.idea_id.in_(idea_ids))
-            .group_by(Vote.idea_id)
+            .select_from(Vote)
+            .join(Idea, Vote.idea_id == Idea.id)
+            .filter(
+                and_(
+                    Idea.status == IdeaStatus.APPROVED,
+                    Idea.deleted_at.is_(None),
+                )
+            )
+            .group_by(Idea.category_id)
             .all()
         )
-
-        if not scores:
-            return 0.0
-
-        total_score = sum(score.score for score in scores)
-        return total_score / len(ideas_in_category)
+        return {category_id: int(score or 0) for category_id, score in rows}
 
     @staticmethod
     def get_top_contributors_by_ideas(db: Session, limit: int = 10) -> list[dict]:
@@ -2,8 +2,9 @@
 Base repository class providing common database operations.
 """
 
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from repositories.database import Base
@@ -29,6 +30,24 @@ class BaseRepository(Generic[T]):
         self.model = model
         self.db = db
 
+    def _upsert_insert(self, table: Any = None) -> Any:
+        """
+        Build a dialect-specific INSERT supporting ON CONFLICT clauses.
+
+        Both SQLite (>= 3.24) and PostgreSQL support ``ON CONFLICT``; the
+        generic ``sqlalchemy.insert`` does not expose it.
+
+        Args:
+            table: Model or table to insert into (defaults to the repo model)
+
+        Returns:
+            Dialect insert construct
+        """
+        target = table if table is not None else self.model
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(target)
+        return sqlite.insert(target)
+
     def get_by_id(self, id: int) -> T | None:
         """
         Get entity by ID.
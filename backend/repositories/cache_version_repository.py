@@ -0,0 +1,97 @@
+"""
+Repository for cache version counters.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import repositories.db_models as db_models
+from models.config import settings
+from repositories.base import BaseRepository
+
+# Entity covering every sitemap shard (bumped by bulk idea changes)
+SITEMAP_ENTITY = "sitemap"
+
+
+def sitemap_shard(idea_id: int) -> int:
+    """Get the sitemap shard number holding an idea (fixed id ranges)."""
+    return idea_id // settings.SITEMAP_SHARD_SIZE
+
+
+def sitemap_shard_entity(shard: int) -> str:
+    """Get the cache entity name of one sitemap shard."""
+    return f"{SITEMAP_ENTITY}:{shard}"
+
+
+class CacheVersionRepository(BaseRepository[db_models.CacheVersion]):
+    """Repository for per-entity cache version counters."""
+
+    def __init__(self, db: Session):
+        """
+        Initialize cache version repository.
+
+        Args:
+            db: Database session
+        """
+        super().__init__(db_models.CacheVersion, db)
+
+    def get_versions(self) -> dict[str, tuple[int, datetime]]:
+        """
+        Get all cache versions.
+
+        Returns:
+            Dict mapping entity to (version, updated_at)
+        """
+        rows = self.db.execute(
+            select(
+                db_models.CacheVersion.entity,
+                db_models.CacheVersion.version,
+                db_models.CacheVersion.updated_at,
+            )
+        ).all()
+        return {entity: (version, updated_at) for entity, version, updated_at in rows}
+
+    def mark_changed(self, entities: Iterable[str]) -> None:
+        """
+        Record entities whose versions must be bumped when the session commits.
+
+        Nothing is written here: the bump runs as the last statement before
+        the commit (see bump), so writers never hold the lock of a shared
+        version row for the rest of their transaction. The entities collect
+        in ``session.info["cache_changed"]``.
+
+        Args:
+            entities: Entity names changed by the current transaction
+        """
+        self.db.info.setdefault("cache_changed", set()).update(entities)
+
+    def bump(self, entities: Iterable[str]) -> None:
+        """
+        Increment the version of each entity, creating missing counters.
+
+        Runs on the session's current connection without committing; the
+        caller commits right away, so the version rows stay locked for
+        the commit only.
+
+        Args:
+            entities: Entity names to bump
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = [
+            {"entity": entity, "version": 1, "updated_at": now}
+            for entity in sorted(set(entities))
+        ]
+        if not rows:
+            return
+        stmt = self._upsert_insert().values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["entity"],
+            set_={
+                "version": db_models.CacheVersion.version + 1,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.db.connection().execute(stmt)
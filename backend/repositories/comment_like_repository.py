@@ -1,5 +1,6 @@
 """Repository for comment like operations."""
 
+from sqlalchemy import case, delete, func, select, update
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
@@ -65,6 +66,109 @@ class CommentLikeRepository(BaseRepository[db_models.CommentLike]):
         )
         return {like.comment_id for like in likes}
 
+    def add_like(self, comment_id: int, user_id: int) -> bool:
+        """
+        Insert a like unless the user already likes the comment.
+
+        A single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` statement,
+        so concurrent clicks cannot race into a unique violation. Does not
+        commit.
+
+        Args:
+            comment_id: Comment ID
+            user_id: User ID
+
+        Returns:
+            True if a like was inserted, False if it already existed
+        """
+        stmt = (
+            self._upsert_insert()
+            .values(comment_id=comment_id, user_id=user_id)
+            .on_conflict_do_nothing(index_elements=["comment_id", "user_id"])
+            .returning(db_models.CommentLike.id)
+        )
+        return self.db.execute(stmt).first() is not None
+
+    def remove_like(self, comment_id: int, user_id: int) -> bool:
+        """
+        Delete a user's like without loading it first.
+
+        Does not commit.
+
+        Args:
+            comment_id: Comment ID
+            user_id: User ID
+
+        Returns:
+            True if a like was deleted, False if none existed
+        """
+        stmt = (
+            delete(db_models.CommentLike)
+            .where(
+                db_models.CommentLike.comment_id == comment_id,
+                db_models.CommentLike.user_id == user_id,
+            )
+            .returning(db_models.CommentLike.id)
+            .execution_options(synchronize_session=False)
+        )
+        return self.db.execute(stmt).first() is not None
+
+    def adjust_like_count(self, comment_id: int, delta: int) -> int:
+        """
+        Add delta to a comment's like counter in the database.
+
+        ``UPDATE comments SET like_count = like_count + :delta``, never
+        going below zero, so concurrent likes cannot lose increments the
+        way a read-modify-write in Python would. Does not commit.
+
+        Args:
+            comment_id: Comment ID
+            delta: Change to apply (+1 or -1)
+
+        Returns:
+            The new like count
+        """
+        new_count = db_models.Comment.like_count + delta
+        stmt = (
+            update(db_models.Comment)
+            .where(db_models.Comment.id == comment_id)
+            .values(like_count=case((new_count < 0, 0), else_=new_count))
+            .returning(db_models.Comment.like_count)
+            .execution_options(synchronize_session=False)
+        )
+        return self.db.execute(stmt).scalar_one()
+
+    def sync_comment_like_counts(self, comment_ids: list[int] | None = None) -> int:
+        """
+        Recompute comment like counters from comment_likes.
+
+        One set-based UPDATE; only comments whose counter drifted are
+        written. Does not commit.
+
+        Args:
+            comment_ids: Comments to resync, or None for every comment
+
+        Returns:
+            Number of comments whose counter was corrected
+        """
+        if comment_ids is not None and not comment_ids:
+            return 0
+
+        likes = (
+            select(func.count(db_models.CommentLike.id))
+            .where(db_models.CommentLike.comment_id == db_models.Comment.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(db_models.Comment)
+            .where(db_models.Comment.like_count != likes)
+            .values(like_count=likes)
+            .execution_options(synchronize_session=False)
+        )
+        if comment_ids is not None:
+            stmt = stmt.where(db_models.Comment.id.in_(comment_ids))
+        return self.db.execute(stmt).rowcount
+
     def count_by_comment(self, comment_id: int) -> int:
         """
         Count likes for a comment.
@@ -252,6 +252,26 @@ class CommentRepository(BaseRepository[db_models.Comment]):
             .first()
         )
 
+    def get_many_with_author(self, comment_ids: list[int]) -> dict[int, Any]:
+        """
+        Get several comments with their authors in one query.
+
+        Args:
+            comment_ids: Comment IDs
+
+        Returns:
+            Dict mapping comment ID to (Comment, User); missing IDs are absent
+        """
+        if not comment_ids:
+            return {}
+        rows = (
+            self.db.query(db_models.Comment, db_models.User)
+            .join(db_models.User, db_models.Comment.user_id == db_models.User.id)
+            .filter(db_models.Comment.id.in_(comment_ids))
+            .all()
+        )
+        return {comment.id: (comment, user) for comment, user in rows}
+
     def unhide(self, comment_id: int) -> bool:
         """
         Unhide a comment and reset flag count.
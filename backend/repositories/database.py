@@ -1,53 +1,435 @@
 """
 Database configuration with connection pooling.
+
+SQLite runs in a production profile: WAL journal, tuned pragmas applied on
+every new connection, a pooled connection set, and write transactions that
+take the write lock up front (``BEGIN IMMEDIATE``) so concurrent writers wait
+on ``busy_timeout`` instead of failing with "database is locked". Sessions
+flagged ``info["writes"]`` (SessionLocal by default, get_db for write
+requests) start every transaction that way, so the reads that lead to a
+write share its snapshot.
+
+PostgreSQL deployments can add read replicas (DATABASE_REPLICA_URLS).
+Sessions from ``get_read_db`` send their reads to a replica whose
+replication lag is within bounds, and fall back to the primary otherwise.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.pool import NullPool, QueuePool
+import itertools
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any
 
+from fastapi import Request
+from loguru import logger
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.sql import Select
+
+from core.metrics import instrument_engine, observe_pool_checkout
+from core.query_tracking import track_engine
 from models.config import settings
 
+# Textual statements (text(), exec_driver_sql, SAVEPOINT) that need the
+# SQLite write lock; compiled DML is recognised from its execution context
+_SQLITE_WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE", "SAVEPOIN")
+
+# HTTP methods served with a read session (deferred BEGIN) by get_db
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _is_sqlite_memory_url(url: str) -> bool:
+    """Check if a SQLite URL points to an in-memory database."""
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
 
-def create_db_engine():
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
     """
-    Create database engine with appropriate configuration.
+    Apply production pragmas to a new SQLite connection.
 
-    Uses QueuePool for PostgreSQL/production and NullPool for SQLite.
-    NullPool creates a new connection per request, avoiding concurrency issues.
+    Also switches pysqlite to manual transaction control
+    (``isolation_level=None``) so ``_sqlite_begin`` decides how each
+    transaction starts.
     """
-    is_sqlite = "sqlite" in settings.DATABASE_URL
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        # Negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+    connection_record.info["sqlite_txn"] = None
 
-    if is_sqlite:
-        # SQLite with NullPool: creates new connection per request
-        # This avoids the race conditions that occur with StaticPool under concurrency
-        return create_engine(
-            settings.DATABASE_URL,
+
+def _sqlite_begin(conn: Any) -> None:
+    """
+    Defer the actual BEGIN until the first statement is known.
+
+    Read-only transactions then use a plain deferred ``BEGIN`` (WAL readers
+    never block), while transactions of write sessions, or starting with a
+    write, use ``BEGIN IMMEDIATE``.
+    """
+    conn.connection.info["sqlite_txn"] = "pending"
+
+
+def _sqlite_write_session_begin(
+    session: Session, transaction: Any, connection: Any
+) -> None:
+    """Make a write session's transaction start with ``BEGIN IMMEDIATE``."""
+    if not session.info.get("writes"):
+        return
+    info = connection.connection.info
+    if info.get("sqlite_txn") == "pending":
+        info["sqlite_txn"] = "pending_write"
+
+
+def _is_sqlite_write(statement: str, context: Any) -> bool:
+    """Check whether a statement needs the write lock."""
+    if context.isinsert or context.isupdate or context.isdelete:
+        return True
+    return statement.lstrip()[:8].upper().startswith(_SQLITE_WRITE_PREFIXES)
+
+
+def _sqlite_before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """
+    Start the transaction before its first statement runs.
+
+    A transaction is never restarted once it has read: ending it would
+    discard the snapshot the caller's checks were made on. A read
+    transaction that later writes fails with SQLITE_BUSY if another
+    connection committed in between, so sessions that write are flagged
+    ``info["writes"]`` and start with ``BEGIN IMMEDIATE`` instead.
+    """
+    info = conn.connection.info
+    state = info.get("sqlite_txn")
+    if state not in ("pending", "pending_write"):
+        return
+
+    immediate = state == "pending_write" or _is_sqlite_write(statement, context)
+    cursor.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    info["sqlite_txn"] = "write" if immediate else "read"
+
+
+def _sqlite_end(conn: Any) -> None:
+    """Reset transaction state after commit or rollback."""
+    conn.connection.info["sqlite_txn"] = None
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout takes."""
+
+    def connect(self) -> Any:
+        """Check out a connection, recording the wait."""
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            observe_pool_checkout(time.perf_counter() - start)
+
+
+def configure_sqlite_engine(engine: Engine) -> Engine:
+    """
+    Attach the SQLite production profile hooks to an engine.
+
+    Args:
+        engine: SQLite engine
+
+    Returns:
+        The same engine, for chaining
+    """
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    event.listen(engine, "begin", _sqlite_begin)
+    event.listen(engine, "before_cursor_execute", _sqlite_before_cursor_execute)
+    event.listen(engine, "commit", _sqlite_end)
+    event.listen(engine, "rollback", _sqlite_end)
+    return engine
+
+
+event.listen(Session, "after_begin", _sqlite_write_session_begin)
+
+
+def create_sqlite_engine(url: str) -> Engine:
+    """
+    Create a SQLite engine using the production profile.
+
+    File databases get a QueuePool so connections (and their parsed schema
+    and page cache) are reused across requests. In-memory databases use a
+    single shared connection.
+
+    Args:
+        url: SQLite database URL
+
+    Returns:
+        Configured engine
+    """
+    if _is_sqlite_memory_url(url):
+        engine = create_engine(
+            url,
             connect_args={"check_same_thread": False},
-            poolclass=NullPool,
+            poolclass=StaticPool,
         )
+    else:
+        engine = create_engine(
+            url,
+            connect_args={
+                "check_same_thread": False,
+                # Python-level lock wait; busy_timeout pragma covers SQLite's
+                "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+            },
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return configure_sqlite_engine(engine)
+
+
+def create_db_engine(url: str | None = None):
+    """
+    Create database engine with appropriate configuration.
+
+    Uses QueuePool for PostgreSQL/production and the SQLite production
+    profile (see create_sqlite_engine) for SQLite. Query and pool metrics
+    (core.metrics) and N+1 tracking (core.query_tracking) are attached to
+    both.
+
+    Args:
+        url: Database URL (defaults to DATABASE_URL)
+    """
+    url = url or settings.DATABASE_URL
+    is_sqlite = "sqlite" in url
+
+    if is_sqlite:
+        return track_engine(instrument_engine(create_sqlite_engine(url)))
     else:
         # PostgreSQL or other databases: use QueuePool with tuned settings
-        return create_engine(
-            settings.DATABASE_URL,
-            poolclass=QueuePool,
+        pg_engine = create_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
             pool_size=settings.DB_POOL_SIZE,
             max_overflow=settings.DB_MAX_OVERFLOW,
             pool_timeout=settings.DB_POOL_TIMEOUT,
             pool_recycle=settings.DB_POOL_RECYCLE,
             pool_pre_ping=True,  # Verify connections before use
         )
+        return track_engine(instrument_engine(pg_engine))
+
+
+# Replication lag in seconds; 0 when the server is not in recovery or has
+# replayed everything it received (an idle primary must not look lagged).
+_PG_REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+# Set per request when the client wrote recently (read-your-writes)
+_force_primary: ContextVar[bool] = ContextVar("db_force_primary", default=False)
+
+
+def force_primary_reads(enabled: bool = True) -> Token[bool]:
+    """
+    Route all reads in the current context to the primary.
+
+    Used for read-your-writes: a client that just voted or commented must
+    not read a replica that has not replayed that write yet.
+
+    Args:
+        enabled: Whether to force primary reads
+
+    Returns:
+        Token for reset_primary_reads
+    """
+    return _force_primary.set(enabled)
+
+
+def reset_primary_reads(token: Token[bool]) -> None:
+    """Restore the previous primary-read setting."""
+    _force_primary.reset(token)
+
+
+class ReplicaSet:
+    """
+    Read-replica engines with cached replication-lag health checks.
+
+    Lag is measured at most once per DB_REPLICA_LAG_CHECK_SECONDS per
+    replica; a replica that is unreachable or lags more than
+    DB_REPLICA_MAX_LAG_SECONDS is skipped until the next check.
+    """
+
+    def __init__(
+        self,
+        engines: list[Engine],
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ):
+        self.engines = engines
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        # {replica index: (lag seconds or None if unreachable, checked_at)}
+        self._lag: dict[int, tuple[float | None, float]] = {}
+        self._check_lock = threading.Lock()
+        self._round_robin = itertools.count()
+
+    @classmethod
+    def from_settings(cls) -> "ReplicaSet | None":
+        """Build the replica set from DATABASE_REPLICA_URLS, if any."""
+        if not settings.DATABASE_REPLICA_URLS:
+            return None
+        return cls(
+            [create_db_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+            max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+            check_interval_seconds=settings.DB_REPLICA_LAG_CHECK_SECONDS,
+        )
+
+    @staticmethod
+    def measure_lag(replica: Engine) -> float | None:
+        """
+        Measure replication lag of one replica.
+
+        Args:
+            replica: Replica engine
+
+        Returns:
+            Lag in seconds, or None if the replica is unreachable
+        """
+        try:
+            with replica.connect() as conn:
+                if replica.dialect.name != "postgresql":
+                    conn.execute(text("SELECT 1"))
+                    return 0.0
+                return float(conn.execute(_PG_REPLICA_LAG_SQL).scalar() or 0)
+        except Exception as e:
+            logger.warning(f"Read replica health check failed: {e}")
+            return None
+
+    def lag(self, index: int) -> float | None:
+        """
+        Get the cached lag of a replica, refreshing it when stale.
+
+        Only one thread refreshes at a time; others use the previous value.
+        """
+        now = time.monotonic()
+        cached = self._lag.get(index)
+        if cached is not None and now - cached[1] < self.check_interval_seconds:
+            return cached[0]
+        if not self._check_lock.acquire(blocking=cached is None):
+            return cached[0] if cached else None
+        try:
+            lag = self.measure_lag(self.engines[index])
+            self._lag[index] = (lag, time.monotonic())
+            return lag
+        finally:
+            self._check_lock.release()
+
+    def choose(self) -> Engine | None:
+        """
+        Pick a healthy replica (round-robin).
+
+        Returns:
+            Replica engine, or None if every replica is lagging or down
+        """
+        count = len(self.engines)
+        start = next(self._round_robin)
+        for offset in range(count):
+            index = (start + offset) % count
+            lag = self.lag(index)
+            if lag is not None and lag <= self.max_lag_seconds:
+                return self.engines[index]
+        return None
+
+
+class RoutingSession(Session):
+    """
+    Session that can serve reads from a replica.
+
+    Only sessions flagged ``info["read_only"]`` (see get_read_db) use
+    replicas, and only for SELECTs. Flushes, DML and raw ``connection()``
+    calls always go to the primary, and once a session has done any of
+    those, its later reads stick to the primary as well.
+
+    The replica is chosen on the session's first read and kept for its
+    lifetime, so every read of one request sees the same replication
+    point (a count and the page it describes never disagree).
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):  # type: ignore[no-untyped-def]
+        if replicas is not None and self._reads_from_replica(clause):
+            if "replica" not in self.info:
+                self.info["replica"] = replicas.choose()
+            replica = self.info["replica"]
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def _reads_from_replica(self, clause: Any) -> bool:
+        """Check whether this statement may be served by a replica."""
+        if not self.info.get("read_only") or _force_primary.get():
+            return False
+        if self._flushing or not isinstance(clause, Select):
+            self.info["read_only"] = False
+            return False
+        return True
 
 
 engine = create_db_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+replicas = ReplicaSet.from_settings()
+# Sessions write by default (jobs, scripts); request sessions say otherwise
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    info={"writes": True},
+)
 
 Base = declarative_base()
 
 
-def get_db():
-    """Get database session with automatic cleanup."""
+def get_db(request: Request):
+    """
+    Get database session with automatic cleanup.
+
+    Sessions of write requests (POST, PUT, PATCH, DELETE) take the SQLite
+    write lock when their transactions begin.
+    """
+    db = SessionLocal()
+    db.info["writes"] = request.method not in _READ_METHODS
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db():
+    """
+    Get a database session for read-only routes.
+
+    Reads may be served by a read replica when DATABASE_REPLICA_URLS is
+    set; without replicas this behaves exactly like get_db.
+    """
     db = SessionLocal()
+    db.info["read_only"] = True
+    db.info["writes"] = False
     try:
         yield db
     finally:
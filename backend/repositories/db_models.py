@@ -131,6 +131,10 @@ def _utc_now() -> datetime:
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Signup trends and user exports filter on created_at ranges
+        Index("ix_users_created", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
@@ -366,6 +370,16 @@ class Idea(Base):
         comment="Status before transitioning to PENDING_EDIT (for restoration)",
     )
 
+    # Denormalized vote counters, maintained by VoteRepository
+    upvote_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    downvote_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    score: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="upvote_count - downvote_count",
+    )
+
     # Relationships
     author: Mapped["User"] = relationship(
         "User", back_populates="ideas", foreign_keys=[user_id]
@@ -392,6 +406,9 @@ class Idea(Base):
         Index("ix_ideas_user_status", "user_id", "status"),
         Index("ix_ideas_category", "category_id"),
         Index("ix_ideas_hidden", "is_hidden"),
+        Index("ix_ideas_status_score", "status", "score"),
+        # Trend queries: created_at range on non-deleted ideas
+        Index("ix_ideas_deleted_created", "deleted_at", "created_at"),
         # Note: deleted_at index is created by index=True on the column
     )
 
@@ -402,6 +419,8 @@ class Vote(Base):
         UniqueConstraint("idea_id", "user_id", name="uq_vote_idea_user"),
         Index("ix_votes_idea", "idea_id"),
         Index("ix_votes_user_idea", "user_id", "idea_id"),
+        # Vote activity over time (analytics trends)
+        Index("ix_votes_created_idea", "created_at", "idea_id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -437,6 +456,7 @@ class Comment(Base):
         Index("ix_comments_hidden", "is_hidden"),
         Index("ix_comments_requires_approval", "requires_approval"),
         Index("ix_comments_deleted", "deleted_at"),
+        Index("ix_comments_created", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -574,6 +594,25 @@ class IdeaTag(Base):
     tag: Mapped["Tag"] = relationship("Tag", back_populates="idea_tags")
 
 
+class TagStat(Base):
+    """
+    Number of public (approved, not deleted) ideas per tag.
+
+    Kept current by TagService on every flush that tags or untags an idea
+    or changes whether a tagged idea is public, and recomputed daily from
+    idea_tags. Popular tags and tag suggestions read counts from here.
+    """
+
+    __tablename__ = "tag_stats"
+    # Popular tags walk this index in idea_count order
+    __table_args__ = (Index("ix_tag_stats_idea_count", "idea_count", "tag_id"),)
+
+    tag_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
+    )
+    idea_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
 # ============================================================================
 # Vote Qualities Models
 # ============================================================================
@@ -647,6 +686,7 @@ class VoteQuality(Base):
         UniqueConstraint("vote_id", "quality_id", name="uq_vote_quality"),
         Index("ix_vote_qualities_vote", "vote_id"),
         Index("ix_vote_qualities_quality", "quality_id"),
+        Index("ix_vote_qualities_created", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -915,6 +955,7 @@ class PasswordResetToken(Base):
         Index("ix_password_reset_tokens_user_created", "user_id", "created_at"),
         Index("ix_password_reset_tokens_expires", "expires_at"),
         Index("ix_password_reset_tokens_reset_token", "reset_token"),
+        Index("ix_password_reset_tokens_user_code_index", "user_id", "code_index"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -928,6 +969,13 @@ class PasswordResetToken(Base):
         nullable=False,
         comment="bcrypt hash of reset code (NOT SHA-256 - Finding #1)",
     )
+    # Keyed HMAC of the code: finds the candidate token so only one bcrypt
+    # check runs per attempt (NULL on tokens created before it existed)
+    code_index: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="HMAC-SHA256 lookup index of reset code (keyed with SECRET_KEY)",
+    )
 
     # Phase 1: Code verification phase
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utc_now)
@@ -1147,9 +1195,10 @@ class LoginEvent(Base):
 
     __tablename__ = "login_events"
     __table_args__ = (
-        Index("ix_login_events_user_id", "user_id"),
-        Index("ix_login_events_ip_address", "ip_address"),
-        Index("ix_login_events_event_type", "event_type"),
+        # Every lookup by user, IP or type is also bounded or ordered by time
+        Index("ix_login_events_user_created", "user_id", "created_at"),
+        Index("ix_login_events_ip_created", "ip_address", "created_at"),
+        Index("ix_login_events_type_created", "event_type", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -1314,6 +1363,34 @@ class ShareEvent(Base):
     idea: Mapped["Idea"] = relationship("Idea", backref="share_events")
 
 
+class ShareCount(Base):
+    """
+    Per-minute share counter rollup.
+
+    One row per (idea, platform, minute). Share clicks are aggregated in
+    memory by ShareService and flushed here in batches, so analytics read
+    a small rollup instead of the raw share_events log.
+    """
+
+    __tablename__ = "share_counts"
+    __table_args__ = (
+        UniqueConstraint(
+            "idea_id", "platform", "bucket_start", name="uq_share_count_bucket"
+        ),
+        Index("ix_share_counts_bucket_start", "bucket_start"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    idea_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("ideas.id", ondelete="CASCADE"), nullable=False
+    )
+    platform: Mapped[SharePlatform] = mapped_column(Enum(SharePlatform), nullable=False)
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, comment="UTC minute the shares were recorded in"
+    )
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
 class PrivacyIncident(Base):
     """
     Privacy incident register for Law 25 compliance.
@@ -1542,3 +1619,79 @@ class TrustedDevice(Base):
         "User",
         back_populates="trusted_devices",
     )
+
+
+class CacheVersion(Base):
+    """
+    Change counter per cached entity group ("ideas", "categories", "tags").
+
+    Bumped right after any write to the group's tables commits, in a short
+    transaction of its own (see services.response_cache_service), so HTTP
+    ETags built from these versions change when the data does, in every
+    worker.
+    """
+
+    __tablename__ = "cache_versions"
+
+    entity: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utc_now, nullable=False
+    )
+
+
+class SchedulerLease(Base):
+    """
+    Time-limited leader lease for the background job runner (SQLite).
+
+    The worker whose holder id is stored here, with expires_at still in
+    the future, is the only one running leader jobs. The leader renews the
+    lease on every heartbeat; other workers take it over once it lapses.
+    PostgreSQL uses an advisory lock instead (see core.job_runner).
+    """
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    holder: Mapped[str] = mapped_column(
+        String(100), nullable=False, comment="host:pid of the worker holding it"
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class JobRun(Base):
+    """One execution of a scheduled background job, with its timing."""
+
+    __tablename__ = "job_runs"
+    __table_args__ = (Index("ix_job_runs_job_started", "job_id", "started_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    job_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    worker: Mapped[str] = mapped_column(
+        String(100), nullable=False, comment="host:pid of the worker that ran it"
+    )
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, comment="success or failed"
+    )
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
+class RetentionCheckpoint(Base):
+    """
+    Progress of an interrupted retention purge.
+
+    Each purge deletes rows in primary-key order, one chunk per
+    transaction, and stores the last id it reached here in the same
+    transaction. A later run resumes after that id; the row is removed
+    once the purge completes.
+    """
+
+    __tablename__ = "retention_checkpoints"
+
+    purge: Mapped[str] = mapped_column(String(50), primary_key=True)
+    last_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utc_now, nullable=False
+    )
@@ -88,6 +88,43 @@ class FlagRepository(BaseRepository[ContentFlag]):
 
         return query.order_by(ContentFlag.created_at.desc()).all()
 
+    def get_flags_for_contents(
+        self,
+        content_type: ContentType,
+        content_ids: list[int],
+        include_reviewed: bool = False,
+    ) -> dict[int, list[Any]]:
+        """
+        Get the flags of several content items in one query.
+
+        Args:
+            content_type: Type of content
+            content_ids: IDs of the content items
+            include_reviewed: Include dismissed/actioned flags
+
+        Returns:
+            Dict mapping content ID to its list of
+            (flag, reporter_username, reporter_display_name), newest first
+        """
+        if not content_ids:
+            return {}
+        query = (
+            self.db.query(ContentFlag, User.username, User.display_name)
+            .join(User, ContentFlag.reporter_id == User.id)
+            .filter(
+                ContentFlag.content_type == content_type,
+                ContentFlag.content_id.in_(content_ids),
+            )
+        )
+
+        if not include_reviewed:
+            query = query.filter(ContentFlag.status == FlagStatus.PENDING)
+
+        flags: dict[int, list[Any]] = {}
+        for row in query.order_by(ContentFlag.created_at.desc()).all():
+            flags.setdefault(row[0].content_id, []).append(row)
+        return flags
+
     def get_pending_flags_count_for_content(
         self,
         content_type: ContentType,
@@ -2,13 +2,15 @@
 Idea repository for database operations.
 """
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
-from sqlalchemy import case, func, literal
+from sqlalchemy import case, func, literal, select
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
+from repositories.tag_repository import TagStatRepository
 from repositories.vote_quality_repository import VoteQualityRepository
 
 if TYPE_CHECKING:
@@ -49,6 +51,158 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
 
         return tags_by_idea
 
+    def _score_columns(self, current_user_id: Optional[int] = None) -> list[Any]:
+        """
+        Build correlated per-idea aggregate columns.
+
+        Each column is a scalar subquery correlated on ``ideas.id``, so the
+        database evaluates it only for the ideas selected by the outer
+        query, through ix_votes_idea / ix_comments_idea_moderated, instead
+        of aggregating the whole votes and comments tables first.
+
+        Args:
+            current_user_id: Current user ID (for the user_vote column)
+
+        Returns:
+            Labeled columns: upvotes, downvotes, comment_count, user_vote
+        """
+
+        def count_votes(vote_type: db_models.VoteType) -> Any:
+            return (
+                select(func.count(db_models.Vote.id))
+                .where(
+                    db_models.Vote.idea_id == db_models.Idea.id,
+                    db_models.Vote.vote_type == vote_type,
+                )
+                .correlate(db_models.Idea)
+                .scalar_subquery()
+            )
+
+        comment_count = (
+            select(func.count(db_models.Comment.id))
+            .where(
+                db_models.Comment.idea_id == db_models.Idea.id,
+                db_models.Comment.is_moderated.is_(False),
+                db_models.Comment.deleted_at.is_(None),
+                db_models.Comment.is_hidden.is_(False),
+                db_models.Comment.requires_approval.is_(False),
+            )
+            .correlate(db_models.Idea)
+            .scalar_subquery()
+        )
+
+        if current_user_id:
+            user_vote: Any = (
+                select(db_models.Vote.vote_type)
+                .where(
+                    db_models.Vote.idea_id == db_models.Idea.id,
+                    db_models.Vote.user_id == current_user_id,
+                )
+                .correlate(db_models.Idea)
+                .limit(1)
+                .scalar_subquery()
+            )
+        else:
+            user_vote = literal(None)
+
+        return [
+            count_votes(db_models.VoteType.UPVOTE).label("upvotes"),
+            count_votes(db_models.VoteType.DOWNVOTE).label("downvotes"),
+            comment_count.label("comment_count"),
+            user_vote.label("user_vote"),
+        ]
+
+    @staticmethod
+    def _to_idea_row(
+        idea: db_models.Idea,
+        result: Any,
+        tags: list[db_models.Tag],
+        idea_quality_data: dict,
+    ) -> "schemas.IdeaWithScoreRow":
+        """
+        Build an IdeaWithScore-shaped row from an idea and its hydrated columns.
+
+        Args:
+            idea: Idea row
+            result: Row with author, category, vote and comment columns
+            tags: Tags of the idea
+            idea_quality_data: Quality counts data of the idea
+
+        Returns:
+            Idea row
+        """
+        quality_counts = None
+        if idea_quality_data.get("counts") or idea_quality_data.get(
+            "total_votes_with_qualities", 0
+        ):
+            quality_counts = {
+                "counts": idea_quality_data["counts"],
+                "total_votes_with_qualities": idea_quality_data[
+                    "total_votes_with_qualities"
+                ],
+            }
+
+        return {
+            "id": idea.id,
+            "title": idea.title,
+            "description": idea.description,
+            "category_id": idea.category_id,
+            "user_id": idea.user_id,
+            "status": idea.status,
+            "admin_comment": idea.admin_comment,
+            "created_at": idea.created_at,
+            "validated_at": idea.validated_at,
+            "author_username": result.author_username,
+            "author_display_name": result.author_display_name,
+            "category_name_en": result.category_name_en,
+            "category_name_fr": result.category_name_fr,
+            "upvotes": result.upvotes,
+            "downvotes": result.downvotes,
+            "score": result.upvotes - result.downvotes,
+            "user_vote": result.user_vote,
+            "comment_count": result.comment_count,
+            "tags": [
+                {
+                    "display_name": tag.display_name,
+                    "id": tag.id,
+                    "name": tag.name,
+                    "created_at": tag.created_at,
+                }
+                for tag in tags
+            ],
+            "quality_counts": quality_counts,
+            "language": idea.language,
+            # Edit tracking fields
+            "edit_count": idea.edit_count,
+            "last_edit_at": idea.last_edit_at,
+            "previous_status": idea.previous_status,
+        }
+
+    @staticmethod
+    def _to_idea_with_score(
+        idea: db_models.Idea,
+        result: Any,
+        tags: list[db_models.Tag],
+        idea_quality_data: dict,
+    ) -> "schemas.IdeaWithScore":
+        """
+        Build an IdeaWithScore from an idea and its hydrated columns.
+
+        Args:
+            idea: Idea row
+            result: Row with author, category, vote and comment columns
+            tags: Tags of the idea
+            idea_quality_data: Quality counts data of the idea
+
+        Returns:
+            IdeaWithScore schema
+        """
+        import models.schemas as schemas
+
+        return schemas.IdeaWithScore.model_validate(
+            IdeaRepository._to_idea_row(idea, result, tags, idea_quality_data)
+        )
+
     def get_by_status(
         self, status: db_models.IdeaStatus, skip: int = 0, limit: int = 100
     ) -> List[db_models.Idea]:
@@ -137,6 +291,46 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
         """
         Get ideas with vote counts, scores, and user vote information.
 
+        Same arguments as get_idea_rows_with_scores.
+
+        Returns:
+            List of ideas with scores and vote information
+        """
+        import models.schemas as schemas
+
+        return [
+            schemas.IdeaWithScore.model_validate(row)
+            for row in self.get_idea_rows_with_scores(
+                status_filter=status_filter,
+                category_id=category_id,
+                user_id=user_id,
+                current_user_id=current_user_id,
+                skip=skip,
+                limit=limit,
+                idea_id=idea_id,
+                preferred_language=preferred_language,
+            )
+        ]
+
+    def get_idea_rows_with_scores(
+        self,
+        status_filter: Union[
+            db_models.IdeaStatus, List[db_models.IdeaStatus]
+        ] = db_models.IdeaStatus.APPROVED,
+        category_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        current_user_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 20,
+        idea_id: Optional[int] = None,
+        preferred_language: Optional[str] = None,
+    ) -> List["schemas.IdeaWithScoreRow"]:
+        """
+        Get ideas with vote counts, scores, and user vote information as rows.
+
+        Rows have the IdeaWithScore shape and can be serialized without
+        building models (see helpers.serialization).
+
         This method builds a complex query with subqueries for:
         - Upvote counts
         - Downvote counts
@@ -157,12 +351,10 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
                 first, followed by other languages. All ideas remain visible.
 
         Returns:
-            List of ideas with scores and vote information
+            List of idea rows with scores and vote information
         """
         import sentry_sdk
 
-        import models.schemas as schemas
-
         # Start performance span for database query
         sentry_sdk.set_tag("repo.method", "get_ideas_with_scores")
 
@@ -329,64 +521,15 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
             )
 
         # Format results
-        ideas_with_scores = []
-        for result in results:
-            # Get tags from pre-fetched batch
-            tags = tags_by_idea.get(result.Idea.id, [])
-
-            # Get quality counts from pre-fetched batch
-            idea_quality_data = quality_counts_by_idea.get(result.Idea.id, {})
-            quality_counts = None
-            if idea_quality_data.get("counts") or idea_quality_data.get(
-                "total_votes_with_qualities", 0
-            ):
-                quality_counts = schemas.QualityCounts(
-                    counts=[
-                        schemas.QualityCount(**c) for c in idea_quality_data["counts"]
-                    ],
-                    total_votes_with_qualities=idea_quality_data[
-                        "total_votes_with_qualities"
-                    ],
-                )
-
-            idea_dict = {
-                "id": result.Idea.id,
-                "title": result.Idea.title,
-                "description": result.Idea.description,
-                "category_id": result.Idea.category_id,
-                "user_id": result.Idea.user_id,
-                "status": result.Idea.status,
-                "admin_comment": result.Idea.admin_comment,
-                "created_at": result.Idea.created_at,
-                "validated_at": result.Idea.validated_at,
-                "author_username": result.author_username,
-                "author_display_name": result.author_display_name,
-                "category_name_en": result.category_name_en,
-                "category_name_fr": result.category_name_fr,
-                "upvotes": result.upvotes,
-                "downvotes": result.downvotes,
-                "score": result.score,
-                "comment_count": result.comment_count,
-                "user_vote": result.user_vote if hasattr(result, "user_vote") else None,
-                "quality_counts": quality_counts,
-                "language": result.Idea.language,
-                # Edit tracking fields
-                "edit_count": result.Idea.edit_count,
-                "last_edit_at": result.Idea.last_edit_at,
-                "previous_status": result.Idea.previous_status,
-                "tags": [
-                    schemas.Tag(
-                        id=int(tag.id),  # type: ignore[arg-type]
-                        name=str(tag.name),  # type: ignore[arg-type]
-                        display_name=str(tag.display_name),  # type: ignore[arg-type]
-                        created_at=tag.created_at,  # type: ignore[arg-type]
-                    )
-                    for tag in tags
-                ],
-            }
-            ideas_with_scores.append(schemas.IdeaWithScore(**idea_dict))
-
-        return ideas_with_scores
+        return [
+            self._to_idea_row(
+                result.Idea,
+                result,
+                tags_by_idea.get(result.Idea.id, []),
+                quality_counts_by_idea.get(result.Idea.id, {}),
+            )
+            for result in results
+        ]
 
     def get_ideas_by_tag_with_scores(
         self,
@@ -804,7 +947,9 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
         Get ideas by IDs with vote scores and comment counts.
 
         Preserves the order of idea_ids for relevance-sorted results
-        (important for search results).
+        (important for search results). Aggregates are correlated on the
+        requested ideas, so the cost grows with their votes and comments
+        rather than with the size of those tables.
 
         Args:
             idea_ids: List of idea IDs to fetch
@@ -813,164 +958,90 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
         Returns:
             List of IdeaWithScore objects in the same order as idea_ids
         """
-        import models.schemas as schemas
-
         if not idea_ids:
             return []
 
-        # Subquery for upvotes
-        upvotes_subq = (
-            self.db.query(
-                db_models.Vote.idea_id, func.count(db_models.Vote.id).label("upvotes")
-            )
-            .filter(db_models.Vote.vote_type == db_models.VoteType.UPVOTE)
-            .group_by(db_models.Vote.idea_id)
-            .subquery()
-        )
-
-        # Subquery for downvotes
-        downvotes_subq = (
-            self.db.query(
-                db_models.Vote.idea_id, func.count(db_models.Vote.id).label("downvotes")
-            )
-            .filter(db_models.Vote.vote_type == db_models.VoteType.DOWNVOTE)
-            .group_by(db_models.Vote.idea_id)
-            .subquery()
-        )
-
-        # Subquery for comment count (only visible comments)
-        comments_subq = (
-            self.db.query(
-                db_models.Comment.idea_id,
-                func.count(db_models.Comment.id).label("comment_count"),
-            )
-            .filter(
-                db_models.Comment.is_moderated.is_(False),
-                db_models.Comment.deleted_at.is_(None),
-                db_models.Comment.is_hidden.is_(False),
-                db_models.Comment.requires_approval.is_(False),
-            )
-            .group_by(db_models.Comment.idea_id)
-            .subquery()
-        )
-
-        # User vote subquery (if user is authenticated)
-        user_vote_subq = None
-        if current_user_id:
-            user_vote_subq = (
-                self.db.query(
-                    db_models.Vote.idea_id, db_models.Vote.vote_type.label("user_vote")
-                )
-                .filter(db_models.Vote.user_id == current_user_id)
-                .subquery()
-            )
-
-        # Main query - fetch by IDs
-        query = (
-            self.db.query(
+        results = self.db.execute(
+            select(
                 db_models.Idea,
                 db_models.User.username.label("author_username"),
                 db_models.User.display_name.label("author_display_name"),
                 db_models.Category.name_en.label("category_name_en"),
                 db_models.Category.name_fr.label("category_name_fr"),
-                func.coalesce(upvotes_subq.c.upvotes, 0).label("upvotes"),
-                func.coalesce(downvotes_subq.c.downvotes, 0).label("downvotes"),
-                (
-                    func.coalesce(upvotes_subq.c.upvotes, 0)
-                    - func.coalesce(downvotes_subq.c.downvotes, 0)
-                ).label("score"),
-                func.coalesce(comments_subq.c.comment_count, 0).label("comment_count"),
-                user_vote_subq.c.user_vote
-                if user_vote_subq is not None
-                else literal(None).label("user_vote"),
+                *self._score_columns(current_user_id),
             )
             .join(db_models.User, db_models.Idea.user_id == db_models.User.id)
             .join(
                 db_models.Category, db_models.Idea.category_id == db_models.Category.id
             )
-            .outerjoin(upvotes_subq, db_models.Idea.id == upvotes_subq.c.idea_id)
-            .outerjoin(downvotes_subq, db_models.Idea.id == downvotes_subq.c.idea_id)
-            .outerjoin(comments_subq, db_models.Idea.id == comments_subq.c.idea_id)
-            .filter(
+            .where(
                 db_models.Idea.id.in_(idea_ids),
                 db_models.Idea.deleted_at.is_(None),
             )
-        )
+        ).all()
 
-        if user_vote_subq is not None:
-            query = query.outerjoin(
-                user_vote_subq, db_models.Idea.id == user_vote_subq.c.idea_id
+        # Batch fetch tags and quality counts for returned ideas
+        found_ids = [result.Idea.id for result in results]
+        tags_by_idea = self._fetch_tags_batch(found_ids)
+        vote_quality_repo = VoteQualityRepository(self.db)
+        quality_counts_by_idea = vote_quality_repo.get_counts_for_ideas_batch(found_ids)
+
+        ideas_by_id = {
+            result.Idea.id: self._to_idea_with_score(
+                result.Idea,
+                result,
+                tags_by_idea.get(result.Idea.id, []),
+                quality_counts_by_idea.get(result.Idea.id, {}),
             )
+            for result in results
+        }
 
-        results = query.all()
-
-        # Batch fetch tags
-        tags_by_idea = self._fetch_tags_batch(idea_ids)
-
-        # Batch fetch quality counts for returned ideas
+        # Return in original order (preserves relevance ranking from search)
+        return [ideas_by_id[id] for id in idea_ids if id in ideas_by_id]
 
-        vote_quality_repo = VoteQualityRepository(self.db)
-        quality_counts_by_idea = vote_quality_repo.get_counts_for_ideas_batch(idea_ids)
+    def hydrate_idea_with_score(
+        self,
+        idea: db_models.Idea,
+        current_user_id: Optional[int] = None,
+    ) -> "schemas.IdeaWithScore":
+        """
+        Add scores, counts and display names to an already loaded idea.
 
-        # Build ideas_by_id dict for preserving order
-        ideas_by_id: dict[int, schemas.IdeaWithScore] = {}
-        for result in results:
-            tags = tags_by_idea.get(result.Idea.id, [])
+        Reuses the idea row instead of selecting it again; the extra query
+        only reads the author and category names and the idea's own votes
+        and comments.
 
-            # Get quality counts from pre-fetched batch
-            idea_quality_data = quality_counts_by_idea.get(result.Idea.id, {})
-            quality_counts = None
-            if idea_quality_data.get("counts") or idea_quality_data.get(
-                "total_votes_with_qualities", 0
-            ):
-                quality_counts = schemas.QualityCounts(
-                    counts=[
-                        schemas.QualityCount(**c) for c in idea_quality_data["counts"]
-                    ],
-                    total_votes_with_qualities=idea_quality_data[
-                        "total_votes_with_qualities"
-                    ],
-                )
+        Args:
+            idea: Loaded idea
+            current_user_id: Optional user ID for vote status
 
-            idea_dict = {
-                "id": result.Idea.id,
-                "title": result.Idea.title,
-                "description": result.Idea.description,
-                "category_id": result.Idea.category_id,
-                "user_id": result.Idea.user_id,
-                "status": result.Idea.status,
-                "admin_comment": result.Idea.admin_comment,
-                "created_at": result.Idea.created_at,
-                "validated_at": result.Idea.validated_at,
-                "author_username": result.author_username,
-                "author_display_name": result.author_display_name,
-                "category_name_en": result.category_name_en,
-                "category_name_fr": result.category_name_fr,
-                "upvotes": result.upvotes,
-                "downvotes": result.downvotes,
-                "score": result.score,
-                "comment_count": result.comment_count,
-                "user_vote": result.user_vote if hasattr(result, "user_vote") else None,
-                "quality_counts": quality_counts,
-                "language": result.Idea.language,
-                # Edit tracking fields
-                "edit_count": result.Idea.edit_count,
-                "last_edit_at": result.Idea.last_edit_at,
-                "previous_status": result.Idea.previous_status,
-                "tags": [
-                    schemas.Tag(
-                        id=int(tag.id),  # type: ignore[arg-type]
-                        name=str(tag.name),  # type: ignore[arg-type]
-                        display_name=str(tag.display_name),  # type: ignore[arg-type]
-                        created_at=tag.created_at,  # type: ignore[arg-type]
-                    )
-                    for tag in tags
-                ],
-            }
-            ideas_by_id[result.Idea.id] = schemas.IdeaWithScore(**idea_dict)
+        Returns:
+            IdeaWithScore for the idea
+        """
+        result = self.db.execute(
+            select(
+                db_models.User.username.label("author_username"),
+                db_models.User.display_name.label("author_display_name"),
+                db_models.Category.name_en.label("category_name_en"),
+                db_models.Category.name_fr.label("category_name_fr"),
+                *self._score_columns(current_user_id),
+            )
+            .select_from(db_models.Idea)
+            .join(db_models.User, db_models.Idea.user_id == db_models.User.id)
+            .join(
+                db_models.Category, db_models.Idea.category_id == db_models.Category.id
+            )
+            .where(db_models.Idea.id == idea.id)
+        ).one()
 
-        # Return in original order (preserves relevance ranking from search)
-        return [ideas_by_id[id] for id in idea_ids if id in ideas_by_id]
+        vote_quality_repo = VoteQualityRepository(self.db)
+        quality_counts = vote_quality_repo.get_counts_for_ideas_batch([idea.id])
+        return self._to_idea_with_score(
+            idea,
+            result,
+            self._fetch_tags_batch([idea.id]).get(idea.id, []),
+            quality_counts.get(idea.id, {}),
+        )
 
     # Soft delete methods
 
@@ -1190,30 +1261,79 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
         result = query.scalar()
         return result if result is not None else 0
 
-    def get_sitemap_data(self) -> list[tuple[int, Optional[datetime], int]]:
+    def iter_sitemap_data(
+        self,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[tuple[int, Optional[datetime], int]]:
         """
-        Get minimal idea data for sitemap generation.
+        Stream minimal idea data for sitemap generation.
 
-        Returns:
-            List of tuples (id, updated_at, score) for approved ideas
-        """
+        Rows are fetched ``batch_size`` at a time (``yield_per``) in
+        primary-key order, so memory stays flat however many ideas exist.
 
-        results = (
-            self.db.query(
+        Args:
+            min_id: Inclusive lower idea ID bound
+            max_id: Exclusive upper idea ID bound
+            batch_size: Rows per fetch
+
+        Yields:
+            Tuples (id, updated_at, score) for approved ideas
+        """
+        stmt = (
+            select(
                 db_models.Idea.id,
                 func.coalesce(
                     db_models.Idea.validated_at, db_models.Idea.created_at
                 ).label("updated_at"),
-                func.coalesce(db_models.Idea.score, 0).label("score"),
+                db_models.Idea.score,
             )
-            .filter(
+            .where(
                 db_models.Idea.status == db_models.IdeaStatus.APPROVED,
                 db_models.Idea.deleted_at.is_(None),
             )
-            .order_by(db_models.Idea.score.desc())
-            .all()
+            .order_by(db_models.Idea.id)
+            .execution_options(yield_per=batch_size)
         )
-        return [(r.id, r.updated_at, r.score) for r in results]
+        if min_id is not None:
+            stmt = stmt.where(db_models.Idea.id >= min_id)
+        if max_id is not None:
+            stmt = stmt.where(db_models.Idea.id < max_id)
+
+        for row in self.db.execute(stmt):
+            yield row.id, row.updated_at, row.score
+
+    def get_sitemap_shards(
+        self, shard_size: int
+    ) -> list[tuple[int, Optional[datetime]]]:
+        """
+        Get non-empty sitemap shards (fixed idea ID ranges).
+
+        Args:
+            shard_size: Idea ID range per shard
+
+        Returns:
+            List of (shard number, last modification) ordered by shard
+        """
+        shard = (db_models.Idea.id // shard_size).label("shard")
+        rows = self.db.execute(
+            select(
+                shard,
+                func.max(
+                    func.coalesce(
+                        db_models.Idea.validated_at, db_models.Idea.created_at
+                    )
+                ),
+            )
+            .where(
+                db_models.Idea.status == db_models.IdeaStatus.APPROVED,
+                db_models.Idea.deleted_at.is_(None),
+            )
+            .group_by(shard)
+            .order_by(shard)
+        ).all()
+        return [(int(number), lastmod) for number, lastmod in rows]
 
     def search_by_keywords(
         self,
@@ -1274,6 +1394,26 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
             .first()
         )
 
+    def get_many_with_author(self, idea_ids: list[int]) -> dict[int, Any]:
+        """
+        Get several ideas with their authors in one query.
+
+        Args:
+            idea_ids: Idea IDs
+
+        Returns:
+            Dict mapping idea ID to (Idea, User); missing IDs are absent
+        """
+        if not idea_ids:
+            return {}
+        rows = (
+            self.db.query(db_models.Idea, db_models.User)
+            .join(db_models.User, db_models.Idea.user_id == db_models.User.id)
+            .filter(db_models.Idea.id.in_(idea_ids))
+            .all()
+        )
+        return {idea.id: (idea, user) for idea, user in rows}
+
     def unhide(self, idea_id: int) -> bool:
         """
         Unhide an idea and reset flag count.
@@ -1563,7 +1703,8 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
         """
         Soft delete all non-deleted ideas by a user.
 
-        Used when banning a user.
+        Used when banning a user. The ideas are taken out of the tag
+        counters first, since the bulk update bypasses the flush hook.
 
         Args:
             user_id: User ID whose ideas to delete
@@ -1574,20 +1715,19 @@ class IdeaRepository(BaseRepository[db_models.Idea]):
             Number of ideas deleted
         """
         now = datetime.now(timezone.utc)
-        result = (
-            self.db.query(db_models.Idea)
-            .filter(
-                db_models.Idea.user_id == user_id,
-                db_models.Idea.deleted_at.is_(None),
-            )
-            .update(
-                {
-                    db_models.Idea.deleted_at: now,
-                    db_models.Idea.deleted_by: deleted_by,
-                    db_models.Idea.deletion_reason: reason,
-                },
-                synchronize_session=False,
-            )
+        query = self.db.query(db_models.Idea).filter(
+            db_models.Idea.user_id == user_id,
+            db_models.Idea.deleted_at.is_(None),
+        )
+        idea_ids = [row.id for row in query.with_entities(db_models.Idea.id)]
+        TagStatRepository(self.db).remove_ideas(idea_ids)
+        result = query.update(
+            {
+                db_models.Idea.deleted_at: now,
+                db_models.Idea.deleted_by: deleted_by,
+                db_models.Idea.deletion_reason: reason,
+            },
+            synchronize_session=False,
         )
         return result
 
@@ -0,0 +1,172 @@
+"""
+Repositories for the background job runner: leader lease and run history.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.orm import Session, aliased
+
+import repositories.db_models as db_models
+from repositories.base import BaseRepository
+
+
+def _utc_now() -> datetime:
+    """Current UTC time as stored in DateTime columns (naive)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class SchedulerLeaseRepository(BaseRepository[db_models.SchedulerLease]):
+    """Repository for time-limited leader leases."""
+
+    def __init__(self, db: Session):
+        """
+        Initialize scheduler lease repository.
+
+        Args:
+            db: Database session
+        """
+        super().__init__(db_models.SchedulerLease, db)
+
+    def try_acquire(self, name: str, holder: str, ttl_seconds: int) -> bool:
+        """
+        Take or renew a lease.
+
+        One upsert: the row is written only when it is missing, already
+        ours, or expired, so two workers can never both succeed.
+
+        Args:
+            name: Lease name
+            holder: Id of the worker asking for it
+            ttl_seconds: How long the lease stays valid without renewal
+
+        Returns:
+            True if the holder now owns the lease
+        """
+        lease = db_models.SchedulerLease
+        now = _utc_now()
+        stmt = self._upsert_insert().values(
+            name=name, holder=holder, expires_at=now + timedelta(seconds=ttl_seconds)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "holder": stmt.excluded.holder,
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=or_(lease.holder == holder, lease.expires_at < now),
+        )
+        self.db.execute(stmt)
+        return self.db.scalar(select(lease.holder).where(lease.name == name)) == holder
+
+    def release(self, name: str, holder: str) -> None:
+        """
+        Give up a lease so another worker can take it at once.
+
+        Args:
+            name: Lease name
+            holder: Id of the worker releasing it (other holders are left alone)
+        """
+        lease = db_models.SchedulerLease
+        self.db.execute(delete(lease).where(lease.name == name, lease.holder == holder))
+
+    def get_lease(self, name: str) -> db_models.SchedulerLease | None:
+        """
+        Get a lease row.
+
+        Args:
+            name: Lease name
+
+        Returns:
+            The lease, or None if it was never taken
+        """
+        return self.db.get(db_models.SchedulerLease, name)
+
+
+class JobRunRepository(BaseRepository[db_models.JobRun]):
+    """Repository for background job run history."""
+
+    def __init__(self, db: Session):
+        """
+        Initialize job run repository.
+
+        Args:
+            db: Database session
+        """
+        super().__init__(db_models.JobRun, db)
+
+    def record(
+        self,
+        job_id: str,
+        worker: str,
+        started_at: datetime,
+        duration_ms: int,
+        error: str | None = None,
+        keep: int = 50,
+    ) -> None:
+        """
+        Record a finished run and drop the job's runs beyond the newest ``keep``.
+
+        Args:
+            job_id: Job id
+            worker: Id of the worker that ran it
+            started_at: Start time (UTC)
+            duration_ms: Run time in milliseconds
+            error: Error message if the run failed
+            keep: Runs to keep per job
+        """
+        run = db_models.JobRun
+        self.db.add(
+            run(
+                job_id=job_id,
+                worker=worker,
+                started_at=started_at.replace(tzinfo=None),
+                duration_ms=duration_ms,
+                status="failed" if error else "success",
+                error=error,
+            )
+        )
+        self.db.flush()
+        oldest_kept = (
+            select(run.id)
+            .where(run.job_id == job_id)
+            .order_by(run.id.desc())
+            .offset(keep - 1)
+            .limit(1)
+            .scalar_subquery()
+        )
+        self.db.execute(delete(run).where(run.job_id == job_id, run.id < oldest_kept))
+
+    def get_recent(
+        self, job_ids: list[str], limit: int
+    ) -> dict[str, list[db_models.JobRun]]:
+        """
+        Get the latest runs of each job, newest first.
+
+        Args:
+            job_ids: Jobs to look up
+            limit: Runs per job
+
+        Returns:
+            Dict mapping job id to its runs (jobs without runs map to [])
+        """
+        run = db_models.JobRun
+        ranked = (
+            select(
+                run,
+                func.row_number()
+                .over(partition_by=run.job_id, order_by=run.id.desc())
+                .label("rank"),
+            )
+            .where(run.job_id.in_(job_ids))
+            .subquery()
+        )
+        latest = aliased(run, ranked)
+        runs: dict[str, list[db_models.JobRun]] = {job_id: [] for job_id in job_ids}
+        for job_run in self.db.scalars(
+            select(latest)
+            .where(ranked.c.rank <= limit)
+            .order_by(ranked.c.job_id, ranked.c.rank)
+        ):
+            runs[job_run.job_id].append(job_run)
+        return runs
@@ -5,6 +5,10 @@ Security features (addressing audit findings):
 - Finding #1 (CRITICAL): Uses bcrypt with cost factor 12 instead of SHA-256
 - Finding #4 (HIGH): Account lockout after exceeding daily/weekly limits
 - Finding #11 (LOW): Context signature binding via HMAC
+
+bcrypt runs on the bounded crypto executor (core.crypto_executor). A keyed
+HMAC of each code (code_index) picks the candidate token, so verifying a
+code costs one bcrypt check however many codes the user has requested.
 """
 
 import hashlib
@@ -14,9 +18,10 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import bcrypt
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
+from core.crypto_executor import run_crypto
 from models.config import settings
 from repositories.base import BaseRepository
 from repositories.db_models import PasswordResetToken
@@ -49,9 +54,12 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
 
         Returns:
             bcrypt hash string (60 characters)
+
+        Raises:
+            CryptoBusyException: If the crypto executor's queue is full
         """
         salt = bcrypt.gensalt(rounds=settings.PASSWORD_RESET_BCRYPT_ROUNDS)
-        return bcrypt.hashpw(code.encode(), salt).decode()
+        return run_crypto(bcrypt.hashpw, code.encode(), salt).decode()
 
     @staticmethod
     def verify_code_hash(code: str, code_hash: str) -> bool:
@@ -64,8 +72,32 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
 
         Returns:
             True if code matches hash, False otherwise
+
+        Raises:
+            CryptoBusyException: If the crypto executor's queue is full
+        """
+        return run_crypto(bcrypt.checkpw, code.encode(), code_hash.encode())
+
+    @staticmethod
+    def code_index(user_id: int, code: str) -> str:
+        """
+        Compute the keyed lookup index of a code.
+
+        HMAC-SHA256 keyed with SECRET_KEY and bound to the user, so the
+        index alone cannot be brute-forced offline; bcrypt stays the check.
+
+        Args:
+            user_id: User's ID
+            code: Plain text reset code
+
+        Returns:
+            HMAC-SHA256 digest (64 hex characters)
         """
-        return bcrypt.checkpw(code.encode(), code_hash.encode())
+        return hmac.new(
+            settings.SECRET_KEY.encode(),
+            f"password-reset:{user_id}:{code}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
 
     @staticmethod
     def generate_context_signature(
@@ -148,6 +180,7 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
         token_record = PasswordResetToken(
             user_id=user_id,
             code_hash=code_hash,
+            code_index=self.code_index(user_id, plain_code),
             expires_at=expires_at,
             ip_address=ip_address,
             user_agent=user_agent,
@@ -168,6 +201,8 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
         Get a valid (not expired, not used, not max attempts) code for user.
 
         Uses bcrypt verification which is inherently slow to prevent brute-force.
+        Only tokens whose code_index matches are bcrypt-checked (plus tokens
+        created before code_index existed).
 
         Args:
             user_id: The user's ID
@@ -178,12 +213,16 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
         """
         now = datetime.now(timezone.utc)
 
-        # Get all active tokens for this user (not expired, not used)
-        active_tokens = (
+        # Active tokens for this user (not expired, not used) matching the code
+        candidates = (
             self.db.query(PasswordResetToken)
             .filter(
                 and_(
                     PasswordResetToken.user_id == user_id,
+                    or_(
+                        PasswordResetToken.code_index == self.code_index(user_id, code),
+                        PasswordResetToken.code_index.is_(None),
+                    ),
                     PasswordResetToken.expires_at > now,
                     PasswordResetToken.used_at.is_(None),
                     PasswordResetToken.attempts < settings.PASSWORD_RESET_MAX_ATTEMPTS,
@@ -192,8 +231,8 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
             .all()
         )
 
-        # Verify code against each token's bcrypt hash
-        for token in active_tokens:
+        # Verify code against each candidate's bcrypt hash
+        for token in candidates:
             if self.verify_code_hash(code, token.code_hash):
                 return token
 
@@ -0,0 +1,70 @@
+"""
+Query plan repository for the admin index advisor.
+
+Captures the execution plans of the statements a repository call issues,
+without running them: while the call runs, each SELECT it sends is first
+explained (EXPLAIN QUERY PLAN on SQLite, EXPLAIN on PostgreSQL), then
+executed wrapped in a constant-false filter. The call sees the columns it
+expects but no rows, so it runs through all of its statements.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class CapturedPlan:
+    """Plan of one statement issued by a repository call."""
+
+    statement: str
+    plan: list[str] = field(default_factory=list)
+
+
+class QueryPlanRepository:
+    """Repository capturing query plans of repository calls."""
+
+    @staticmethod
+    def explain_call(db: Session, call: Callable[[], object]) -> list[CapturedPlan]:
+        """
+        Get the plans of the statements a call issues, without running them.
+
+        The call runs on the session's connection and is rolled back at
+        the end. Its SELECTs return no rows; errors the call raises on
+        empty results are ignored.
+
+        Args:
+            db: Database session
+            call: Read-only repository call to explain
+
+        Returns:
+            One CapturedPlan per SELECT, in the order issued
+        """
+        connection = db.connection()
+        prefix = (
+            "EXPLAIN QUERY PLAN " if connection.dialect.name == "sqlite" else "EXPLAIN "
+        )
+        plans: list[CapturedPlan] = []
+
+        def explain_instead(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+            if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                return statement, parameters
+            cursor.execute(prefix + statement, parameters)
+            # SQLite: (id, parent, notused, detail); PostgreSQL: one text column
+            plan = [str(row[-1]) for row in cursor.fetchall()]
+            plans.append(CapturedPlan(statement, plan))
+            # Same columns, no rows: the planner drops the constant-false query
+            return f"SELECT * FROM ({statement}) AS explained WHERE 1 = 0", parameters
+
+        event.listen(connection, "before_cursor_execute", explain_instead, retval=True)
+        try:
+            call()
+        except Exception as e:
+            logger.debug(f"Explained call failed on empty results: {e}")
+        finally:
+            event.remove(connection, "before_cursor_execute", explain_instead)
+            db.rollback()
+        return plans
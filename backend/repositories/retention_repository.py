@@ -1,11 +1,15 @@
 """
 Retention Repository for Law 25 Compliance.
 
-Provides database operations for data retention cleanup.
+Provides database operations for data retention cleanup. Purges select
+ids in primary-key order and delete by id, so each chunk is a short
+transaction (see RetentionService._purge_in_batches).
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any
 
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
@@ -25,25 +29,196 @@ class RetentionRepository(BaseRepository[db_models.User]):
         """
         super().__init__(db_models.User, db)
 
-    def get_soft_deleted_idea_ids(self, cutoff_date: datetime) -> list[int]:
+    def _id_batch(
+        self, model: Any, conditions: list[Any], after_id: int, limit: int
+    ) -> list[int]:
+        """
+        Get the next ids matching conditions, in primary-key order.
+
+        Args:
+            model: Model to select from
+            conditions: Filter conditions
+            after_id: Only ids greater than this (keyset pagination)
+            limit: Maximum ids to return
+
+        Returns:
+            List of ids, ascending
+        """
+        return list(
+            self.db.scalars(
+                select(model.id)
+                .where(*conditions, model.id > after_id)
+                .order_by(model.id)
+                .limit(limit)
+            )
+        )
+
+    def get_soft_deleted_idea_ids(
+        self, cutoff_date: datetime, after_id: int = 0, limit: int = 1000
+    ) -> list[int]:
         """
         Get IDs of ideas soft-deleted before cutoff date.
 
         Args:
             cutoff_date: Cutoff date for deletion
+            after_id: Only ids greater than this
+            limit: Maximum ids to return
 
         Returns:
-            List of idea IDs
+            List of idea IDs, ascending
         """
-        results = (
-            self.db.query(db_models.Idea.id)
-            .filter(
+        return self._id_batch(
+            db_models.Idea,
+            [
                 db_models.Idea.deleted_at.isnot(None),
                 db_models.Idea.deleted_at < cutoff_date,
-            )
-            .all()
+            ],
+            after_id,
+            limit,
+        )
+
+    def get_soft_deleted_comment_ids(
+        self, cutoff_date: datetime, after_id: int = 0, limit: int = 1000
+    ) -> list[int]:
+        """
+        Get IDs of comments soft-deleted before cutoff date.
+
+        Args:
+            cutoff_date: Cutoff date for deletion
+            after_id: Only ids greater than this
+            limit: Maximum ids to return
+
+        Returns:
+            List of comment IDs, ascending
+        """
+        return self._id_batch(
+            db_models.Comment,
+            [
+                db_models.Comment.deleted_at.isnot(None),
+                db_models.Comment.deleted_at < cutoff_date,
+            ],
+            after_id,
+            limit,
+        )
+
+    def get_expired_login_code_ids(
+        self, cutoff_date: datetime, after_id: int = 0, limit: int = 1000
+    ) -> list[int]:
+        """
+        Get IDs of email login codes expired before cutoff date.
+
+        Args:
+            cutoff_date: Cutoff date for deletion
+            after_id: Only ids greater than this
+            limit: Maximum ids to return
+
+        Returns:
+            List of code IDs, ascending
+        """
+        return self._id_batch(
+            db_models.EmailLoginCode,
+            [db_models.EmailLoginCode.expires_at < cutoff_date],
+            after_id,
+            limit,
+        )
+
+    def get_login_event_ids_before(
+        self, cutoff_date: datetime, after_id: int = 0, limit: int = 1000
+    ) -> list[int]:
+        """
+        Get IDs of login events created before cutoff date.
+
+        Args:
+            cutoff_date: Cutoff date for deletion
+            after_id: Only ids greater than this
+            limit: Maximum ids to return
+
+        Returns:
+            List of event IDs, ascending
+        """
+        return self._id_batch(
+            db_models.LoginEvent,
+            [db_models.LoginEvent.created_at < cutoff_date],
+            after_id,
+            limit,
+        )
+
+    def get_security_audit_log_ids_before(
+        self, cutoff_date: datetime, after_id: int = 0, limit: int = 1000
+    ) -> list[int]:
+        """
+        Get IDs of security audit logs created before cutoff date.
+
+        Args:
+            cutoff_date: Cutoff date for deletion
+            after_id: Only ids greater than this
+            limit: Maximum ids to return
+
+        Returns:
+            List of log IDs, ascending
+        """
+        return self._id_batch(
+            db_models.SecurityAuditLog,
+            [db_models.SecurityAuditLog.created_at < cutoff_date],
+            after_id,
+            limit,
+        )
+
+    def get_orphan_vote_quality_ids(
+        self, after_id: int = 0, limit: int = 1000
+    ) -> list[int]:
+        """
+        Get IDs of vote qualities whose vote no longer exists.
+
+        Args:
+            after_id: Only ids greater than this
+            limit: Maximum ids to return
+
+        Returns:
+            List of vote quality IDs, ascending
+        """
+        vote_exists = (
+            select(db_models.Vote.id)
+            .where(db_models.Vote.id == db_models.VoteQuality.vote_id)
+            .exists()
+        )
+        return self._id_batch(db_models.VoteQuality, [~vote_exists], after_id, limit)
+
+    def get_orphan_comment_like_ids(
+        self, after_id: int = 0, limit: int = 1000
+    ) -> list[int]:
+        """
+        Get IDs of comment likes whose comment no longer exists.
+
+        Args:
+            after_id: Only ids greater than this
+            limit: Maximum ids to return
+
+        Returns:
+            List of comment like IDs, ascending
+        """
+        comment_exists = (
+            select(db_models.Comment.id)
+            .where(db_models.Comment.id == db_models.CommentLike.comment_id)
+            .exists()
         )
-        return [r[0] for r in results]
+        return self._id_batch(db_models.CommentLike, [~comment_exists], after_id, limit)
+
+    def delete_by_ids(self, model: Any, ids: list[int]) -> int:
+        """
+        Delete rows by primary key.
+
+        Args:
+            model: Model to delete from
+            ids: Primary keys
+
+        Returns:
+            Number of deleted records
+        """
+        if not ids:
+            return 0
+        result = self.db.execute(delete(model).where(model.id.in_(ids)))
+        return result.rowcount  # type: ignore[attr-defined]
 
     def delete_idea_tags_by_idea_ids(self, idea_ids: list[int]) -> int:
         """
@@ -63,6 +238,25 @@ class RetentionRepository(BaseRepository[db_models.User]):
             .delete(synchronize_session=False)
         )
 
+    def delete_vote_qualities_by_idea_ids(self, idea_ids: list[int]) -> int:
+        """
+        Delete vote qualities of the votes on given idea IDs.
+
+        Args:
+            idea_ids: List of idea IDs
+
+        Returns:
+            Number of deleted records
+        """
+        if not idea_ids:
+            return 0
+        vote_ids = select(db_models.Vote.id).where(db_models.Vote.idea_id.in_(idea_ids))
+        return (
+            self.db.query(db_models.VoteQuality)
+            .filter(db_models.VoteQuality.vote_id.in_(vote_ids))
+            .delete(synchronize_session=False)
+        )
+
     def delete_votes_by_idea_ids(self, idea_ids: list[int]) -> int:
         """
         Delete votes for given idea IDs.
@@ -81,9 +275,9 @@ class RetentionRepository(BaseRepository[db_models.User]):
             .delete(synchronize_session=False)
         )
 
-    def delete_comments_by_idea_ids(self, idea_ids: list[int]) -> int:
+    def delete_comment_likes_by_idea_ids(self, idea_ids: list[int]) -> int:
         """
-        Delete comments for given idea IDs.
+        Delete likes of the comments on given idea IDs.
 
         Args:
             idea_ids: List of idea IDs
@@ -93,64 +287,87 @@ class RetentionRepository(BaseRepository[db_models.User]):
         """
         if not idea_ids:
             return 0
-        return (
-            self.db.query(db_models.Comment)
-            .filter(db_models.Comment.idea_id.in_(idea_ids))
-            .delete(synchronize_session=False)
+        comment_ids = select(db_models.Comment.id).where(
+            db_models.Comment.idea_id.in_(idea_ids)
         )
+        return self.delete_comment_likes_by_comment_ids(comment_ids)
 
-    def delete_soft_deleted_ideas(self, cutoff_date: datetime) -> int:
+    def delete_comment_likes_by_comment_ids(self, comment_ids: Any) -> int:
         """
-        Permanently delete soft-deleted ideas past retention period.
+        Delete likes of given comments.
 
         Args:
-            cutoff_date: Delete ideas deleted before this date
+            comment_ids: List of comment IDs, or a select of them
 
         Returns:
-            Number of deleted ideas
+            Number of deleted records
         """
         return (
-            self.db.query(db_models.Idea)
-            .filter(
-                db_models.Idea.deleted_at.isnot(None),
-                db_models.Idea.deleted_at < cutoff_date,
-            )
+            self.db.query(db_models.CommentLike)
+            .filter(db_models.CommentLike.comment_id.in_(comment_ids))
             .delete(synchronize_session=False)
         )
 
-    def delete_soft_deleted_comments(self, cutoff_date: datetime) -> int:
+    def delete_comments_by_idea_ids(self, idea_ids: list[int]) -> int:
         """
-        Permanently delete soft-deleted comments past retention period.
+        Delete comments for given idea IDs.
 
         Args:
-            cutoff_date: Delete comments deleted before this date
+            idea_ids: List of idea IDs
 
         Returns:
-            Number of deleted comments
+            Number of deleted records
         """
+        if not idea_ids:
+            return 0
         return (
             self.db.query(db_models.Comment)
-            .filter(
-                db_models.Comment.deleted_at.isnot(None),
-                db_models.Comment.deleted_at < cutoff_date,
-            )
+            .filter(db_models.Comment.idea_id.in_(idea_ids))
             .delete(synchronize_session=False)
         )
 
-    def delete_expired_login_codes(self, cutoff_date: datetime) -> int:
+    def get_checkpoint(self, purge: str) -> int:
         """
-        Delete email login codes expired before cutoff date.
+        Get the last id reached by an interrupted purge.
 
         Args:
-            cutoff_date: Delete codes expired before this date
+            purge: Purge name
 
         Returns:
-            Number of deleted codes
+            Last id reached, or 0 to start from the beginning
         """
-        return (
-            self.db.query(db_models.EmailLoginCode)
-            .filter(db_models.EmailLoginCode.expires_at < cutoff_date)
-            .delete(synchronize_session=False)
+        checkpoint = self.db.get(db_models.RetentionCheckpoint, purge)
+        return checkpoint.last_id if checkpoint else 0
+
+    def save_checkpoint(self, purge: str, last_id: int) -> None:
+        """
+        Record purge progress (without committing).
+
+        Args:
+            purge: Purge name
+            last_id: Last id reached
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        stmt = self._upsert_insert(db_models.RetentionCheckpoint).values(
+            purge=purge, last_id=last_id, updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["purge"],
+            set_={"last_id": stmt.excluded.last_id, "updated_at": now},
+        )
+        self.db.execute(stmt)
+
+    def clear_checkpoint(self, purge: str) -> None:
+        """
+        Forget purge progress once the purge has completed.
+
+        Args:
+            purge: Purge name
+        """
+        self.db.execute(
+            delete(db_models.RetentionCheckpoint).where(
+                db_models.RetentionCheckpoint.purge == purge
+            )
         )
 
     def get_users_to_warn_for_inactivity(
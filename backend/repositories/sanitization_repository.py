@@ -0,0 +1,100 @@
+"""
+Sanitization repository for the stored-content backfill.
+
+Reads user text columns in primary-key order (keyset pagination) and
+writes sanitized values back by primary key, so each batch is a short
+transaction (see SanitizationService.backfill_existing_content). A value
+is only overwritten if it still holds the text that was sanitized, so an
+edit made while its batch was being sanitized is never lost.
+"""
+
+from typing import Any
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+
+class SanitizationRepository:
+    """Repository reading and rewriting user text columns."""
+
+    def __init__(self, db: Session):
+        """
+        Initialize sanitization repository.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    def get_text_batch(
+        self, model: Any, columns: list[str], after_id: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """
+        Get the next rows of a model's text columns, in primary-key order.
+
+        Args:
+            model: Model to read
+            columns: Text column names
+            after_id: Only rows with a greater id (keyset pagination)
+            limit: Maximum rows to return
+
+        Returns:
+            Dicts with "id" and each column, ascending by id
+        """
+        rows = self.db.execute(
+            select(model.id, *(getattr(model, column) for column in columns))
+            .where(model.id > after_id)
+            .order_by(model.id)
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def get_text_by_ids(
+        self, model: Any, columns: list[str], ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Get a model's text columns for given rows.
+
+        Args:
+            model: Model to read
+            columns: Text column names
+            ids: Primary keys
+
+        Returns:
+            Dict mapping id to a dict of the columns
+        """
+        if not ids:
+            return {}
+        rows = self.db.execute(
+            select(model.id, *(getattr(model, column) for column in columns)).where(
+                model.id.in_(ids)
+            )
+        )
+        return {row.id: dict(row._mapping) for row in rows}
+
+    def update_text(
+        self, model: Any, column: str, updates: list[dict[str, Any]]
+    ) -> None:
+        """
+        Write new values of one column by primary key (one executemany).
+
+        Each row is only written if the column still holds "original":
+        ``UPDATE ... SET column = :column WHERE id = :id AND column =
+        :original``.
+
+        Args:
+            model: Model to update
+            column: Column to set
+            updates: Dicts with "id", the column's new value and "original"
+        """
+        if updates:
+            self.db.execute(
+                update(model)
+                .where(getattr(model, column) == bindparam("original"))
+                .execution_options(synchronize_session=None),
+                updates,
+            )
+
+    def commit(self) -> None:
+        """Commit the current batch."""
+        self.db.commit()
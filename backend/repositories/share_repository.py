@@ -1,7 +1,9 @@
 """
 Share repository for database operations.
 
-Handles all database interactions for share event tracking.
+Handles all database interactions for share event tracking. Analytics
+read from the ``share_counts`` rollup; ``share_events`` is an optional,
+sampled raw log.
 """
 
 from datetime import datetime, timedelta, timezone
@@ -50,6 +52,54 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
         )
         return self.create(share_event)
 
+    def upsert_share_counts(
+        self, counts: dict[tuple[int, db_models.SharePlatform, datetime], int]
+    ) -> int:
+        """
+        Add buffered share counts into the per-minute rollup table.
+
+        Uses a single ``INSERT ... ON CONFLICT DO UPDATE`` so concurrent
+        flushes from several workers add up instead of overwriting.
+        Counts for ideas that no longer exist are dropped.
+
+        Args:
+            counts: Mapping of (idea_id, platform, bucket_start) to count
+
+        Returns:
+            Number of shares written
+        """
+        if not counts:
+            return 0
+
+        idea_ids = {idea_id for idea_id, _, _ in counts}
+        existing = {
+            row.id
+            for row in self.db.query(db_models.Idea.id)
+            .filter(db_models.Idea.id.in_(idea_ids))
+            .all()
+        }
+        rows = [
+            {
+                "idea_id": idea_id,
+                "platform": platform,
+                "bucket_start": bucket_start,
+                "count": count,
+            }
+            for (idea_id, platform, bucket_start), count in counts.items()
+            if idea_id in existing
+        ]
+        if not rows:
+            return 0
+
+        stmt = self._upsert_insert(db_models.ShareCount).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["idea_id", "platform", "bucket_start"],
+            set_={"count": db_models.ShareCount.count + stmt.excluded.count},
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+        return sum(row["count"] for row in rows)
+
     def get_share_counts_by_idea(self, idea_id: int) -> dict[str, Any]:
         """
         Get share counts for a specific idea.
@@ -62,16 +112,16 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
         """
         counts = (
             self.db.query(
-                db_models.ShareEvent.platform,
-                func.count(db_models.ShareEvent.id).label("count"),
+                db_models.ShareCount.platform,
+                func.sum(db_models.ShareCount.count).label("count"),
             )
-            .filter(db_models.ShareEvent.idea_id == idea_id)
-            .group_by(db_models.ShareEvent.platform)
+            .filter(db_models.ShareCount.idea_id == idea_id)
+            .group_by(db_models.ShareCount.platform)
             .all()
         )
 
         by_platform: dict[str, int] = {
-            row.platform.value: row.count
+            row.platform.value: int(row.count)
             for row in counts  # type: ignore[misc]
         }
         total = sum(by_platform.values())
@@ -93,11 +143,11 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
             Number of shares in the period
         """
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        return (
-            self.db.query(func.count(db_models.ShareEvent.id))
+        return int(
+            self.db.query(func.sum(db_models.ShareCount.count))
             .filter(
-                db_models.ShareEvent.idea_id == idea_id,
-                db_models.ShareEvent.created_at >= cutoff,
+                db_models.ShareCount.idea_id == idea_id,
+                db_models.ShareCount.bucket_start >= cutoff,
             )
             .scalar()
             or 0
@@ -121,12 +171,12 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
         # Get counts grouped by idea and platform
         counts = (
             self.db.query(
-                db_models.ShareEvent.idea_id,
-                db_models.ShareEvent.platform,
-                func.count(db_models.ShareEvent.id).label("count"),
+                db_models.ShareCount.idea_id,
+                db_models.ShareCount.platform,
+                func.sum(db_models.ShareCount.count).label("count"),
             )
-            .filter(db_models.ShareEvent.idea_id.in_(idea_ids))
-            .group_by(db_models.ShareEvent.idea_id, db_models.ShareEvent.platform)
+            .filter(db_models.ShareCount.idea_id.in_(idea_ids))
+            .group_by(db_models.ShareCount.idea_id, db_models.ShareCount.platform)
             .all()
         )
 
@@ -136,8 +186,8 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
             idea_id = row.idea_id
             if idea_id not in result:
                 result[idea_id] = {"total_shares": 0, "by_platform": {}}
-            result[idea_id]["by_platform"][row.platform.value] = row.count
-            result[idea_id]["total_shares"] += row.count
+            result[idea_id]["by_platform"][row.platform.value] = int(row.count)
+            result[idea_id]["total_shares"] += int(row.count)
 
         # Fill in zeros for ideas with no shares
         for idea_id in idea_ids:
@@ -156,11 +206,11 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
         Returns:
             Total share count
         """
-        query = self.db.query(func.count(db_models.ShareEvent.id))
+        query = self.db.query(func.sum(db_models.ShareCount.count))
         if days:
             cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.filter(db_models.ShareEvent.created_at >= cutoff)
-        return query.scalar() or 0
+            query = query.filter(db_models.ShareCount.bucket_start >= cutoff)
+        return int(query.scalar() or 0)
 
     def get_platform_distribution(self, days: int | None = None) -> dict[str, int]:
         """
@@ -173,16 +223,16 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
             Dict mapping platform to count
         """
         query = self.db.query(
-            db_models.ShareEvent.platform,
-            func.count(db_models.ShareEvent.id).label("count"),
+            db_models.ShareCount.platform,
+            func.sum(db_models.ShareCount.count).label("count"),
         )
         if days:
             cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.filter(db_models.ShareEvent.created_at >= cutoff)
-        query = query.group_by(db_models.ShareEvent.platform)
+            query = query.filter(db_models.ShareCount.bucket_start >= cutoff)
+        query = query.group_by(db_models.ShareCount.platform)
 
         return {  # type: ignore[invalid-return-type]
-            row.platform.value: row.count for row in query.all()
+            row.platform.value: int(row.count) for row in query.all()
         }
 
     def get_top_shared_ideas(self, limit: int = 10) -> list[dict[str, Any]]:
@@ -195,17 +245,19 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
         Returns:
             List of dicts with idea_id, title, total_shares, by_platform
         """
+        total = func.sum(db_models.ShareCount.count)
+
         # Get top ideas by share count
         top_ideas = (
             self.db.query(
-                db_models.ShareEvent.idea_id,
+                db_models.ShareCount.idea_id,
                 db_models.Idea.title,
-                func.count(db_models.ShareEvent.id).label("total_shares"),
+                total.label("total_shares"),
             )
-            .join(db_models.Idea, db_models.ShareEvent.idea_id == db_models.Idea.id)
+            .join(db_models.Idea, db_models.ShareCount.idea_id == db_models.Idea.id)
             .filter(db_models.Idea.deleted_at.is_(None))
-            .group_by(db_models.ShareEvent.idea_id, db_models.Idea.title)
-            .order_by(func.count(db_models.ShareEvent.id).desc())
+            .group_by(db_models.ShareCount.idea_id, db_models.Idea.title)
+            .order_by(total.desc())
             .limit(limit)
             .all()
         )
@@ -223,7 +275,7 @@ class ShareRepository(BaseRepository[db_models.ShareEvent]):
                 {
                     "idea_id": row.idea_id,
                     "title": row.title,
-                    "total_shares": row.total_shares,
+                    "total_shares": int(row.total_shares),
                     "by_platform": platform_counts.get(row.idea_id, {}).get(
                         "by_platform", {}
                     ),
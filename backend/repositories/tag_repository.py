@@ -2,11 +2,17 @@
 Tag repository for database operations.
 """
 
+from collections import defaultdict
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import case, delete, desc, exists, func, insert, literal, select, update
 from repositories.base import BaseRepository
-from repositories.db_models import Tag, IdeaTag, Idea, IdeaStatus
+from repositories.db_models import Tag, IdeaTag, Idea, IdeaStatus, TagStat
+
+
+def _public_idea_filter() -> tuple:
+    """Conditions for an idea to count in tag_stats (approved, not deleted)."""
+    return (Idea.status == IdeaStatus.APPROVED, Idea.deleted_at.is_(None))
 
 
 class TagRepository(BaseRepository[Tag]):
@@ -56,25 +62,47 @@ class TagRepository(BaseRepository[Tag]):
             .all()
         )
 
+    def search_tags_with_counts(self, query: str, limit: int = 10) -> List[tuple]:
+        """
+        Search tags by name with their public idea counts (for autocomplete).
+
+        Args:
+            query: Search query
+            limit: Maximum results to return
+
+        Returns:
+            List of tuples (tag, idea_count)
+        """
+        search_term = f"%{query.lower()}%"
+        results = (
+            self.db.query(Tag, func.coalesce(TagStat.idea_count, 0))
+            .outerjoin(TagStat, TagStat.tag_id == Tag.id)
+            .filter(Tag.name.like(search_term))
+            .order_by(Tag.display_name)
+            .limit(limit)
+            .all()
+        )
+        return results  # type: ignore[return-value]
+
     def get_popular_tags(self, limit: int = 20, min_ideas: int = 1) -> List[tuple]:
         """
-        Get most popular tags based on number of approved ideas.
+        Get most popular tags based on number of public ideas.
+
+        Reads the maintained counts in tag_stats, walking its idea_count
+        index, instead of counting idea_tags.
 
         Args:
             limit: Maximum number of tags to return
-            min_ideas: Minimum number of ideas required
+            min_ideas: Minimum number of ideas required (at least 1)
 
         Returns:
             List of tuples (tag, idea_count)
         """
         results = (
-            self.db.query(Tag, func.count(IdeaTag.id).label("idea_count"))
-            .join(IdeaTag, Tag.id == IdeaTag.tag_id)
-            .join(Idea, IdeaTag.idea_id == Idea.id)
-            .filter(Idea.status == IdeaStatus.APPROVED)
-            .group_by(Tag.id)
-            .having(func.count(IdeaTag.id) >= min_ideas)
-            .order_by(desc("idea_count"))
+            self.db.query(Tag, TagStat.idea_count)
+            .join(TagStat, TagStat.tag_id == Tag.id)
+            .filter(TagStat.idea_count >= max(min_ideas, 1))
+            .order_by(desc(TagStat.idea_count), desc(TagStat.tag_id))
             .limit(limit)
             .all()
         )
@@ -215,19 +243,16 @@ class TagRepository(BaseRepository[Tag]):
 
     def get_tag_idea_count(self, tag_id: int) -> int:
         """
-        Get count of approved ideas for a tag (Phase 3).
+        Get count of public ideas for a tag (Phase 3).
 
         Args:
             tag_id: Tag ID
 
         Returns:
-            Number of approved ideas with this tag
+            Number of approved, non-deleted ideas with this tag
         """
         count = (
-            self.db.query(func.count(IdeaTag.id))
-            .join(Idea, IdeaTag.idea_id == Idea.id)
-            .filter(IdeaTag.tag_id == tag_id, Idea.status == IdeaStatus.APPROVED)
-            .scalar()
+            self.db.query(TagStat.idea_count).filter(TagStat.tag_id == tag_id).scalar()
         )
         return count or 0
 
@@ -294,6 +319,50 @@ class IdeaTagRepository(BaseRepository[IdeaTag]):
 
         return False
 
+    def set_idea_tags(self, idea_id: int, tag_ids: list[int]) -> None:
+        """
+        Make an idea's tag associations match a list, in one commit.
+
+        Only associations that change are deleted or inserted.
+
+        Args:
+            idea_id: Idea ID
+            tag_ids: Tag IDs the idea should have
+        """
+        existing = {
+            idea_tag.tag_id: idea_tag
+            for idea_tag in self.db.query(IdeaTag).filter(IdeaTag.idea_id == idea_id)
+        }
+
+        for tag_id, idea_tag in existing.items():
+            if tag_id not in tag_ids:
+                self.db.delete(idea_tag)
+        for tag_id in dict.fromkeys(tag_ids):
+            if tag_id not in existing:
+                self.db.add(IdeaTag(idea_id=idea_id, tag_id=tag_id))
+
+        self.db.commit()
+
+    def get_tag_ids_by_idea(self, idea_ids: set[int]) -> dict[int, set[int]]:
+        """
+        Get the tag IDs associated with each of several ideas.
+
+        Args:
+            idea_ids: Idea IDs
+
+        Returns:
+            Dict mapping idea ID to its tag IDs (ideas without tags omitted)
+        """
+        if not idea_ids:
+            return {}
+        tag_ids: dict[int, set[int]] = defaultdict(set)
+        rows = self.db.execute(
+            select(IdeaTag.idea_id, IdeaTag.tag_id).where(IdeaTag.idea_id.in_(idea_ids))
+        )
+        for idea_id, tag_id in rows:
+            tag_ids[idea_id].add(tag_id)
+        return dict(tag_ids)
+
     def remove_all_tags_from_idea(self, idea_id: int) -> int:
         """
         Remove all tag associations from an idea.
@@ -341,3 +410,141 @@ class IdeaTagRepository(BaseRepository[IdeaTag]):
         )
 
         return [row.idea_id for row in query.all()]
+
+
+class TagStatRepository(BaseRepository[TagStat]):
+    """
+    Repository for the per-tag public idea counters (tag_stats).
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize TagStatRepository.
+
+        Args:
+            db: Database session
+        """
+        super().__init__(TagStat, db)
+
+    def adjust_counts(self, deltas: dict[int, int]) -> None:
+        """
+        Add per-tag deltas to the counters in the database.
+
+        Increments are upserts, creating missing counters; decrements are
+        ``UPDATE ... SET idea_count = idea_count + :delta`` never going
+        below zero. Tags are written in ID order so concurrent
+        transactions lock rows in the same order. Does not commit.
+
+        Args:
+            deltas: Dict mapping tag ID to the change in its idea count
+        """
+        increments = [
+            {"tag_id": tag_id, "idea_count": delta}
+            for tag_id, delta in sorted(deltas.items())
+            if delta > 0
+        ]
+        if increments:
+            stmt = self._upsert_insert().values(increments)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["tag_id"],
+                set_={"idea_count": TagStat.idea_count + stmt.excluded.idea_count},
+            )
+            self.db.execute(stmt)
+
+        decrements: dict[int, list[int]] = defaultdict(list)
+        for tag_id, delta in sorted(deltas.items()):
+            if delta < 0:
+                decrements[delta].append(tag_id)
+        for delta, tag_ids in decrements.items():
+            new_count = TagStat.idea_count + delta
+            self.db.execute(
+                update(TagStat)
+                .where(TagStat.tag_id.in_(tag_ids))
+                .values(idea_count=case((new_count < 0, 0), else_=new_count))
+                .execution_options(synchronize_session=False)
+            )
+
+    def get_public_idea_ids(self, idea_ids: set[int]) -> set[int]:
+        """
+        Get which of several ideas count in tag_stats.
+
+        Args:
+            idea_ids: Idea IDs
+
+        Returns:
+            IDs of the ideas that are approved and not deleted
+        """
+        if not idea_ids:
+            return set()
+        rows = self.db.execute(
+            select(Idea.id).where(Idea.id.in_(idea_ids), *_public_idea_filter())
+        )
+        return {idea_id for (idea_id,) in rows}
+
+    def remove_ideas(self, idea_ids: list[int]) -> None:
+        """
+        Take ideas out of the counters of their tags.
+
+        For bulk statements that delete or hide ideas or their tags
+        without going through the ORM flush hook. Call before the bulk
+        statement runs. Does not commit.
+
+        Args:
+            idea_ids: Idea IDs about to stop counting
+        """
+        if not idea_ids:
+            return
+        rows = self.db.execute(
+            select(IdeaTag.tag_id, func.count(IdeaTag.id))
+            .join(Idea, IdeaTag.idea_id == Idea.id)
+            .where(IdeaTag.idea_id.in_(idea_ids), *_public_idea_filter())
+            .group_by(IdeaTag.tag_id)
+        )
+        self.adjust_counts({tag_id: -count for tag_id, count in rows})
+
+    def sync_tag_stats(self, tag_ids: list[int] | None = None) -> int:
+        """
+        Recompute tag counters from idea_tags.
+
+        Set-based: creates missing counters, corrects only the counters
+        that drifted and drops counters of deleted tags. Does not commit.
+
+        Args:
+            tag_ids: Tags to resync, or None for every tag
+
+        Returns:
+            Number of counters corrected
+        """
+        if tag_ids is not None and not tag_ids:
+            return 0
+
+        missing = select(Tag.id, literal(0)).where(
+            ~exists().where(TagStat.tag_id == Tag.id)
+        )
+        if tag_ids is not None:
+            missing = missing.where(Tag.id.in_(tag_ids))
+        self.db.execute(insert(TagStat).from_select(["tag_id", "idea_count"], missing))
+
+        public_ideas = (
+            select(func.count(IdeaTag.id))
+            .join(Idea, IdeaTag.idea_id == Idea.id)
+            .where(IdeaTag.tag_id == TagStat.tag_id, *_public_idea_filter())
+            .scalar_subquery()
+        )
+        stmt = (
+            update(TagStat)
+            .where(TagStat.idea_count != public_ideas)
+            .values(idea_count=public_ideas)
+            .execution_options(synchronize_session=False)
+        )
+        if tag_ids is not None:
+            stmt = stmt.where(TagStat.tag_id.in_(tag_ids))
+        corrected = self.db.execute(stmt).rowcount
+
+        if tag_ids is None:
+            self.db.execute(
+                delete(TagStat)
+                .where(~exists().where(Tag.id == TagStat.tag_id))
+                .execution_options(synchronize_session=False)
+            )
+        return corrected
@@ -8,6 +8,9 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
+from repositories.tag_repository import TagStatRepository
+from repositories.vote_repository import VoteRepository
+
 from .base import BaseRepository
 
 
@@ -104,6 +107,70 @@ class UserRepository(BaseRepository[db_models.User]):
             is not None
         )
 
+    def avatar_in_use(self, avatar_url: str, exclude_user_id: int) -> bool:
+        """
+        Check whether another user shares an avatar (deduplicated uploads).
+
+        Args:
+            avatar_url: Stored avatar URL
+            exclude_user_id: User to ignore (the one replacing it)
+
+        Returns:
+            True if another user's avatar_url is the same
+        """
+        return (
+            self.db.query(db_models.User.id)
+            .filter(
+                db_models.User.avatar_url == avatar_url,
+                db_models.User.id != exclude_user_id,
+            )
+            .first()
+            is not None
+        )
+
+    def get_avatar_urls_in_use(self, avatar_urls: list[str]) -> set[str]:
+        """
+        Get which of the given avatar URLs some user still points at.
+
+        Args:
+            avatar_urls: Stored avatar URLs
+
+        Returns:
+            The referenced URLs
+        """
+        if not avatar_urls:
+            return set()
+        return {
+            row.avatar_url
+            for row in self.db.query(db_models.User.avatar_url)
+            .filter(db_models.User.avatar_url.in_(avatar_urls))
+            .distinct()
+        }
+
+    def get_users_with_avatar_after(
+        self, after_id: int, limit: int
+    ) -> List[db_models.User]:
+        """
+        Get users with an avatar, in id order, for batch processing.
+
+        Args:
+            after_id: Return users with a greater id
+            limit: Maximum number of users
+
+        Returns:
+            List of users
+        """
+        return (
+            self.db.query(db_models.User)
+            .filter(
+                db_models.User.avatar_url.isnot(None),
+                db_models.User.id > after_id,
+            )
+            .order_by(db_models.User.id)
+            .limit(limit)
+            .all()
+        )
+
     def get_all_users(self, skip: int = 0, limit: int = 100) -> List[db_models.User]:
         """
         Get all users with pagination.
@@ -132,13 +199,21 @@ class UserRepository(BaseRepository[db_models.User]):
             return False
 
         # Delete related records (votes, comments, admin roles, ideas)
-        self.db.query(db_models.Vote).filter(db_models.Vote.user_id == user_id).delete()
+        VoteRepository(self.db).delete_by_user_id(user_id)
         self.db.query(db_models.Comment).filter(
             db_models.Comment.user_id == user_id
         ).delete()
         self.db.query(db_models.AdminRole).filter(
             db_models.AdminRole.user_id == user_id
         ).delete()
+        # The bulk delete bypasses the flush hook maintaining tag counters
+        idea_ids = [
+            idea_id
+            for (idea_id,) in self.db.query(db_models.Idea.id).filter(
+                db_models.Idea.user_id == user_id
+            )
+        ]
+        TagStatRepository(self.db).remove_ideas(idea_ids)
         self.db.query(db_models.Idea).filter(db_models.Idea.user_id == user_id).delete()
 
         # Delete user
@@ -4,10 +4,16 @@ Vote repository for database operations.
 
 from typing import Optional, List
 
-from sqlalchemy import case, func
+from sqlalchemy import case, delete, func, select, update
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
+from repositories.cache_version_repository import (
+    SITEMAP_ENTITY,
+    CacheVersionRepository,
+    sitemap_shard,
+    sitemap_shard_entity,
+)
 from .base import BaseRepository
 
 
@@ -84,6 +90,138 @@ class VoteRepository(BaseRepository[db_models.Vote]):
             .all()
         )
 
+    def upsert_vote(
+        self, idea_id: int, user_id: int, vote_type: db_models.VoteType
+    ) -> tuple[db_models.Vote, db_models.VoteType | None]:
+        """
+        Insert a vote or change the type of the existing one.
+
+        New votes, the common case, are a single ``INSERT ... ON CONFLICT
+        DO NOTHING RETURNING``. When the vote already exists (or a
+        concurrent request inserted it first), it is read ``FOR UPDATE``
+        and changed, so concurrent clicks of the same user serialize on it
+        and the previous type returned is the one this change replaced.
+        Does not commit.
+
+        Args:
+            idea_id: Idea ID
+            user_id: User ID
+            vote_type: New vote type
+
+        Returns:
+            The inserted or updated vote, and its previous type (None if
+            the vote is new)
+        """
+        cache_entities = ("ideas", sitemap_shard_entity(sitemap_shard(idea_id)))
+        while True:
+            stmt = self._upsert_insert().values(
+                idea_id=idea_id, user_id=user_id, vote_type=vote_type
+            )
+            stmt = (
+                stmt.on_conflict_do_nothing(index_elements=["idea_id", "user_id"])
+                .returning(db_models.Vote)
+                .execution_options(
+                    populate_existing=True, cache_entities=cache_entities
+                )
+            )
+            vote = self.db.scalars(stmt).one_or_none()
+            if vote is not None:
+                return vote, None
+
+            vote = self.db.scalars(
+                select(db_models.Vote)
+                .where(
+                    db_models.Vote.idea_id == idea_id,
+                    db_models.Vote.user_id == user_id,
+                )
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            ).one_or_none()
+            # None: deleted again since the insert; try inserting once more
+            if vote is not None:
+                previous = vote.vote_type
+                if previous != vote_type:
+                    vote.vote_type = vote_type
+                    self.db.flush()
+                return vote, previous
+
+    def remove_vote(self, idea_id: int, user_id: int) -> db_models.VoteType | None:
+        """
+        Delete a user's vote and its qualities without loading it first.
+
+        Does not commit.
+
+        Args:
+            idea_id: Idea ID
+            user_id: User ID
+
+        Returns:
+            Type of the deleted vote, or None if none existed
+        """
+        cache_entities = ("ideas", sitemap_shard_entity(sitemap_shard(idea_id)))
+        vote_ids = (
+            select(db_models.Vote.id)
+            .where(db_models.Vote.idea_id == idea_id, db_models.Vote.user_id == user_id)
+            .scalar_subquery()
+        )
+        self.db.execute(
+            delete(db_models.VoteQuality)
+            .where(db_models.VoteQuality.vote_id.in_(vote_ids))
+            .execution_options(synchronize_session=False, cache_entities=cache_entities)
+        )
+        return self.db.execute(
+            delete(db_models.Vote)
+            .where(db_models.Vote.idea_id == idea_id, db_models.Vote.user_id == user_id)
+            .returning(db_models.Vote.vote_type)
+            .execution_options(
+                synchronize_session="fetch", cache_entities=cache_entities
+            )
+        ).scalar_one_or_none()
+
+    def adjust_idea_vote_counts(
+        self,
+        idea_id: int,
+        removed: db_models.VoteType | None,
+        added: db_models.VoteType | None,
+    ) -> None:
+        """
+        Apply one vote change to an idea's denormalized counters.
+
+        ``UPDATE ideas SET upvote_count = upvote_count + :delta ...``, so
+        concurrent votes on one idea each add their own delta after the
+        row lock instead of writing back a count taken from a snapshot
+        that misses the other vote. Does not commit.
+
+        Args:
+            idea_id: Idea ID
+            removed: Type of the vote taken away (None if none)
+            added: Type of the vote cast (None if none)
+        """
+        if removed == added:
+            return
+        up = (added == db_models.VoteType.UPVOTE) - (
+            removed == db_models.VoteType.UPVOTE
+        )
+        down = (added == db_models.VoteType.DOWNVOTE) - (
+            removed == db_models.VoteType.DOWNVOTE
+        )
+        self.db.execute(
+            update(db_models.Idea)
+            .where(db_models.Idea.id == idea_id)
+            .values(
+                upvote_count=db_models.Idea.upvote_count + up,
+                downvote_count=db_models.Idea.downvote_count + down,
+                score=db_models.Idea.score + (up - down),
+            )
+            .execution_options(
+                synchronize_session=False,
+                cache_entities=(
+                    "ideas",
+                    sitemap_shard_entity(sitemap_shard(idea_id)),
+                ),
+            )
+        )
+
     def delete_by_idea_and_user(self, idea_id: int, user_id: int) -> bool:
         """
         Delete vote by idea and user.
@@ -105,7 +243,7 @@ class VoteRepository(BaseRepository[db_models.Vote]):
 
     def delete_by_user_id(self, user_id: int) -> int:
         """
-        Delete all votes by a user.
+        Delete all votes by a user and resync the affected idea counters.
 
         Args:
             user_id: User ID
@@ -113,13 +251,84 @@ class VoteRepository(BaseRepository[db_models.Vote]):
         Returns:
             Number of deleted records
         """
+        idea_ids = self.get_voted_idea_ids(user_id)
         count = (
             self.db.query(db_models.Vote)
             .filter(db_models.Vote.user_id == user_id)
             .delete()
         )
+        self.sync_idea_vote_counts(idea_ids)
         return count
 
+    def get_voted_idea_ids(self, user_id: int) -> list[int]:
+        """
+        Get IDs of ideas a user has voted on.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List of idea IDs
+        """
+        return list(
+            self.db.scalars(
+                select(db_models.Vote.idea_id).where(db_models.Vote.user_id == user_id)
+            )
+        )
+
+    def sync_idea_vote_counts(self, idea_ids: Optional[list[int]] = None) -> int:
+        """
+        Recompute denormalized vote counters on ideas from the votes table.
+
+        For bulk changes and the nightly resync; single votes apply deltas
+        with adjust_idea_vote_counts, since a recount taken under READ
+        COMMITTED can miss a concurrent vote. Uses correlated subqueries, so each idea costs O(its votes) via
+        ix_votes_idea. Also marks the response cache versions of the
+        affected ideas and sitemap shards for a bump once the caller
+        commits. Does not commit.
+
+        Args:
+            idea_ids: Ideas to resync, or None for every idea
+
+        Returns:
+            Number of ideas updated
+        """
+        if idea_ids is not None and not idea_ids:
+            return 0
+
+        def count_votes(vote_type: db_models.VoteType):  # type: ignore[no-untyped-def]
+            return (
+                select(func.count(db_models.Vote.id))
+                .where(
+                    db_models.Vote.idea_id == db_models.Idea.id,
+                    db_models.Vote.vote_type == vote_type,
+                )
+                .scalar_subquery()
+            )
+
+        upvotes = count_votes(db_models.VoteType.UPVOTE)
+        downvotes = count_votes(db_models.VoteType.DOWNVOTE)
+        stmt = update(db_models.Idea).values(
+            upvote_count=upvotes,
+            downvote_count=downvotes,
+            score=upvotes - downvotes,
+        )
+        if idea_ids is not None:
+            stmt = stmt.where(db_models.Idea.id.in_(idea_ids))
+
+        # Core execution: the cache bump below is precise per shard, so the
+        # generic bulk-update hook (which invalidates every shard) is skipped
+        result = self.db.connection().execute(stmt)
+
+        if idea_ids is None:
+            entities = {"ideas", SITEMAP_ENTITY}
+        else:
+            entities = {"ideas"} | {
+                sitemap_shard_entity(sitemap_shard(idea_id)) for idea_id in idea_ids
+            }
+        CacheVersionRepository(self.db).mark_changed(entities)
+        return result.rowcount
+
     def delete_by_idea_id(self, idea_id: int) -> int:
         """
         Delete all votes for an idea.
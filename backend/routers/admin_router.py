@@ -3,7 +3,7 @@ from datetime import timedelta
 from datetime import timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
 import authentication.auth as auth
@@ -11,6 +11,7 @@ import models.schemas as schemas
 import repositories.db_models as db_models
 from helpers.pagination import PaginationLimitLarge, PaginationSkip
 from helpers.rate_limiter import limiter
+from helpers.serialization import lean_json_response
 from models.exceptions import ValidationException
 from repositories.database import get_db
 from services import CategoryService, CommentService, IdeaService, UserService
@@ -28,7 +29,7 @@ def get_pending_ideas(
     limit: int = Query(20, ge=1, le=100, description="Max items to return"),
     db: Session = Depends(get_db),
     current_user: db_models.User = Depends(auth.get_current_active_user),
-) -> schemas.PendingIdeasResponse:
+) -> Response:
     """
     Get pending ideas for admin review with pagination.
 
@@ -41,12 +42,15 @@ def get_pending_ideas(
 
     total = IdeaService.count_pending_ideas_for_admin_with_permissions(db, current_user)
 
-    return schemas.PendingIdeasResponse(
-        items=ideas,
-        total=total,
-        skip=skip,
-        limit=limit,
-        has_more=(skip + len(ideas)) < total,
+    return lean_json_response(
+        schemas.PendingIdeasResponse(
+            items=ideas,
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=(skip + len(ideas)) < total,
+        ),
+        schemas.PendingIdeasResponse,
     )
 
 
@@ -339,7 +343,7 @@ def get_approved_ideas(
 ):
     """Get all approved ideas for admin management with optional quality filtering."""
     user_id: int = current_user.id  # type: ignore[assignment]
-    return IdeaService.get_approved_ideas_for_admin(
+    ideas = IdeaService.get_approved_ideas_for_admin(
         db,
         category_id,
         user_id,
@@ -348,6 +352,7 @@ def get_approved_ideas(
         quality_key=quality_key,
         min_quality_count=min_quality_count,
     )
+    return lean_json_response(ideas, List[schemas.IdeaWithScore])
 
 
 @router.post("/ideas/merge", response_model=schemas.Idea)
@@ -818,6 +823,29 @@ def get_database_diagnostics(
     return DiagnosticsService.get_database_diagnostics(db)
 
 
+@router.get(
+    "/diagnostics/indexes",
+    response_model=schemas.IndexAdvisorResponse,
+)
+def get_index_advice(
+    db: Session = Depends(get_db),
+    current_user: db_models.User = Depends(auth.get_admin_user),
+) -> schemas.IndexAdvisorResponse:
+    """
+    Explain the hot analytics and security queries (index advisor).
+
+    Admin only endpoint. Each query is planned with EXPLAIN, not run.
+
+    Returns:
+        - Plan of each hot query
+        - Tables each query reads in full (likely missing indexes)
+        - Number of flagged queries
+    """
+    from services.diagnostics_service import DiagnosticsService
+
+    return DiagnosticsService.get_index_advice(db)
+
+
 @router.get(
     "/diagnostics/system",
     response_model=schemas.SystemResourcesResponse,
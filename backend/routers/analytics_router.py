@@ -23,7 +23,7 @@ from models.schemas import (
     TopContributorsResponse,
     TrendsResponse,
 )
-from repositories.database import get_db
+from repositories.database import get_read_db
 from services.analytics_service import AnalyticsService
 
 router = APIRouter(prefix="/admin/analytics", tags=["Analytics"])
@@ -36,7 +36,7 @@ router = APIRouter(prefix="/admin/analytics", tags=["Analytics"])
     description="Returns summary counts for users, ideas, votes, and comments. Cached for 10 minutes.",
 )
 def get_overview(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ) -> OverviewMetrics:
     """
@@ -68,7 +68,7 @@ def get_trends(
         Granularity.WEEK,
         description="Time granularity: day, week, or month",
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ) -> TrendsResponse:
     """
@@ -95,7 +95,7 @@ def get_trends(
     description="Returns analytics for all categories including idea counts, approval rates, and engagement metrics.",
 )
 def get_categories_analytics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ) -> CategoriesAnalyticsResponse:
     """
@@ -124,7 +124,7 @@ def get_top_contributors(
         le=50,
         description="Number of contributors to return (5-50)",
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ) -> TopContributorsResponse:
     """
@@ -183,7 +183,7 @@ def export_data(
         None,
         description="End date for filtering (YYYY-MM-DD)",
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ) -> StreamingResponse:
     """
@@ -230,7 +230,7 @@ def export_data(
     description="Returns analytics on quality voting patterns, adoption rates, and top ideas by quality.",
 )
 def get_quality_analytics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ):
     """
@@ -261,7 +261,7 @@ def get_quality_analytics(
 )
 def get_weighted_score_for_idea(
     idea_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ):
     """
@@ -300,7 +300,7 @@ def get_score_anomalies(
         le=1.0,
         description="Minimum divergence threshold (0.3 = 30%)",
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_admin_user),
 ):
     """
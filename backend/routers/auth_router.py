@@ -114,7 +114,7 @@ async def update_profile(
 
 
 @router.put("/password")
-async def change_password(
+def change_password(
     password_change: schemas.PasswordChange,
     current_user: db_models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db),
@@ -141,12 +141,17 @@ async def get_activity_history(
 
 
 @router.post("/avatar", response_model=schemas.AvatarUploadResponse)
-async def upload_avatar(
+def upload_avatar(
     file: UploadFile = File(...),
     current_user: db_models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db),
 ) -> schemas.AvatarUploadResponse:
-    """Upload user avatar."""
+    """
+    Upload user avatar.
+
+    Sync endpoint: resizing waits on the image process pool, which must
+    not block the event loop.
+    """
     user_id: int = current_user.id  # type: ignore[assignment]
     return UserService.upload_avatar(db, user_id, file)
 
@@ -288,7 +293,7 @@ async def export_my_data(
 
 @router.delete("/account", response_model=schemas.DeleteAccountResponse)
 @limiter.limit("3/day")
-async def delete_my_account(
+def delete_my_account(
     request: Request,
     delete_request: schemas.DeleteAccountRequest,
     current_user: db_models.User = Depends(auth.get_current_active_user),
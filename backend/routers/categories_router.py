@@ -1,18 +1,21 @@
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 import models.schemas as schemas
+from helpers.http_cache import cached_json_response
 from repositories.database import get_db
 from services import CategoryService
 from services.quality_service import QualityService
+from services.response_cache_service import ResponseCacheService
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 
 @router.get("/", response_model=List[schemas.Category])
 def get_categories(
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -20,13 +23,27 @@ def get_categories(
 
     Categories are few in number, so pagination is not needed.
     """
-    return CategoryService.get_all_categories(db)
+    return cached_json_response(
+        request,
+        ResponseCacheService,
+        db,
+        ("categories",),
+        lambda: CategoryService.get_all_categories(db),
+        List[schemas.Category],
+    )
 
 
 @router.get("/qualities/defaults", response_model=List[schemas.QualityPublic])
-def get_default_qualities(db: Session = Depends(get_db)):
+def get_default_qualities(request: Request, db: Session = Depends(get_db)):
     """Get all default qualities (applies to all categories)."""
-    return QualityService.get_all_default_qualities(db)
+    return cached_json_response(
+        request,
+        ResponseCacheService,
+        db,
+        ("categories",),
+        lambda: QualityService.get_all_default_qualities(db),
+        List[schemas.QualityPublic],
+    )
 
 
 @router.get("/{category_id}", response_model=schemas.Category)
@@ -38,6 +55,7 @@ def get_category(category_id: int, db: Session = Depends(get_db)):
 @router.get("/{category_id}/qualities", response_model=List[schemas.QualityPublic])
 def get_category_qualities(
     category_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -46,4 +64,11 @@ def get_category_qualities(
     Returns qualities that can be attached to votes for ideas in this category.
     Includes default qualities and category-specific additions.
     """
-    return QualityService.get_qualities_for_category(db, category_id)
+    return cached_json_response(
+        request,
+        ResponseCacheService,
+        db,
+        ("categories",),
+        lambda: QualityService.get_qualities_for_category(db, category_id),
+        List[schemas.QualityPublic],
+    )
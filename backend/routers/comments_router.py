@@ -7,6 +7,7 @@ import authentication.auth as auth
 import models.schemas as schemas
 import repositories.db_models as db_models
 from helpers.pagination import PaginationLimitComments, PaginationSkip
+from helpers.serialization import lean_json_response
 from repositories.database import get_db
 from services.comment_service import CommentService
 
@@ -27,15 +28,20 @@ def get_comments_for_idea(
 
     Includes user_has_liked field when authenticated.
     Domain exceptions are caught by centralized exception handlers.
+    Rows are serialized without building models.
     """
     current_user_id = current_user.id if current_user else None
-    return CommentService.get_comments_for_idea(
-        db=db,
-        idea_id=idea_id,
-        skip=skip,
-        limit=limit,
-        current_user_id=current_user_id,
-        sort_by=sort_by,
+    return lean_json_response(
+        CommentService.get_comment_rows_for_idea(
+            db=db,
+            idea_id=idea_id,
+            skip=skip,
+            limit=limit,
+            current_user_id=current_user_id,
+            sort_by=sort_by,
+        ),
+        List[schemas.CommentRow],
+        List[schemas.Comment],
     )
 
 
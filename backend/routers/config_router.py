@@ -1,19 +1,35 @@
 """Public configuration endpoint for frontend."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
-from services.config_service import get_config
+from helpers.http_cache import cached_json_response
+from services.config_service import get_config, get_config_fingerprint
+from services.response_cache_service import ResponseCacheService
 
 router = APIRouter(prefix="/config", tags=["configuration"])
 
 
 @router.get("/public", response_model=dict)
-def get_public_config() -> dict:
+def get_public_config(request: Request):
     """Get public platform configuration.
 
     Returns non-sensitive configuration for frontend use.
     Excludes admin emails, internal settings, etc.
+    The ETag follows the loaded configuration.
     """
+    return cached_json_response(
+        request,
+        ResponseCacheService,
+        None,
+        (),
+        _build_public_config,
+        dict,
+        version_key=get_config_fingerprint(),
+    )
+
+
+def _build_public_config() -> dict:
+    """Build the public subset of the platform configuration."""
     config = get_config()
 
     return {
@@ -1,26 +1,30 @@
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, Header, Query
+from fastapi import APIRouter, Depends, Header, Query, Request
 from sqlalchemy.orm import Session
 
 import authentication.auth as auth
+from helpers.http_cache import cached_json_response
 from helpers.language import parse_accept_language
+from helpers.serialization import lean_json_response
 import models.schemas as schemas
 import repositories.db_models as db_models
 from helpers.pagination import PaginationLimit, PaginationLimitSmall, PaginationSkip
-from repositories.database import get_db
+from repositories.database import get_db, get_read_db
 from services import IdeaService
+from services.response_cache_service import ResponseCacheService
 
 router = APIRouter(prefix="/ideas", tags=["ideas"])
 
 
 @router.get("/leaderboard", response_model=List[schemas.IdeaWithScore])
 def get_leaderboard(
+    request: Request,
     category_id: Optional[int] = None,
     skip: PaginationSkip = 0,
     limit: PaginationLimit = 20,
     accept_language: Annotated[str, Header(alias="Accept-Language")] = "fr",
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[db_models.User] = Depends(auth.get_current_user_optional),
 ):
     """
@@ -28,11 +32,29 @@ def get_leaderboard(
 
     Ideas in the user's preferred language (from Accept-Language header)
     appear first, followed by other languages. All ideas are shown.
+    Anonymous responses carry an ETag and are served from the response
+    cache until ideas change. Rows are serialized without building models.
     """
     user_id = current_user.id if current_user else None
     preferred_lang = parse_accept_language(accept_language)
-    return IdeaService.get_leaderboard(
-        db, category_id, user_id, skip, limit, preferred_lang
+    if current_user is None:
+        return cached_json_response(
+            request,
+            ResponseCacheService,
+            db,
+            ("ideas",),
+            lambda: IdeaService.get_leaderboard_rows(
+                db, category_id, None, skip, limit, preferred_lang
+            ),
+            List[schemas.IdeaWithScore],
+            row_type=List[schemas.IdeaWithScoreRow],
+        )
+    return lean_json_response(
+        IdeaService.get_leaderboard_rows(
+            db, category_id, user_id, skip, limit, preferred_lang
+        ),
+        List[schemas.IdeaWithScoreRow],
+        List[schemas.IdeaWithScore],
     )
 
 
@@ -67,14 +89,27 @@ def get_my_ideas(
 @router.get("/{idea_id}", response_model=schemas.IdeaWithScore)
 def get_idea(
     idea_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Optional[db_models.User] = Depends(auth.get_current_user_optional),
 ):
     """
     Get a single idea with scores.
 
+    Anonymous responses carry an ETag and are served from the response
+    cache until ideas change.
+
     Domain exceptions are caught by centralized exception handlers.
     """
+    if current_user is None:
+        return cached_json_response(
+            request,
+            ResponseCacheService,
+            db,
+            ("ideas",),
+            lambda: IdeaService.get_idea_with_score(db=db, idea_id=idea_id),
+            schemas.IdeaWithScore,
+        )
     current_user_id: int | None = int(current_user.id) if current_user else None  # type: ignore[arg-type]
     return IdeaService.get_idea_with_score(
         db=db,
@@ -0,0 +1,47 @@
+"""Prometheus metrics router.
+
+Serves the metrics collected in core.metrics in the Prometheus text
+format. Mounted at the root (``/metrics``), the path scrapers expect.
+"""
+
+import hmac
+
+from fastapi import APIRouter, Request, Response
+
+from core.metrics import render_metrics
+from models.config import settings
+from models.exceptions import AuthenticationException, NotFoundException
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request) -> Response:
+    """
+    Get application metrics for Prometheus.
+
+    Aggregated across all gunicorn workers in multiprocess mode.
+
+    Args:
+        request: FastAPI request (for the Authorization header)
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+
+    Raises:
+        NotFoundException: If METRICS_ENABLED is off
+        AuthenticationException: If METRICS_TOKEN is set and the request
+            does not carry it as a bearer token
+    """
+    if not settings.METRICS_ENABLED:
+        raise NotFoundException("Not found")
+
+    if settings.METRICS_TOKEN:
+        authorization = request.headers.get("authorization", "")
+        if not hmac.compare_digest(
+            authorization.encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+        ):
+            raise AuthenticationException("Invalid metrics token")
+
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -27,7 +27,7 @@ from models.schemas import (
     OfficialsTopComment,
     OfficialsTopIdeaByQuality,
 )
-from repositories.database import get_db
+from repositories.database import get_read_db
 from services.analytics_service import AnalyticsService
 
 router = APIRouter(prefix="/officials", tags=["Officials"])
@@ -43,7 +43,7 @@ __all__ = ["router", "OfficialsTopComment"]
     description="Returns summary statistics for quality voting. Requires official or admin permissions.",
 )
 def get_quality_overview(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> OfficialsQualityOverview:
     """
@@ -64,7 +64,7 @@ def get_quality_overview(
 def get_top_ideas_by_quality(
     quality_key: Optional[str] = Query(None, description="Filter by quality key"),
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> List[OfficialsTopIdeaByQuality]:
     """
@@ -85,7 +85,7 @@ def get_top_ideas_by_quality(
     description="Returns quality count breakdown by category. Requires official or admin permissions.",
 )
 def get_category_breakdown(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> List[OfficialsCategoryQualityBreakdown]:
     """
@@ -105,7 +105,7 @@ def get_category_breakdown(
 )
 def get_quality_trends(
     days: int = Query(30, ge=7, le=365),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> List[OfficialsTimeSeriesPoint]:
     """
@@ -131,7 +131,7 @@ def get_ideas_with_quality_stats(
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> OfficialsIdeasWithQualityResponse:
     """
@@ -176,7 +176,7 @@ def get_ideas_with_quality_stats(
 )
 def get_idea_detail(
     idea_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> OfficialsIdeaDetail:
     """
@@ -217,7 +217,7 @@ def export_ideas_csv(
     min_quality_count: int = Query(0, ge=0),
     category_id: Optional[int] = Query(None),
     sort_by: str = Query("quality_count", pattern="^(quality_count|score|created_at)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> StreamingResponse:
     """
@@ -313,7 +313,7 @@ def export_ideas_csv(
     description="Export quality analytics summary as CSV file. Requires official or admin permissions.",
 )
 def export_analytics_csv(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: db_models.User = Depends(auth.get_official_user),
 ) -> StreamingResponse:
     """
@@ -10,9 +10,10 @@ import authentication.auth as auth
 from helpers.language import parse_accept_language
 import repositories.db_models as db_models
 from helpers.pagination import PaginationLimit, PaginationSkip
+from helpers.serialization import lean_json_response
 from models.schemas import SearchBackendInfo, SearchHealthStatus
 from models.search_schemas import SearchResults, SearchSortOrder
-from repositories.database import get_db
+from repositories.database import get_db, get_read_db
 from services.search import SearchService
 
 router = APIRouter(prefix="/search", tags=["search"])
@@ -46,7 +47,7 @@ def search_ideas(
         None, description="Exclude specific idea IDs"
     ),
     accept_language: Annotated[str, Header(alias="Accept-Language")] = "fr",
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[db_models.User] = Depends(auth.get_current_user_optional),
 ) -> SearchResults:
     """
@@ -66,10 +67,13 @@ def search_ideas(
 
     Language prioritization: If Accept-Language header is provided, results
     within the same relevance tier will show preferred language first.
+
+    The results are already validated models, so they are serialized
+    directly instead of going through response_model again.
     """
     user_id: int | None = current_user.id if current_user else None  # type: ignore[assignment]
     preferred_lang = parse_accept_language(accept_language)
-    return SearchService.search_ideas(
+    results = SearchService.search_ideas(
         db=db,
         query=q,
         category_id=category_id,
@@ -90,13 +94,14 @@ def search_ideas(
         exclude_ids=exclude_ids,
         preferred_language=preferred_lang,
     )
+    return lean_json_response(results, SearchResults)
 
 
 @router.get("/suggestions", response_model=list[str])
 def get_suggestions(
     q: str = Query(..., min_length=2, max_length=100, description="Partial query"),
     limit: int = Query(5, ge=1, le=10, description="Max suggestions"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[str]:
     """
     Get search suggestions for autocomplete.
@@ -170,7 +175,7 @@ def rebuild_index(
 def autocomplete(
     q: str = Query(..., min_length=2, max_length=100, description="Partial query"),
     limit: int = Query(5, ge=1, le=10, description="Max suggestions per type"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
     """
     Get combined autocomplete suggestions for ideas and tags (Phase 3).
@@ -188,7 +193,7 @@ def search_with_tags(
     q: str = Query(..., min_length=2, max_length=200, description="Search query"),
     skip: PaginationSkip = 0,
     limit: PaginationLimit = 20,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[db_models.User] = Depends(auth.get_current_user_optional),
 ) -> dict:
     """
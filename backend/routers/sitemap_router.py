@@ -1,19 +1,27 @@
 """Sitemap router for SEO optimization.
 
-Provides lightweight endpoints for sitemap generation.
+Provides lightweight, streamed endpoints for sitemap generation.
 """
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from repositories.database import get_db
+from helpers.http_cache import cached_stream_response
+from repositories.cache_version_repository import (
+    SITEMAP_ENTITY,
+    sitemap_shard_entity,
+)
+from repositories.database import get_read_db
+from services.response_cache_service import ResponseCacheService
 from services.sitemap_service import SitemapService
 
 router = APIRouter(prefix="/sitemap", tags=["sitemap"])
 
+_XML_MEDIA_TYPE = "application/xml"
+
 
 class SitemapIdea(BaseModel):
     """Lightweight idea representation for sitemap."""
@@ -21,25 +29,67 @@ class SitemapIdea(BaseModel):
     id: int
     updated_at: datetime
     score: int
+    priority: float
 
     model_config = {"from_attributes": True}
 
 
 @router.get("/ideas", response_model=list[SitemapIdea])
-def get_sitemap_ideas(db: Session = Depends(get_db)) -> list[SitemapIdea]:
+def get_sitemap_ideas(request: Request, db: Session = Depends(get_read_db)):
     """Get all approved ideas for sitemap generation.
 
     Returns minimal data needed for sitemap:
     - id: for URL generation
     - updated_at: for lastmod
-    - score: for priority calculation
+    - score: maintained vote score
+    - priority: sitemap priority derived from the score
+
+    Streamed in batches, and served from the response cache until ideas
+    change.
+    """
+    return cached_stream_response(
+        request,
+        ResponseCacheService,
+        db,
+        ("ideas",),
+        lambda: SitemapService.iter_ideas_json(db),
+        "application/json",
+    )
+
+
+@router.get("/index.xml", response_class=Response)
+def get_sitemap_index(request: Request, db: Session = Depends(get_read_db)):
+    """Get the sitemap index listing every idea sitemap shard."""
+    return cached_stream_response(
+        request,
+        ResponseCacheService,
+        db,
+        (SITEMAP_ENTITY, "ideas"),
+        lambda: iter(
+            [
+                SitemapService.render_index(
+                    SitemapService.get_shards(db),
+                    lambda shard: request.app.url_path_for(
+                        "get_sitemap_shard", shard=shard
+                    ),
+                )
+            ]
+        ),
+        _XML_MEDIA_TYPE,
+    )
+
+
+@router.get("/ideas-{shard}.xml", response_class=Response)
+def get_sitemap_shard(shard: int, request: Request, db: Session = Depends(get_read_db)):
+    """Get the sitemap of one idea shard (a fixed range of idea IDs).
+
+    Cached until an idea in the shard changes.
     """
-    ideas = SitemapService.get_sitemap_ideas(db)
-    return [
-        SitemapIdea(
-            id=idea.id,
-            updated_at=idea.updated_at,
-            score=idea.score,
-        )
-        for idea in ideas
-    ]
+    return cached_stream_response(
+        request,
+        ResponseCacheService,
+        db,
+        (SITEMAP_ENTITY, sitemap_shard_entity(shard)),
+        lambda: SitemapService.iter_shard_xml(db, shard),
+        _XML_MEDIA_TYPE,
+    )
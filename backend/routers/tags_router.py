@@ -3,13 +3,15 @@ Tags router for tag-related endpoints.
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 import repositories.db_models as db_models
 import models.schemas as schemas
 import authentication.auth as auth
 from repositories.database import get_db
+from services.response_cache_service import ResponseCacheService
 from services.tag_service import TagService
+from helpers.http_cache import cached_json_response
 from helpers.pagination import PaginationSkip, PaginationLimit
 
 router = APIRouter(prefix="/tags", tags=["tags"])
@@ -17,6 +19,7 @@ router = APIRouter(prefix="/tags", tags=["tags"])
 
 @router.get("/", response_model=List[schemas.Tag])
 def get_all_tags(
+    request: Request,
     skip: PaginationSkip = 0,
     limit: PaginationLimit = 100,
     db: Session = Depends(get_db),
@@ -25,7 +28,14 @@ def get_all_tags(
     Get all tags with pagination.
     Public endpoint - no authentication required.
     """
-    return TagService.get_all_tags(db, skip, limit)
+    return cached_json_response(
+        request,
+        ResponseCacheService,
+        db,
+        ("tags",),
+        lambda: TagService.get_all_tags(db, skip, limit),
+        List[schemas.Tag],
+    )
 
 
 @router.get("/search", response_model=List[schemas.Tag])
@@ -54,6 +64,7 @@ def get_tag_by_name(name: str, db: Session = Depends(get_db)):
 
 @router.get("/popular", response_model=List[schemas.TagWithCount])
 def get_popular_tags(
+    request: Request,
     limit: int = Query(20, ge=1, le=100, description="Maximum results"),
     min_ideas: int = Query(1, ge=1, description="Minimum ideas per tag"),
     db: Session = Depends(get_db),
@@ -62,7 +73,14 @@ def get_popular_tags(
     Get most popular tags based on number of approved ideas.
     Public endpoint - no authentication required.
     """
-    return TagService.get_popular_tags(db, limit, min_ideas)
+    return cached_json_response(
+        request,
+        ResponseCacheService,
+        db,
+        ("tags", "ideas"),
+        lambda: TagService.get_popular_tags(db, limit, min_ideas),
+        List[schemas.TagWithCount],
+    )
 
 
 @router.get("/{tag_id}", response_model=schemas.Tag)
@@ -44,7 +44,7 @@ async def verify_setup(
 
 
 @router.delete("/disable", response_model=schemas.MessageResponse)
-async def disable_2fa(
+def disable_2fa(
     request_body: schemas.TwoFactorDisableRequest,
     db: Session = Depends(get_db),
     current_user: db_models.User = Depends(auth.get_current_active_user),
@@ -137,7 +137,7 @@ async def verify_2fa_login(
 
 
 @router.post("/backup-codes/regenerate", response_model=schemas.BackupCodesResponse)
-async def regenerate_backup_codes(
+def regenerate_backup_codes(
     request_body: schemas.TwoFactorDisableRequest,  # Same re-auth requirement
     db: Session = Depends(get_db),
     current_user: db_models.User = Depends(auth.get_current_active_user),
@@ -285,7 +285,7 @@ async def revoke_trusted_device(
 
 @router.delete("/devices", response_model=schemas.MessageResponse)
 @limiter.limit("5/minute")
-async def revoke_all_trusted_devices(
+def revoke_all_trusted_devices(
     request: Request,
     password_confirmation: schemas.PasswordConfirmation,
     db: Session = Depends(get_db),
@@ -27,21 +27,12 @@ def vote_on_idea(
     - vote_type: "upvote" or "downvote"
     - quality_keys: Optional list of quality keys (only for upvotes)
     """
-    # Convert quality keys to IDs if provided
-    quality_ids = None
-    if vote.quality_keys:
-        idea = IdeaService.get_idea_by_id(db, idea_id)
-        if idea:
-            quality_ids = QualityService.keys_to_ids(
-                db, vote.quality_keys, idea.category_id
-            )
-
     return VoteService.vote_on_idea(
         db=db,
         idea_id=idea_id,
         user_id=current_user.id,
         vote_type=vote.vote_type,
-        quality_ids=quality_ids,
+        quality_keys=vote.quality_keys,
     )
 
 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Script to convert avatars uploaded before avatar variants existed.
+
+Renders each legacy avatar file into the pre-sized WebP/JPEG variants,
+points the user at them and deletes the legacy file. Safe to re-run:
+avatars already using variants are skipped. Run from the backend
+directory (avatar paths are relative to it):
+- Manual: python scripts/backfill_avatars.py
+
+Options:
+    --batch-size N: Users loaded and committed at a time (default: 100)
+    --dry-run: Count the avatars that would be converted without converting
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from core.image_executor import shutdown_image_executor
+from repositories.database import SessionLocal
+from services.avatar_service import AvatarService
+
+
+def main() -> int:
+    """Run the avatar backfill."""
+    parser = argparse.ArgumentParser(
+        description="Render pre-sized variants for legacy avatars"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Users loaded and committed at a time (default: 100)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count the avatars that would be converted without converting",
+    )
+
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        counts = AvatarService.backfill_variants(
+            db, batch_size=args.batch_size, dry_run=args.dry_run
+        )
+        prefix = "[DRY RUN] Would convert" if args.dry_run else "Converted"
+        logger.info(
+            f"{prefix} {counts['converted']} avatars "
+            f"({counts['already_converted']} already converted, "
+            f"{counts['missing']} files missing, {counts['failed']} failed)"
+        )
+        return 0
+    except Exception as e:
+        logger.error(f"Avatar backfill failed: {e}")
+        return 1
+    finally:
+        db.close()
+        shutdown_image_executor()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,784 @@
+#!/usr/bin/env python3
+# ruff: noqa: E402
+# E402 disabled: sys.path modification must happen before local imports
+"""
+Load-test and benchmark the API against a generated dataset.
+
+Seeds a deterministic dataset with generate_test_data.py --bulk (cached in
+data/benchmark_{size}_seed{seed}.db), copies it so every run starts from
+the same rows, then drives a weighted mix of public, member and admin
+requests through the app:
+
+- ``inprocess``: the ASGI app in this process via httpx.ASGITransport
+  (no network, one event loop; sync endpoints run in the threadpool)
+- ``workers``: gunicorn with uvicorn workers (as in the Dockerfile) over
+  local TCP, to include process-level parallelism and SQLite locking
+
+Per endpoint it reports P50/P95/P99 latency, throughput, non-2xx responses
+and SQL statements per request (from the db_queries_per_request histogram
+on /metrics, so both modes count the same way). The JSON report can be
+compared against a previous one to catch regressions.
+
+Usage:
+    cd backend
+
+    # Small dataset, in-process, 2,000 requests with 16 concurrent clients
+    uv run python scripts/benchmark.py --size small
+
+    # Medium dataset through 4 gunicorn workers
+    uv run python scripts/benchmark.py --size medium --mode workers --workers 4
+
+    # Fail if any endpoint's P95 is more than 20% slower than the baseline
+    uv run python scripts/benchmark.py --compare data/benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+DEFAULT_SEED = 42
+RESULTS_DIR = backend_dir / "data" / "benchmarks"
+SEARCH_TERMS = [
+    "parc",
+    "vélo",
+    "transport",
+    "bike",
+    "park",
+    "arbres",
+    "sécurité",
+    "public",
+    "quartier",
+    "jardin",
+]
+
+
+# =============================================================================
+# Dataset
+# =============================================================================
+
+
+def dataset_path(size: str, seed: int) -> Path:
+    """Get the cached dataset path for a size and seed."""
+    return backend_dir / "data" / f"benchmark_{size}_seed{seed}.db"
+
+
+def ensure_dataset(size: str, seed: int, rebuild: bool = False) -> Path:
+    """
+    Get the dataset for a size and seed, generating it if needed.
+
+    Args:
+        size: Dataset size (small, medium, large)
+        seed: Generator seed
+        rebuild: Regenerate even if cached
+
+    Returns:
+        Path to the dataset database
+    """
+    path = dataset_path(size, seed)
+    if rebuild or not path.exists():
+        # Separate process: the generator keeps its config in module globals
+        subprocess.run(
+            [
+                sys.executable,
+                str(backend_dir / "scripts" / "generate_test_data.py"),
+                "--size",
+                size,
+                "--seed",
+                str(seed),
+                "--output",
+                str(path),
+                "--no-report",
+                "--bulk",
+                "--workers",
+                str(min(os.cpu_count() or 1, 8)),
+            ],
+            cwd=backend_dir,
+            check=True,
+        )
+    return path
+
+
+@dataclass
+class Targets:
+    """Ids and credentials the request mix draws from."""
+
+    category_ids: list[int]
+    idea_ids: list[int]
+    member_tokens: list[str]
+    admin_tokens: list[str]
+    search_terms: list[str] = field(default_factory=lambda: list(SEARCH_TERMS))
+
+
+def load_targets(db: Session, max_ideas: int = 2000, max_users: int = 200) -> Targets:
+    """
+    Pick the ideas and users requests will use.
+
+    Members are active regular users without an active penalty, so votes
+    and comments are accepted. The selection is ordered by id, so the
+    same dataset always yields the same targets.
+
+    Args:
+        db: Session on the benchmark database
+        max_ideas: Maximum approved ideas to target
+        max_users: Maximum members to sign requests for
+
+    Returns:
+        Targets with signed access tokens
+    """
+    from authentication.auth import create_access_token
+    from repositories.db_models import (
+        Category,
+        Idea,
+        IdeaStatus,
+        PenaltyStatus,
+        User,
+        UserPenalty,
+    )
+
+    penalized = select(UserPenalty.user_id).where(
+        UserPenalty.status == PenaltyStatus.ACTIVE
+    )
+    members = db.scalars(
+        select(User.email)
+        .where(
+            User.is_active.is_(True),
+            User.is_global_admin.is_(False),
+            User.id.not_in(penalized),
+        )
+        .order_by(User.id)
+        .limit(max_users)
+    ).all()
+    admins = db.scalars(
+        select(User.email)
+        .where(User.is_active.is_(True), User.is_global_admin.is_(True))
+        .order_by(User.id)
+    ).all()
+    ideas = db.scalars(
+        select(Idea.id)
+        .where(Idea.status == IdeaStatus.APPROVED)
+        .order_by(Idea.id)
+        .limit(max_ideas)
+    ).all()
+    categories = db.scalars(select(Category.id).order_by(Category.id)).all()
+
+    def token(email: str) -> str:
+        return create_access_token(data={"sub": email})
+
+    return Targets(
+        category_ids=list(categories),
+        idea_ids=list(ideas),
+        member_tokens=[token(email) for email in members],
+        admin_tokens=[token(email) for email in admins],
+    )
+
+
+# =============================================================================
+# Request mix
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    """One request to send."""
+
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    json: dict[str, Any] | None = None
+    token: str | None = None
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """A request type in the mix."""
+
+    name: str
+    route: str  # Route template, as labelled in /metrics
+    weight: int
+    build: Callable[[random.Random, Targets], RequestSpec]
+
+
+def _leaderboard(rng: random.Random, targets: Targets) -> RequestSpec:
+    params: dict[str, Any] = {"limit": 20}
+    if rng.random() < 0.7:
+        params["category_id"] = rng.choice(targets.category_ids)
+    return RequestSpec("GET", "/api/ideas/leaderboard", params=params)
+
+
+def _idea_detail(rng: random.Random, targets: Targets) -> RequestSpec:
+    return RequestSpec("GET", f"/api/ideas/{rng.choice(targets.idea_ids)}")
+
+
+def _vote(rng: random.Random, targets: Targets) -> RequestSpec:
+    vote_type = "upvote" if rng.random() < 0.75 else "downvote"
+    return RequestSpec(
+        "POST",
+        f"/api/votes/{rng.choice(targets.idea_ids)}",
+        json={"vote_type": vote_type},
+        token=rng.choice(targets.member_tokens),
+    )
+
+
+def _comment(rng: random.Random, targets: Targets) -> RequestSpec:
+    return RequestSpec(
+        "POST",
+        f"/api/comments/{rng.choice(targets.idea_ids)}",
+        json={"content": f"Benchmark comment {rng.randrange(1_000_000)}"},
+        token=rng.choice(targets.member_tokens),
+    )
+
+
+def _search(rng: random.Random, targets: Targets) -> RequestSpec:
+    return RequestSpec(
+        "GET", "/api/search/ideas", params={"q": rng.choice(targets.search_terms)}
+    )
+
+
+def _autocomplete(rng: random.Random, targets: Targets) -> RequestSpec:
+    term = rng.choice(targets.search_terms)
+    return RequestSpec(
+        "GET", "/api/search/autocomplete", params={"q": term[: rng.randint(2, 4)]}
+    )
+
+
+def _admin_queue(rng: random.Random, targets: Targets) -> RequestSpec:
+    return RequestSpec(
+        "GET",
+        "/api/admin/moderation/queue",
+        params={"limit": 20},
+        token=rng.choice(targets.admin_tokens),
+    )
+
+
+def _analytics(rng: random.Random, targets: Targets) -> RequestSpec:
+    return RequestSpec(
+        "GET",
+        "/api/admin/analytics/overview",
+        token=rng.choice(targets.admin_tokens),
+    )
+
+
+# Weights approximate production traffic: mostly anonymous browsing, some
+# member writes, a trickle of admin pages.
+DEFAULT_MIX = [
+    Endpoint("leaderboard", "/api/ideas/leaderboard", 30, _leaderboard),
+    Endpoint("idea_detail", "/api/ideas/{idea_id}", 25, _idea_detail),
+    Endpoint("search", "/api/search/ideas", 10, _search),
+    Endpoint("autocomplete", "/api/search/autocomplete", 10, _autocomplete),
+    Endpoint("vote", "/api/votes/{idea_id}", 12, _vote),
+    Endpoint("comment", "/api/comments/{idea_id}", 5, _comment),
+    Endpoint("admin_queue", "/api/admin/moderation/queue", 4, _admin_queue),
+    Endpoint("analytics", "/api/admin/analytics/overview", 4, _analytics),
+]
+
+
+# =============================================================================
+# Load generation
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Outcome of one request."""
+
+    endpoint: str
+    status: int
+    latency: float  # seconds
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    targets: Targets,
+    mix: list[Endpoint],
+    requests: int,
+    concurrency: int,
+    seed: int,
+) -> tuple[list[Sample], float]:
+    """
+    Send ``requests`` requests from ``concurrency`` concurrent clients.
+
+    Each client draws from its own seeded generator, so the same seed
+    sends the same requests (their interleaving still varies).
+
+    Args:
+        client: HTTP client for the app
+        targets: Ids and tokens to use
+        mix: Weighted endpoints
+        requests: Total requests to send
+        concurrency: Concurrent clients
+        seed: Seed for request selection
+
+    Returns:
+        Samples and wall-clock duration in seconds
+    """
+    weights = [endpoint.weight for endpoint in mix]
+    samples: list[Sample] = []
+    share, extra = divmod(requests, concurrency)
+
+    async def client_loop(index: int, count: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        for _ in range(count):
+            endpoint = rng.choices(mix, weights)[0]
+            spec = endpoint.build(rng, targets)
+            headers = {"Authorization": f"Bearer {spec.token}"} if spec.token else {}
+            started = time.perf_counter()
+            response = await client.request(
+                spec.method,
+                spec.url,
+                params=spec.params,
+                json=spec.json,
+                headers=headers,
+            )
+            samples.append(
+                Sample(
+                    endpoint.name, response.status_code, time.perf_counter() - started
+                )
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(client_loop(i, share + (1 if i < extra else 0)) for i in range(concurrency))
+    )
+    return samples, time.perf_counter() - started
+
+
+async def scrape_query_counts(
+    client: httpx.AsyncClient,
+) -> dict[str, tuple[float, float]]:
+    """
+    Read statements-per-request totals by route from /metrics.
+
+    Returns:
+        Route -> (sum of statements, number of requests)
+    """
+    response = await client.get("/metrics")
+    response.raise_for_status()
+    totals: dict[str, list[float]] = {}
+    for family in text_string_to_metric_families(response.text):
+        if family.name != "db_queries_per_request":
+            continue
+        for sample in family.samples:
+            route = sample.labels.get("route", "")
+            entry = totals.setdefault(route, [0.0, 0.0])
+            if sample.name.endswith("_sum"):
+                entry[0] = sample.value
+            elif sample.name.endswith("_count"):
+                entry[1] = sample.value
+    return {route: (total, count) for route, (total, count) in totals.items()}
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """
+    Linear-interpolated percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The percentile (0.0 for no values)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (
+        rank - low
+    )
+
+
+def _latency_stats(latencies: list[float], duration: float) -> dict[str, float]:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "throughput_rps": round(len(values) / duration, 2) if duration else 0.0,
+        "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+    }
+
+
+def summarize(
+    samples: list[Sample],
+    duration: float,
+    mix: list[Endpoint],
+    queries_before: dict[str, tuple[float, float]],
+    queries_after: dict[str, tuple[float, float]],
+) -> dict[str, Any]:
+    """
+    Aggregate samples into per-endpoint and overall statistics.
+
+    Args:
+        samples: Request outcomes
+        duration: Wall-clock duration of the run in seconds
+        mix: Endpoints in the mix
+        queries_before: /metrics query totals before the run
+        queries_after: /metrics query totals after the run
+
+    Returns:
+        ``{"total": {...}, "endpoints": {name: {...}}}``
+    """
+    endpoints: dict[str, Any] = {}
+    for endpoint in mix:
+        own = [s for s in samples if s.endpoint == endpoint.name]
+        if not own:
+            continue
+        stats = _latency_stats([s.latency for s in own], duration)
+        stats["non_2xx"] = sum(1 for s in own if not 200 <= s.status < 300)
+        statuses: dict[str, int] = {}
+        for s in own:
+            statuses[str(s.status)] = statuses.get(str(s.status), 0) + 1
+        stats["status_codes"] = dict(sorted(statuses.items()))
+        total_after, count_after = queries_after.get(endpoint.route, (0.0, 0.0))
+        total_before, count_before = queries_before.get(endpoint.route, (0.0, 0.0))
+        handled = count_after - count_before
+        stats["queries_per_request"] = (
+            round((total_after - total_before) / handled, 2) if handled else None
+        )
+        endpoints[endpoint.name] = stats
+
+    total = _latency_stats([s.latency for s in samples], duration)
+    total["non_2xx"] = sum(1 for s in samples if not 200 <= s.status < 300)
+    total["duration_s"] = round(duration, 3)
+    return {"total": total, "endpoints": endpoints}
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], max_regression: float
+) -> list[str]:
+    """
+    Find endpoints whose P95 latency or query count regressed.
+
+    Args:
+        report: Current report
+        baseline: Earlier report for the same size and mode
+        max_regression: Allowed relative P95 increase (0.2 = 20%)
+
+    Returns:
+        Human-readable regressions (empty if none)
+    """
+    regressions = []
+    for name, current in report["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if not previous:
+            continue
+        if previous["p95_ms"] and current["p95_ms"] > previous["p95_ms"] * (
+            1 + max_regression
+        ):
+            regressions.append(
+                f"{name}: p95 {previous['p95_ms']:.1f}ms -> {current['p95_ms']:.1f}ms"
+            )
+        before_q = previous.get("queries_per_request")
+        after_q = current.get("queries_per_request")
+        if before_q is not None and after_q is not None and after_q > before_q:
+            regressions.append(f"{name}: queries/request {before_q} -> {after_q}")
+    return regressions
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print the report as a table."""
+    header = (
+        f"{'endpoint':<14}{'reqs':>7}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'p99 ms':>9}{'queries':>9}{'non2xx':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    rows = [*report["endpoints"].items(), ("TOTAL", report["total"])]
+    for name, stats in rows:
+        queries = stats.get("queries_per_request")
+        print(
+            f"{name:<14}{stats['requests']:>7}{stats['throughput_rps']:>9.1f}"
+            f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+            f"{'-' if queries is None else queries:>9}{stats['non_2xx']:>8}"
+        )
+
+
+# =============================================================================
+# Runners
+# =============================================================================
+
+
+@contextmanager
+def working_copy(dataset: Path) -> Iterator[Path]:
+    """Copy a dataset to a temporary file so runs don't change it."""
+    with tempfile.TemporaryDirectory(prefix="benchmark-") as tmp:
+        copy = Path(tmp) / dataset.name
+        shutil.copyfile(dataset, copy)
+        yield copy
+
+
+async def benchmark_app(
+    client: httpx.AsyncClient,
+    targets: Targets,
+    requests: int,
+    concurrency: int,
+    seed: int,
+    warmup: int = 50,
+    mix: list[Endpoint] | None = None,
+) -> dict[str, Any]:
+    """
+    Warm up, run the mix and summarize, against any client for the app.
+
+    Args:
+        client: HTTP client bound to the app under test
+        targets: Ids and tokens to use
+        requests: Measured requests
+        concurrency: Concurrent clients
+        seed: Seed for request selection
+        warmup: Unmeasured requests sent first (fills caches and pools)
+        mix: Endpoints to use (default: DEFAULT_MIX)
+
+    Returns:
+        Report without run metadata
+    """
+    mix = mix or DEFAULT_MIX
+    if warmup:
+        await run_load(client, targets, mix, warmup, min(concurrency, warmup), seed + 1)
+    queries_before = await scrape_query_counts(client)
+    samples, duration = await run_load(
+        client, targets, mix, requests, concurrency, seed
+    )
+    queries_after = await scrape_query_counts(client)
+    return summarize(samples, duration, mix, queries_before, queries_after)
+
+
+@asynccontextmanager
+async def in_process_client(database: Path):
+    """
+    Serve the app in this process on the given database.
+
+    The app binds its engine on first import, so nothing may import
+    ``repositories`` before this (load_targets included).
+    """
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=60
+        ) as client:
+            yield client
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def workers_client(database: Path, workers: int):
+    """Serve the app with gunicorn workers on the given database."""
+    port = _free_port()
+    with tempfile.TemporaryDirectory(prefix="benchmark-metrics-") as metrics_dir:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{database}",
+            "PROMETHEUS_MULTIPROC_DIR": metrics_dir,
+        }
+        server = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "main:app",
+            "--workers",
+            str(workers),
+            "--worker-class",
+            "uvicorn.workers.UvicornWorker",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--log-level",
+            "warning",
+            cwd=backend_dir,
+            env=env,
+        )
+        try:
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{port}",
+                timeout=60,
+                limits=httpx.Limits(max_connections=256),
+            ) as client:
+                deadline = time.monotonic() + 60
+                while True:
+                    if server.returncode is not None:
+                        raise RuntimeError("gunicorn exited during startup")
+                    try:
+                        if (await client.get("/api/health")).status_code == 200:
+                            break
+                    except httpx.TransportError:
+                        pass
+                    if time.monotonic() > deadline:
+                        raise RuntimeError("gunicorn did not become ready in 60s")
+                    await asyncio.sleep(0.25)
+                yield client
+        finally:
+            server.terminate()
+            await asyncio.wait_for(server.wait(), timeout=30)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run one benchmark as configured on the command line (no metadata)."""
+    dataset = ensure_dataset(args.size, args.seed, rebuild=args.rebuild)
+    with working_copy(dataset) as database:
+        if args.mode == "inprocess":
+            serve = in_process_client(database)
+        else:
+            serve = workers_client(database, args.workers)
+        async with serve as client:
+            engine = create_engine(f"sqlite:///{database}")
+            with Session(engine) as db:
+                targets = load_targets(db)
+            engine.dispose()
+
+            report = await benchmark_app(
+                client,
+                targets,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                seed=args.seed,
+                warmup=args.warmup,
+            )
+    return report
+
+
+def run_metadata(args: argparse.Namespace) -> dict[str, Any]:
+    """Describe the run, so reports can be matched up for comparison."""
+    git_revision = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    ).stdout.strip()
+    return {
+        "size": args.size,
+        "seed": args.seed,
+        "mode": args.mode,
+        "workers": args.workers if args.mode == "workers" else 1,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "git_revision": git_revision or None,
+        "python": platform.python_version(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def configure_environment() -> None:
+    """
+    Set the app settings for a benchmark run, before the app is imported.
+
+    A local dataset copy needs no real secrets. ENVIRONMENT=production
+    measures the production code paths (no response model re-validation,
+    production headers), and /metrics must be open for query counts.
+    """
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("ADMIN_EMAIL", "admin@benchmark.local")
+    os.environ.setdefault("ADMIN_PASSWORD", "Benchmark123!")
+    os.environ.setdefault("ENVIRONMENT", "production")
+    os.environ["METRICS_ENABLED"] = "true"
+    os.environ["METRICS_TOKEN"] = ""
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Load-test the API against a generated dataset",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--size", choices=["small", "medium", "large"], default="small")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--mode",
+        choices=["inprocess", "workers"],
+        default="inprocess",
+        help="Serve the app in this process or with gunicorn workers",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Gunicorn workers (workers mode)"
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Regenerate the cached dataset"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Report path (default: data/benchmarks/{size}-{mode}-{time}.json)",
+    )
+    parser.add_argument(
+        "--compare", type=Path, default=None, help="Baseline report to compare with"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed relative P95 increase against the baseline (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    configure_environment()
+    meta = run_metadata(args)
+    report = {"meta": meta, **asyncio.run(run(args))}
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        output = RESULTS_DIR / f"{args.size}-{args.mode}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+
+    print()
+    print_report(report)
+    print(f"\nReport saved to: {output}")
+
+    if args.compare:
+        regressions = compare(
+            report, json.loads(args.compare.read_text()), args.max_regression
+        )
+        if regressions:
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
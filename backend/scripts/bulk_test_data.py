@@ -0,0 +1,1569 @@
+#!/usr/bin/env python3
+# ruff: noqa: E402
+# E402 disabled: sys.path modification must happen before local imports
+"""
+Bulk mode for generate_test_data.py (``--bulk``).
+
+Builds the same tables as the ORM generator, fast enough to rebuild the
+large dataset (~3M votes) for a benchmark run:
+
+- Rows are plain tuples written with driver-level executemany. Every id
+  is assigned up front instead of read back after a flush, dates are
+  formatted from cached date and time strings, and the password hashes
+  are computed once per role.
+- Votes, comments and their children are generated per chunk of ideas.
+  Each chunk has its own random stream (seed + chunk number) and writes
+  its own staging database, so chunks run in parallel processes
+  (``--workers``) and the result does not depend on the worker count.
+- Staging databases are merged in chunk order with ATTACH and
+  INSERT ... SELECT, and secondary indexes are built once at the end.
+
+The same seed gives the same rows in bulk mode, but not the same rows as
+the ORM generator.
+
+Usage:
+    cd backend
+    uv run python scripts/generate_test_data.py --size large --bulk --seed 7
+    uv run python scripts/generate_test_data.py --size large --bulk --workers 8
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import DateTime, Table, create_engine, literal, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+from repositories.database import Base
+from repositories.tag_repository import TagStatRepository
+from scripts import generate_test_data as gtd
+from scripts.generate_test_data import (
+    COMMENT_TEMPLATES,
+    COMMENT_TEMPLATES_EN,
+    FIRST_NAMES_FR,
+    IDEA_DESCRIPTIONS,
+    IDEA_DESCRIPTIONS_EN,
+    IDEA_TITLES,
+    IDEA_TITLES_EN,
+    LAST_NAMES_FR,
+    AppealStatus,
+    CategoryQuality,
+    ContentType,
+    DatasetConfig,
+    FlagReason,
+    FlagStatus,
+    IdeaStatus,
+    LoginEventType,
+    LoginFailureReason,
+    PenaltyStatus,
+    PenaltyType,
+    SharePlatform,
+)
+
+DAY = 86_400
+IDEAS_PER_CHUNK = 1_000
+ID_BATCH = 500
+CACHE_KIB = 512 * 1024  # page cache while loading and indexing
+
+# Tables written in bulk; their secondary indexes are dropped while loading
+BULK_TABLES = (
+    "users",
+    "admin_roles",
+    "consent_logs",
+    "ideas",
+    "idea_tags",
+    "votes",
+    "vote_qualities",
+    "comments",
+    "comment_likes",
+    "content_flags",
+    "user_penalties",
+    "appeals",
+    "keyword_watchlist",
+    "admin_notes",
+    "login_events",
+    "share_events",
+    "share_counts",
+    "security_audit_logs",
+)
+
+# Columns written by the chunk workers (merged from the staging databases)
+VOTE_COLUMNS = ("id", "idea_id", "user_id", "vote_type", "created_at")
+VOTE_QUALITY_COLUMNS = ("vote_id", "quality_id", "created_at")
+COMMENT_COLUMNS = (
+    "id",
+    "idea_id",
+    "user_id",
+    "content",
+    "created_at",
+    "requires_approval",
+    "like_count",
+    "language",
+)
+COMMENT_LIKE_COLUMNS = ("comment_id", "user_id", "created_at")
+
+# Staging ids are local to a chunk; these columns are shifted on merge
+OFFSET_COLUMNS = {
+    "votes": ("id", "votes"),
+    "vote_qualities": ("vote_id", "votes"),
+    "comments": ("id", "comments"),
+    "comment_likes": ("comment_id", "comments"),
+}
+
+_DIALECT = sqlite.dialect()
+_EPOCH = datetime(1970, 1, 1)
+_DATES: dict[int, str] = {}
+_TIMES = [
+    f" {hour:02d}:{minute:02d}:{second:02d}.000000"
+    for hour in range(24)
+    for minute in range(60)
+    for second in range(60)
+]
+
+
+# =============================================================================
+# Insert helpers
+# =============================================================================
+
+
+def _table(name: str) -> Table:
+    """Get a table from the application metadata."""
+    return Base.metadata.tables[name]
+
+
+def _insert_parts(table: Table, columns: Sequence[str]) -> tuple[list[str], list[str]]:
+    """
+    Column names and VALUES expressions for a bulk insert.
+
+    Omitted columns with a scalar Python default get the default inlined,
+    since the ORM is not there to apply it.
+
+    Args:
+        table: Target table
+        columns: Columns supplied by each row, in row order
+
+    Returns:
+        (column names, value expressions)
+    """
+    names = list(columns)
+    values = ["?"] * len(columns)
+    for column in table.columns:
+        default = column.default
+        if column.name in columns or default is None or not default.is_scalar:
+            continue
+        names.append(column.name)
+        values.append(
+            str(
+                literal(default.arg, column.type).compile(
+                    dialect=_DIALECT, compile_kwargs={"literal_binds": True}
+                )
+            )
+        )
+    return names, values
+
+
+def insert_rows(
+    conn: Connection,
+    table_name: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    """
+    Insert tuples with one driver-level executemany.
+
+    Args:
+        conn: Connection to the target database
+        table_name: Table name (also used for staging tables)
+        columns: Column of each tuple position
+        rows: Row tuples; enums as member names, dates from timestamp()
+    """
+    names, values = _insert_parts(_table(table_name), columns)
+    conn.exec_driver_sql(
+        f"INSERT INTO {table_name} ({', '.join(names)}) "  # nosec B608
+        f"VALUES ({', '.join(values)})",
+        list(rows),
+    )
+
+
+def insert_dicts(conn: Connection, table_name: str, rows: list[dict]) -> None:
+    """
+    Insert rows given as dicts with the same keys.
+
+    Same as insert_rows, except that dates are unix seconds.
+    """
+    if not rows:
+        return
+    table = _table(table_name)
+    columns = list(rows[0])
+    dates = {name for name in columns if isinstance(table.c[name].type, DateTime)}
+    insert_rows(
+        conn,
+        table_name,
+        columns,
+        [
+            tuple(
+                timestamp(row[name])
+                if name in dates and row[name] is not None
+                else row[name]
+                for name in columns
+            )
+            for row in rows
+        ],
+    )
+
+
+def timestamp(seconds: int) -> str:
+    """
+    Format unix seconds the way SQLAlchemy stores DateTime on SQLite.
+
+    Several times faster than strftime, in Python or in SQL.
+    """
+    day, second = divmod(seconds, DAY)
+    date = _DATES.get(day)
+    if date is None:
+        date = _DATES[day] = (_EPOCH + timedelta(days=day)).strftime("%Y-%m-%d")
+    return date + _TIMES[second]
+
+
+def _date_in_range(rng: random.Random, now: int, days: int) -> int:
+    """Unix time up to ``days`` days (and a day's worth of hours) ago."""
+    return now - rng.randrange((days + 1) * DAY)
+
+
+def _date_after(rng: random.Random, base: int, max_days: int) -> int:
+    """Unix time 1 to ``max_days`` days (plus hours) after ``base``."""
+    return base + rng.randrange(DAY, (max_days + 1) * DAY)
+
+
+# =============================================================================
+# Chunk workers: votes, vote qualities, comments and comment likes
+# =============================================================================
+
+
+@dataclass
+class ChunkContext:
+    """Read-only state shared by the chunk workers."""
+
+    config: DatasetConfig
+    seed: int
+    staging_dir: str
+    voter_ids: list[int]  # regular users and category admins
+    requires_approval: frozenset[int]
+    qualities: dict[int, list[int]]  # category id -> quality ids
+    languages: list[str]
+    language_weights: list[float]
+
+
+@dataclass
+class ChunkRows:
+    """Rows generated for one chunk of ideas."""
+
+    votes: list[tuple] = field(default_factory=list)
+    vote_qualities: list[tuple] = field(default_factory=list)
+    comments: list[tuple] = field(default_factory=list)
+    comment_likes: list[tuple] = field(default_factory=list)
+    # (idea id, upvotes, downvotes) for every idea of the chunk
+    counters: list[tuple[int, int, int]] = field(default_factory=list)
+
+    def tables(self) -> list[tuple[str, tuple[str, ...], list[tuple]]]:
+        """(table name, columns, rows) in insertion order."""
+        return [
+            ("votes", VOTE_COLUMNS, self.votes),
+            ("vote_qualities", VOTE_QUALITY_COLUMNS, self.vote_qualities),
+            ("comments", COMMENT_COLUMNS, self.comments),
+            ("comment_likes", COMMENT_LIKE_COLUMNS, self.comment_likes),
+        ]
+
+
+@dataclass
+class ChunkResult:
+    """What a worker wrote to its staging database."""
+
+    path: str
+    votes: int
+    comments: int
+    counters: list[tuple[int, int, int]]
+
+
+def chunk_rows(
+    context: ChunkContext,
+    index: int,
+    ideas: list[tuple[int, int, int, int, bool]],
+    vote_offset: int = 0,
+    comment_offset: int = 0,
+) -> ChunkRows:
+    """
+    Generate the votes and comments of a chunk of ideas.
+
+    Follows the distributions of create_votes, create_comments and
+    create_comment_likes. Voters, commenters, likers and vote qualities
+    are a window of a shuffled list at a random offset rather than a
+    random.sample: still distinct and uniform, with one draw instead of
+    one per pick. The random stream depends only on the seed and the
+    chunk number.
+
+    Args:
+        context: Shared worker state
+        index: Chunk number
+        ideas: (id, author id, category id, created_at, approved) tuples
+        vote_offset: Votes before this chunk (ids continue from there)
+        comment_offset: Comments before this chunk
+
+    Returns:
+        Rows ready for insert_rows
+    """
+    config = context.config
+    rng = random.Random(f"{context.seed}:chunk:{index}")
+    # Bound methods, float arithmetic and lookup tables: the loops below
+    # run millions of times
+    uniform = rng.random
+    randint = rng.randint
+    num_voters = len(context.voter_ids)
+    users = list(context.voter_ids)
+    rng.shuffle(users)
+    users += users  # windows wrap around
+    category_qualities = {}
+    for category_id, quality_ids in context.qualities.items():
+        shuffled = list(quality_ids)
+        rng.shuffle(shuffled)
+        category_qualities[category_id] = (shuffled + shuffled, len(shuffled))
+    min_qualities, max_qualities = config.qualities_per_vote_range
+    quality_choices = max_qualities - min_qualities + 1
+    # Dates of every day a row of this chunk can fall on
+    first_day = min((idea[3] for idea in ideas), default=0) // DAY
+    last_day = max((idea[3] for idea in ideas), default=0) // DAY + 125
+    dates = [timestamp(day * DAY)[:10] for day in range(first_day, last_day)]
+    times = _TIMES
+    requires_approval = context.requires_approval
+    templates = {
+        language: COMMENT_TEMPLATES.get(language, COMMENT_TEMPLATES_EN)
+        for language in context.languages
+    }
+    cum_weights = list(accumulate(context.language_weights))
+    quality_probability = config.quality_selection_probability
+    like_probability = config.comment_like_probability
+    vote_span = 60 * DAY
+    comment_span = 90 * DAY
+    like_span = 30 * DAY
+
+    rows = ChunkRows()
+    votes = rows.votes
+    vote_qualities = rows.vote_qualities
+    comments = rows.comments
+    likes = rows.comment_likes
+    vote_id = vote_offset
+    comment_id = comment_offset
+
+    for idea_id, author_id, category_id, created_at, approved in ideas:
+        upvotes = downvotes = 0
+        if approved:
+            qualities, num_available = category_qualities.get(category_id, ([], 0))
+            num_votes = randint(*config.votes_per_idea_range)
+            start = int(uniform() * num_voters)
+            for voter_id in users[start : start + min(num_votes, num_voters)]:
+                if voter_id == author_id:
+                    continue
+                vote_id += 1
+                at = created_at + DAY + int(uniform() * vote_span)
+                voted_at = dates[at // DAY - first_day] + times[at % DAY]
+                if uniform() < 0.7:
+                    upvotes += 1
+                    votes.append((vote_id, idea_id, voter_id, "UPVOTE", voted_at))
+                    if num_available and uniform() < quality_probability:
+                        num_qualities = min(
+                            min_qualities + int(uniform() * quality_choices),
+                            num_available,
+                        )
+                        start = int(uniform() * num_available)
+                        for quality_id in qualities[start : start + num_qualities]:
+                            vote_qualities.append((vote_id, quality_id, voted_at))
+                else:
+                    downvotes += 1
+                    votes.append((vote_id, idea_id, voter_id, "DOWNVOTE", voted_at))
+        rows.counters.append((idea_id, upvotes, downvotes))
+
+        if not approved and uniform() > 0.1:
+            continue
+        num_comments = randint(*config.comments_per_idea_range)
+        start = int(uniform() * num_voters)
+        for commenter_id in users[start : start + min(num_comments, num_voters)]:
+            comment_id += 1
+            language = rng.choices(context.languages, cum_weights=cum_weights)[0]
+            commented_at = created_at + DAY + int(uniform() * comment_span)
+            needs_approval = commenter_id in requires_approval and uniform() < 0.3
+            content = rng.choice(templates[language])
+
+            like_count = 0
+            if uniform() <= like_probability:
+                num_likes = randint(*config.likes_per_comment_range)
+                # One extra draw stands in for the commenter, who cannot like
+                start = int(uniform() * num_voters)
+                for liker_id in users[start : start + min(num_likes + 1, num_voters)]:
+                    if like_count == num_likes:
+                        break
+                    if liker_id == commenter_id:
+                        continue
+                    at = commented_at + DAY + int(uniform() * like_span)
+                    likes.append(
+                        (
+                            comment_id,
+                            liker_id,
+                            dates[at // DAY - first_day] + times[at % DAY],
+                        )
+                    )
+                    like_count += 1
+
+            comments.append(
+                (
+                    comment_id,
+                    idea_id,
+                    commenter_id,
+                    content,
+                    timestamp(commented_at),
+                    needs_approval,
+                    like_count,
+                    language,
+                )
+            )
+    return rows
+
+
+_context: ChunkContext | None = None
+
+
+def _init_worker(context: ChunkContext) -> None:
+    """Install the shared context in a worker process."""
+    global _context
+    _context = context
+
+
+def _generate_chunk(index: int, ideas: list[tuple]) -> ChunkResult:
+    """
+    Worker task: generate a chunk into its own staging database.
+
+    Ids are numbered from 1 within the chunk and shifted by _merge_chunk.
+    """
+    context = _context
+    assert context is not None, "worker not initialized"
+    rows = chunk_rows(context, index, ideas)
+
+    path = os.path.join(context.staging_dir, f"chunk_{index:05d}.db")
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=OFF")
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+            for table_name, columns, table_rows in rows.tables():
+                # Untyped, unconstrained: staging rows are only copied out
+                names, _ = _insert_parts(_table(table_name), columns)
+                conn.exec_driver_sql(f"CREATE TABLE {table_name} ({', '.join(names)})")
+                insert_rows(conn, table_name, columns, table_rows)
+            conn.commit()
+    finally:
+        engine.dispose()
+    return ChunkResult(path, len(rows.votes), len(rows.comments), rows.counters)
+
+
+def _merge_chunk(conn: Connection, result: ChunkResult, offsets: dict) -> None:
+    """
+    Copy a staging database into the target, shifting its local ids.
+
+    Args:
+        conn: Connection to the target database (no open transaction)
+        result: Chunk to merge
+        offsets: Rows already loaded per id space ("votes", "comments");
+            updated in place
+    """
+    conn.exec_driver_sql("ATTACH DATABASE ? AS staging", (result.path,))
+    try:
+        for table_name, columns, _ in ChunkRows().tables():
+            names, _ = _insert_parts(_table(table_name), columns)
+            shifted, id_space = OFFSET_COLUMNS[table_name]
+            expressions = [
+                f"{name} + {offsets[id_space]:d}" if name == shifted else name
+                for name in names
+            ]
+            conn.exec_driver_sql(
+                f"INSERT INTO main.{table_name} ({', '.join(names)}) "  # nosec B608
+                f"SELECT {', '.join(expressions)} FROM staging.{table_name} "
+                "ORDER BY rowid"
+            )
+        conn.commit()
+    finally:
+        conn.exec_driver_sql("DETACH DATABASE staging")
+    offsets["votes"] += result.votes
+    offsets["comments"] += result.comments
+    os.remove(result.path)
+
+
+def start_workers(
+    context: ChunkContext, chunks: list[list[tuple]], workers: int
+) -> Iterator[ChunkResult] | None:
+    """
+    Start generating chunks in worker processes.
+
+    The workers run while the caller writes the other tables.
+
+    Args:
+        context: Shared worker state
+        chunks: Idea tuples per chunk
+        workers: Process count
+
+    Returns:
+        Iterator over the results in chunk order, or None for a single
+        worker (load_chunks then generates in process)
+    """
+    if workers <= 1:
+        return None
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(context,)
+    )
+    futures = [
+        executor.submit(_generate_chunk, index, ideas)
+        for index, ideas in enumerate(chunks)
+    ]
+
+    def results() -> Iterator[ChunkResult]:
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    return results()
+
+
+def load_chunks(
+    conn: Connection,
+    context: ChunkContext,
+    chunks: list[list[tuple]],
+    pending: Iterator[ChunkResult] | None,
+) -> tuple[dict[str, int], list[tuple[int, int, int]]]:
+    """
+    Load every chunk into the target database, in chunk order.
+
+    Without workers, chunks are generated here and inserted directly,
+    skipping the staging copy.
+
+    Args:
+        conn: Connection to the target database (no open transaction)
+        context: Shared worker state
+        chunks: Idea tuples per chunk
+        pending: Result of start_workers
+
+    Returns:
+        (row totals for "votes" and "comments", idea vote counters)
+    """
+    offsets = {"votes": 0, "comments": 0}
+    counters: list[tuple[int, int, int]] = []
+    if pending is not None:
+        for result in pending:
+            _merge_chunk(conn, result, offsets)
+            counters.extend(result.counters)
+        return offsets, counters
+
+    for index, ideas in enumerate(chunks):
+        rows = chunk_rows(context, index, ideas, offsets["votes"], offsets["comments"])
+        for table_name, columns, table_rows in rows.tables():
+            insert_rows(conn, table_name, columns, table_rows)
+        conn.commit()
+        offsets["votes"] += len(rows.votes)
+        offsets["comments"] += len(rows.comments)
+        counters.extend(rows.counters)
+    return offsets, counters
+
+
+# =============================================================================
+# Main process: users, ideas and moderation data
+# =============================================================================
+
+
+def _reference_data(conn: Connection) -> tuple[list[int], list[int], dict, int]:
+    """
+    Create policy versions, categories, qualities and tags with the ORM
+    generator (a few dozen rows).
+
+    Returns:
+        (category ids, tag ids, category id -> quality ids, policy versions)
+    """
+    session = Session(bind=conn)
+    policy_versions = gtd.create_policy_versions(session)
+    categories = gtd.create_categories(session)
+    qualities = gtd.create_qualities(session, categories)
+    tags = gtd.create_tags(session)
+
+    default_ids = [quality.id for quality in qualities if quality.is_default]
+    category_qualities = {category.id: list(default_ids) for category in categories}
+    for category_id, quality_id in session.execute(
+        select(CategoryQuality.category_id, CategoryQuality.quality_id).where(
+            CategoryQuality.is_enabled.is_(True)
+        )
+    ):
+        category_qualities[category_id].append(quality_id)
+    tag_ids = [tag.id for tag in tags]
+    session.close()
+    return list(category_qualities), tag_ids, category_qualities, len(policy_versions)
+
+
+def _sync_tag_stats(conn: Connection) -> int:
+    """
+    Fill tag_stats from the loaded idea_tags.
+
+    Returns:
+        Number of tag counters
+    """
+    session = Session(bind=conn)
+    TagStatRepository(session).sync_tag_stats()
+    session.commit()
+    session.close()
+    return conn.exec_driver_sql("SELECT COUNT(*) FROM tag_stats").scalar_one()
+
+
+def _build_users(
+    config: DatasetConfig, rng: random.Random, now: int
+) -> tuple[list[dict], dict[str, str]]:
+    """
+    User rows with precomputed ids, following create_users.
+
+    Returns:
+        (user rows in id order starting at 1, email -> password)
+    """
+    password_map: dict[str, str] = {}
+    users: list[dict] = []
+
+    def add(
+        email: str,
+        username: str,
+        display_name: str,
+        password: str,
+        created_at: int,
+        **fields: Any,
+    ) -> dict:
+        last_activity = _date_after(rng, created_at, fields.pop("active_days", 30))
+        marketing = fields.pop("marketing_consent", False)
+        row = {
+            "id": len(users) + 1,
+            "email": email,
+            "username": username,
+            "display_name": display_name,
+            "hashed_password": gtd.get_password_hash(password),
+            "is_global_admin": False,
+            "is_active": True,
+            "created_at": created_at,
+            "trust_score": 100,
+            "approved_comments_count": 0,
+            "total_flags_received": 0,
+            "valid_flags_received": 0,
+            "requires_comment_approval": False,
+            "consent_terms_accepted": True,
+            "consent_privacy_accepted": True,
+            "consent_terms_version": "1.0",
+            "consent_privacy_version": "1.0",
+            "consent_timestamp": created_at,
+            "marketing_consent": marketing,
+            "marketing_consent_timestamp": created_at if marketing else None,
+            "last_login_at": last_activity,
+            "last_activity_at": last_activity,
+            "profile_visibility": "public",
+            "show_display_name": True,
+            "show_avatar": True,
+            "show_activity": True,
+            "show_join_date": True,
+            "is_official": False,
+            "official_title": None,
+            "official_verified_at": None,
+        }
+        row.update(fields)
+        users.append(row)
+        password_map[email] = password
+        return row
+
+    for i in range(config.num_global_admins):
+        add(
+            gtd._get_test_admin_email(i + 1),
+            f"admin{i + 1}",
+            f"Admin {i + 1}",
+            "Admin123!",
+            _date_in_range(rng, now, config.date_range_days),
+            is_global_admin=True,
+            approved_comments_count=rng.randint(10, 50),
+        )
+    for i in range(config.num_category_admins):
+        add(
+            gtd._get_test_category_admin_email(i + 1),
+            f"catadmin{i + 1}",
+            f"Category Admin {i + 1}",
+            "CatAdmin123!",
+            _date_in_range(rng, now, config.date_range_days),
+            trust_score=90,
+            approved_comments_count=rng.randint(5, 30),
+            marketing_consent=rng.random() > 0.5,
+        )
+
+    used_emails: set[str] = set()
+    used_usernames: set[str] = set()
+    for _ in range(config.num_regular_users):
+        first_name = rng.choice(FIRST_NAMES_FR)
+        last_name = rng.choice(LAST_NAMES_FR)
+        email = f"{first_name.lower()}.{last_name.lower()}@example.com"
+        counter = 1
+        while email in used_emails:
+            email = f"{first_name.lower()}.{last_name.lower()}{counter}@example.com"
+            counter += 1
+        used_emails.add(email)
+        base_username = username = f"{first_name.lower()}{last_name.lower()[:3]}"
+        counter = 1
+        while username in used_usernames:
+            username = f"{base_username}{counter}"
+            counter += 1
+        used_usernames.add(username)
+
+        trust_score = rng.randint(20, 100)
+        add(
+            email,
+            username,
+            f"{first_name} {last_name}",
+            "User123!",
+            _date_in_range(rng, now, config.date_range_days),
+            active_days=60,
+            is_active=rng.random() > 0.05,
+            trust_score=trust_score,
+            approved_comments_count=rng.randint(0, 20),
+            total_flags_received=rng.randint(0, 5) if trust_score < 60 else 0,
+            valid_flags_received=rng.randint(0, 2) if trust_score < 50 else 0,
+            requires_comment_approval=trust_score < 50,
+            marketing_consent=rng.random() > 0.7,
+            profile_visibility=rng.choice(
+                ["public", "public", "public", "registered", "private"]
+            ),
+            show_display_name=rng.random() > 0.1,
+            show_avatar=rng.random() > 0.15,
+            show_activity=rng.random() > 0.2,
+            show_join_date=rng.random() > 0.1,
+        )
+    return users, password_map
+
+
+def _build_consent_logs(users: list[dict], rng: random.Random) -> list[dict]:
+    """Consent log rows, following create_consent_logs."""
+    logs: list[dict] = []
+
+    def log(user: dict, consent_type: str, action: str, created_at: int) -> None:
+        logs.append(
+            {
+                "user_id": user["id"],
+                "consent_type": consent_type,
+                "action": action,
+                "policy_version": "1.0" if consent_type != "marketing" else None,
+                "ip_address": f"192.168.1.{rng.randint(1, 254)}",
+                "user_agent": "Mozilla/5.0 (Test Data Generator)",
+                "created_at": created_at,
+            }
+        )
+
+    for user in users:
+        log(user, "terms", "granted", user["created_at"])
+        log(user, "privacy", "granted", user["created_at"])
+        if user["marketing_consent"]:
+            log(user, "marketing", "granted", user["created_at"])
+    for user in rng.sample(users, min(20, len(users))):
+        if user["marketing_consent"]:
+            opt_out = _date_after(rng, user["created_at"], 60)
+            log(user, "marketing", "withdrawn", opt_out)
+            log(user, "marketing", "granted", _date_after(rng, opt_out, 30))
+    return logs
+
+
+def _build_ideas(
+    config: DatasetConfig,
+    rng: random.Random,
+    now: int,
+    author_ids: list[int],
+    category_ids: list[int],
+    languages: list[str],
+    language_weights: list[float],
+) -> list[dict]:
+    """Idea rows with precomputed ids, following create_ideas."""
+    rejection_comments = [
+        "Cette idée ne respecte pas les critères de recevabilité.",
+        "Projet déjà en cours de réalisation par la ville.",
+        "Idée trop vague, veuillez préciser.",
+        "Ne relève pas de la compétence municipale.",
+        "Doublon d'une idée existante.",
+    ]
+    cum_weights = list(accumulate(language_weights))
+    ideas = []
+    for i in range(config.num_ideas):
+        created_at = _date_in_range(rng, now, config.date_range_days)
+        rand = rng.random()
+        if rand < 0.60:
+            status, validated_at, admin_comment = (
+                IdeaStatus.APPROVED,
+                _date_after(rng, created_at, 7),
+                None,
+            )
+        elif rand < 0.85:
+            status, validated_at, admin_comment = IdeaStatus.PENDING, None, None
+        else:
+            status, validated_at, admin_comment = (
+                IdeaStatus.REJECTED,
+                _date_after(rng, created_at, 7),
+                rng.choice(rejection_comments),
+            )
+        language = rng.choices(languages, cum_weights=cum_weights)[0]
+        titles = IDEA_TITLES.get(language, IDEA_TITLES_EN)
+        title = rng.choice(titles)
+        variant = i // len(titles)
+        ideas.append(
+            {
+                "id": i + 1,
+                "title": f"{title} - Variante {variant}" if variant > 0 else title,
+                "description": rng.choice(
+                    IDEA_DESCRIPTIONS.get(language, IDEA_DESCRIPTIONS_EN)
+                ),
+                "category_id": rng.choice(category_ids),
+                "user_id": rng.choice(author_ids),
+                "status": status.name,
+                "admin_comment": admin_comment,
+                "created_at": created_at,
+                "validated_at": validated_at,
+                "language": language,
+                "flag_count": 0,
+                "edit_count": 0,
+                "last_edit_at": None,
+                "previous_status": None,
+                "upvote_count": 0,
+                "downvote_count": 0,
+                "score": 0,
+            }
+        )
+    return ideas
+
+
+def _build_penalties(
+    config: DatasetConfig,
+    rng: random.Random,
+    now: int,
+    users: list[dict],
+    admin_ids: list[int],
+) -> tuple[list[dict], list[dict]]:
+    """
+    Penalty and appeal rows, following create_user_penalties and
+    create_appeals. Lowers the trust score of penalized users.
+
+    Returns:
+        (penalty rows, appeal rows)
+    """
+    durations = {
+        PenaltyType.WARNING: 7 * DAY,
+        PenaltyType.TEMP_BAN_24H: DAY,
+        PenaltyType.TEMP_BAN_7D: 7 * DAY,
+        PenaltyType.TEMP_BAN_30D: 30 * DAY,
+    }
+    regular = users[config.num_global_admins + config.num_category_admins :]
+    penalties = []
+    for user in rng.sample(regular, min(config.num_user_penalties, len(regular))):
+        penalty_type = rng.choice(list(PenaltyType))
+        status = rng.choice(
+            [PenaltyStatus.ACTIVE, PenaltyStatus.EXPIRED, PenaltyStatus.REVOKED]
+        )
+        issued_at = _date_in_range(rng, now, 180)
+        duration = durations.get(penalty_type)
+        revoked = status == PenaltyStatus.REVOKED
+        penalties.append(
+            {
+                "id": len(penalties) + 1,
+                "user_id": user["id"],
+                "penalty_type": penalty_type.name,
+                "reason": "Violation des règles communautaires lors des tests de "
+                "données.",
+                "status": status.name,
+                "issued_by": rng.choice(admin_ids),
+                "issued_at": issued_at,
+                "expires_at": issued_at + duration if duration else None,
+                "revoked_at": _date_after(rng, issued_at, 14) if revoked else None,
+                "revoked_by": rng.choice(admin_ids) if revoked else None,
+                "revoke_reason": "Révoqué suite à un appel accepté."
+                if revoked
+                else None,
+            }
+        )
+        user["trust_score"] = max(0, user["trust_score"] - 10)
+
+    appealable = [
+        penalty
+        for penalty in penalties
+        if penalty["status"] in (PenaltyStatus.ACTIVE.name, PenaltyStatus.EXPIRED.name)
+    ]
+    appeals = []
+    for penalty in rng.sample(appealable, min(config.num_appeals, len(appealable))):
+        status = rng.choice(list(AppealStatus))
+        created_at = _date_after(rng, penalty["issued_at"], 7)
+        reviewed = status != AppealStatus.PENDING
+        appeals.append(
+            {
+                "penalty_id": penalty["id"],
+                "user_id": penalty["user_id"],
+                "reason": "Je conteste cette sanction car je n'ai pas violé les "
+                "règles intentionnellement. Je m'engage à respecter les règles "
+                "communautaires à l'avenir.",
+                "status": status.name,
+                "created_at": created_at,
+                "reviewed_at": _date_after(rng, created_at, 14) if reviewed else None,
+                "reviewed_by": rng.choice(admin_ids) if reviewed else None,
+                "review_notes": None
+                if not reviewed
+                else "Appel accepté après examen."
+                if status == AppealStatus.APPROVED
+                else "Appel rejeté - violation confirmée.",
+            }
+        )
+        if status == AppealStatus.APPROVED:
+            penalty["status"] = PenaltyStatus.APPEALED.name
+    return penalties, appeals
+
+
+def _build_idea_moderation(
+    config: DatasetConfig,
+    rng: random.Random,
+    approved: list[dict],
+    reporter_ids: list[int],
+    admin_ids: list[int],
+) -> tuple[list[dict], int]:
+    """
+    Idea flags and edit tracking, following create_content_flags and
+    apply_idea_edit_tracking. Updates the idea rows in place.
+
+    Returns:
+        (flag rows, number of edited ideas)
+    """
+    flags = []
+    for idea in rng.sample(approved, min(config.num_flagged_ideas, len(approved))):
+        reporter_id = rng.choice(reporter_ids)
+        if reporter_id == idea["user_id"]:
+            continue
+        status = rng.choice([FlagStatus.PENDING, FlagStatus.DISMISSED])
+        created_at = _date_after(rng, idea["created_at"], 60)
+        reviewed = status != FlagStatus.PENDING
+        flags.append(
+            {
+                "content_type": ContentType.IDEA.name,
+                "content_id": idea["id"],
+                "reporter_id": reporter_id,
+                "reason": rng.choice(list(FlagReason)).name,
+                "details": None,
+                "status": status.name,
+                "created_at": created_at,
+                "reviewed_at": _date_after(rng, created_at, 7) if reviewed else None,
+                "reviewed_by": rng.choice(admin_ids) if reviewed else None,
+                "review_notes": None,
+            }
+        )
+        idea["flag_count"] += 1
+
+    num_to_edit = int(len(approved) * config.ideas_with_edits_probability)
+    edited = rng.sample(approved, min(num_to_edit, len(approved)))
+    for idea in edited:
+        idea["edit_count"] = rng.randint(1, 3)
+        idea["last_edit_at"] = _date_after(
+            rng, idea["validated_at"] or idea["created_at"], 60
+        )
+        if rng.random() < 0.2:
+            idea["previous_status"] = IdeaStatus.APPROVED.value
+            idea["status"] = IdeaStatus.PENDING_EDIT.name
+    return flags, len(edited)
+
+
+def _flag_comments(
+    conn: Connection,
+    config: DatasetConfig,
+    rng: random.Random,
+    num_comments: int,
+    reporter_ids: list[int],
+    admin_ids: list[int],
+) -> int:
+    """
+    Flag merged comments, following create_content_flags.
+
+    Returns:
+        Number of comment flags created
+    """
+    sampled = sorted(
+        rng.sample(
+            range(1, num_comments + 1), min(config.num_flagged_comments, num_comments)
+        )
+    )
+    comments = []
+    for start in range(0, len(sampled), ID_BATCH):
+        batch = sampled[start : start + ID_BATCH]
+        comments.extend(
+            conn.exec_driver_sql(
+                "SELECT id, user_id, CAST(strftime('%s', created_at) AS INTEGER) "
+                f"FROM comments WHERE id IN ({', '.join('?' * len(batch))})",  # nosec B608
+                tuple(batch),
+            )
+        )
+
+    flags = []
+    hidden = []
+    for comment_id, author_id, commented_at in comments:
+        reporter_id = rng.choice(reporter_ids)
+        if reporter_id == author_id:
+            continue
+        status = rng.choice(
+            [FlagStatus.PENDING, FlagStatus.DISMISSED, FlagStatus.ACTIONED]
+        )
+        created_at = _date_after(rng, commented_at, 30)
+        reviewed_at = (
+            _date_after(rng, created_at, 7) if status != FlagStatus.PENDING else None
+        )
+        flags.append(
+            {
+                "content_type": ContentType.COMMENT.name,
+                "content_id": comment_id,
+                "reporter_id": reporter_id,
+                "reason": rng.choice(list(FlagReason)).name,
+                "details": "Contenu signalé automatiquement pour les tests."
+                if rng.random() < 0.5
+                else None,
+                "status": status.name,
+                "created_at": created_at,
+                "reviewed_at": reviewed_at,
+                "reviewed_by": rng.choice(admin_ids) if reviewed_at else None,
+                "review_notes": "Examiné lors des tests." if reviewed_at else None,
+            }
+        )
+        is_hidden = status == FlagStatus.ACTIONED
+        hidden_at = timestamp(reviewed_at or created_at) if is_hidden else None
+        hidden.append((is_hidden, hidden_at, comment_id))
+
+    insert_dicts(conn, "content_flags", flags)
+    conn.exec_driver_sql(
+        "UPDATE comments SET flag_count = flag_count + 1, is_hidden = ?, "
+        "hidden_at = ? WHERE id = ?",
+        hidden,
+    )
+    return len(flags)
+
+
+def _build_login_events(
+    config: DatasetConfig, rng: random.Random, now: int, users: list[dict]
+) -> list[tuple]:
+    """Login event rows, following create_login_events."""
+    sample_ips = (
+        [f"192.168.1.{i}" for i in range(1, 255)]
+        + [f"10.0.0.{i}" for i in range(1, 100)]
+        + [f"172.16.0.{i}" for i in range(1, 50)]
+    )
+    user_agents = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15",
+        "Mozilla/5.0 (Android 14; Mobile) AppleWebKit/537.36",
+    ]
+    failure_reasons = [
+        LoginFailureReason.INVALID_PASSWORD,
+        LoginFailureReason.USER_NOT_FOUND,
+        LoginFailureReason.ACCOUNT_INACTIVE,
+        LoginFailureReason.RATE_LIMITED,
+        LoginFailureReason.TWO_FACTOR_FAILED,
+    ]
+    events = []
+    for i in range(config.num_login_events):
+        rand = rng.random()
+        failure_reason = None
+        if rand < 0.70:
+            event_type = LoginEventType.LOGIN_SUCCESS
+        elif rand < 0.90:
+            event_type = LoginEventType.LOGIN_FAILED
+            failure_reason = rng.choice(failure_reasons).name
+        elif rand < 0.98:
+            event_type = LoginEventType.LOGOUT
+        else:
+            event_type = LoginEventType.PASSWORD_RESET_REQUEST
+        user = (
+            rng.choice(users)
+            if event_type != LoginEventType.LOGIN_FAILED or rng.random() > 0.3
+            else None
+        )
+        events.append(
+            (
+                user["id"] if user else None,
+                user["email"] if user else f"unknown{i}@example.com",
+                event_type.name,
+                rng.choice(sample_ips),
+                rng.choice(user_agents),
+                failure_reason,
+                timestamp(_date_in_range(rng, now, config.date_range_days)),
+            )
+        )
+    return events
+
+
+def _build_share_events(
+    config: DatasetConfig, rng: random.Random, approved: list[dict]
+) -> list[tuple]:
+    """Share event rows, following create_share_events."""
+    if not approved:
+        return []
+    platforms = [platform.name for platform in SharePlatform]
+    events = []
+    for _ in range(config.num_share_events):
+        idea = rng.choice(approved)
+        events.append(
+            (
+                idea["id"],
+                rng.choice(platforms),
+                f"https://opencitivibes.local/ideas/{idea['id']}"
+                if rng.random() > 0.3
+                else None,
+                timestamp(_date_after(rng, idea["created_at"], 90)),
+            )
+        )
+    return events
+
+
+def _build_share_counts(share_events: list[tuple]) -> list[tuple]:
+    """Per-minute share_counts rollup of the share events."""
+    counts: dict[tuple[int, str, str], int] = {}
+    for idea_id, platform, _, created_at in share_events:
+        # created_at comes from timestamp(): truncate it to the minute
+        key = (idea_id, platform, f"{created_at[:16]}:00.000000")
+        counts[key] = counts.get(key, 0) + 1
+    return [(*key, count) for key, count in counts.items()]
+
+
+def _build_audit_logs(
+    config: DatasetConfig,
+    rng: random.Random,
+    now: int,
+    user_ids: list[int],
+    admin_ids: list[int],
+    voter_ids: list[int],
+) -> list[tuple]:
+    """Security audit log rows, following create_security_audit_logs."""
+    event_types = [
+        ("login_failed", "warning", "authenticate"),
+        ("login_success", "info", "authenticate"),
+        ("data_export", "info", "export"),
+        ("admin_access_pii", "warning", "view"),
+        ("password_change", "info", "update"),
+        ("permission_change", "warning", "update"),
+        ("bulk_data_access", "warning", "view"),
+        ("consent_change", "info", "update"),
+    ]
+    admin_events = {"admin_access_pii", "permission_change", "bulk_data_access"}
+    logs = []
+    for _ in range(config.num_security_audit_logs):
+        event_type, severity, action = rng.choice(event_types)
+        if event_type in admin_events:
+            user_id = rng.choice(admin_ids or user_ids)
+            target_id = rng.choice(voter_ids) if voter_ids else None
+        else:
+            user_id = rng.choice(user_ids)
+            target_id = None
+        logs.append(
+            (
+                event_type,
+                severity,
+                user_id,
+                target_id,
+                f"192.168.1.{rng.randint(1, 99)}",
+                "Mozilla/5.0 (Test Data Generator)",
+                "user" if target_id else None,
+                target_id,
+                action,
+                rng.random() > 0.1,
+                timestamp(_date_in_range(rng, now, config.date_range_days)),
+            )
+        )
+    return logs
+
+
+def _other_user_rows(
+    config: DatasetConfig,
+    rng: random.Random,
+    now: int,
+    users: list[dict],
+    category_ids: list[int],
+    admin_ids: list[int],
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Admin roles, watchlist and admin notes; marks official users in place
+    (create_admin_roles, create_keyword_watchlist, create_admin_notes,
+    create_official_users).
+
+    Returns:
+        (admin role rows, watchlist rows, admin note rows)
+    """
+    category_admins = users[
+        config.num_global_admins : config.num_global_admins + config.num_category_admins
+    ]
+    regular = users[config.num_global_admins + config.num_category_admins :]
+
+    roles = [
+        {"user_id": user["id"], "category_id": category_id}
+        for user in category_admins
+        for category_id in rng.sample(category_ids, rng.randint(1, 2))
+    ]
+
+    watchlist = [
+        {
+            "keyword": keyword,
+            "is_regex": is_regex,
+            "auto_flag_reason": reason.name,
+            "is_active": True,
+            "created_by": rng.choice(admin_ids),
+            "created_at": _date_in_range(rng, now, 180),
+            "match_count": rng.randint(0, 10),
+        }
+        for keyword, reason, is_regex in [
+            ("spam", FlagReason.SPAM, False),
+            ("publicité", FlagReason.SPAM, False),
+            (r"bit\.ly", FlagReason.SPAM, True),
+            ("haine", FlagReason.HATE_SPEECH, False),
+            ("stupide", FlagReason.HARASSMENT, False),
+        ]
+    ]
+
+    note_templates = [
+        "Utilisateur actif, contributions de qualité.",
+        "À surveiller - plusieurs signalements récents.",
+        "Nouveau contributeur, semble prometteur.",
+        "Historique de commentaires hors sujet.",
+        "Membre de longue date, très respectueux.",
+    ]
+    notes = [
+        {
+            "user_id": user["id"],
+            "content": rng.choice(note_templates),
+            "created_by": rng.choice(admin_ids),
+            "created_at": _date_in_range(rng, now, 90),
+        }
+        for user in rng.sample(regular, min(config.num_admin_notes, len(regular)))
+    ]
+
+    official_titles = [
+        "City Councillor",
+        "Borough Mayor",
+        "Urban Planner",
+        "Transportation Director",
+        "Environment Coordinator",
+        "Community Liaison",
+        "Public Works Manager",
+        "Parks Director",
+        "Heritage Officer",
+        "Accessibility Coordinator",
+    ]
+    for user in rng.sample(regular, min(config.num_official_users, len(regular))):
+        user["is_official"] = True
+        user["official_title"] = rng.choice(official_titles)
+        user["official_verified_at"] = _date_after(rng, user["created_at"], 30)
+    return roles, watchlist, notes
+
+
+# =============================================================================
+# Entry point
+# =============================================================================
+
+
+def _secondary_indexes() -> list:
+    """Indexes of the bulk-loaded tables, dropped while loading."""
+    return [index for name in BULK_TABLES for index in _table(name).indexes]
+
+
+def build(
+    config: DatasetConfig,
+    output: Path,
+    seed: int | None = None,
+    workers: int = 1,
+) -> tuple[dict[str, int], dict[str, str]]:
+    """
+    Build a test database in bulk.
+
+    Args:
+        config: Dataset size
+        output: Database path (replaced if it exists)
+        seed: Seed for every random stream (default: random)
+        workers: Processes generating votes and comments
+
+    Returns:
+        (actual row counts per table, email -> password of generated users)
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    now = int(time.time())
+    rng = random.Random(f"{seed}:main")
+    gtd.config = config
+    random.seed(seed)
+
+    if output.exists():
+        output.unlink()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(f"sqlite:///{output}", echo=False)
+    Base.metadata.create_all(bind=engine)
+
+    counts: dict[str, int] = {}
+    indexes = _secondary_indexes()
+    try:
+        with (
+            engine.connect() as conn,
+            tempfile.TemporaryDirectory(dir=output.parent) as staging_dir,
+        ):
+            conn.exec_driver_sql("PRAGMA journal_mode=OFF")
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+            conn.exec_driver_sql(f"PRAGMA cache_size=-{CACHE_KIB:d}")
+            for index in indexes:
+                conn.exec_driver_sql(f"DROP INDEX {index.name}")
+            conn.commit()
+
+            print("1. Creating reference data...")
+            category_ids, tag_ids, category_qualities, policy_versions = (
+                _reference_data(conn)
+            )
+
+            print("\n2. Planning users and ideas...")
+            users, password_map = _build_users(config, rng, now)
+            num_admins = config.num_global_admins
+            admin_ids = [user["id"] for user in users[:num_admins]]
+            voter_ids = [user["id"] for user in users[num_admins:]]
+            author_ids = voter_ids[config.num_category_admins :]
+            languages, weights = gtd._get_instance_languages()
+            ideas = _build_ideas(
+                config, rng, now, author_ids, category_ids, languages, weights
+            )
+
+            print(
+                f"\n3. Generating votes and comments ({workers} worker"
+                f"{'s' if workers != 1 else ''})..."
+            )
+            context = ChunkContext(
+                config=config,
+                seed=seed,
+                staging_dir=staging_dir,
+                voter_ids=voter_ids,
+                requires_approval=frozenset(
+                    user["id"] for user in users if user["requires_comment_approval"]
+                ),
+                qualities=category_qualities,
+                languages=languages,
+                language_weights=weights,
+            )
+            chunks = [
+                [
+                    (
+                        idea["id"],
+                        idea["user_id"],
+                        idea["category_id"],
+                        idea["created_at"],
+                        idea["status"] == IdeaStatus.APPROVED.name,
+                    )
+                    for idea in ideas[start : start + IDEAS_PER_CHUNK]
+                ]
+                for start in range(0, len(ideas), IDEAS_PER_CHUNK)
+            ]
+            pending = start_workers(context, chunks, workers)
+
+            # Moderation data is decided before the ideas and users are
+            # written, so it goes in with them
+            approved = [
+                idea for idea in ideas if idea["status"] == IdeaStatus.APPROVED.name
+            ]
+            penalties, appeals = _build_penalties(config, rng, now, users, admin_ids)
+            roles, watchlist, notes = _other_user_rows(
+                config, rng, now, users, category_ids, admin_ids
+            )
+            idea_flags, edited = _build_idea_moderation(
+                config, rng, approved, voter_ids, admin_ids
+            )
+
+            insert_dicts(conn, "users", users)
+            insert_dicts(conn, "admin_roles", roles)
+            consent_logs = _build_consent_logs(users, rng)
+            insert_dicts(conn, "consent_logs", consent_logs)
+            insert_dicts(conn, "user_penalties", penalties)
+            insert_dicts(conn, "appeals", appeals)
+            insert_dicts(conn, "keyword_watchlist", watchlist)
+            insert_dicts(conn, "admin_notes", notes)
+            login_events = _build_login_events(config, rng, now, users)
+            insert_rows(
+                conn,
+                "login_events",
+                (
+                    "user_id",
+                    "email",
+                    "event_type",
+                    "ip_address",
+                    "user_agent",
+                    "failure_reason",
+                    "created_at",
+                ),
+                login_events,
+            )
+            audit_logs = _build_audit_logs(
+                config, rng, now, [user["id"] for user in users], admin_ids, voter_ids
+            )
+            insert_rows(
+                conn,
+                "security_audit_logs",
+                (
+                    "event_type",
+                    "severity",
+                    "user_id",
+                    "target_user_id",
+                    "ip_address",
+                    "user_agent",
+                    "resource_type",
+                    "resource_id",
+                    "action",
+                    "success",
+                    "created_at",
+                ),
+                audit_logs,
+            )
+            share_events = _build_share_events(config, rng, approved)
+            insert_rows(
+                conn,
+                "share_events",
+                ("idea_id", "platform", "referrer_url", "created_at"),
+                share_events,
+            )
+            share_counts = _build_share_counts(share_events)
+            insert_rows(
+                conn,
+                "share_counts",
+                ("idea_id", "platform", "bucket_start", "count"),
+                share_counts,
+            )
+            idea_tags = [
+                (idea["id"], tag_id, timestamp(idea["created_at"]))
+                for idea in ideas
+                for tag_id in rng.sample(
+                    tag_ids,
+                    min(rng.randint(*config.tags_per_idea_range), len(tag_ids)),
+                )
+            ]
+            insert_rows(
+                conn, "idea_tags", ("idea_id", "tag_id", "created_at"), idea_tags
+            )
+            conn.commit()
+
+            print("\n4. Loading votes and comments...")
+            offsets, counters = load_chunks(conn, context, chunks, pending)
+            for idea_id, upvotes, downvotes in counters:
+                idea = ideas[idea_id - 1]
+                idea["upvote_count"] = upvotes
+                idea["downvote_count"] = downvotes
+                idea["score"] = upvotes - downvotes
+            insert_dicts(conn, "ideas", ideas)
+            insert_dicts(conn, "content_flags", idea_flags)
+            comment_flags = _flag_comments(
+                conn, config, rng, offsets["comments"], voter_ids, admin_ids
+            )
+            conn.commit()
+
+            print("\n5. Building indexes...")
+            for index in indexes:
+                conn.execute(CreateIndex(index))
+            conn.commit()
+            tag_stats = _sync_tag_stats(conn)
+            conn.exec_driver_sql("PRAGMA journal_mode=DELETE")
+
+            counts = {
+                "users": len(users),
+                "ideas": len(ideas),
+                "idea_tags": len(idea_tags),
+                "tag_stats": tag_stats,
+                "votes": offsets["votes"],
+                "comments": offsets["comments"],
+                "comment_likes": conn.exec_driver_sql(
+                    "SELECT COUNT(*) FROM comment_likes"
+                ).scalar_one(),
+                "flags": len(idea_flags) + comment_flags,
+                "penalties": len(penalties),
+                "appeals": len(appeals),
+                "policy_versions": policy_versions,
+                "consent_logs": len(consent_logs),
+                "official_users": min(config.num_official_users, len(author_ids)),
+                "login_events": len(login_events),
+                "share_events": len(share_events),
+                "share_counts": len(share_counts),
+                "security_audit_logs": len(audit_logs),
+                "edited_ideas": edited,
+            }
+
+        print("\n6. Setting up FTS5...")
+        gtd.setup_fts5(engine)
+    finally:
+        engine.dispose()
+
+    return counts, password_map
+
+
+def generate_bulk(
+    size: str = "small",
+    output: Path | None = None,
+    seed: int | None = None,
+    workers: int = 1,
+    write_report: bool = True,
+) -> dict[str, int]:
+    """
+    Build a test database in bulk (see generate_test_data.generate).
+
+    Args:
+        size: Key of DATASET_CONFIGS
+        output: Database path (default: data/opencitivibes_test_{size}.db)
+        seed: Seed for the random streams
+        workers: Processes generating votes and comments
+        write_report: Write the TEST_USERS.md credentials report
+
+    Returns:
+        Actual row counts per table
+    """
+    config = gtd.DATASET_CONFIGS[size]
+    output = output if output is not None else gtd.get_db_path(size)
+
+    print("=" * 70)
+    print("OpenCitiVibes - Test Data Generator (bulk)")
+    print("=" * 70)
+    print(f"\nDataset: {config.name}")
+    print(f"Database: {output.name}")
+    if seed is not None:
+        print(f"Seed: {seed}")
+    print()
+
+    started = time.perf_counter()
+    counts, password_map = build(config, output, seed=seed, workers=workers)
+
+    print("\n" + "=" * 70)
+    print(f"Test database created in {time.perf_counter() - started:.1f}s")
+    print(f"Location: {output}")
+    print(f"Size: {output.stat().st_size / (1024 * 1024):.1f} MB")
+    for table, count in counts.items():
+        print(f"  - {table}: {count:,}")
+    print("=" * 70)
+
+    if write_report:
+        docs_dir = backend_dir.parent / "claude-docs" / "testing"
+        docs_dir.mkdir(parents=True, exist_ok=True)
+        gtd.generate_markdown_report(
+            password_map, docs_dir / "TEST_USERS.md", counts, size
+        )
+    return counts
@@ -2,7 +2,9 @@
 """
 Script to clean up expired password reset tokens.
 
-Can be run via:
+The application scheduler already does this hourly (core.scheduler,
+password_reset_cleanup job). This script is for manual runs, dry runs
+or deployments without the app scheduler. Can be run via:
 - Cron: 0 * * * * cd /path/to/backend && python scripts/cleanup_tokens.py
 - Manual: python scripts/cleanup_tokens.py
 - Systemd timer: See /etc/systemd/system/cleanup-tokens.service
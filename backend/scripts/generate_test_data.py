@@ -27,6 +27,12 @@ Usage:
     # Large dataset - city-scale stress testing
     uv run python scripts/generate_test_data.py --size large
 
+    # Reproducible dataset (same seed -> same rows), no markdown report
+    uv run python scripts/generate_test_data.py --size medium --seed 7 --no-report
+
+    # Bulk mode (core inserts, parallel workers) - see bulk_test_data.py
+    uv run python scripts/generate_test_data.py --size large --bulk --workers 8
+
 Instance-specific generation (uses language distribution from config):
     # Montreal instance (70% FR, 30% EN)
     PLATFORM_CONFIG_PATH=/path/to/instances/montreal/platform.config.json \\
@@ -52,6 +58,7 @@ import random
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from pathlib import Path
 
 # Add backend to path for imports
@@ -59,7 +66,7 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 import bcrypt
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from repositories.database import Base
@@ -380,8 +387,9 @@ def get_db_path(size: str) -> Path:
 config: DatasetConfig = DATASET_CONFIGS["small"]
 
 
+@cache
 def get_password_hash(password: str) -> str:
-    """Hash password using bcrypt."""
+    """Hash password using bcrypt (once per distinct password)."""
     return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
 
@@ -2248,6 +2256,32 @@ def create_security_audit_logs(session, users) -> int:
     return events_count
 
 
+def apply_vote_counters(session) -> None:
+    """Fill the denormalized idea vote counters from the generated votes.
+
+    Votes are inserted directly rather than through VoteRepository, which
+    normally maintains these counters.
+    """
+    print("  Computing idea vote counters...")
+    session.execute(
+        text(
+            """
+            UPDATE ideas SET
+                upvote_count = (
+                    SELECT COUNT(*) FROM votes
+                    WHERE votes.idea_id = ideas.id AND votes.vote_type = 'UPVOTE'
+                ),
+                downvote_count = (
+                    SELECT COUNT(*) FROM votes
+                    WHERE votes.idea_id = ideas.id AND votes.vote_type = 'DOWNVOTE'
+                )
+            """
+        )
+    )
+    session.execute(text("UPDATE ideas SET score = upvote_count - downvote_count"))
+    session.commit()
+
+
 def apply_idea_edit_tracking(session, ideas) -> int:
     """Apply edit tracking fields to some approved ideas.
 
@@ -2295,8 +2329,6 @@ def setup_fts5(engine) -> int:
 
     Returns the number of ideas indexed.
     """
-    from sqlalchemy import text
-
     FTS_TABLE_NAME = "ideas_fts"
 
     print("  Setting up FTS5 full-text search...")
@@ -2602,48 +2634,30 @@ uv run python scripts/generate_test_data.py --size large
     print(f"\nMarkdown report saved to: {output_path}")
 
 
-def main():
-    """Main entry point."""
-    global config
+def generate(
+    size: str = "small",
+    output: Path | None = None,
+    seed: int | None = None,
+    write_report: bool = True,
+) -> dict[str, int]:
+    """Build a test database.
 
-    parser = argparse.ArgumentParser(
-        description="Generate test data for OpenCitiVibes platform",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Dataset sizes:
-  small   Development/testing - ~100 users, ~500 ideas (default)
-  medium  Small-scale deployment - ~1,000 users, ~5,000 ideas
-  large   City-scale stress test - ~10,000 users, ~50,000 ideas
+    Args:
+        size: Key of DATASET_CONFIGS
+        output: Database path (default: data/opencitivibes_test_{size}.db)
+        seed: Seed for the random generator; the same seed and size produce
+            the same rows (dates stay relative to the time of generation)
+        write_report: Write the TEST_USERS.md credentials report
 
-Examples:
-  uv run python scripts/generate_test_data.py
-  uv run python scripts/generate_test_data.py --size medium
-  uv run python scripts/generate_test_data.py --size large
-        """,
-    )
-    parser.add_argument(
-        "--size",
-        choices=["small", "medium", "large"],
-        default="small",
-        help="Dataset size (default: small)",
-    )
-    parser.add_argument(
-        "--output",
-        "-o",
-        type=str,
-        default=None,
-        help="Custom output database path (default: data/opencitivibes_test_{size}.db)",
-    )
-    args = parser.parse_args()
+    Returns:
+        Actual row counts per table
+    """
+    global config, TEST_DB_PATH
 
-    global TEST_DB_PATH
-    config = DATASET_CONFIGS[args.size]
-    if args.output:
-        TEST_DB_PATH = Path(args.output)
-        if not TEST_DB_PATH.is_absolute():
-            TEST_DB_PATH = backend_dir / TEST_DB_PATH
-    else:
-        TEST_DB_PATH = get_db_path(args.size)
+    config = DATASET_CONFIGS[size]
+    TEST_DB_PATH = output if output is not None else get_db_path(size)
+    if seed is not None:
+        random.seed(seed)
 
     print("=" * 70)
     print("OpenCitiVibes - Test Data Generator")
@@ -2651,6 +2665,8 @@ Examples:
     print(f"\nDataset: {config.name}")
     print(f"Description: {config.description}")
     print(f"Database: {TEST_DB_PATH.name}")
+    if seed is not None:
+        print(f"Seed: {seed}")
     print("\nTargets:")
     print(
         f"  - Users: {config.num_regular_users + config.num_category_admins + config.num_global_admins:,}"
@@ -2663,6 +2679,7 @@ Examples:
     if TEST_DB_PATH.exists():
         print(f"\nRemoving existing test database: {TEST_DB_PATH}")
         TEST_DB_PATH.unlink()
+    TEST_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     # Create engine and session
     engine = create_engine(f"sqlite:///{TEST_DB_PATH}", echo=False)
@@ -2700,6 +2717,7 @@ Examples:
 
         print("\n8. Creating votes...")
         votes = create_votes(session, users, ideas, qualities)
+        apply_vote_counters(session)
 
         print("\n9. Creating comments...")
         comments = create_comments(session, users, ideas)
@@ -2759,12 +2777,13 @@ Examples:
         print(f"Size: {TEST_DB_PATH.stat().st_size / (1024 * 1024):.1f} MB")
         print("=" * 70)
 
-        # Generate markdown documentation
-        docs_dir = backend_dir.parent / "claude-docs" / "testing"
-        docs_dir.mkdir(parents=True, exist_ok=True)
-        generate_markdown_report(
-            password_map, docs_dir / "TEST_USERS.md", actual_counts, args.size
-        )
+        if write_report:
+            # Generate markdown documentation
+            docs_dir = backend_dir.parent / "claude-docs" / "testing"
+            docs_dir.mkdir(parents=True, exist_ok=True)
+            generate_markdown_report(
+                password_map, docs_dir / "TEST_USERS.md", actual_counts, size
+            )
 
     except Exception as e:
         session.rollback()
@@ -2772,6 +2791,85 @@ Examples:
         raise
     finally:
         session.close()
+        engine.dispose()
+
+    return actual_counts
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate test data for OpenCitiVibes platform",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Dataset sizes:
+  small   Development/testing - ~100 users, ~500 ideas (default)
+  medium  Small-scale deployment - ~1,000 users, ~5,000 ideas
+  large   City-scale stress test - ~10,000 users, ~50,000 ideas
+
+Examples:
+  uv run python scripts/generate_test_data.py
+  uv run python scripts/generate_test_data.py --size medium
+  uv run python scripts/generate_test_data.py --size large
+  uv run python scripts/generate_test_data.py --size medium --seed 7
+  uv run python scripts/generate_test_data.py --size large --bulk --workers 8
+        """,
+    )
+    parser.add_argument(
+        "--size",
+        choices=["small", "medium", "large"],
+        default="small",
+        help="Dataset size (default: small)",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default=None,
+        help="Custom output database path (default: data/opencitivibes_test_{size}.db)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for a reproducible dataset (default: random)",
+    )
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="Skip writing the TEST_USERS.md credentials report",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Use the bulk generator (core inserts, seconds instead of minutes)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes generating votes and comments in bulk mode (default: 1)",
+    )
+    args = parser.parse_args()
+
+    output = None
+    if args.output:
+        output = Path(args.output)
+        if not output.is_absolute():
+            output = backend_dir / output
+
+    if args.bulk:
+        from scripts.bulk_test_data import generate_bulk
+
+        generate_bulk(
+            args.size,
+            output,
+            seed=args.seed,
+            workers=args.workers,
+            write_report=not args.no_report,
+        )
+    else:
+        generate(args.size, output, seed=args.seed, write_report=not args.no_report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Script to import the Pwned Passwords dump into the local breach store.
+
+Password reset checks are served from this store (see
+helpers.pwned_passwords) instead of the HIBP range API. Download the
+SHA-1 dump ("SHA1:COUNT" lines, e.g. with the official
+PwnedPasswordsDownloader), then import it:
+- Manual: python scripts/import_pwned_passwords.py pwnedpasswords.txt
+
+The new store replaces the previous one atomically; restart the workers
+to pick it up.
+
+Options:
+    --output PATH: Store file (default: PWNED_PASSWORDS_DB_PATH)
+    --min-count N: Skip hashes seen fewer than N times (default: 1)
+    --batch-size N: Rows inserted at a time (default: 100000)
+"""
+
+import argparse
+import gzip
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+
+from helpers.pwned_passwords import import_pwned_dump
+from models.config import settings
+
+
+def main() -> int:
+    """Run the Pwned Passwords import."""
+    parser = argparse.ArgumentParser(
+        description="Import a Pwned Passwords SHA-1 dump into the local store"
+    )
+    parser.add_argument(
+        "dump",
+        help='Dump file of "SHA1:COUNT" lines (.gz accepted, "-" for stdin)',
+    )
+    parser.add_argument(
+        "--output",
+        default=settings.PWNED_PASSWORDS_DB_PATH,
+        help=f"Store file (default: {settings.PWNED_PASSWORDS_DB_PATH})",
+    )
+    parser.add_argument(
+        "--min-count",
+        type=int,
+        default=1,
+        help="Skip hashes seen fewer than N times (default: 1)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100_000,
+        help="Rows inserted at a time (default: 100000)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.dump == "-":
+            dump = sys.stdin
+        elif args.dump.endswith(".gz"):
+            dump = gzip.open(args.dump, "rt", encoding="ascii")
+        else:
+            dump = open(args.dump, encoding="ascii")
+        with dump:
+            counts = import_pwned_dump(
+                dump,
+                args.output,
+                min_count=args.min_count,
+                batch_size=args.batch_size,
+            )
+        logger.info(
+            f"Imported {counts['imported']} hashes into {args.output} "
+            f"({counts['skipped']} below min count, {counts['invalid']} invalid lines)"
+        )
+        return 0
+    except Exception as e:
+        logger.error(f"Pwned passwords import failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,29 @@
 #!/usr/bin/env python3
-# ruff: noqa: E402
-# E402 disabled: sys.path modification must occur before imports
 """
-One-time migration script to sanitize existing idea content.
+Migration script to sanitize existing user content.
 
-This script audits and cleans all existing ideas in the database,
-removing any potentially malicious HTML/JavaScript that may have
-been stored before sanitization was implemented.
+This script audits and cleans ideas (title and description) and comments
+stored before sanitization was applied on write, removing any potentially
+malicious HTML/JavaScript. Rows are streamed in batches, sanitized in
+worker processes and committed per batch, so it runs on large databases
+and can be interrupted and re-run.
 
 Usage:
     cd backend && uv run python -m scripts.sanitize_existing_ideas
 
-The script will:
-1. Load all existing ideas from the database
-2. Apply sanitization to title and description
-3. Log any changes made
-4. Commit the sanitized data
+Options:
+    --tables ideas comments: Tables to sanitize (default: both)
+    --batch-size N: Rows read and committed at a time (default: 500)
+    --workers N: Worker processes (default: CPU count)
+    --dry-run: Report what would change without writing
+
+Changes are written to an audit log next to this script as they are
+committed, one JSON object per line, followed by a summary line.
 """
 
+import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -26,95 +31,91 @@ from pathlib import Path
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from helpers.sanitization import sanitize_html, sanitize_plain_text
-from repositories.database import SessionLocal
-from repositories.db_models import Idea
 
+def main() -> int:
+    """Run the sanitization backfill."""
+    # Imported here: worker processes re-import this module on start, and
+    # only need helpers.sanitization
+    from repositories.database import SessionLocal
+    from services.sanitization_service import SANITIZED_FIELDS, SanitizationService
+
+    parser = argparse.ArgumentParser(description="Sanitize existing user content")
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        choices=list(SANITIZED_FIELDS),
+        default=list(SANITIZED_FIELDS),
+        help="Tables to sanitize (default: all)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Rows read and committed at a time (default: 500)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without writing",
+    )
+
+    args = parser.parse_args()
+
+    print(f"Auditing {', '.join(args.tables)} for XSS content...")
+
+    audit_file = (
+        Path(__file__).parent
+        / f"sanitization_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    )
+
+    def report(changes: list[dict]) -> None:
+        """Print a batch's changes and append them to the audit log."""
+        for change in changes:
+            preview = change["original"][:50].replace("\n", " ")
+            print(
+                f"  Sanitized {change['table']} {change['id']} "
+                f"{change['field']}: {preview}"
+            )
+        if not args.dry_run:
+            with open(audit_file, "a") as f:
+                f.writelines(json.dumps(change) + "\n" for change in changes)
 
-def sanitize_existing_ideas() -> None:
-    """Sanitize all existing ideas in the database."""
     db = SessionLocal()
     try:
-        ideas = db.query(Idea).all()
-        total = len(ideas)
-        sanitized_count = 0
-        changes: list[dict] = []
+        result = SanitizationService.backfill_existing_content(
+            db,
+            tables=args.tables,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            dry_run=args.dry_run,
+            on_changes=report,
+        )
+    finally:
+        db.close()
 
-        print(f"Auditing {total} ideas for XSS content...")
+    verb = "would be sanitized" if args.dry_run else "sanitized"
+    for table, counts in result["tables"].items():
+        print(f"\nSummary: {counts['sanitized']}/{counts['scanned']} {table} {verb}")
+        if counts["skipped"]:
+            print(f"  {counts['skipped']} edited while running, left for a re-run")
 
-        for idea in ideas:
-            original_title = idea.title
-            original_desc = idea.description
+    if audit_file.exists():
+        with open(audit_file, "a") as f:
+            summary = {
+                "timestamp": datetime.now().isoformat(),
+                "tables": result["tables"],
+            }
+            f.write(json.dumps(summary) + "\n")
+        print(f"Audit log written to: {audit_file}")
 
-            new_title = sanitize_plain_text(
-                str(original_title) if original_title else None
-            )
-            new_desc = sanitize_html(str(original_desc) if original_desc else None)
-
-            title_changed = new_title != original_title
-            desc_changed = new_desc != original_desc
-
-            if title_changed or desc_changed:
-                sanitized_count += 1
-                idea.title = new_title  # type: ignore[assignment]
-                idea.description = new_desc  # type: ignore[assignment]
-
-                change_record: dict = {
-                    "id": idea.id,
-                    "title_changed": title_changed,
-                    "desc_changed": desc_changed,
-                }
-
-                if title_changed:
-                    change_record["original_title"] = (
-                        str(original_title)[:100] if original_title else ""
-                    )
-                    change_record["sanitized_title"] = (
-                        str(new_title)[:100] if new_title else ""
-                    )
-                if desc_changed:
-                    change_record["original_desc"] = (
-                        str(original_desc)[:200] if original_desc else ""
-                    )
-                    change_record["sanitized_desc"] = (
-                        str(new_desc)[:200] if new_desc else ""
-                    )
-
-                changes.append(change_record)
-                title_preview = (
-                    str(original_title)[:50] if original_title else "No title"
-                )
-                print(f"  Sanitized idea {idea.id}: {title_preview}")
-
-        if sanitized_count > 0:
-            db.commit()
-            print(f"\nCommitted {sanitized_count} sanitized ideas.")
-
-            # Write audit log
-            audit_file = (
-                Path(__file__).parent
-                / f"sanitization_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            )
-            with open(audit_file, "w") as f:
-                json.dump(
-                    {
-                        "timestamp": datetime.now().isoformat(),
-                        "total_ideas": total,
-                        "sanitized_count": sanitized_count,
-                        "changes": changes,
-                    },
-                    f,
-                    indent=2,
-                )
-            print(f"Audit log written to: {audit_file}")
-        else:
-            print("\nNo ideas required sanitization.")
-
-        print(f"\nSummary: {sanitized_count}/{total} ideas sanitized")
-
-    finally:
-        db.close()
+    return 0
 
 
 if __name__ == "__main__":
-    sanitize_existing_ideas()
+    sys.exit(main())
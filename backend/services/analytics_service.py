@@ -11,6 +11,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from core.metrics import record_cache
 from models.exceptions import ValidationException
 from models.schemas import (
     CategoriesAnalyticsResponse,
@@ -53,14 +54,17 @@ class AnalyticsService:
             Cached data or None if expired/missing
         """
         if key not in cls._cache:
+            record_cache("analytics", False)
             return None
 
         data, cached_time = cls._cache[key]
         if time.time() - cached_time > ttl:
             # Cache expired
             del cls._cache[key]
+            record_cache("analytics", False)
             return None
 
+        record_cache("analytics", True)
         return data
 
     @classmethod
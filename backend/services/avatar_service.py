@@ -0,0 +1,237 @@
+"""
+Avatar Service
+
+Renders uploaded avatars into pre-sized WebP/JPEG variants and stores
+them content-addressed (see helpers.avatar_images). Rendering runs in the
+bounded process pool of core.image_executor.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from core.image_executor import run_image_task
+from helpers.avatar_images import (
+    AVATAR_DIR,
+    AVATAR_FORMATS,
+    avatar_dir,
+    content_hash,
+    render_avatar_variants,
+    variant_digest,
+    variant_path,
+)
+from models.config import settings
+from models.exceptions import ValidationException
+from repositories.user_repository import UserRepository
+
+
+class AvatarService:
+    """Service for avatar image variants and their storage."""
+
+    @staticmethod
+    def _variants_exist(digest: str) -> bool:
+        """Check that every configured variant of an image is on disk."""
+        return all(
+            Path(variant_path(digest, size, extension)).exists()
+            for size in settings.AVATAR_SIZES
+            for extension in AVATAR_FORMATS
+        )
+
+    @staticmethod
+    def store_avatar(content: bytes) -> str:
+        """
+        Render and store the variants of an uploaded image.
+
+        Identical uploads hash to the same directory, so an image already
+        stored (by anyone) is not rendered again; its directory is touched
+        instead, so sweep_unused_variants leaves it alone while the caller
+        saves the URL.
+
+        Args:
+            content: Uploaded image bytes (type and size already validated)
+
+        Returns:
+            Avatar URL (the largest WebP variant)
+
+        Raises:
+            ValidationException: If the image cannot be decoded
+            ImageBusyException: If the image executor's queue is full
+        """
+        digest = content_hash(content)
+        avatar_url = variant_path(digest, max(settings.AVATAR_SIZES), "webp")
+        if AvatarService._variants_exist(digest):
+            os.utime(avatar_dir(digest))
+            return avatar_url
+
+        try:
+            variants = run_image_task(
+                render_avatar_variants,
+                content,
+                settings.AVATAR_SIZES,
+                settings.AVATAR_MAX_PIXELS,
+            )
+        except ValueError as e:
+            raise ValidationException(str(e)) from e
+
+        # Write into a temporary directory and rename it into place, so a
+        # concurrent request never sees a partly written set of variants
+        target = Path(avatar_dir(digest))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=target.parent, prefix=".tmp-"))
+        try:
+            for name, data in variants.items():
+                (staging / name).write_bytes(data)
+            if target.exists():
+                shutil.rmtree(target)
+            os.replace(staging, target)
+        except OSError:
+            # Lost a race with an identical upload: its variants are in place
+            shutil.rmtree(staging, ignore_errors=True)
+            if not AvatarService._variants_exist(digest):
+                raise
+        return avatar_url
+
+    @staticmethod
+    def delete_avatar_files(avatar_url: str) -> None:
+        """
+        Delete the files of an avatar no user references any more.
+
+        Args:
+            avatar_url: Stored avatar URL (variant or legacy upload)
+        """
+        digest = variant_digest(avatar_url)
+        if digest is not None:
+            shutil.rmtree(avatar_dir(digest), ignore_errors=True)
+            return
+        # Legacy upload: a single file (stored with forward slashes)
+        legacy_path = Path(avatar_url.replace("/", os.sep))
+        if legacy_path.exists():
+            legacy_path.unlink()
+
+    @staticmethod
+    def replace_avatar(
+        db: Session, user_id: int, old_url: str | None, new_url: str
+    ) -> None:
+        """
+        Delete a user's previous legacy avatar file unless still referenced.
+
+        Variant directories are shared by identical uploads: a concurrent
+        upload may have just been handed the old URL without having
+        committed it yet. They are left to sweep_unused_variants.
+
+        Args:
+            db: Database session
+            user_id: User whose avatar changed
+            old_url: Previous avatar URL
+            new_url: New avatar URL
+        """
+        if not old_url or old_url == new_url or variant_digest(old_url) is not None:
+            return
+        if UserRepository(db).avatar_in_use(old_url, exclude_user_id=user_id):
+            return
+        AvatarService.delete_avatar_files(old_url)
+
+    @staticmethod
+    def sweep_unused_variants(db: Session, batch_size: int = 500) -> int:
+        """
+        Delete variant directories no user references any more.
+
+        Directories stored or reused within AVATAR_SWEEP_GRACE_SECONDS are
+        kept: their upload may not have committed its avatar_url yet.
+
+        Args:
+            db: Database session
+            batch_size: Directories checked per query
+
+        Returns:
+            Number of directories deleted
+        """
+        cutoff = time.time() - settings.AVATAR_SWEEP_GRACE_SECONDS
+        candidates = [
+            path
+            for path in Path(AVATAR_DIR).glob("??/*")
+            if path.is_dir()
+            and not path.name.startswith(".tmp-")
+            and path.stat().st_mtime < cutoff
+        ]
+        user_repo = UserRepository(db)
+        deleted = 0
+        for start in range(0, len(candidates), batch_size):
+            urls = {
+                variant_path(path.name, max(settings.AVATAR_SIZES), "webp"): path
+                for path in candidates[start : start + batch_size]
+            }
+            in_use = user_repo.get_avatar_urls_in_use(list(urls))
+            for url, path in urls.items():
+                if url not in in_use:
+                    shutil.rmtree(path, ignore_errors=True)
+                    deleted += 1
+        if deleted:
+            logger.info(f"Swept {deleted} unused avatar variant directories")
+        return deleted
+
+    @staticmethod
+    def backfill_variants(
+        db: Session, batch_size: int = 100, dry_run: bool = False
+    ) -> dict[str, int]:
+        """
+        Convert avatars uploaded before variants existed.
+
+        Each legacy file is rendered into variants, the user's avatar_url
+        is switched to them and the legacy file is deleted. Users are
+        committed in batches.
+
+        Args:
+            db: Database session
+            batch_size: Users loaded and committed at a time
+            dry_run: Only count the avatars that would be converted
+
+        Returns:
+            Counts of converted, missing (file gone) and failed avatars,
+            and of those already using variants
+        """
+        user_repo = UserRepository(db)
+        counts = {"converted": 0, "already_converted": 0, "missing": 0, "failed": 0}
+        converted_urls: set[str] = set()
+        after_id = 0
+        while True:
+            users = user_repo.get_users_with_avatar_after(after_id, batch_size)
+            if not users:
+                break
+            for user in users:
+                old_url = str(user.avatar_url)
+                if variant_digest(old_url) is not None:
+                    counts["already_converted"] += 1
+                    continue
+                legacy_path = Path(old_url.replace("/", os.sep))
+                if not legacy_path.is_file():
+                    counts["missing"] += 1
+                    continue
+                if dry_run:
+                    counts["converted"] += 1
+                    continue
+                try:
+                    new_url = AvatarService.store_avatar(legacy_path.read_bytes())
+                except ValidationException as e:
+                    logger.warning(f"Avatar of user {user.id} not converted: {e}")
+                    counts["failed"] += 1
+                    continue
+                user.avatar_url = new_url  # type: ignore[assignment]
+                converted_urls.add(old_url)
+                counts["converted"] += 1
+            after_id = users[-1].id  # type: ignore[assignment]
+            if not dry_run:
+                user_repo.commit()
+
+        # Legacy files go once no user points at them any more
+        for old_url in converted_urls:
+            if not user_repo.avatar_in_use(old_url, exclude_user_id=0):
+                AvatarService.delete_avatar_files(old_url)
+
+        logger.info(f"Avatar variant backfill: {counts}")
+        return counts
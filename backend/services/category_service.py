@@ -12,18 +12,24 @@ from sqlalchemy.orm import Session
 
 import models.schemas as schemas
 import repositories.db_models as db_models
+from core.metrics import record_cache
 from models.exceptions import (
     AlreadyExistsException,
     BusinessRuleException,
     NotFoundException,
 )
 from repositories.category_repository import CategoryRepository
+from services.reference_data_service import CategoryRef, ReferenceDataService
 
 
 class CategoryService:
     """
     Service for managing categories with in-memory caching.
 
+    Category lookups read the reference data snapshot (see
+    ReferenceDataService), which is shared by all workers through the
+    "categories" cache version. The cache below only holds statistics.
+
     Note: The cache is designed for single-worker deployments.
     For multi-worker production deployments, consider using Redis or memcached.
     The cache operations are not thread-safe in concurrent async contexts,
@@ -35,7 +41,6 @@ class CategoryService:
     _cache_ttl: float = 300.0  # 5 minutes in seconds
 
     # Cache keys
-    _CACHE_ALL_CATEGORIES = "all_categories"
     _CACHE_ALL_WITH_STATS = "all_categories_with_stats"
 
     @classmethod
@@ -50,14 +55,17 @@ class CategoryService:
             Cached data or None if expired/missing
         """
         if key not in cls._cache:
+            record_cache("category_stats", False)
             return None
 
         data, cached_time = cls._cache[key]
         if time.time() - cached_time > cls._cache_ttl:
             # Cache expired
             del cls._cache[key]
+            record_cache("category_stats", False)
             return None
 
+        record_cache("category_stats", True)
         return data
 
     @classmethod
@@ -77,33 +85,22 @@ class CategoryService:
         cls._cache.clear()
 
     @staticmethod
-    def get_all_categories(db: Session) -> list[db_models.Category]:
+    def get_all_categories(db: Session) -> list[CategoryRef]:
         """
-        Get all categories with caching.
+        Get all categories from the reference data snapshot.
 
         Args:
             db: Database session
 
         Returns:
-            List of all categories
+            List of all categories, by ID
         """
-
-        # Check cache first
-        cached = CategoryService._get_from_cache(CategoryService._CACHE_ALL_CATEGORIES)
-        if cached is not None:
-            return cached
-
-        # Cache miss - fetch from database
-        category_repo = CategoryRepository(db)
-        categories = category_repo.get_all()
-
-        # Store in cache
-        CategoryService._set_cache(CategoryService._CACHE_ALL_CATEGORIES, categories)
-
-        return categories
+        return list(ReferenceDataService.get_snapshot(db).categories.values())
 
     @staticmethod
-    def get_category_by_id(db: Session, category_id: int) -> db_models.Category:
+    def get_category_by_id(
+        db: Session, category_id: int
+    ) -> CategoryRef | db_models.Category:
         """
         Get category by ID.
 
@@ -117,8 +114,7 @@ class CategoryService:
         Raises:
             NotFoundException: If category does not exist
         """
-        category_repo = CategoryRepository(db)
-        category = category_repo.get_by_id(category_id)
+        category = ReferenceDataService.get_category(db, category_id)
         if category is None:
             raise NotFoundException(f"Category with ID {category_id} not found")
         return category
@@ -8,7 +8,6 @@ from models.exceptions import (
 )
 from repositories.comment_like_repository import CommentLikeRepository
 from repositories.comment_repository import CommentRepository
-from repositories.db_models import CommentLike
 
 
 class CommentLikeService:
@@ -51,25 +50,22 @@ class CommentLikeService:
         if comment.user_id == user_id:
             raise BusinessRuleException("Cannot like your own comment")
 
-        # Check existing like
-        existing = like_repo.get_by_comment_and_user(comment_id, user_id)
-
-        if existing:
-            # Unlike
-            like_repo.delete(existing)
-            comment.like_count = max(0, comment.like_count - 1)
+        # Insert the like, or remove it if it already exists; the counter
+        # is updated in SQL so concurrent toggles never lose a change
+        if like_repo.add_like(comment_id, user_id):
+            liked = True
+            like_count = like_repo.adjust_like_count(comment_id, 1)
+        elif like_repo.remove_like(comment_id, user_id):
             liked = False
+            like_count = like_repo.adjust_like_count(comment_id, -1)
         else:
-            # Like
-            new_like = CommentLike(comment_id=comment_id, user_id=user_id)
-            like_repo.create(new_like)
-            comment.like_count += 1
-            liked = True
+            # Unliked concurrently between the two statements
+            liked = False
+            like_count = comment.like_count
 
-        comment_repo.commit()
-        comment_repo.refresh(comment)
+        like_repo.commit()
 
-        return {"liked": liked, "like_count": comment.like_count}
+        return {"liked": liked, "like_count": like_count}
 
     @staticmethod
     def get_user_liked_status(
@@ -94,3 +90,19 @@ class CommentLikeService:
         liked_ids = like_repo.get_user_liked_comment_ids(user_id, comment_ids)
 
         return {cid: cid in liked_ids for cid in comment_ids}
+
+    @staticmethod
+    def resync_like_counts(db: Session) -> int:
+        """
+        Recompute the like counter of every comment from its likes.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of comments whose counter was corrected
+        """
+        like_repo = CommentLikeRepository(db)
+        updated = like_repo.sync_comment_like_counts()
+        like_repo.commit()
+        return updated
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 import models.schemas as schemas
 import repositories.db_models as db_models
+from helpers.sanitization import sanitize_html
 from models.exceptions import (
     BusinessRuleException,
     CommentNotFoundException,
@@ -34,6 +35,32 @@ class CommentService:
         """
         Get comments for an idea.
 
+        Same arguments and errors as get_comment_rows_for_idea.
+
+        Returns:
+            List of comments with author information and like status
+        """
+        return [
+            schemas.Comment.model_validate(row)
+            for row in CommentService.get_comment_rows_for_idea(
+                db, idea_id, skip, limit, current_user_id, sort_by
+            )
+        ]
+
+    @staticmethod
+    def get_comment_rows_for_idea(
+        db: Session,
+        idea_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        current_user_id: int | None = None,
+        sort_by: CommentSortOrder = CommentSortOrder.RELEVANCE,
+    ) -> List[schemas.CommentRow]:
+        """
+        Get comments for an idea as Comment-shaped rows.
+
+        Used by the endpoint to serialize the page without building models.
+
         Args:
             db: Database session
             idea_id: Idea ID
@@ -43,7 +70,7 @@ class CommentService:
             sort_by: Sorting order (relevance, newest, oldest, most_liked)
 
         Returns:
-            List of comments with author information and like status
+            List of comment rows with author information and like status
 
         Raises:
             IdeaNotFoundException: If idea not found
@@ -75,28 +102,29 @@ class CommentService:
         )
 
         # Format results
-        result = []
-        for comment, username, display_name in comments:
-            user_has_liked = (
-                like_status.get(comment.id, False)
-                if current_user_id is not None
-                else None
-            )
-            comment_dict = {
+        return [
+            {
+                "content": comment.content,
                 "id": comment.id,
                 "idea_id": comment.idea_id,
                 "user_id": comment.user_id,
-                "content": comment.content,
                 "is_moderated": comment.is_moderated,
                 "created_at": comment.created_at,
                 "author_username": username,
                 "author_display_name": display_name,
+                "is_deleted": None,
+                "deletion_reason": None,
+                "is_hidden": None,
                 "like_count": comment.like_count,
-                "user_has_liked": user_has_liked,
+                "user_has_liked": (
+                    like_status.get(comment.id, False)
+                    if current_user_id is not None
+                    else None
+                ),
+                "language": comment.language,
             }
-            result.append(schemas.Comment(**comment_dict))
-
-        return result
+            for comment, username, display_name in comments
+        ]
 
     @staticmethod
     def create_comment(
@@ -149,6 +177,9 @@ class CommentService:
             TrustScoreService.requires_comment_approval(db, user) if user else True
         )
 
+        # Comments are rich text like idea descriptions: strip unsafe HTML
+        content = sanitize_html(content) or ""
+
         # Create comment with language tracking
         db_comment = db_models.Comment(
             idea_id=idea_id,
@@ -3,6 +3,7 @@
 Loads and provides access to instance-specific configuration.
 """
 
+import hashlib
 import json
 import os
 import re
@@ -255,9 +256,17 @@ def get_entity_name(locale: str = "en") -> str:
     return config.instance.entity.name.get(locale, "")
 
 
+@lru_cache(maxsize=1)
+def get_config_fingerprint() -> str:
+    """Get a short hash of the loaded configuration (used in HTTP ETags)."""
+    payload = get_config().model_dump_json().encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
 def clear_config_cache() -> None:
     """Clear the configuration cache.
 
     Useful for testing or when configuration changes at runtime.
     """
     load_platform_config.cache_clear()
+    get_config_fingerprint.cache_clear()
@@ -2,10 +2,14 @@
 Diagnostics service for system health checks.
 
 Provides database connectivity diagnostics, table statistics,
-connection pool information, and system resource monitoring.
+connection pool information, an index advisor for hot queries,
+and system resource monitoring.
 """
 
 import re
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from functools import partial
 
 from loguru import logger
 from sqlalchemy import inspect, text
@@ -18,11 +22,64 @@ from models.schemas import (
     DatabaseSizeInfo,
     DiskUsageInfo,
     DockerUsageInfo,
+    IndexAdvisorResponse,
     PoolInfo,
+    QueryPlanInfo,
     SystemResourcesResponse,
     TableInfo,
 )
+from repositories.analytics_repository import AnalyticsRepository
 from repositories.database import engine
+from repositories.login_event_repository import LoginEventRepository
+from repositories.query_plan_repository import QueryPlanRepository
+from services.security_audit_service import SecurityAuditService
+
+# Documentation-range address for lookups keyed by IP
+_SAMPLE_IP = "192.0.2.1"
+
+
+def _last_30_days() -> tuple[datetime, datetime]:
+    """Window used by the analytics trend queries."""
+    now = datetime.now(timezone.utc)
+    return now - timedelta(days=30), now
+
+
+# Hot queries checked by the index advisor: read-only repository calls as
+# issued by the analytics dashboard and security monitoring
+HOT_QUERIES: dict[str, Callable[[Session], object]] = {
+    "analytics.daily_trends": (
+        lambda db: AnalyticsRepository.get_daily_trends(db, *_last_30_days())
+    ),
+    "analytics.this_week_counts": AnalyticsRepository.get_this_week_counts,
+    "analytics.quality_time_series": AnalyticsRepository.get_quality_time_series,
+    "login_events.failed_attempts": (
+        lambda db: LoginEventRepository(db).get_failed_attempts_count(
+            ip_address=_SAMPLE_IP
+        )
+    ),
+    "login_events.events_by_user": (
+        lambda db: LoginEventRepository(db).get_events_by_user(user_id=0)
+    ),
+    "login_events.events_by_ip": (
+        lambda db: LoginEventRepository(db).get_events_by_ip(_SAMPLE_IP)
+    ),
+    "login_events.suspicious_ips": (
+        lambda db: LoginEventRepository(db).get_suspicious_ips()
+    ),
+    "login_events.failed_by_ip": (
+        lambda db: LoginEventRepository(db).get_failed_attempts_by_ip_in_window()
+    ),
+    "security_audit.suspicious_patterns": (
+        SecurityAuditService.detect_suspicious_patterns
+    ),
+}
+
+# A table read in full: SQLite "SCAN <table>" (with or without an index,
+# as opposed to SEARCH) and PostgreSQL "Seq Scan on <table>"
+_FULL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"^SCAN (?:TABLE )?(\w+)"),
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+}
 
 
 class DiagnosticsService:
@@ -86,6 +143,64 @@ class DiagnosticsService:
             error=error,
         )
 
+    @staticmethod
+    def get_index_advice(db: Session) -> IndexAdvisorResponse:
+        """
+        Explain the hot queries and flag the tables they read in full.
+
+        Each query in HOT_QUERIES is run through EXPLAIN (no rows are
+        read). A flagged table usually means a missing index. On
+        PostgreSQL, small tables are legitimately read with a sequential
+        scan, so flags there need the table's size for context.
+
+        Args:
+            db: Database session
+
+        Returns:
+            IndexAdvisorResponse with the plan and full scans of each query,
+            flagged queries first
+        """
+        bind = db.get_bind()
+        database_type = bind.dialect.name
+        table_names = set(inspect(bind).get_table_names())
+
+        queries: list[QueryPlanInfo] = []
+        for name, call in HOT_QUERIES.items():
+            captured = QueryPlanRepository.explain_call(db, partial(call, db))
+            plan = [line for item in captured for line in item.plan]
+            queries.append(
+                QueryPlanInfo(
+                    name=name,
+                    statements=[item.statement for item in captured],
+                    plan=plan,
+                    full_scans=DiagnosticsService._find_full_scans(
+                        database_type, plan, table_names
+                    ),
+                )
+            )
+
+        queries.sort(key=lambda query: not query.full_scans)
+        return IndexAdvisorResponse(
+            database_type=database_type,
+            queries=queries,
+            flagged_count=sum(1 for query in queries if query.full_scans),
+        )
+
+    @staticmethod
+    def _find_full_scans(
+        database_type: str, plan: list[str], table_names: set[str]
+    ) -> list[str]:
+        """Tables a plan reads in full (sorted, without duplicates)."""
+        pattern = _FULL_SCAN_PATTERNS.get(database_type)
+        if pattern is None:
+            return []
+        scanned = {
+            match.group(1)
+            for line in plan
+            if (match := pattern.search(line.strip())) and match.group(1) in table_names
+        }
+        return sorted(scanned)
+
     @staticmethod
     def _detect_database_type(db_url: str) -> str:
         """Detect the database type from connection URL."""
@@ -182,23 +182,62 @@ class FlagService:
         )
 
         return [
-            {
-                "id": flag.id,
-                "content_type": flag.content_type,
-                "content_id": flag.content_id,
-                "reporter_id": flag.reporter_id,
-                "reporter_username": username,
-                "reporter_display_name": display_name,
-                "reason": flag.reason,
-                "details": flag.details,
-                "status": flag.status,
-                "created_at": flag.created_at,
-                "reviewed_at": flag.reviewed_at,
-                "review_notes": flag.review_notes,
-            }
+            FlagService._flag_to_dict(flag, username, display_name)
             for flag, username, display_name in flags_with_reporters
         ]
 
+    @staticmethod
+    def get_flags_for_contents(
+        db: Session,
+        content_type: ContentType,
+        content_ids: list[int],
+        include_reviewed: bool = False,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """
+        Get the flags of several content items with reporter info.
+
+        Args:
+            db: Database session
+            content_type: Type of content
+            content_ids: IDs of the content items
+            include_reviewed: Include reviewed flags
+
+        Returns:
+            Dict mapping content ID to its list of flag dicts
+        """
+        flag_repo = FlagRepository(db)
+        flags_by_content = flag_repo.get_flags_for_contents(
+            content_type, content_ids, include_reviewed
+        )
+
+        return {
+            content_id: [
+                FlagService._flag_to_dict(flag, username, display_name)
+                for flag, username, display_name in rows
+            ]
+            for content_id, rows in flags_by_content.items()
+        }
+
+    @staticmethod
+    def _flag_to_dict(
+        flag: Any, username: str, display_name: str | None
+    ) -> dict[str, Any]:
+        """Build the flag dict shown to moderators."""
+        return {
+            "id": flag.id,
+            "content_type": flag.content_type,
+            "content_id": flag.content_id,
+            "reporter_id": flag.reporter_id,
+            "reporter_username": username,
+            "reporter_display_name": display_name,
+            "reason": flag.reason,
+            "details": flag.details,
+            "status": flag.status,
+            "created_at": flag.created_at,
+            "reviewed_at": flag.reviewed_at,
+            "review_notes": flag.review_notes,
+        }
+
     @staticmethod
     def _get_content_author_id(
         db: Session,
@@ -89,20 +89,10 @@ class IdeaService:
             if not current_user_id or int(db_idea.user_id) != current_user_id:  # type: ignore[arg-type]
                 raise NotFoundException("Idea not found")
 
-        # Use repository to get the specific idea with scores and user vote
+        # Hydrate the already loaded row; aggregates only read this idea's
+        # votes and comments
         repo = IdeaRepository(db)
-        ideas = repo.get_ideas_with_scores(
-            status_filter=db_idea.status,
-            current_user_id=current_user_id,
-            idea_id=idea_id,
-            skip=0,
-            limit=1,
-        )
-
-        if not ideas:
-            raise NotFoundException("Idea not found")
-
-        return ideas[0]
+        return repo.hydrate_idea_with_score(db_idea, current_user_id)
 
     @staticmethod
     def validate_and_create_idea(
@@ -125,14 +115,13 @@ class IdeaService:
             ValidationException: If content validation fails
         """
         from helpers.sanitization import sanitize_html, sanitize_plain_text
-        from repositories.category_repository import CategoryRepository
+        from services.reference_data_service import ReferenceDataService
 
         # Initialize content validator
         content_validator = ContentValidationService()
 
         # Validate category exists
-        category_repo = CategoryRepository(db)
-        category = category_repo.get_by_id(idea.category_id)
+        category = ReferenceDataService.get_category(db, idea.category_id)
         if not category:
             raise NotFoundException("Category not found")
 
@@ -345,10 +334,9 @@ class IdeaService:
 
         # Validate category if changed
         if "category_id" in update_data:
-            from repositories.category_repository import CategoryRepository
+            from services.reference_data_service import ReferenceDataService
 
-            category_repo = CategoryRepository(db)
-            category = category_repo.get_by_id(update_data["category_id"])
+            category = ReferenceDataService.get_category(db, update_data["category_id"])
             if not category:
                 raise NotFoundException("Category not found")
 
@@ -799,6 +787,32 @@ class IdeaService:
         """
         Get approved ideas for leaderboard.
 
+        Same arguments as get_leaderboard_rows.
+
+        Returns:
+            List of approved ideas with scores
+        """
+        return [
+            schemas.IdeaWithScore.model_validate(row)
+            for row in IdeaService.get_leaderboard_rows(
+                db, category_id, current_user_id, skip, limit, preferred_language
+            )
+        ]
+
+    @staticmethod
+    def get_leaderboard_rows(
+        db: Session,
+        category_id: Optional[int] = None,
+        current_user_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 20,
+        preferred_language: Optional[str] = None,
+    ) -> List[schemas.IdeaWithScoreRow]:
+        """
+        Get approved ideas for leaderboard as IdeaWithScore-shaped rows.
+
+        Used by the endpoint to serialize the page without building models.
+
         Args:
             db: Database session
             category_id: Optional category filter
@@ -809,7 +823,7 @@ class IdeaService:
                 prioritization. Ideas in the preferred language appear first.
 
         Returns:
-            List of approved ideas with scores
+            List of approved idea rows with scores
         """
         import sentry_sdk
 
@@ -824,7 +838,7 @@ class IdeaService:
             span.set_data("preferred_language", preferred_language)
 
             repo = IdeaRepository(db)
-            ideas = repo.get_ideas_with_scores(
+            ideas = repo.get_idea_rows_with_scores(
                 status_filter=db_models.IdeaStatus.APPROVED,
                 category_id=category_id,
                 current_user_id=current_user_id,
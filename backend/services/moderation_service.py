@@ -51,15 +51,29 @@ class ModerationService:
 
         pending_count = flag_repo.count_pending_flags()
 
+        # Load details and flags per content type in batches, not per item
+        ids_by_type: dict[ContentType, list[int]] = {}
+        for ct, content_id, _ in content_items:
+            ids_by_type.setdefault(ct, []).append(content_id)
+        details: dict[tuple[ContentType, int], dict] = {}
+        flags_by_content: dict[tuple[ContentType, int], list[dict]] = {}
+        for ct, content_ids in ids_by_type.items():
+            for content_id, data in ModerationService._get_content_details(
+                db, ct, content_ids
+            ).items():
+                details[(ct, content_id)] = data
+            for content_id, flags in FlagService.get_flags_for_contents(
+                db, ct, content_ids
+            ).items():
+                flags_by_content[(ct, content_id)] = flags
+
         result = []
         for ct, content_id, flag_count in content_items:
-            # Get content details
-            content_data = ModerationService._get_content_details(db, ct, content_id)
+            content_data = details.get((ct, content_id))
             if not content_data:
                 continue
 
-            # Get flags with reporters
-            flags = FlagService.get_flags_for_content(db, ct, content_id)
+            flags = flags_by_content.get((ct, content_id), [])
 
             item = {
                 "content_type": ct,
@@ -238,43 +252,39 @@ class ModerationService:
     def _get_content_details(
         db: Session,
         content_type: ContentType,
-        content_id: int,
-    ) -> Optional[dict]:
-        """Get content details for queue display."""
+        content_ids: list[int],
+    ) -> dict[int, dict]:
+        """Get content details for queue display, keyed by content ID."""
         from repositories.comment_repository import CommentRepository
         from repositories.idea_repository import IdeaRepository
 
+        details = {}
         if content_type == ContentType.COMMENT:
-            comment_repo = CommentRepository(db)
-            result = comment_repo.get_with_author(content_id)
-            if not result:
-                return None
-            comment, user = result
-            return {
-                "content_text": str(comment.content)[:500],  # Preview
-                "content_author_id": comment.user_id,
-                "content_author_username": user.username if user else "Unknown",
-                "content_created_at": comment.created_at,
-                "is_hidden": comment.is_hidden,
-                "author_trust_score": user.trust_score if user else 0,
-                "author_total_flags": user.total_flags_received if user else 0,
-                "idea_id": comment.idea_id,  # Link to parent idea for context
-            }
+            comments = CommentRepository(db).get_many_with_author(content_ids)
+            for content_id, (comment, user) in comments.items():
+                details[content_id] = {
+                    "content_text": str(comment.content)[:500],  # Preview
+                    "content_author_id": comment.user_id,
+                    "content_author_username": user.username if user else "Unknown",
+                    "content_created_at": comment.created_at,
+                    "is_hidden": comment.is_hidden,
+                    "author_trust_score": user.trust_score if user else 0,
+                    "author_total_flags": user.total_flags_received if user else 0,
+                    "idea_id": comment.idea_id,  # Link to parent idea for context
+                }
         else:
-            idea_repo = IdeaRepository(db)
-            result = idea_repo.get_with_author(content_id)
-            if not result:
-                return None
-            idea, user = result
-            return {
-                "content_text": f"{idea.title}: {str(idea.description)[:400]}",
-                "content_author_id": idea.user_id,
-                "content_author_username": user.username if user else "Unknown",
-                "content_created_at": idea.created_at,
-                "is_hidden": idea.is_hidden,
-                "author_trust_score": user.trust_score if user else 0,
-                "author_total_flags": user.total_flags_received if user else 0,
-            }
+            ideas = IdeaRepository(db).get_many_with_author(content_ids)
+            for content_id, (idea, user) in ideas.items():
+                details[content_id] = {
+                    "content_text": f"{idea.title}: {str(idea.description)[:400]}",
+                    "content_author_id": idea.user_id,
+                    "content_author_username": user.username if user else "Unknown",
+                    "content_created_at": idea.created_at,
+                    "is_hidden": idea.is_hidden,
+                    "author_trust_score": user.trust_score if user else 0,
+                    "author_total_flags": user.total_flags_received if user else 0,
+                }
+        return details
 
     @staticmethod
     def _get_content_author_id(
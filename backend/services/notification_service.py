@@ -10,6 +10,7 @@ import asyncio
 import httpx
 from loguru import logger
 
+from core.metrics import set_queue_depth
 from models.config import settings
 from models.notification_types import NotificationType
 
@@ -22,6 +23,9 @@ class NotificationService:
     exceptions or block the calling code.
     """
 
+    # Sends still running; referenced so the event loop can't drop them
+    _in_flight: set[asyncio.Task] = set()
+
     @classmethod
     def _get_topic(cls, notification_type: NotificationType) -> str:
         """Build full topic name from type."""
@@ -120,11 +124,14 @@ class NotificationService:
         try:
             loop = asyncio.get_running_loop()
             # We're in an async context, create task
-            loop.create_task(
+            task = loop.create_task(
                 cls._send_async(
                     notification_type, title, message, click_url, priority_override
                 )
             )
+            cls._in_flight.add(task)
+            task.add_done_callback(cls._send_done)
+            set_queue_depth("notifications", len(cls._in_flight))
         except RuntimeError:
             # No running loop, run synchronously (shouldn't happen in FastAPI)
             logger.debug("No event loop, running notification sync")
@@ -134,6 +141,12 @@ class NotificationService:
                 )
             )
 
+    @classmethod
+    def _send_done(cls, task: asyncio.Task) -> None:
+        """Forget a finished send."""
+        cls._in_flight.discard(task)
+        set_queue_depth("notifications", len(cls._in_flight))
+
     # =========================================================================
     # Convenience Methods
     # =========================================================================
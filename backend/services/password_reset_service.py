@@ -22,6 +22,8 @@ import httpx
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from core.crypto_executor import run_crypto
+from helpers.pwned_passwords import get_pwned_password_store, sha1_hex
 from models.config import settings
 from models.exceptions import (
     PasswordResetAccountLockedException,
@@ -127,7 +129,9 @@ class PasswordResetService:
         Used when user doesn't exist to prevent enumeration via timing.
         """
         # Use a fixed cost factor matching our real hashing
-        bcrypt.hashpw(b"dummy_password_for_timing", bcrypt.gensalt(rounds=12))
+        run_crypto(
+            bcrypt.hashpw, b"dummy_password_for_timing", bcrypt.gensalt(rounds=12)
+        )
 
     @staticmethod
     def validate_password_strength(password: str) -> list[str]:
@@ -184,16 +188,25 @@ class PasswordResetService:
         """
         Check if password has been exposed in data breaches (Finding #16).
 
-        Uses Have I Been Pwned API with k-anonymity model.
+        Served from the local Pwned Passwords store (helpers.pwned_passwords).
+        Until a store is imported, falls back to the HIBP range API
+        (k-anonymity) if PWNED_PASSWORDS_REMOTE_FALLBACK is enabled.
         Returns count of times seen in breaches, or None if check failed.
         """
+        # SHA-1 is required by HIBP (not used for security)
+        sha1_hash = sha1_hex(password)
+        store = get_pwned_password_store(
+            settings.PWNED_PASSWORDS_DB_PATH, settings.PWNED_PASSWORDS_CACHE_SIZE
+        )
+        count = store.lookup(sha1_hash)
+        if count is not None or not settings.PWNED_PASSWORDS_REMOTE_FALLBACK:
+            return count
+        return PasswordResetService._check_password_pwned_remote(sha1_hash, timeout)
+
+    @staticmethod
+    def _check_password_pwned_remote(sha1_hash: str, timeout: float) -> Optional[int]:
+        """Look up a password hash with the HIBP range API."""
         try:
-            # Hash the password with SHA-1 (required by HIBP API - not used for security)
-            sha1_hash = (
-                hashlib.sha1(password.encode(), usedforsecurity=False)
-                .hexdigest()
-                .upper()
-            )
             prefix = sha1_hash[:5]
             suffix = sha1_hash[5:]
 
@@ -2,25 +2,59 @@
 Quality service for business logic.
 """
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Session
 
 from models.exceptions import CategoryNotFoundException
-from repositories.category_repository import CategoryRepository
 from repositories.db_models import Quality
 from repositories.quality_repository import QualityRepository
 from repositories.vote_quality_repository import VoteQualityRepository
+from services.reference_data_service import QualityRef, ReferenceDataService
 
 if TYPE_CHECKING:
     import models.schemas as schemas
 
 
 class QualityService:
-    """Service for quality-related business logic."""
+    """
+    Service for quality-related business logic.
+
+    Categories, qualities and their mapping are read from the reference
+    data snapshot (see ReferenceDataService), which follows the
+    "categories" cache version across workers.
+    """
 
     @staticmethod
-    def get_qualities_for_category(db: Session, category_id: int) -> list[Quality]:
+    def get_category_quality_map(db: Session, category_id: int) -> Mapping[str, int]:
+        """
+        Get the qualities available for a category.
+
+        Args:
+            db: Database session
+            category_id: Category ID
+
+        Returns:
+            Read-only mapping of quality key to quality ID
+
+        Raises:
+            CategoryNotFoundException: If the category does not exist
+        """
+        quality_map = ReferenceDataService.get_snapshot(db).quality_keys.get(
+            category_id
+        )
+        if quality_map is None:
+            quality_map = {
+                q.key: q.id
+                for q in QualityService.get_qualities_for_category(db, category_id)
+            }
+        return quality_map
+
+    @staticmethod
+    def get_qualities_for_category(
+        db: Session, category_id: int
+    ) -> "list[QualityRef] | list[Quality]":
         """
         Get available qualities for a category.
 
@@ -37,17 +71,19 @@ class QualityService:
         Raises:
             CategoryNotFoundException: If the category does not exist
         """
-        # Validate category exists
-        category_repo = CategoryRepository(db)
-        category = category_repo.get_by_id(category_id)
-        if not category:
+        qualities = ReferenceDataService.get_snapshot(db).qualities_for(category_id)
+        if qualities is not None:
+            return qualities
+
+        # Not in the snapshot yet (created by another worker just now)
+        if not ReferenceDataService.get_category(db, category_id):
             raise CategoryNotFoundException(f"Category with ID {category_id} not found")
 
         quality_repo = QualityRepository(db)
         return quality_repo.get_for_category(category_id)
 
     @staticmethod
-    def get_all_default_qualities(db: Session) -> list[Quality]:
+    def get_all_default_qualities(db: Session) -> list[QualityRef]:
         """
         Get all default qualities (for when category is unknown).
 
@@ -57,8 +93,8 @@ class QualityService:
         Returns:
             List of default active qualities
         """
-        quality_repo = QualityRepository(db)
-        return quality_repo.get_defaults()
+        snapshot = ReferenceDataService.get_snapshot(db)
+        return [snapshot.qualities[qid] for qid in snapshot.default_quality_ids]
 
     @staticmethod
     def get_quality_counts_for_idea(
@@ -106,8 +142,9 @@ class QualityService:
         if not quality_ids:
             return []
 
-        valid_qualities = QualityService.get_qualities_for_category(db, category_id)
-        valid_ids = {q.id for q in valid_qualities}
+        valid_ids = set(
+            QualityService.get_category_quality_map(db, category_id).values()
+        )
 
         return [qid for qid in quality_ids if qid in valid_ids]
 
@@ -127,14 +164,8 @@ class QualityService:
         if not keys:
             return []
 
-        quality_repo = QualityRepository(db)
-        qualities = quality_repo.get_by_keys(keys)
-
-        # Get valid IDs for this category
-        valid_qualities = QualityService.get_qualities_for_category(db, category_id)
-        valid_ids = {q.id for q in valid_qualities}
-
-        return [q.id for q in qualities if q.id in valid_ids]
+        quality_map = QualityService.get_category_quality_map(db, category_id)
+        return [quality_map[key] for key in dict.fromkeys(keys) if key in quality_map]
 
     @staticmethod
     def ids_to_keys(db: Session, quality_ids: list[int]) -> list[str]:
@@ -151,7 +182,6 @@ class QualityService:
         if not quality_ids:
             return []
 
-        quality_repo = QualityRepository(db)
-        qualities = quality_repo.get_by_ids(quality_ids)
-
-        return [q.key for q in qualities]
+        # The snapshot holds active qualities only, like get_by_ids
+        qualities = ReferenceDataService.get_snapshot(db).qualities
+        return [qualities[qid].key for qid in quality_ids if qid in qualities]
@@ -0,0 +1,377 @@
+"""
+Reference Data Service
+
+Immutable in-process snapshot of slow-changing reference data: categories,
+qualities, the category -> qualities mapping and popular tags.
+
+Each snapshot records the "categories" cache version it was built from
+(see ResponseCacheService). Every write to categories, qualities or their
+overrides bumps that counter right after it commits, so each worker
+notices the change within RESPONSE_CACHE_VERSION_TTL_SECONDS, builds a new
+snapshot and swaps it in with a single reference assignment. Readers keep
+using whichever snapshot they fetched, which is never mutated.
+"""
+
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from types import MappingProxyType
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+import models.schemas as schemas
+import repositories.db_models as db_models
+from core.metrics import record_cache
+from models.config import settings
+from repositories.category_repository import CategoryRepository
+from repositories.quality_repository import QualityRepository
+from repositories.tag_repository import TagRepository
+from services.response_cache_service import ResponseCacheService
+
+
+class CategoryRef:
+    """Read-only category data."""
+
+    __slots__ = ("description_en", "description_fr", "id", "name_en", "name_fr")
+
+    def __init__(
+        self,
+        id: int,
+        name_en: str,
+        name_fr: str,
+        description_en: Optional[str],
+        description_fr: Optional[str],
+    ) -> None:
+        self.id = id
+        self.name_en = name_en
+        self.name_fr = name_fr
+        self.description_en = description_en
+        self.description_fr = description_fr
+
+
+class QualityRef:
+    """Read-only quality data."""
+
+    __slots__ = (
+        "color",
+        "created_at",
+        "description_en",
+        "description_fr",
+        "icon",
+        "id",
+        "is_active",
+        "is_default",
+        "display_order",
+        "key",
+        "name_en",
+        "name_fr",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        key: str,
+        name_en: str,
+        name_fr: str,
+        description_en: Optional[str],
+        description_fr: Optional[str],
+        icon: Optional[str],
+        color: Optional[str],
+        is_default: bool,
+        is_active: bool,
+        display_order: int,
+        created_at: Optional[datetime],
+    ) -> None:
+        self.id = id
+        self.key = key
+        self.name_en = name_en
+        self.name_fr = name_fr
+        self.description_en = description_en
+        self.description_fr = description_fr
+        self.icon = icon
+        self.color = color
+        self.is_default = is_default
+        self.is_active = is_active
+        self.display_order = display_order
+        self.created_at = created_at
+
+
+class ReferenceSnapshot:
+    """Categories, active qualities and their mapping at one version."""
+
+    __slots__ = (
+        "categories",
+        "category_qualities",
+        "default_quality_ids",
+        "qualities",
+        "quality_keys",
+        "version",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        categories: Mapping[int, CategoryRef],
+        qualities: Mapping[int, QualityRef],
+        category_qualities: Mapping[int, tuple[int, ...]],
+        default_quality_ids: tuple[int, ...],
+    ) -> None:
+        self.version = version
+        self.categories = categories
+        self.qualities = qualities
+        self.category_qualities = category_qualities
+        self.default_quality_ids = default_quality_ids
+        # {category_id: {quality_key: quality_id}}
+        self.quality_keys: Mapping[int, Mapping[str, int]] = MappingProxyType(
+            {
+                category_id: MappingProxyType(
+                    {qualities[qid].key: qid for qid in quality_ids}
+                )
+                for category_id, quality_ids in category_qualities.items()
+            }
+        )
+
+    def qualities_for(self, category_id: int) -> Optional[list[QualityRef]]:
+        """
+        Get the qualities available for a category.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            Qualities in display order, or None if the category does not exist
+        """
+        quality_ids = self.category_qualities.get(category_id)
+        if quality_ids is None:
+            return None
+        return [self.qualities[qid] for qid in quality_ids]
+
+
+class PopularTagsSnapshot:
+    """Most used tags at one tags version."""
+
+    __slots__ = ("loaded_at", "tags", "version")
+
+    def __init__(
+        self, version: int, tags: tuple[schemas.TagWithCount, ...], loaded_at: float
+    ) -> None:
+        self.version = version
+        self.tags = tags
+        self.loaded_at = loaded_at
+
+
+def _build_snapshot(db: Session, version: int) -> ReferenceSnapshot:
+    """Load categories and qualities into a new snapshot."""
+    category_repo = CategoryRepository(db)
+    quality_repo = QualityRepository(db)
+
+    categories = {
+        category.id: CategoryRef(
+            id=category.id,
+            name_en=category.name_en,
+            name_fr=category.name_fr,
+            description_en=category.description_en,
+            description_fr=category.description_fr,
+        )
+        for category in sorted(
+            category_repo.get_all(limit=settings.REFERENCE_DATA_MAX_CATEGORIES),
+            key=lambda c: c.id,
+        )
+    }
+    qualities = {
+        quality.id: QualityRef(
+            id=quality.id,
+            key=quality.key,
+            name_en=quality.name_en,
+            name_fr=quality.name_fr,
+            description_en=quality.description_en,
+            description_fr=quality.description_fr,
+            icon=quality.icon,
+            color=quality.color,
+            is_default=quality.is_default,
+            is_active=quality.is_active,
+            display_order=quality.display_order,
+            created_at=quality.created_at,
+        )
+        for quality in quality_repo.get_all_active()
+    }
+    # The per-category rules (defaults minus disabled, plus enabled
+    # extras, override ordering) stay in QualityRepository
+    category_qualities = {
+        category_id: tuple(q.id for q in quality_repo.get_for_category(category_id))
+        for category_id in categories
+    }
+    default_quality_ids = tuple(q.id for q in quality_repo.get_defaults())
+
+    return ReferenceSnapshot(
+        version=version,
+        categories=MappingProxyType(categories),
+        qualities=MappingProxyType(qualities),
+        category_qualities=MappingProxyType(category_qualities),
+        default_quality_ids=default_quality_ids,
+    )
+
+
+def _load_popular_tags(db: Session) -> tuple[schemas.TagWithCount, ...]:
+    """Load the REFERENCE_DATA_POPULAR_TAGS most used tags."""
+    results = TagRepository(db).get_popular_tags(
+        settings.REFERENCE_DATA_POPULAR_TAGS, 1
+    )
+    return tuple(
+        schemas.TagWithCount(
+            id=tag.id,
+            name=tag.name,
+            display_name=tag.display_name,
+            created_at=tag.created_at,
+            idea_count=count,
+        )
+        for tag, count in results
+    )
+
+
+def _has_pending_changes(db: Session, entity: str) -> bool:
+    """
+    Check whether the session changed an entity it has not committed.
+
+    Versions are only bumped at commit, so such a transaction still
+    sees the committed version while reading different data.
+    """
+    return entity in db.info.get("cache_changed", ())
+
+
+class ReferenceDataService:
+    """
+    Service for the versioned reference-data snapshot.
+
+    The snapshot is loaded at startup and rebuilt when the "categories"
+    version changes. Popular tags are kept in a separate snapshot tied to
+    the "tags" version, and also refreshed after
+    REFERENCE_DATA_POPULAR_TAGS_MAX_AGE_SECONDS since approvals change the
+    counts without touching tags.
+    """
+
+    _snapshot: ReferenceSnapshot | None = None
+    _popular_tags: PopularTagsSnapshot | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_snapshot(cls, db: Session) -> ReferenceSnapshot:
+        """
+        Get the current reference-data snapshot.
+
+        Args:
+            db: Database session (only used to check the version, and to
+                rebuild the snapshot when it changed)
+
+        Returns:
+            Immutable snapshot
+        """
+        version = ResponseCacheService.get_versions(db, ("categories",))["categories"][
+            0
+        ]
+        if _has_pending_changes(db, "categories"):
+            # Built from uncommitted data: never share it with other requests
+            record_cache("reference_data", False)
+            return _build_snapshot(db, version)
+
+        snapshot = cls._snapshot
+        if snapshot is not None and snapshot.version == version:
+            record_cache("reference_data", True)
+            return snapshot
+
+        record_cache("reference_data", False)
+
+        with cls._lock:
+            snapshot = cls._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = _build_snapshot(db, version)
+                cls._snapshot = snapshot
+                logger.debug(f"Reference data snapshot loaded (version {version})")
+        return snapshot
+
+    @classmethod
+    def get_category(
+        cls, db: Session, category_id: int
+    ) -> "CategoryRef | db_models.Category | None":
+        """
+        Get a category by ID.
+
+        Answers from the snapshot, and only asks the database for IDs the
+        snapshot does not know (a category created by another worker less
+        than RESPONSE_CACHE_VERSION_TTL_SECONDS ago).
+
+        Args:
+            db: Database session
+            category_id: Category ID
+
+        Returns:
+            Category, or None if it does not exist
+        """
+        category = cls.get_snapshot(db).categories.get(category_id)
+        if category is not None:
+            return category
+        return CategoryRepository(db).get_by_id(category_id)
+
+    @classmethod
+    def get_popular_tags(cls, db: Session) -> tuple[schemas.TagWithCount, ...]:
+        """
+        Get the most used tags (up to REFERENCE_DATA_POPULAR_TAGS).
+
+        Args:
+            db: Database session
+
+        Returns:
+            Tags with approved idea counts, most used first
+        """
+        version = ResponseCacheService.get_versions(db, ("tags",))["tags"][0]
+        if _has_pending_changes(db, "tags"):
+            record_cache("popular_tags", False)
+            return _load_popular_tags(db)
+
+        now = time.monotonic()
+        popular = cls._popular_tags
+        if (
+            popular is not None
+            and popular.version == version
+            and now - popular.loaded_at
+            < settings.REFERENCE_DATA_POPULAR_TAGS_MAX_AGE_SECONDS
+        ):
+            record_cache("popular_tags", True)
+            return popular.tags
+
+        record_cache("popular_tags", False)
+        with cls._lock:
+            popular = cls._popular_tags
+            if (
+                popular is None
+                or popular.version != version
+                or now - popular.loaded_at
+                >= settings.REFERENCE_DATA_POPULAR_TAGS_MAX_AGE_SECONDS
+            ):
+                popular = PopularTagsSnapshot(
+                    version=version, tags=_load_popular_tags(db), loaded_at=now
+                )
+                cls._popular_tags = popular
+        return popular.tags
+
+    @classmethod
+    def load(cls, db: Session) -> None:
+        """
+        Load the snapshots eagerly (application startup).
+
+        Args:
+            db: Database session
+        """
+        cls.clear()
+        cls.get_snapshot(db)
+        cls.get_popular_tags(db)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop the loaded snapshots."""
+        with cls._lock:
+            cls._snapshot = None
+            cls._popular_tags = None
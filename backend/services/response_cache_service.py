@@ -0,0 +1,259 @@
+"""
+Response Cache Service
+
+Version counters and rendered-bytes cache for anonymous GET endpoints.
+
+Writes to cached tables bump a per-entity counter (``cache_versions``),
+tracked by SQLAlchemy session events and written as the last statement
+of the write's own transaction, just before it commits: the bump commits
+or rolls back with the data, and writers hold the shared version rows
+only for the commit itself. ETags are derived from those counters, so
+every worker produces the same ETag for the same data and a new one once
+a write has committed.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+import repositories.db_models as db_models
+from core.metrics import record_cache
+from models.config import settings
+from repositories.cache_version_repository import (
+    SITEMAP_ENTITY,
+    CacheVersionRepository,
+    sitemap_shard,
+    sitemap_shard_entity,
+)
+
+# Entity groups whose data each model feeds into. Bulk statements on ideas
+# and votes can touch any sitemap shard; ORM flushes narrow this down to
+# the shard of each changed idea (see entities_for).
+ENTITY_MODELS: dict[type, tuple[str, ...]] = {
+    db_models.Idea: ("ideas", SITEMAP_ENTITY),
+    db_models.Vote: ("ideas", SITEMAP_ENTITY),
+    db_models.VoteQuality: ("ideas",),
+    db_models.Comment: ("ideas",),
+    db_models.IdeaTag: ("ideas", "tags"),
+    db_models.Tag: ("tags",),
+    db_models.TagStat: ("tags",),
+    db_models.Category: ("categories", "ideas"),
+    db_models.Quality: ("categories",),
+    db_models.CategoryQuality: ("categories",),
+}
+
+# User columns shown next to ideas; other user updates (logins, trust
+# score...) must not invalidate idea caches.
+_USER_PUBLIC_ATTRS = ("username", "display_name", "avatar_url")
+
+
+class ResponseCacheService:
+    """
+    Service for HTTP response cache versions and rendered bodies.
+
+    Versions are read from the database at most once per
+    RESPONSE_CACHE_VERSION_TTL_SECONDS per worker, and immediately after
+    this worker commits a change. Rendered bodies are keyed by ETag, so a
+    version bump makes older entries unreachable; they are also dropped
+    eagerly on local commits and evicted LRU beyond
+    RESPONSE_CACHE_MAX_ENTRIES.
+    """
+
+    # {entity: (version, updated_at)}
+    _versions: dict[str, tuple[int, datetime | None]] = {}
+    _versions_fetched_at: float = 0.0
+
+    # {etag: (body, entities)}
+    _rendered: "OrderedDict[str, tuple[bytes, frozenset[str]]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_versions(
+        cls, db: Session, entities: Iterable[str]
+    ) -> dict[str, tuple[int, datetime | None]]:
+        """
+        Get current versions for entity groups.
+
+        Args:
+            db: Database session
+            entities: Entity names
+
+        Returns:
+            Dict mapping entity to (version, updated_at); unknown entities
+            are version 0
+        """
+        entities = tuple(entities)
+        if not entities:
+            return {}
+        now = time.monotonic()
+        if now - cls._versions_fetched_at > settings.RESPONSE_CACHE_VERSION_TTL_SECONDS:
+            cls._versions = CacheVersionRepository(db).get_versions()
+            cls._versions_fetched_at = now
+        return {entity: cls._versions.get(entity, (0, None)) for entity in entities}
+
+    @classmethod
+    def get_rendered(cls, etag: str) -> bytes | None:
+        """
+        Get a cached rendered body.
+
+        Args:
+            etag: ETag of the response
+
+        Returns:
+            Body bytes or None on a miss
+        """
+        with cls._lock:
+            entry = cls._rendered.get(etag)
+            if entry is not None:
+                cls._rendered.move_to_end(etag)
+        record_cache("rendered_response", entry is not None)
+        return entry[0] if entry is not None else None
+
+    @classmethod
+    def store_rendered(cls, etag: str, body: bytes, entities: Iterable[str]) -> None:
+        """
+        Cache a rendered body.
+
+        Args:
+            etag: ETag of the response
+            body: Serialized response body
+            entities: Entity groups the body depends on
+        """
+        with cls._lock:
+            cls._rendered[etag] = (body, frozenset(entities))
+            cls._rendered.move_to_end(etag)
+            while len(cls._rendered) > settings.RESPONSE_CACHE_MAX_ENTRIES:
+                cls._rendered.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, entities: Iterable[str]) -> None:
+        """
+        Drop cached bodies for entity groups and refetch versions.
+
+        Called after this worker commits a change.
+
+        Args:
+            entities: Changed entity names
+        """
+        changed = frozenset(entities)
+        if not changed:
+            return
+        with cls._lock:
+            stale = [
+                etag for etag, (_, deps) in cls._rendered.items() if deps & changed
+            ]
+            for etag in stale:
+                del cls._rendered[etag]
+        cls._versions_fetched_at = 0.0
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear all cached versions and bodies."""
+        with cls._lock:
+            cls._rendered.clear()
+            cls._versions = {}
+            cls._versions_fetched_at = 0.0
+
+    @staticmethod
+    def entities_for(obj: Any) -> tuple[str, ...]:
+        """
+        Get the entity groups affected by a change to an ORM object.
+
+        Args:
+            obj: Mapped instance
+
+        Returns:
+            Affected entity names (empty if not cached)
+        """
+        if isinstance(obj, db_models.User):
+            state = inspect(obj)
+            if any(state.attrs[a].history.has_changes() for a in _USER_PUBLIC_ATTRS):
+                return ("ideas",)
+            return ()
+        if isinstance(obj, db_models.Idea) and obj.id is not None:
+            return ("ideas", sitemap_shard_entity(sitemap_shard(obj.id)))
+        if isinstance(obj, db_models.Vote) and obj.idea_id is not None:
+            return ("ideas", sitemap_shard_entity(sitemap_shard(obj.idea_id)))
+        return ENTITY_MODELS.get(type(obj), ())
+
+
+def _record_changes(session: Session, entities: Iterable[str]) -> None:
+    """Remember changed entities for the bump at commit."""
+    changed = set(entities)
+    if not changed:
+        return
+    CacheVersionRepository(session).mark_changed(changed)
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    """Bump versions for ORM objects written by this flush."""
+    entities: set[str] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        entities.update(ResponseCacheService.entities_for(obj))
+    _record_changes(session, entities)
+
+
+def _do_orm_execute(orm_execute_state: Any) -> None:
+    """
+    Bump versions for bulk UPDATE/DELETE/INSERT statements.
+
+    Statements that know exactly what they touch can narrow the bump with
+    a ``cache_entities`` execution option.
+    """
+    if not (
+        orm_execute_state.is_update
+        or orm_execute_state.is_delete
+        or orm_execute_state.is_insert
+    ):
+        return
+    declared = orm_execute_state.execution_options.get("cache_entities")
+    if declared is not None:
+        _record_changes(orm_execute_state.session, declared)
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    _record_changes(orm_execute_state.session, ENTITY_MODELS.get(mapper.class_, ()))
+
+
+def _before_commit(session: Session) -> None:
+    """
+    Bump versions of the changed entities in the committing transaction.
+
+    The pending changes are flushed first so their entities are known;
+    the bump then goes out as the transaction's last statement.
+    """
+    if session.in_nested_transaction():
+        return
+    session.flush()
+    changed = session.info.pop("cache_changed", None)
+    if not changed:
+        return
+    CacheVersionRepository(session).bump(changed)
+    session.info["cache_committed"] = changed
+
+
+def _after_commit(session: Session) -> None:
+    """Invalidate this worker's cache for the committed changes."""
+    changed = session.info.pop("cache_committed", None)
+    if changed:
+        ResponseCacheService.invalidate(changed)
+
+
+def _after_rollback(session: Session) -> None:
+    """Forget changes of a rolled-back transaction."""
+    session.info.pop("cache_changed", None)
+    session.info.pop("cache_committed", None)
+
+
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "do_orm_execute", _do_orm_execute)
+event.listen(Session, "before_commit", _before_commit)
+event.listen(Session, "after_commit", _after_commit)
+event.listen(Session, "after_rollback", _after_rollback)
@@ -3,8 +3,16 @@ Data Retention Service for Law 25 Compliance.
 
 Implements automated cleanup of expired data according to retention policies.
 Article 11 (Destruction), Article 12 (Retention Schedules), Article 13 (Anonymization).
+
+Purges delete in chunks of RETENTION_PURGE_BATCH_SIZE rows, one short
+transaction per chunk with a RETENTION_PURGE_SLEEP_SECONDS pause between
+chunks, so other writers (on SQLite, every other writer) are never held
+up for a whole run. Progress is checkpointed in retention_checkpoints and
+an interrupted purge resumes after the last chunk it committed.
 """
 
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from typing import Tuple
 
@@ -30,24 +38,144 @@ class RetentionService:
         Run all retention cleanup jobs.
 
         Returns:
-            Summary of cleanup actions taken
+            Summary of cleanup actions taken, with deletion rates per table
+            under "purge_rates"
         """
         logger.info("Starting retention cleanup jobs")
 
+        rates: dict[str, dict] = {}
         results = {
-            "soft_deleted_content": RetentionService.cleanup_soft_deleted_content(db),
-            "expired_login_codes": RetentionService.cleanup_expired_login_codes(db),
+            "soft_deleted_content": RetentionService.cleanup_soft_deleted_content(
+                db, rates
+            ),
+            "expired_login_codes": RetentionService.cleanup_expired_login_codes(
+                db, rates
+            ),
+            "login_events": RetentionService.cleanup_old_login_events(db, rates),
+            "security_audit_logs": RetentionService.cleanup_old_security_audit_logs(
+                db, rates
+            ),
+            "orphans": RetentionService.cleanup_orphaned_rows(db, rates),
             "inactive_accounts": RetentionService.process_inactive_accounts(db),
         }
+        results["purge_rates"] = rates
 
         logger.info(f"Retention cleanup complete: {results}")
         return results
 
     @staticmethod
-    def cleanup_soft_deleted_content(db: Session) -> Tuple[int, int]:
+    def _purge_in_batches(
+        db: Session,
+        purge: str,
+        next_ids: Callable[[int, int], list[int]],
+        delete_ids: Callable[[list[int]], dict[str, int]],
+        rates: dict[str, dict] | None = None,
+    ) -> dict[str, int]:
+        """
+        Delete rows chunk by chunk, checkpointing after each chunk.
+
+        Each chunk (its deletes plus the checkpoint) is one transaction.
+        A purge interrupted mid-way resumes after its checkpoint; rows
+        that expire behind the checkpoint meanwhile are picked up by the
+        next run, which starts from the beginning again.
+
+        Args:
+            db: Database session
+            purge: Purge name (checkpoint key)
+            next_ids: Returns up to `limit` ids greater than `after_id`, ascending
+            delete_ids: Deletes a chunk, returning rows deleted per table
+            rates: If given, receives rows deleted and rows/sec per table
+
+        Returns:
+            Rows deleted per table
+        """
+        retention_repo = RetentionRepository(db)
+        batch_size = settings.RETENTION_PURGE_BATCH_SIZE
+        last_id = retention_repo.get_checkpoint(purge)
+        if last_id:
+            logger.info(f"Resuming retention purge {purge} after id {last_id}")
+
+        deleted: dict[str, int] = {}
+        start = time.perf_counter()
+        while True:
+            ids = next_ids(last_id, batch_size)
+            if not ids:
+                break
+            for table, count in delete_ids(ids).items():
+                deleted[table] = deleted.get(table, 0) + count
+            last_id = ids[-1]
+            retention_repo.save_checkpoint(purge, last_id)
+            retention_repo.commit()
+            if len(ids) < batch_size:
+                break
+            time.sleep(settings.RETENTION_PURGE_SLEEP_SECONDS)
+
+        retention_repo.clear_checkpoint(purge)
+        retention_repo.commit()
+
+        elapsed = time.perf_counter() - start
+        for table, count in deleted.items():
+            rate = count / elapsed if elapsed > 0 else 0.0
+            logger.info(
+                f"Retention purge {purge}: {count} {table} rows in {elapsed:.2f}s "
+                f"({rate:.0f} rows/s)"
+            )
+            if rates is not None:
+                # Several purges delete from the same table (comments go
+                # with their ideas and on their own): rate over the totals
+                total = rates.get(table, {})
+                table_deleted = total.get("deleted", 0) + count
+                table_seconds = total.get("seconds", 0.0) + elapsed
+                rates[table] = {
+                    "deleted": table_deleted,
+                    "seconds": round(table_seconds, 3),
+                    "rows_per_second": round(
+                        table_deleted / table_seconds if table_seconds > 0 else 0.0,
+                        1,
+                    ),
+                }
+        return deleted
+
+    @staticmethod
+    def _delete_ideas(retention_repo: RetentionRepository, idea_ids: list[int]) -> dict:
+        """Delete ideas with their tags, votes, vote qualities, comments and likes."""
+        return {
+            "idea_tags": retention_repo.delete_idea_tags_by_idea_ids(idea_ids),
+            "vote_qualities": retention_repo.delete_vote_qualities_by_idea_ids(
+                idea_ids
+            ),
+            "votes": retention_repo.delete_votes_by_idea_ids(idea_ids),
+            "comment_likes": retention_repo.delete_comment_likes_by_idea_ids(idea_ids),
+            "comments": retention_repo.delete_comments_by_idea_ids(idea_ids),
+            "ideas": retention_repo.delete_by_ids(db_models.Idea, idea_ids),
+        }
+
+    @staticmethod
+    def _delete_comments(
+        retention_repo: RetentionRepository, comment_ids: list[int]
+    ) -> dict:
+        """Delete comments with their likes."""
+        return {
+            "comment_likes": retention_repo.delete_comment_likes_by_comment_ids(
+                comment_ids
+            ),
+            "comments": retention_repo.delete_by_ids(db_models.Comment, comment_ids),
+        }
+
+    @staticmethod
+    def cleanup_soft_deleted_content(
+        db: Session, rates: dict[str, dict] | None = None
+    ) -> Tuple[int, int]:
         """
         Permanently delete soft-deleted content past retention period.
 
+        Ideas go together with their tags, votes (and vote qualities) and
+        comments (and comment likes); comments with their likes.
+
+        Args:
+            db: Database session
+            rates: If given, receives rows deleted and rows/sec per table
+
         Returns:
             Tuple of (deleted_ideas_count, deleted_comments_count)
         """
@@ -57,22 +185,26 @@ class RetentionService:
 
         retention_repo = RetentionRepository(db)
 
-        # Get IDs of ideas to delete for cascade cleanup
-        idea_ids = retention_repo.get_soft_deleted_idea_ids(cutoff_date)
-
-        # Delete related records first (foreign key constraints)
-        if idea_ids:
-            retention_repo.delete_idea_tags_by_idea_ids(idea_ids)
-            retention_repo.delete_votes_by_idea_ids(idea_ids)
-            retention_repo.delete_comments_by_idea_ids(idea_ids)
-
-        # Delete the ideas
-        deleted_ideas = retention_repo.delete_soft_deleted_ideas(cutoff_date)
-
-        # Delete orphaned comments (soft-deleted past retention)
-        deleted_comments = retention_repo.delete_soft_deleted_comments(cutoff_date)
-
-        retention_repo.commit()
+        deleted_ideas = RetentionService._purge_in_batches(
+            db,
+            "soft_deleted_ideas",
+            lambda after_id, limit: retention_repo.get_soft_deleted_idea_ids(
+                cutoff_date, after_id, limit
+            ),
+            lambda ids: RetentionService._delete_ideas(retention_repo, ids),
+            rates,
+        ).get("ideas", 0)
+
+        # Comments soft-deleted on their own (not removed with an idea above)
+        deleted_comments = RetentionService._purge_in_batches(
+            db,
+            "soft_deleted_comments",
+            lambda after_id, limit: retention_repo.get_soft_deleted_comment_ids(
+                cutoff_date, after_id, limit
+            ),
+            lambda ids: RetentionService._delete_comments(retention_repo, ids),
+            rates,
+        ).get("comments", 0)
 
         logger.info(
             f"Cleaned up soft-deleted content: {deleted_ideas} ideas, "
@@ -82,10 +214,36 @@ class RetentionService:
         return (deleted_ideas, deleted_comments)
 
     @staticmethod
-    def cleanup_expired_login_codes(db: Session) -> int:
+    def _purge_table(
+        db: Session,
+        purge: str,
+        model: type,
+        next_ids: Callable[[int, int], list[int]],
+        rates: dict[str, dict] | None,
+    ) -> int:
+        """Purge rows of one table with no dependents, in batches."""
+        retention_repo = RetentionRepository(db)
+        table = model.__tablename__  # type: ignore[attr-defined]
+        deleted = RetentionService._purge_in_batches(
+            db,
+            purge,
+            next_ids,
+            lambda ids: {table: retention_repo.delete_by_ids(model, ids)},
+            rates,
+        )
+        return deleted.get(table, 0)
+
+    @staticmethod
+    def cleanup_expired_login_codes(
+        db: Session, rates: dict[str, dict] | None = None
+    ) -> int:
         """
         Delete expired email login codes past retention period.
 
+        Args:
+            db: Database session
+            rates: If given, receives rows deleted and rows/sec per table
+
         Returns:
             Number of deleted codes
         """
@@ -94,12 +252,124 @@ class RetentionService:
         )
 
         retention_repo = RetentionRepository(db)
-        deleted_count = retention_repo.delete_expired_login_codes(cutoff_date)
-        retention_repo.commit()
+        deleted_count = RetentionService._purge_table(
+            db,
+            "expired_login_codes",
+            db_models.EmailLoginCode,
+            lambda after_id, limit: retention_repo.get_expired_login_code_ids(
+                cutoff_date, after_id, limit
+            ),
+            rates,
+        )
 
         logger.info(f"Cleaned up {deleted_count} expired login codes")
         return deleted_count
 
+    @staticmethod
+    def cleanup_old_login_events(
+        db: Session,
+        rates: dict[str, dict] | None = None,
+        retention_days: int | None = None,
+    ) -> int:
+        """
+        Delete login events older than LOGIN_EVENT_RETENTION_DAYS.
+
+        Args:
+            db: Database session
+            rates: If given, receives rows deleted and rows/sec per table
+            retention_days: Days to retain instead of the configured period
+
+        Returns:
+            Number of deleted events
+        """
+        if retention_days is None:
+            retention_days = settings.LOGIN_EVENT_RETENTION_DAYS
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
+
+        retention_repo = RetentionRepository(db)
+        deleted_count = RetentionService._purge_table(
+            db,
+            "login_events",
+            db_models.LoginEvent,
+            lambda after_id, limit: retention_repo.get_login_event_ids_before(
+                cutoff_date, after_id, limit
+            ),
+            rates,
+        )
+
+        logger.info(f"Cleaned up {deleted_count} old login events")
+        return deleted_count
+
+    @staticmethod
+    def cleanup_old_security_audit_logs(
+        db: Session, rates: dict[str, dict] | None = None
+    ) -> int:
+        """
+        Delete security audit logs older than SECURITY_AUDIT_LOG_RETENTION_YEARS.
+
+        Args:
+            db: Database session
+            rates: If given, receives rows deleted and rows/sec per table
+
+        Returns:
+            Number of deleted logs
+        """
+        cutoff_date = datetime.now(timezone.utc) - timedelta(
+            days=settings.SECURITY_AUDIT_LOG_RETENTION_YEARS * 365
+        )
+
+        retention_repo = RetentionRepository(db)
+        deleted_count = RetentionService._purge_table(
+            db,
+            "security_audit_logs",
+            db_models.SecurityAuditLog,
+            lambda after_id, limit: retention_repo.get_security_audit_log_ids_before(
+                cutoff_date, after_id, limit
+            ),
+            rates,
+        )
+
+        logger.info(f"Cleaned up {deleted_count} old security audit logs")
+        return deleted_count
+
+    @staticmethod
+    def cleanup_orphaned_rows(
+        db: Session, rates: dict[str, dict] | None = None
+    ) -> dict[str, int]:
+        """
+        Delete vote qualities and comment likes whose vote or comment is gone.
+
+        SQLite does not enforce the ON DELETE CASCADE of these foreign keys,
+        so rows left behind by earlier purges and deletions are swept here.
+
+        Args:
+            db: Database session
+            rates: If given, receives rows deleted and rows/sec per table
+
+        Returns:
+            Rows deleted per table
+        """
+        retention_repo = RetentionRepository(db)
+        orphans = {
+            "vote_qualities": RetentionService._purge_table(
+                db,
+                "orphan_vote_qualities",
+                db_models.VoteQuality,
+                retention_repo.get_orphan_vote_quality_ids,
+                rates,
+            ),
+            "comment_likes": RetentionService._purge_table(
+                db,
+                "orphan_comment_likes",
+                db_models.CommentLike,
+                retention_repo.get_orphan_comment_like_ids,
+                rates,
+            ),
+        }
+
+        logger.info(f"Cleaned up orphaned rows: {orphans}")
+        return orphans
+
     @staticmethod
     def _warn_inactive_users(
         retention_repo: RetentionRepository,
@@ -0,0 +1,192 @@
+"""
+Sanitization backfill for user content stored before write-time sanitization.
+
+Rows are streamed in primary-key order, one batch at a time. The text of
+each batch is sanitized in worker processes (bleach parsing is CPU-bound)
+while the next batch is read; the main process writes back only the rows
+that change and commits each batch. An interrupted run keeps what it
+committed, and a re-run finds nothing left to change.
+
+A field edited after its batch was read keeps the edit: the write is
+conditional on the text that was sanitized, and the next run picks the
+row up again. Change records are handed out per batch (on_changes), so a
+run over a large table does not hold them all in memory.
+"""
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+import repositories.db_models as db_models
+from helpers.sanitization import sanitize_rows
+from repositories.sanitization_repository import SanitizationRepository
+
+# Fields sanitized on write, by table: (model, field -> sanitizer kind)
+SANITIZED_FIELDS: dict[str, tuple[Any, dict[str, str]]] = {
+    "ideas": (db_models.Idea, {"title": "plain", "description": "html"}),
+    "comments": (db_models.Comment, {"content": "html"}),
+}
+
+# Characters of original and sanitized text kept in change records
+PREVIEW_LENGTH = 200
+
+# Change records returned in the result (all of them go to on_changes)
+MAX_CHANGE_RECORDS = 1000
+
+
+def _submit(
+    pool: ProcessPoolExecutor | None,
+    rows: list[dict[str, Any]],
+    fields: dict[str, str],
+) -> "Future[list[dict[str, Any]]]":
+    """Sanitize a batch in the pool, or inline without one."""
+    if pool is not None:
+        return pool.submit(sanitize_rows, rows, fields)
+    future: Future[list[dict[str, Any]]] = Future()
+    future.set_result(sanitize_rows(rows, fields))
+    return future
+
+
+class SanitizationService:
+    """Service for sanitizing stored user content."""
+
+    @staticmethod
+    def backfill_existing_content(
+        db: Session,
+        tables: list[str] | None = None,
+        batch_size: int = 500,
+        workers: int = 1,
+        dry_run: bool = False,
+        on_changes: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Sanitize the stored text of ideas and comments.
+
+        Args:
+            db: Database session
+            tables: Tables to cover (default: all of SANITIZED_FIELDS)
+            batch_size: Rows read, sanitized and committed at a time
+            workers: Worker processes sanitizing batches (1: in-process)
+            dry_run: Find the rows that would change without writing
+            on_changes: Called with the change records (table, id, field,
+                original and sanitized previews) of each batch, once
+                committed
+
+        Returns:
+            Per-table counts of scanned, sanitized and skipped (edited
+            since read) rows, and the first MAX_CHANGE_RECORDS change
+            records
+
+        Raises:
+            KeyError: If a table is not in SANITIZED_FIELDS
+        """
+        repo = SanitizationRepository(db)
+        result: dict[str, Any] = {"tables": {}, "changes": []}
+        # Spawned workers only import helpers.sanitization, not the app
+        pool = (
+            ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            if workers > 1
+            else None
+        )
+        try:
+            for table in tables or list(SANITIZED_FIELDS):
+                model, fields = SANITIZED_FIELDS[table]
+                counts = {"scanned": 0, "sanitized": 0, "skipped": 0}
+                pending: deque[tuple[list[dict[str, Any]], Future]] = deque()
+                after_id = 0
+                while True:
+                    rows = repo.get_text_batch(
+                        model, list(fields), after_id, batch_size
+                    )
+                    if rows:
+                        after_id = rows[-1]["id"]
+                        pending.append((rows, _submit(pool, rows, fields)))
+                    # Keep every worker busy, with one batch queued behind each
+                    if pending and (not rows or len(pending) > 2 * workers):
+                        batch, future = pending.popleft()
+                        updates = future.result()
+                        changes = SanitizationService._apply_batch(
+                            repo, table, model, batch, updates, dry_run
+                        )
+                        sanitized = len({change["id"] for change in changes})
+                        counts["scanned"] += len(batch)
+                        counts["sanitized"] += sanitized
+                        counts["skipped"] += len(updates) - sanitized
+                        room = MAX_CHANGE_RECORDS - len(result["changes"])
+                        result["changes"].extend(changes[:room])
+                        if changes and on_changes is not None:
+                            on_changes(changes)
+                    if not rows and not pending:
+                        break
+                result["tables"][table] = counts
+                logger.info(f"Sanitization backfill of {table}: {counts}")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        return result
+
+    @staticmethod
+    def _apply_batch(
+        repo: SanitizationRepository,
+        table: str,
+        model: Any,
+        batch: list[dict[str, Any]],
+        updates: list[dict[str, Any]],
+        dry_run: bool,
+    ) -> list[dict[str, Any]]:
+        """
+        Write a sanitized batch and commit it.
+
+        Returns:
+            Change records of the fields written (or, in a dry run, that
+            would be)
+        """
+        originals = {row["id"]: row for row in batch}
+        by_field: dict[str, list[dict[str, Any]]] = {}
+        for update in updates:
+            for field, sanitized in update.items():
+                if field != "id":
+                    by_field.setdefault(field, []).append(
+                        {
+                            "id": update["id"],
+                            field: sanitized,
+                            "original": originals[update["id"]][field],
+                        }
+                    )
+
+        written = by_field
+        if not dry_run and by_field:
+            for field, field_updates in by_field.items():
+                repo.update_text(model, field, field_updates)
+            # Fields edited since the batch was read were left alone
+            current = repo.get_text_by_ids(
+                model, list(by_field), [update["id"] for update in updates]
+            )
+            repo.commit()
+            written = {
+                field: [
+                    row
+                    for row in field_updates
+                    if current.get(row["id"], {}).get(field) == row[field]
+                ]
+                for field, field_updates in by_field.items()
+            }
+
+        return [
+            {
+                "table": table,
+                "id": row["id"],
+                "field": field,
+                "original": (row["original"] or "")[:PREVIEW_LENGTH],
+                "sanitized": (row[field] or "")[:PREVIEW_LENGTH],
+            }
+            for field, field_updates in written.items()
+            for row in field_updates
+        ]
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy.orm import Session
 
+from core.metrics import search_timer
 from models.config import get_settings
 from models.exceptions import ValidationException
 from models.search_schemas import (
@@ -56,6 +57,7 @@ class SearchService:
         return SearchService._backend_cache
 
     @staticmethod
+    @search_timer("ideas")
     def search_ideas(
         db: Session,
         query: str,
@@ -177,6 +179,7 @@ class SearchService:
         return results
 
     @staticmethod
+    @search_timer("suggestions")
     def get_suggestions(
         db: Session,
         partial_query: str,
@@ -368,6 +371,7 @@ class SearchService:
             db.rollback()
 
     @staticmethod
+    @search_timer("tag")
     def search_by_tag(
         db: Session,
         tag_query: str,
@@ -444,6 +448,7 @@ class SearchService:
         )
 
     @staticmethod
+    @search_timer("tags")
     def search_with_tags(
         db: Session,
         query: str,
@@ -486,17 +491,16 @@ class SearchService:
             current_user_id=current_user_id,
         )
 
-        # Get matching tags
-        tag_repo = TagRepository(db)
-        tags = tag_repo.search_tags(query, limit=5)
+        # Get matching tags with their maintained idea counts
+        tags = TagRepository(db).search_tags_with_counts(query, limit=5)
 
         matching_tags = [
             TagSuggestion(
                 name=tag.name,
                 display_name=tag.display_name,
-                idea_count=tag_repo.get_tag_idea_count(tag.id),
+                idea_count=idea_count,
             )
-            for tag in tags
+            for tag, idea_count in tags
         ]
 
         return {
@@ -505,6 +509,7 @@ class SearchService:
         }
 
     @staticmethod
+    @search_timer("autocomplete")
     def get_autocomplete(
         db: Session,
         query: str,
@@ -533,17 +538,16 @@ class SearchService:
         if backend.is_available(db):
             idea_suggestions = backend.get_suggestions(db, query, limit)
 
-        # Get tag suggestions
-        tag_repo = TagRepository(db)
-        tags = tag_repo.search_tags(query, limit=limit)
+        # Get tag suggestions with their maintained idea counts
+        tags = TagRepository(db).search_tags_with_counts(query, limit=limit)
 
         tag_suggestions = [
             TagSuggestion(
                 name=tag.name,
                 display_name=tag.display_name,
-                idea_count=tag_repo.get_tag_idea_count(tag.id),
+                idea_count=idea_count,
             )
-            for tag in tags
+            for tag, idea_count in tags
         ]
 
         return {
@@ -5,7 +5,7 @@ import re
 from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from models.search_schemas import (
     SearchFilters,
@@ -198,8 +198,10 @@ class SQLiteFTS5Backend(SearchBackend):
             # Log error if FTS table doesn't exist - non-critical for fallback flow
             logging.debug(f"Could not clear FTS index (table may not exist): {e}")
 
-        # Get all ideas with tags
-        ideas = db.query(db_models.Idea).all()
+        # Get all ideas with tags (loaded in one extra query, not per idea)
+        ideas = (
+            db.query(db_models.Idea).options(selectinload(db_models.Idea.tags)).all()
+        )
 
         count = 0
         for idea in ideas:
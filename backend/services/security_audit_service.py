@@ -18,6 +18,7 @@ from models.notification_types import NotificationType
 from repositories import db_models
 from repositories.security_audit_repository import SecurityAuditRepository
 from services.notification_service import NotificationService
+from services.retention_service import RetentionService
 
 
 class SecurityEventType:
@@ -658,7 +659,8 @@ class SecurityAuditService:
         """
         Remove login events older than the retention period.
 
-        Should be called periodically (e.g., daily cron job).
+        Runs the batched, checkpointed retention purge, so a large backlog
+        is deleted chunk by chunk rather than in one statement.
 
         Args:
             db: Database session
@@ -667,10 +669,9 @@ class SecurityAuditService:
         Returns:
             Number of deleted events
         """
-        from repositories.login_event_repository import LoginEventRepository
-
-        repo = LoginEventRepository(db)
-        return repo.cleanup_old_events(retention_days=retention_days)
+        return RetentionService.cleanup_old_login_events(
+            db, retention_days=retention_days
+        )
 
     # =========================================================================
     # Admin API Methods (Security Audit Phase 2)
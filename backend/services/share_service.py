@@ -2,13 +2,23 @@
 Share service for business logic.
 
 Handles share event recording and analytics retrieval.
+
+Share clicks are counted in an in-process buffer keyed by
+(idea_id, platform, minute) and flushed in one upsert into the
+``share_counts`` rollup, instead of one committed row per click.
 """
 
+import random
+import threading
+import time
 from datetime import datetime, timezone
 
+from loguru import logger
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
+from core.metrics import set_queue_depth
+from models.config import settings
 from models.exceptions import IdeaNotFoundException
 from models.schemas import (
     AdminShareAnalyticsResponse,
@@ -22,7 +32,88 @@ from repositories.share_repository import ShareRepository
 
 
 class ShareService:
-    """Service for share-related business logic."""
+    """
+    Service for share-related business logic.
+
+    Note: The share buffer is per process. Each worker flushes its own
+    counts; the rollup upsert adds them together, so totals converge
+    within SHARE_FLUSH_INTERVAL_SECONDS across workers. Analytics read
+    the rollup as it stands and never flush.
+    """
+
+    # Buffered counts: {(idea_id, platform, bucket_start): count}
+    _pending: dict[tuple[int, db_models.SharePlatform, datetime], int] = {}
+    _pending_lock = threading.Lock()
+    _last_flush: float = time.monotonic()
+
+    @classmethod
+    def _buffer_share(
+        cls, idea_id: int, platform: db_models.SharePlatform, now: datetime
+    ) -> bool:
+        """
+        Count a share in the in-memory buffer.
+
+        Args:
+            idea_id: ID of the shared idea
+            platform: Social media platform
+            now: Time of the share
+
+        Returns:
+            True if the buffer is due for a flush
+        """
+        bucket_start = now.replace(second=0, microsecond=0)
+        key = (idea_id, platform, bucket_start)
+        with cls._pending_lock:
+            cls._pending[key] = cls._pending.get(key, 0) + 1
+            set_queue_depth("share_buffer", len(cls._pending))
+            return (
+                len(cls._pending) >= settings.SHARE_BUFFER_MAX_KEYS
+                or time.monotonic() - cls._last_flush
+                >= settings.SHARE_FLUSH_INTERVAL_SECONDS
+            )
+
+    @classmethod
+    def flush_share_buffer(cls, db: Session) -> int:
+        """
+        Write buffered share counts to the rollup table.
+
+        Safe to call from any thread; the buffer is swapped out under a
+        lock so clicks arriving during the write land in the next batch.
+        On failure the drained counts are merged back for the next flush.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of shares written
+        """
+        with cls._pending_lock:
+            pending = cls._pending
+            cls._pending = {}
+            cls._last_flush = time.monotonic()
+            set_queue_depth("share_buffer", 0)
+
+        if not pending:
+            return 0
+
+        try:
+            return ShareRepository(db).upsert_share_counts(pending)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Share count flush failed, will retry: {e}")
+            with cls._pending_lock:
+                for key, count in pending.items():
+                    cls._pending[key] = cls._pending.get(key, 0) + count
+                set_queue_depth("share_buffer", len(cls._pending))
+            return 0
+
+    @classmethod
+    def discard_share_buffer(cls) -> None:
+        """Drop all buffered share counts (used by tests)."""
+        with cls._pending_lock:
+            cls._pending = {}
+            cls._last_flush = time.monotonic()
+            set_queue_depth("share_buffer", 0)
 
     @staticmethod
     def record_share(
@@ -34,6 +125,9 @@ class ShareService:
         """
         Record a share event for an idea.
 
+        The share is counted in the in-memory buffer; a raw share_events
+        row is only written for the SHARE_EVENT_LOG_SAMPLE_RATE fraction.
+
         Args:
             db: Database session
             idea_id: ID of the shared idea
@@ -41,13 +135,12 @@ class ShareService:
             referrer_url: Optional URL where share was initiated
 
         Returns:
-            ShareEventResponse with created event details
+            ShareEventResponse (id is None when the raw event was not logged)
 
         Raises:
             IdeaNotFoundException: If idea does not exist
         """
         idea_repo = IdeaRepository(db)
-        share_repo = ShareRepository(db)
 
         # Validate idea exists
         idea = idea_repo.get_by_id(idea_id)
@@ -56,19 +149,27 @@ class ShareService:
 
         # Convert schema enum to db enum
         db_platform = db_models.SharePlatform(platform.value)
+        now = datetime.now(timezone.utc)
 
-        # Record the share event
-        share_event = share_repo.create_share_event(
-            idea_id=idea_id,
-            platform=db_platform,
-            referrer_url=referrer_url,
-        )
+        event_id = None
+        sample_rate = settings.SHARE_EVENT_LOG_SAMPLE_RATE
+        # Optionally keep a sampled raw log (random is fine: not security)
+        if sample_rate > 0 and random.random() < sample_rate:  # nosec B311
+            share_event = ShareRepository(db).create_share_event(
+                idea_id=idea_id,
+                platform=db_platform,
+                referrer_url=referrer_url,
+            )
+            event_id = share_event.id
+
+        if ShareService._buffer_share(idea_id, db_platform, now):
+            ShareService.flush_share_buffer(db)
 
         return ShareEventResponse(
-            id=share_event.id,
-            idea_id=share_event.idea_id,
-            platform=SharePlatform(share_event.platform.value),
-            created_at=share_event.created_at,
+            id=event_id,
+            idea_id=idea_id,
+            platform=platform,
+            created_at=now,
         )
 
     @staticmethod
@@ -1,24 +1,45 @@
 """Sitemap service for SEO optimization.
 
-Provides lightweight data retrieval for sitemap generation.
+Provides lightweight, streaming data retrieval for sitemap generation.
+
+Idea sitemaps are split into shards covering fixed idea ID ranges of
+SITEMAP_SHARD_SIZE (the sitemaps.org limit is 50,000 URLs per file),
+listed by a sitemap index. Since an idea never moves between shards, each
+shard only changes when one of its own ideas does, and can be cached
+independently (see the "sitemap:<n>" cache version entities).
 """
 
+import json
+import math
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional
+from xml.sax.saxutils import escape
 
 from sqlalchemy.orm import Session
 
+from models.config import settings
 from repositories.idea_repository import IdeaRepository
 
+_SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+_XML_HEADER = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
 
 class SitemapIdeaData:
     """Lightweight idea data for sitemap."""
 
+    __slots__ = ("id", "updated_at", "score")
+
     def __init__(self, id: int, updated_at: datetime, score: int) -> None:
         self.id = id
         self.updated_at = updated_at
         self.score = score
 
+    @property
+    def priority(self) -> float:
+        """Sitemap priority derived from the idea score."""
+        return SitemapService.idea_priority(self.score)
+
 
 class SitemapService:
     """Service for sitemap-related operations."""
@@ -29,22 +50,171 @@ class SitemapService:
         return updated_at if updated_at else datetime.now(timezone.utc)
 
     @staticmethod
-    def get_sitemap_ideas(db: Session) -> list[SitemapIdeaData]:
-        """Get all approved ideas for sitemap generation.
+    def _lastmod(updated_at: Optional[datetime]) -> str:
+        """Format a W3C datetime for <lastmod>."""
+        value = SitemapService._get_updated_at(updated_at)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    @staticmethod
+    def idea_priority(score: int) -> float:
+        """
+        Compute the sitemap priority of an idea from its score.
+
+        Log-scaled into 0.5-0.9 with a fixed ceiling (score 999), so the
+        priority of an idea does not depend on other ideas and a shard only
+        changes when its own ideas do.
+
+        Args:
+            score: Maintained idea score (upvotes - downvotes)
+
+        Returns:
+            Priority between 0.5 and 0.9
+        """
+        scaled = min(1.0, math.log10(1 + max(score, 0)) / 3)
+        return round(0.5 + 0.4 * scaled, 2)
 
-        Returns minimal data needed for sitemap:
+    @staticmethod
+    def iter_sitemap_ideas(
+        db: Session,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None,
+    ) -> Iterator[SitemapIdeaData]:
+        """Stream approved ideas for sitemap generation.
+
+        Yields minimal data needed for sitemap:
         - id: for URL generation
         - updated_at: for lastmod
         - score: for priority calculation
+
+        Args:
+            db: Database session
+            min_id: Inclusive lower idea ID bound
+            max_id: Exclusive upper idea ID bound
         """
         idea_repo = IdeaRepository(db)
-        sitemap_data = idea_repo.get_sitemap_data()
-
-        return [
-            SitemapIdeaData(
+        for id, updated_at, score in idea_repo.iter_sitemap_data(
+            min_id=min_id,
+            max_id=max_id,
+            batch_size=settings.SITEMAP_STREAM_BATCH_SIZE,
+        ):
+            yield SitemapIdeaData(
                 id=id,
                 updated_at=SitemapService._get_updated_at(updated_at),
                 score=score,
             )
-            for id, updated_at, score in sitemap_data
-        ]
+
+    @staticmethod
+    def get_sitemap_ideas(db: Session) -> list[SitemapIdeaData]:
+        """Get all approved ideas for sitemap generation."""
+        return list(SitemapService.iter_sitemap_ideas(db))
+
+    @staticmethod
+    def get_shards(db: Session) -> list[tuple[int, Optional[datetime]]]:
+        """
+        Get the non-empty idea sitemap shards.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List of (shard number, last modification)
+        """
+        return IdeaRepository(db).get_sitemap_shards(settings.SITEMAP_SHARD_SIZE)
+
+    @staticmethod
+    def iter_ideas_json(db: Session) -> Iterator[bytes]:
+        """
+        Stream the approved ideas as a JSON array, one batch per chunk.
+
+        Args:
+            db: Database session
+
+        Yields:
+            Encoded chunks of the JSON document
+        """
+        yield b"["
+        separator = ""
+        batch: list[str] = []
+        for idea in SitemapService.iter_sitemap_ideas(db):
+            batch.append(
+                separator
+                + json.dumps(
+                    {
+                        "id": idea.id,
+                        "updated_at": idea.updated_at.isoformat(),
+                        "score": idea.score,
+                        "priority": idea.priority,
+                    },
+                    separators=(",", ":"),
+                )
+            )
+            separator = ","
+            if len(batch) >= settings.SITEMAP_STREAM_BATCH_SIZE:
+                yield "".join(batch).encode()
+                batch = []
+        if batch:
+            yield "".join(batch).encode()
+        yield b"]"
+
+    @staticmethod
+    def render_index(
+        shards: list[tuple[int, Optional[datetime]]],
+        shard_path: Callable[[int], str],
+    ) -> bytes:
+        """
+        Render the sitemap index listing every idea shard.
+
+        Shard locations are built on APP_URL, the public site the index is
+        served from: crawlers only accept sitemaps on the index's own host.
+
+        Args:
+            shards: (shard number, last modification) pairs
+            shard_path: Builds the public path of a shard (e.g.
+                /api/sitemap/ideas-0.xml)
+
+        Returns:
+            Sitemap index XML
+        """
+        base_url = settings.APP_URL.rstrip("/")
+        parts = [f'<sitemapindex xmlns="{_SITEMAP_NS}">']
+        for shard, lastmod in shards:
+            parts.append(
+                f"<sitemap><loc>{escape(base_url + shard_path(shard))}</loc>"
+                f"<lastmod>{SitemapService._lastmod(lastmod)}</lastmod></sitemap>"
+            )
+        parts.append("</sitemapindex>")
+        return _XML_HEADER + "\n".join(parts).encode()
+
+    @staticmethod
+    def iter_shard_xml(db: Session, shard: int) -> Iterator[bytes]:
+        """
+        Stream the <urlset> of one idea shard.
+
+        Args:
+            db: Database session
+            shard: Shard number (ideas with id in [shard*S, (shard+1)*S))
+
+        Yields:
+            Encoded chunks of the sitemap XML
+        """
+        size = settings.SITEMAP_SHARD_SIZE
+        base_url = escape(settings.APP_URL.rstrip("/"))
+        yield _XML_HEADER + f'<urlset xmlns="{_SITEMAP_NS}">\n'.encode()
+        batch: list[str] = []
+        for idea in SitemapService.iter_sitemap_ideas(
+            db, min_id=shard * size, max_id=(shard + 1) * size
+        ):
+            batch.append(
+                f"<url><loc>{base_url}/ideas/{idea.id}</loc>"
+                f"<lastmod>{SitemapService._lastmod(idea.updated_at)}</lastmod>"
+                f"<changefreq>weekly</changefreq>"
+                f"<priority>{idea.priority:.2f}</priority></url>\n"
+            )
+            if len(batch) >= settings.SITEMAP_STREAM_BATCH_SIZE:
+                yield "".join(batch).encode()
+                batch = []
+        if batch:
+            yield "".join(batch).encode()
+        yield b"</urlset>\n"
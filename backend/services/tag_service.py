@@ -1,17 +1,32 @@
 """
 Tag service for business logic with caching.
+
+Per-tag public idea counts (tag_stats) are maintained from SQLAlchemy
+session events: every flush that tags or untags an idea, or changes
+whether a tagged idea is public (approved and not deleted), applies the
+resulting +/- deltas in the same transaction. A daily job recomputes the
+counters to repair drift from bulk statements that bypass the ORM.
 """
 
 import time
+from collections import Counter, defaultdict
 from typing import Any
 
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 
 import models.schemas as schemas
 import repositories.db_models as db_models
+from core.metrics import record_cache
+from models.config import settings
 from models.exceptions import BusinessRuleException, NotFoundException
 from repositories.idea_repository import IdeaRepository
-from repositories.tag_repository import IdeaTagRepository, TagRepository
+from repositories.tag_repository import (
+    IdeaTagRepository,
+    TagRepository,
+    TagStatRepository,
+)
+from services.reference_data_service import ReferenceDataService
 
 
 class TagService:
@@ -45,14 +60,17 @@ class TagService:
             Cached data or None if expired/missing
         """
         if key not in cls._cache:
+            record_cache("tags", False)
             return None
 
         data, cached_time = cls._cache[key]
         if time.time() - cached_time > cls._cache_ttl:
             # Cache expired
             del cls._cache[key]
+            record_cache("tags", False)
             return None
 
+        record_cache("tags", True)
         return data
 
     @classmethod
@@ -164,6 +182,9 @@ class TagService:
         """
         Get most popular tags with caching.
 
+        Served from the reference data snapshot when it holds enough tags,
+        otherwise from the TTL cache.
+
         Args:
             db: Database session
             limit: Maximum number of tags to return
@@ -172,6 +193,14 @@ class TagService:
         Returns:
             List of tags with idea counts
         """
+        if limit <= settings.REFERENCE_DATA_POPULAR_TAGS and min_ideas >= 1:
+            # Snapshot tags are sorted by idea count, most used first
+            return [
+                tag
+                for tag in ReferenceDataService.get_popular_tags(db)[:limit]
+                if tag.idea_count >= min_ideas
+            ]
+
         # Check cache first
         cache_key = TagService._get_cache_key("popular", limit, min_ideas)
         cached = TagService._get_from_cache(cache_key)
@@ -434,19 +463,15 @@ class TagService:
         if not idea:
             raise NotFoundException(f"Idea with ID {idea_id} not found")
 
-        # Remove all existing tags
-        idea_tag_repo = IdeaTagRepository(db)
-        idea_tag_repo.remove_all_tags_from_idea(idea_id)
-
-        # Add new tags
-        tags = []
-        for tag_name in tag_names:
-            if tag_name and tag_name.strip():
-                tag = TagService.create_tag(
-                    db, schemas.TagCreate(display_name=tag_name)
-                )
-                idea_tag_repo.add_tag_to_idea(idea_id, tag.id)
-                tags.append(tag)
+        tags = [
+            TagService.create_tag(db, schemas.TagCreate(display_name=tag_name))
+            for tag_name in tag_names
+            if tag_name and tag_name.strip()
+        ]
+
+        # Only touch associations that change, so tag counters see the
+        # actual difference rather than a full remove and re-add
+        IdeaTagRepository(db).set_idea_tags(idea_id, [tag.id for tag in tags])
 
         # Invalidate popular tags cache
         TagService.invalidate_popular_cache()
@@ -520,3 +545,129 @@ class TagService:
             skip=skip,
             limit=limit,
         )
+
+    @staticmethod
+    def resync_tag_stats(db: Session) -> int:
+        """
+        Recompute every tag counter from idea_tags.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of tag counters corrected
+        """
+        tag_stat_repo = TagStatRepository(db)
+        corrected = tag_stat_repo.sync_tag_stats()
+        tag_stat_repo.commit()
+        if corrected:
+            TagService.invalidate_popular_cache()
+        return corrected
+
+
+# Idea attributes deciding whether its tags count in tag_stats
+_PUBLIC_ATTRS = ("status", "deleted_at")
+
+# Attribute value not loaded in the session (written blind by the flush)
+_UNKNOWN = object()
+
+
+def _is_public(status: Any, deleted_at: Any) -> bool | None:
+    """Whether an idea with these values counts in tag_stats (None if unknown)."""
+    if status is _UNKNOWN or deleted_at is _UNKNOWN:
+        return None
+    return status == db_models.IdeaStatus.APPROVED and deleted_at is None
+
+
+def _public_before_after(idea: db_models.Idea) -> tuple[bool | None, bool | None]:
+    """Whether a flushed idea counted before and after the flush."""
+    state = inspect(idea)
+    before, after = [], []
+    for attr in _PUBLIC_ATTRS:
+        history = state.attrs[attr].history
+        if history.unchanged:
+            before.append(history.unchanged[0])
+            after.append(history.unchanged[0])
+        else:
+            before.append(history.deleted[0] if history.deleted else _UNKNOWN)
+            after.append(history.added[0] if history.added else _UNKNOWN)
+    return _is_public(*before), _is_public(*after)
+
+
+def _tag_count_deltas(session: Session) -> tuple[Counter, set[int]]:
+    """
+    Work out the tag counter changes of a flush.
+
+    Returns:
+        (deltas by tag ID, tag IDs to recount because an idea's previous
+        state is unknown)
+    """
+    added: dict[int, set[int]] = defaultdict(set)
+    removed: dict[int, set[int]] = defaultdict(set)
+    public: dict[int, tuple[bool | None, bool | None]] = {}
+
+    for obj in session.new:
+        if isinstance(obj, db_models.IdeaTag):
+            added[obj.idea_id].add(obj.tag_id)
+        elif isinstance(obj, db_models.Idea):
+            public[obj.id] = (False, _is_public(obj.status, obj.deleted_at))
+    for obj in session.deleted:
+        if isinstance(obj, db_models.IdeaTag):
+            removed[obj.idea_id].add(obj.tag_id)
+        elif isinstance(obj, db_models.Idea):
+            public[obj.id] = (_public_before_after(obj)[0], False)
+    for obj in session.dirty:
+        if isinstance(obj, db_models.Idea) and obj.id not in public:
+            state = inspect(obj)
+            if any(state.attrs[a].history.has_changes() for a in _PUBLIC_ATTRS):
+                public[obj.id] = _public_before_after(obj)
+
+    changed = {
+        idea_id
+        for idea_id, (before, after) in public.items()
+        if before != after or before is None
+    }
+    retagged = (set(added) | set(removed)) - set(public)
+    if not changed and not retagged:
+        return Counter(), set()
+
+    # Ideas only retagged in this flush kept their public state
+    stat_repo = TagStatRepository(session)
+    public_now = stat_repo.get_public_idea_ids(retagged)
+    for idea_id in retagged:
+        public[idea_id] = (idea_id in public_now, idea_id in public_now)
+    current_tags = IdeaTagRepository(session).get_tag_ids_by_idea(changed)
+
+    deltas: Counter = Counter()
+    recount: set[int] = set()
+    for idea_id in changed | set(added) | set(removed):
+        before, after = public[idea_id]
+        tags_after = current_tags.get(idea_id, set())
+        if before is None or after is None:
+            recount |= tags_after | removed[idea_id] | added[idea_id]
+        elif before == after:
+            if after:
+                deltas.update(added[idea_id])
+                deltas.subtract(removed[idea_id])
+        else:
+            tags_before = (tags_after - added[idea_id]) | removed[idea_id]
+            if after:
+                deltas.update(tags_after)
+            if before:
+                deltas.subtract(tags_before)
+    return deltas, recount
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    """Apply the tag counter changes of ORM objects written by this flush."""
+    deltas, recount = _tag_count_deltas(session)
+    deltas = Counter({tag_id: d for tag_id, d in deltas.items() if d})
+    if not deltas and not recount:
+        return
+    stat_repo = TagStatRepository(session)
+    stat_repo.adjust_counts(dict(deltas))
+    stat_repo.sync_tag_stats(sorted(recount))
+    TagService.invalidate_popular_cache()
+
+
+event.listen(Session, "after_flush", _after_flush)
@@ -4,9 +4,7 @@ User Service
 Handles user management operations including admin role assignment.
 """
 
-import os
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import List, Optional
 
 from fastapi import UploadFile
@@ -821,22 +819,26 @@ class UserService:
         """
         Upload user avatar with security validation.
 
+        The image is rendered into pre-sized variants off the request
+        thread and stored by content hash (see AvatarService).
+
         Args:
             db: Database session
             user_id: User ID
             file: Avatar image file
 
         Returns:
-            AvatarUploadResponse with message and avatar_url
+            AvatarUploadResponse with message, avatar_url and per-size URLs
 
         Raises:
             NotFoundException: If user not found
             ValidationException: If file invalid (type, size, or content)
+            ImageBusyException: If too many images are already being processed
         """
-        import uuid
-
         import magic
 
+        from services.avatar_service import AvatarService
+
         # Allowed MIME types and their extensions
         allowed_mime_types = {
             "image/jpeg": ".jpg",
@@ -867,32 +869,17 @@ class UserService:
                 f"Allowed: {', '.join(allowed_mime_types.keys())}"
             )
 
-        # Generate unpredictable filename using UUID
-        extension = allowed_mime_types[detected_type]
-        filename = f"{uuid.uuid4()}{extension}"
-
-        # Create uploads directory if it doesn't exist
-        upload_dir = Path("data/uploads/avatars")
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        file_path = upload_dir / filename
-
-        # Save file
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
-
-        # Delete old avatar if exists
-        avatar_url_str = str(user.avatar_url) if user.avatar_url is not None else ""  # type: ignore[truthy-bool]
-        if avatar_url_str:
-            # Convert forward slashes to system path separators
-            old_file_path = Path(avatar_url_str.replace("/", os.sep))
-            if old_file_path.exists():
-                old_file_path.unlink()
-
-        # Update user avatar_url (use forward slashes for URL compatibility)
-        avatar_url = str(file_path).replace("\\", "/")
+        # Decode, strip metadata and render the size variants (stored
+        # under the content hash, so identical uploads share files)
+        avatar_url = AvatarService.store_avatar(content)
+
+        old_avatar_url = str(user.avatar_url) if user.avatar_url is not None else None  # type: ignore[truthy-bool]
         user.avatar_url = avatar_url  # type: ignore[assignment]
         user_repo.update(user)
 
+        # Delete the old avatar files unless another user shares them
+        AvatarService.replace_avatar(db, user_id, old_avatar_url, avatar_url)
+
         return schemas.AvatarUploadResponse(
             message="Avatar uploaded successfully", avatar_url=avatar_url
         )
@@ -26,16 +26,25 @@ class VoteService:
         user_id: int,
         vote_type: db_models.VoteType,
         quality_ids: list[int] | None = None,
+        quality_keys: list[str] | None = None,
     ) -> db_models.Vote:
         """
         Vote on an idea with optional qualities.
 
+        The vote is locked and changed (or inserted), and the vote, its
+        qualities and atomic deltas to the idea's vote counters are
+        written in one transaction. Qualities are validated against the cached
+        category -> qualities map, so a vote costs no reference-data
+        queries.
+
         Args:
             db: Database session
             idea_id: Idea ID
             user_id: User ID
             vote_type: Vote type (UPVOTE or DOWNVOTE)
             quality_ids: Optional list of quality IDs (only for upvotes)
+            quality_keys: Optional list of quality keys (only for upvotes),
+                used when quality_ids is not given
 
         Returns:
             Created or updated vote
@@ -63,37 +72,30 @@ class VoteService:
         # Business rule: qualities only for upvotes
         if vote_type != db_models.VoteType.UPVOTE:
             quality_ids = None
+            quality_keys = None
 
-        # Validate quality IDs against category
+        # Validate qualities against category
         if quality_ids:
             quality_ids = QualityService.validate_quality_ids(
                 db, quality_ids, idea.category_id
             )
+        elif quality_keys:
+            quality_ids = QualityService.keys_to_ids(db, quality_keys, idea.category_id)
 
-        # Check if user already voted
-        existing_vote = vote_repo.get_by_idea_and_user(idea_id, user_id)
-
-        if existing_vote:
-            # Update existing vote
-            existing_vote.vote_type = vote_type
-            vote = vote_repo.update(existing_vote)
+        try:
+            vote, previous = vote_repo.upsert_vote(idea_id, user_id, vote_type)
 
             # Clear qualities if switching to downvote
             if vote_type == db_models.VoteType.DOWNVOTE:
                 vote_quality_repo.clear_qualities(vote.id)
             elif quality_ids:
                 vote_quality_repo.set_qualities(vote.id, quality_ids)
-        else:
-            # Create new vote
-            new_vote = db_models.Vote(
-                idea_id=idea_id, user_id=user_id, vote_type=vote_type
-            )
-            vote = vote_repo.create(new_vote)
-
-            # Add qualities for upvotes
-            if vote_type == db_models.VoteType.UPVOTE and quality_ids:
-                vote_quality_repo.set_qualities(vote.id, quality_ids)
 
+            vote_repo.adjust_idea_vote_counts(idea_id, previous, vote_type)
+            vote_repo.commit()
+        except Exception:
+            vote_repo.rollback()
+            raise
         return vote
 
     @staticmethod
@@ -176,14 +178,15 @@ class VoteService:
         """
         vote_repo = VoteRepository(db)
 
-        vote = vote_repo.get_by_idea_and_user(idea_id, user_id)
-        if not vote:
+        removed = vote_repo.remove_vote(idea_id, user_id)
+        if removed is None:
+            vote_repo.rollback()
             raise VoteNotFoundException(
                 f"Vote not found for idea {idea_id} and user {user_id}"
             )
 
-        # VoteQuality records are deleted via cascade
-        vote_repo.delete(vote)
+        vote_repo.adjust_idea_vote_counts(idea_id, removed, None)
+        vote_repo.commit()
 
     @staticmethod
     def get_user_vote(db: Session, idea_id: int, user_id: int) -> db_models.Vote | None:
@@ -200,3 +203,19 @@ class VoteService:
         """
         vote_repo = VoteRepository(db)
         return vote_repo.get_by_idea_and_user(idea_id, user_id)
+
+    @staticmethod
+    def resync_vote_counts(db: Session) -> int:
+        """
+        Recompute the vote counters and score of every idea.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of ideas updated
+        """
+        vote_repo = VoteRepository(db)
+        updated = vote_repo.sync_idea_vote_counts()
+        vote_repo.commit()
+        return updated
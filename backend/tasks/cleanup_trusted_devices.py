@@ -6,12 +6,11 @@ Law 25 Compliance: Data Retention
 - Expired devices are soft-deleted immediately
 - Revoked devices are permanently deleted after retention period
 
-This script can be run:
-- Via cron: 0 * * * * cd /path/to/backend && python -m tasks.cleanup_trusted_devices
-- Via scheduler (APScheduler, Celery Beat, etc.)
+The application scheduler runs this hourly (core.scheduler,
+trusted_device_cleanup job). It can also be run:
+- Via cron, when the app scheduler is not running:
+  0 * * * * cd /path/to/backend && python -m tasks.cleanup_trusted_devices
 - Manually: python -m tasks.cleanup_trusted_devices
-
-Recommended: Run hourly
 """
 
 import sys
@@ -25,7 +25,8 @@ os.environ["ADMIN_PASSWORD"] = "TestAdmin123!"
 os.environ["TOTP_ENCRYPTION_KEY"] = "P0LYDU58oBna0xcCcu-fgUPuS02-HzzJRarCoSA1ySA="
 
 from authentication.auth import create_access_token, get_password_hash  # noqa: E402
-from repositories.database import Base, get_db  # noqa: E402
+from core.query_tracking import count_queries  # noqa: E402
+from repositories.database import Base, get_db, get_read_db  # noqa: E402
 import repositories.db_models as db_models  # noqa: E402
 
 # Test database engine (in-memory SQLite)
@@ -39,14 +40,70 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail if the test body runs more than n SQL statements "
+        "on the test database (fixture setup is not counted)",
+    )
+    config.addinivalue_line(
+        "markers", "benchmark: performance benchmarks under tests/performance"
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Enforce @pytest.mark.query_budget on the test body."""
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+
+    budget = marker.args[0]
+    with count_queries(engine) as queries:
+        result = yield
+    if queries.count > budget:
+        pytest.fail(
+            f"Query budget exceeded: {queries.count} statements, budget {budget}\n"
+            f"{queries.summary()}",
+            pytrace=False,
+        )
+    return result
+
+
+@pytest.fixture
+def query_counter():
+    """
+    Count statements run on the test database inside a block.
+
+    Usage::
+
+        with query_counter() as queries:
+            client.get("/api/ideas/leaderboard")
+        assert queries.count <= 5
+        assert not queries.repeated(3)
+    """
+    return lambda: count_queries(engine)
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh in-memory database session for each test."""
+    from services.reference_data_service import ReferenceDataService
+    from services.response_cache_service import ResponseCacheService
+    from services.share_service import ShareService
+
+    # Cache versions restart with each database, so cached bodies and
+    # reference data must not survive from a previous test
+    ResponseCacheService.clear()
+    ReferenceDataService.clear()
     Base.metadata.create_all(bind=engine)
     session = TestingSessionLocal()
     try:
         yield session
     finally:
+        # Buffered share counts must not leak into the next test's database
+        ShareService.discard_share_buffer()
         session.close()
         Base.metadata.drop_all(bind=engine)
 
@@ -73,6 +130,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -0,0 +1,39 @@
+"""Smoke run of the load-test harness (scripts/benchmark.py).
+
+Drives the full request mix through the ASGI app against the test
+database, to keep the harness working as endpoints change. Real numbers
+come from generated datasets:
+
+    uv run python scripts/benchmark.py --size medium
+"""
+
+import httpx
+import pytest
+
+from scripts.benchmark import DEFAULT_MIX, benchmark_app, load_targets
+
+pytestmark = pytest.mark.benchmark
+
+
+async def test_request_mix_runs_in_process(
+    client, db_session, test_idea, other_user, admin_user
+) -> None:
+    """Every endpoint in the mix should be exercised without server errors."""
+    from main import app
+
+    targets = load_targets(db_session)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as async_client:
+        report = await benchmark_app(
+            async_client, targets, requests=80, concurrency=1, seed=3, warmup=0
+        )
+
+    assert set(report["endpoints"]) == {endpoint.name for endpoint in DEFAULT_MIX}
+    assert report["total"]["requests"] == 80
+    for name, stats in report["endpoints"].items():
+        assert all(int(code) < 500 for code in stats["status_codes"]), name
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+        # Observed on /metrics (cached leaderboard responses run no queries)
+        assert stats["queries_per_request"] is not None, name
@@ -0,0 +1,160 @@
+"""Performance benchmark for the request middleware stack.
+
+Compares the per-request overhead on /api/health of the previous stack
+(three BaseHTTPMiddleware layers: security headers, correlation ID and
+request logging) with the fused pure-ASGI RequestContextMiddleware.
+Requests are driven straight through the ASGI interface, so the numbers
+exclude HTTP parsing and client overhead.
+
+Run with: pytest tests/performance/test_middleware_performance.py -v -s
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from loguru import logger
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from core.correlation import generate_correlation_id, set_correlation_id
+from helpers.request_middleware import RequestContextMiddleware
+from helpers.security_headers import DEFAULT_CACHE_CONTROL, build_security_headers
+from models.config import settings
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 2000
+
+_SECURITY_HEADERS = [
+    (name.decode(), value.decode()) for name, value in build_security_headers()
+]
+
+
+class _LegacySecurityHeaders(BaseHTTPMiddleware):
+    """Previous SecurityHeadersMiddleware."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        response = await call_next(request)
+        for name, value in _SECURITY_HEADERS:
+            response.headers[name] = value
+        if "Cache-Control" not in response.headers:
+            response.headers["Cache-Control"] = DEFAULT_CACHE_CONTROL
+        return response
+
+
+class _LegacyCorrelationId(BaseHTTPMiddleware):
+    """Previous CorrelationIdMiddleware."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        correlation_id = (
+            request.headers.get("X-Correlation-ID") or generate_correlation_id()
+        )
+        set_correlation_id(correlation_id)
+        response = await call_next(request)
+        response.headers["X-Correlation-ID"] = correlation_id
+        return response
+
+
+class _LegacyRequestLogging(BaseHTTPMiddleware):
+    """Previous RequestLoggingMiddleware (two log lines per request)."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        start_time = time.perf_counter()
+        client_host = request.client.host if request.client else "unknown"
+        logger.info(f"Request: {request.method} {request.url.path} from {client_host}")
+        response = await call_next(request)
+        duration = time.perf_counter() - start_time
+        logger.info(
+            f"Response: {request.method} {request.url.path} "
+            f"status={response.status_code} duration={duration:.3f}s"
+        )
+        response.headers["X-Response-Time"] = f"{duration:.3f}s"
+        return response
+
+
+def _make_app(middleware: list[type]) -> FastAPI:
+    """Build an app with a health endpoint and the given middleware."""
+    app = FastAPI()
+    for cls in middleware:
+        app.add_middleware(cls)
+
+    @app.get("/api/health")
+    def health_check() -> dict:
+        return {"status": "healthy"}
+
+    return app
+
+
+async def _drive(app: ASGIApp, count: int) -> float:
+    """Send ``count`` GET /api/health requests, return mean ms per request."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/health",
+        "raw_path": b"/api/health",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        pass
+
+    # Warm up (route compilation, first-call caches)
+    for _ in range(50):
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) * 1000 / count
+
+
+class TestMiddlewareOverhead:
+    """Per-request overhead of the middleware stack."""
+
+    @pytest.fixture(autouse=True)
+    def quiet_logs(self, monkeypatch):
+        """Log to a no-op sink, like production with a queued sink."""
+        monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0.1)
+        logger.remove()
+        handler_id = logger.add(lambda message: None, level="INFO")
+        yield
+        logger.remove(handler_id)
+
+    def test_fused_middleware_faster(self) -> None:
+        """The fused middleware should cost less than the legacy stack."""
+        bare = _make_app([])
+        legacy = _make_app(
+            [_LegacySecurityHeaders, _LegacyCorrelationId, _LegacyRequestLogging]
+        )
+        fused = _make_app([RequestContextMiddleware])
+
+        bare_ms = asyncio.run(_drive(bare, REQUESTS))
+        legacy_ms = asyncio.run(_drive(legacy, REQUESTS))
+        fused_ms = asyncio.run(_drive(fused, REQUESTS))
+
+        print(
+            f"\n/api/health ({REQUESTS} requests): no middleware {bare_ms:.3f}ms, "
+            f"legacy stack +{legacy_ms - bare_ms:.3f}ms, "
+            f"fused +{fused_ms - bare_ms:.3f}ms per request"
+        )
+
+        assert fused_ms < legacy_ms
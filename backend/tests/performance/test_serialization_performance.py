@@ -0,0 +1,158 @@
+"""Performance benchmarks for list endpoint serialization.
+
+Compares the model path (build IdeaWithScore/Comment models, then let
+FastAPI validate and serialize them again against response_model) with
+the lean path (build TypedDict rows and dump them with a cached
+TypeAdapter, see helpers.serialization) on 100-item pages.
+
+Run with: pytest tests/performance/test_serialization_performance.py -v -s
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, List
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+import models.schemas as schemas
+from helpers.serialization import dump_json, type_adapter
+from models.config import settings
+from repositories.db_models import IdeaStatus, VoteType
+
+pytestmark = pytest.mark.benchmark
+
+PAGE_SIZE = 100
+ROUNDS = 30
+
+
+def _idea_rows() -> list[schemas.IdeaWithScoreRow]:
+    """Build a page of leaderboard rows."""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": i,
+            "title": f"Idea {i}",
+            "description": "A fairly long description of the idea. " * 8,
+            "category_id": 1,
+            "user_id": i,
+            "status": IdeaStatus.APPROVED,
+            "admin_comment": None,
+            "created_at": now,
+            "validated_at": now,
+            "author_username": f"user{i}",
+            "author_display_name": f"User {i}",
+            "category_name_en": "Transport",
+            "category_name_fr": "Transport",
+            "upvotes": 10,
+            "downvotes": 2,
+            "score": 8,
+            "user_vote": VoteType.UPVOTE,
+            "comment_count": 3,
+            "tags": [
+                {
+                    "display_name": f"Tag {t}",
+                    "id": t,
+                    "name": f"tag{t}",
+                    "created_at": now,
+                }
+                for t in range(3)
+            ],
+            "quality_counts": {
+                "counts": [
+                    {"quality_id": q, "quality_key": f"quality{q}", "count": q}
+                    for q in range(1, 4)
+                ],
+                "total_votes_with_qualities": 6,
+            },
+            "language": "fr",
+            "edit_count": 0,
+            "last_edit_at": None,
+            "previous_status": None,
+        }
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def _comment_rows() -> list[schemas.CommentRow]:
+    """Build a page of comment rows."""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "content": "A thoughtful comment about this idea. " * 4,
+            "id": i,
+            "idea_id": 1,
+            "user_id": i,
+            "is_moderated": False,
+            "created_at": now,
+            "author_username": f"user{i}",
+            "author_display_name": f"User {i}",
+            "is_deleted": None,
+            "deletion_reason": None,
+            "is_hidden": None,
+            "like_count": i,
+            "user_has_liked": None,
+            "language": "fr",
+        }
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def _model_path(model: Any, rows: list[Any]) -> bytes:
+    """Build models per row, then validate and serialize like FastAPI does."""
+    items = [model.model_validate(row) for row in rows]
+    adapter = type_adapter(List[model])
+    # FastAPI: dump the returned models, validate against response_model,
+    # then serialize the validated copy
+    validated = adapter.validate_python(jsonable_encoder(items))
+    return adapter.dump_json(validated)
+
+
+def _best_of(fn: Callable[[], bytes]) -> float:
+    """Best wall time of ROUNDS calls, in milliseconds."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+class TestListSerialization:
+    """Benchmarks for the lean serialization path."""
+
+    @pytest.fixture(autouse=True)
+    def production(self, monkeypatch):
+        """Measure the production configuration (no response validation)."""
+        monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+
+    @pytest.mark.parametrize(
+        ("name", "model", "row_type", "rows"),
+        [
+            (
+                "leaderboard",
+                schemas.IdeaWithScore,
+                schemas.IdeaWithScoreRow,
+                _idea_rows,
+            ),
+            ("comments", schemas.Comment, schemas.CommentRow, _comment_rows),
+        ],
+    )
+    def test_lean_path_faster(
+        self, name: str, model: Any, row_type: Any, rows: Callable[[], list[Any]]
+    ) -> None:
+        """The lean path should produce the same JSON in less time."""
+        page = rows()
+        lean = lambda: dump_json(page, List[row_type])  # noqa: E731
+        full = lambda: _model_path(model, page)  # noqa: E731
+
+        assert lean() == full()
+
+        lean_ms = _best_of(lean)
+        full_ms = _best_of(full)
+        print(
+            f"\n{name} ({PAGE_SIZE} rows): model path {full_ms:.2f}ms, "
+            f"lean path {lean_ms:.2f}ms ({full_ms / lean_ms:.1f}x)"
+        )
+
+        assert lean_ms < full_ms
@@ -0,0 +1,246 @@
+"""Concurrency benchmark for the SQLite production profile.
+
+Hammers a file-backed SQLite database with votes and comments from many
+threads, the way the FastAPI threadpool does during a live consultation.
+
+The production profile (WAL, busy_timeout, pooled connections and
+``BEGIN IMMEDIATE`` write transactions) must finish with zero
+"database is locked" errors. The legacy configuration (NullPool, default
+rollback journal, no pragmas) is run on the same workload for comparison
+and only reported, since its failure rate depends on timing.
+
+Run with: pytest tests/performance/test_sqlite_concurrency.py -v -s
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, insert, literal, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+import repositories.db_models as db_models
+from models.config import settings
+from repositories.database import Base, create_sqlite_engine
+from services.comment_service import CommentService
+from services.vote_service import VoteService
+
+pytestmark = pytest.mark.benchmark
+
+NUM_THREADS = 16
+OPS_PER_THREAD = 25
+NUM_IDEAS = 10
+# The profile's 5s default assumes an otherwise idle host; a parallel test
+# run can starve a writer for longer, which is load, not lock contention
+BUSY_TIMEOUT_MS = 60_000
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one concurrent run."""
+
+    label: str
+    ops: int = 0
+    locked_errors: int = 0
+    other_errors: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.ops / self.elapsed if self.elapsed else 0.0
+
+
+def _seed(engine: Engine) -> tuple[list[int], list[int]]:
+    """Create schema, one author, voters and approved ideas."""
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        category = db_models.Category(
+            name_en="Bench", name_fr="Bench", description_en="", description_fr=""
+        )
+        session.add(category)
+        users = [
+            db_models.User(
+                email=f"bench{i}@example.com",
+                username=f"bench{i}",
+                display_name=f"Bench {i}",
+                hashed_password="not-a-real-hash",  # pragma: allowlist secret
+                trust_score=100,
+            )
+            for i in range(NUM_THREADS + 1)
+        ]
+        session.add_all(users)
+        session.flush()
+        ideas = [
+            db_models.Idea(
+                title=f"Bench idea {i}",
+                description="Benchmark idea description.",
+                category_id=category.id,
+                user_id=users[0].id,
+                status=db_models.IdeaStatus.APPROVED,
+            )
+            for i in range(NUM_IDEAS)
+        ]
+        session.add_all(ideas)
+        session.commit()
+        return [u.id for u in users[1:]], [i.id for i in ideas]
+    finally:
+        session.close()
+
+
+def _run(
+    label: str, engine: Engine, user_ids: list[int], idea_ids: list[int]
+) -> BenchmarkResult:
+    """Run votes and comments concurrently, one write session per operation."""
+    make_session: Callable[[], Session] = sessionmaker(
+        autocommit=False, autoflush=False, bind=engine, info={"writes": True}
+    )
+    result = BenchmarkResult(label=label)
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(len(user_ids))
+
+    def worker(user_id: int) -> None:
+        rng = random.Random(user_id)
+        start_barrier.wait()
+        for n in range(OPS_PER_THREAD):
+            db = make_session()
+            try:
+                idea_id = rng.choice(idea_ids)
+                if n % 3 == 0:
+                    CommentService.create_comment(
+                        db,
+                        idea_id=idea_id,
+                        user_id=user_id,
+                        content=f"Benchmark comment {n}",
+                        username=f"bench{user_id}",
+                        display_name=f"Bench {user_id}",
+                    )
+                else:
+                    VoteService.vote_on_idea(
+                        db,
+                        idea_id=idea_id,
+                        user_id=user_id,
+                        vote_type=rng.choice(list(db_models.VoteType)),
+                    )
+                with lock:
+                    result.ops += 1
+            except OperationalError as e:
+                db.rollback()
+                with lock:
+                    if "locked" in str(e):
+                        result.locked_errors += 1
+                    else:
+                        result.other_errors.append(str(e))
+            finally:
+                db.close()
+
+    threads = [threading.Thread(target=worker, args=(uid,)) for uid in user_ids]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _report(result: BenchmarkResult) -> None:
+    print(
+        f"\n{result.label}: {result.ops} ok, {result.locked_errors} locked, "
+        f"{len(result.other_errors)} other errors in {result.elapsed:.2f}s "
+        f"({result.throughput:.0f} ops/s)"
+    )
+
+
+class TestSQLiteConcurrency:
+    """Concurrent vote/comment workload against file-backed SQLite."""
+
+    def test_production_profile_has_no_lock_errors(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """WAL + BEGIN IMMEDIATE should serialize writers without failures."""
+        monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", BUSY_TIMEOUT_MS)
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+        try:
+            user_ids, idea_ids = _seed(engine)
+            result = _run("production profile", engine, user_ids, idea_ids)
+            _report(result)
+
+            assert result.locked_errors == 0
+            assert result.other_errors == []
+            assert result.ops == NUM_THREADS * OPS_PER_THREAD
+
+            with engine.connect() as conn:
+                mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+                votes = conn.execute(text("SELECT COUNT(*) FROM votes")).scalar()
+            assert mode == "wal"
+            assert votes and votes <= NUM_THREADS * NUM_IDEAS
+        finally:
+            engine.dispose()
+
+    def test_legacy_configuration_baseline(self, tmp_path: Path) -> None:
+        """Report the previous NullPool configuration on the same workload."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'legacy.db'}",
+            connect_args={"check_same_thread": False},
+            poolclass=NullPool,
+        )
+        try:
+            user_ids, idea_ids = _seed(engine)
+            result = _run("legacy NullPool", engine, user_ids, idea_ids)
+            _report(result)
+
+            assert result.ops + result.locked_errors + len(result.other_errors) == (
+                NUM_THREADS * OPS_PER_THREAD
+            )
+        finally:
+            engine.dispose()
+
+    def test_pragmas_applied_to_pooled_connections(self, tmp_path: Path) -> None:
+        """Every pooled connection should carry the tuned pragmas."""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                # NORMAL == 1
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() > 0
+        finally:
+            engine.dispose()
+
+    def test_write_session_begins_immediate(self, tmp_path: Path) -> None:
+        """A write session should hold the write lock from its first read."""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'begin.db'}")
+        try:
+            Base.metadata.create_all(engine)
+            for writes, expected in ((True, "write"), (False, "read")):
+                with sessionmaker(bind=engine, info={"writes": writes})() as db:
+                    db.execute(select(db_models.Category.id)).all()
+                    state = db.connection().connection.info["sqlite_txn"]
+                    assert state == expected
+        finally:
+            engine.dispose()
+
+    def test_cte_insert_begins_immediate(self, tmp_path: Path) -> None:
+        """DML led by a WITH clause should still be detected as a write."""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'cte.db'}")
+        try:
+            Base.metadata.create_all(engine)
+            names = select(literal("Cat").label("name")).cte("names")
+            table = db_models.Category.__table__
+            stmt = insert(table).from_select(
+                ["name_en", "name_fr", "description_en", "description_fr"],
+                select(names.c.name, names.c.name, literal(""), literal("")),
+            )
+            with sessionmaker(bind=engine)() as db:
+                db.execute(stmt)
+                assert db.connection().connection.info["sqlite_txn"] == "write"
+                db.commit()
+        finally:
+            engine.dispose()
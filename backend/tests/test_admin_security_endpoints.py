@@ -4,10 +4,13 @@ Tests for admin security endpoints (Phase 2).
 Tests the admin API for viewing and managing security events.
 """
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from fastapi import status
 
 import repositories.db_models as db_models
+from models.config import settings
 from repositories.login_event_repository import LoginEventRepository
 
 
@@ -253,6 +256,35 @@ class TestSecurityCleanupEndpoint:
         assert "triggered_at" in data
         assert data["retention_days"] == 90
 
+    def test_cleanup_purges_in_batches(
+        self, client, admin_auth_headers, db_session, test_user, monkeypatch
+    ):
+        """Cleanup deletes expired events through the batched retention purge."""
+        monkeypatch.setattr(settings, "RETENTION_PURGE_BATCH_SIZE", 2)
+        monkeypatch.setattr(settings, "RETENTION_PURGE_SLEEP_SECONDS", 0)
+        now = datetime.now(timezone.utc)
+        for days in (100, 120, 130, 140, 10):
+            db_session.add(
+                db_models.LoginEvent(
+                    user_id=test_user.id,
+                    event_type=db_models.LoginEventType.LOGIN_SUCCESS,
+                    created_at=now - timedelta(days=days),
+                )
+            )
+        db_session.commit()
+
+        response = client.post(
+            "/api/admin/security/cleanup?retention_days=90",
+            headers=admin_auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["deleted_count"] == 4
+        remaining = db_session.query(db_models.LoginEvent).filter(
+            db_models.LoginEvent.user_id == test_user.id
+        )
+        assert remaining.count() == 1
+
     def test_retention_days_validation(self, client, admin_auth_headers):
         """Retention days must be within valid range."""
         # Too low
@@ -0,0 +1,63 @@
+"""Tests for the shared bounded executor."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.bounded_executor import BoundedExecutor
+
+
+class BusyError(Exception):
+    """Raised by the executor under test when full."""
+
+
+@pytest.fixture
+def executor():
+    """A one-slot executor over a thread pool."""
+    rejected: list[int] = []
+    bounded = BoundedExecutor(
+        "test",
+        create_pool=lambda: ThreadPoolExecutor(max_workers=1),
+        max_pending=lambda: 1,
+        busy=BusyError,
+        on_reject=lambda: rejected.append(1),
+    )
+    bounded.rejected = rejected
+    yield bounded
+    bounded.shutdown()
+
+
+class TestBoundedExecutor:
+    """Tests for BoundedExecutor."""
+
+    def test_admit_rejects_past_cap(self, executor):
+        """A second job should be refused until the first is released."""
+        pool = executor.admit()
+
+        with pytest.raises(BusyError):
+            executor.admit()
+        assert executor.rejected == [1]
+
+        executor.release()
+        assert executor.admit() is pool
+        executor.release()
+        assert executor.pending_count() == 0
+
+    def test_discard_starts_new_pool(self, executor):
+        """A discarded pool should be replaced on the next job."""
+        pool = executor.admit()
+        executor.discard(pool)
+        executor.release()
+
+        assert executor.admit() is not pool
+        executor.release()
+
+    def test_reset_after_fork_forgets_pool(self, executor):
+        """A forked child should start from an empty executor."""
+        executor.admit()
+
+        executor._reset_after_fork()
+
+        assert executor.pending_count() == 0
+        assert executor.admit() is not None
+        executor.release()
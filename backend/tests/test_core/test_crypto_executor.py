@@ -0,0 +1,104 @@
+"""Tests for the bounded crypto executor."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from prometheus_client import REGISTRY
+
+from core import crypto_executor
+from core.crypto_executor import pending_count, run_crypto
+from models.config import settings
+from models.exceptions import CryptoBusyException
+
+
+def _sample(name: str, **labels: str) -> float:
+    """Read a sample from the default registry (0 when absent)."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def blocked_call():
+    """Start a crypto call that runs until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block() -> str:
+        started.set()
+        release.wait(5)
+        return "done"
+
+    with ThreadPoolExecutor(max_workers=1) as caller:
+        future = caller.submit(run_crypto, block)
+        assert started.wait(5)
+        yield release
+        release.set()
+        assert future.result(5) == "done"
+
+
+class TestRunCrypto:
+    """Tests for run_crypto."""
+
+    def test_runs_on_crypto_thread(self):
+        """Should run the function on the executor and return its result."""
+        name = run_crypto(lambda: threading.current_thread().name)
+
+        assert name.startswith("crypto")
+        assert pending_count() == 0
+
+    def test_propagates_errors_and_frees_slot(self):
+        """An exception should reach the caller and release the slot."""
+
+        def fail() -> None:
+            raise ValueError("bad hash")
+
+        with pytest.raises(ValueError, match="bad hash"):
+            run_crypto(fail)
+
+        assert pending_count() == 0
+
+    def test_records_wait_and_depth(self):
+        """Should observe the queue wait and report the depth."""
+        before = _sample("crypto_queue_wait_seconds_count")
+
+        run_crypto(sum, [1, 2])
+
+        assert _sample("crypto_queue_wait_seconds_count") == before + 1
+        assert _sample("background_queue_depth", queue="crypto") == 0
+
+    def test_rejects_when_full(self, monkeypatch, blocked_call):
+        """Should refuse new calls once CRYPTO_MAX_PENDING are queued."""
+        monkeypatch.setattr(settings, "CRYPTO_MAX_PENDING", 1)
+        before = _sample("crypto_rejected_total")
+
+        assert pending_count() == 1
+        assert _sample("background_queue_depth", queue="crypto") == 1
+        with pytest.raises(CryptoBusyException):
+            run_crypto(sum, [1, 2])
+
+        assert _sample("crypto_rejected_total") == before + 1
+
+    def test_restarts_after_shutdown(self):
+        """A call after shutdown should start a new pool."""
+        crypto_executor.shutdown_crypto_executor()
+
+        assert run_crypto(sum, [1, 2]) == 3
+
+
+class TestCryptoBusyResponse:
+    """Tests for the crypto busy exception handler."""
+
+    def test_login_returns_503_with_retry_after(self, client, test_user, monkeypatch):
+        """A saturated executor should answer 503 instead of queueing."""
+        monkeypatch.setattr(settings, "CRYPTO_MAX_PENDING", 0)
+
+        response = client.post(
+            "/api/auth/login",
+            data={"username": test_user.email, "password": "testpassword123"},
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(
+            settings.CRYPTO_RETRY_AFTER_SECONDS
+        )
+        assert "correlation_id" in response.json()
@@ -0,0 +1,40 @@
+"""Tests for the bounded image process pool."""
+
+import os
+
+import pytest
+from prometheus_client import REGISTRY
+
+from core.image_executor import pending_count, run_image_task
+from models.config import settings
+from models.exceptions import ImageBusyException
+
+
+class TestRunImageTask:
+    """Tests for run_image_task."""
+
+    def test_runs_in_another_process(self):
+        """Should run the function in a pool process and return its result."""
+        pid = run_image_task(os.getpid)
+
+        assert pid != os.getpid()
+        assert pending_count() == 0
+        assert (
+            REGISTRY.get_sample_value("background_queue_depth", {"queue": "image"}) == 0
+        )
+
+    def test_propagates_errors_and_frees_slot(self):
+        """An exception should reach the caller and release the slot."""
+        with pytest.raises(ValueError):
+            run_image_task(int, "not a number")
+
+        assert pending_count() == 0
+
+    def test_rejects_when_full(self, monkeypatch):
+        """Should refuse new jobs once IMAGE_MAX_PENDING are queued."""
+        monkeypatch.setattr(settings, "IMAGE_MAX_PENDING", 0)
+
+        with pytest.raises(ImageBusyException):
+            run_image_task(os.getpid)
+
+        assert pending_count() == 0
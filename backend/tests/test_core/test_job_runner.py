@@ -0,0 +1,232 @@
+"""Tests for the single-leader job runner and the scheduler job registry."""
+
+from datetime import datetime
+
+import pytest
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from core import scheduler as scheduler_module
+from core.job_runner import (
+    Job,
+    JobRunner,
+    RowLease,
+    _advisory_lock_key,
+)
+from models.config import settings
+from repositories.database import Base
+from repositories.db_models import JobRun, SchedulerLease
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Sessions on a file SQLite database shared by all 'workers'."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _runner(session_factory, worker: str) -> JobRunner:
+    """A runner for one simulated worker process."""
+    return JobRunner(session_factory, RowLease(session_factory, worker), worker)
+
+
+def _job(func, job_id: str = "test_job", leader_only: bool = True) -> Job:
+    """An hourly job running func."""
+    return Job(job_id, "Test Job", func, IntervalTrigger(hours=1), leader_only)
+
+
+class TestRowLease:
+    """Tests for RowLease."""
+
+    def test_single_holder(self, session_factory):
+        """Only the first worker should get the lease; it can renew it."""
+        lease_a = RowLease(session_factory, "host:1")
+        lease_b = RowLease(session_factory, "host:2")
+
+        assert lease_a.acquire() is True
+        assert lease_b.acquire() is False
+        assert lease_a.acquire() is True
+
+    def test_takeover_after_expiry(self, session_factory):
+        """Another worker should take over a lapsed lease."""
+        lease_a = RowLease(session_factory, "host:1")
+        lease_b = RowLease(session_factory, "host:2")
+        lease_a.acquire()
+        with session_factory() as db:
+            db.execute(
+                update(SchedulerLease).values(
+                    expires_at=datetime(2000, 1, 1),
+                )
+            )
+            db.commit()
+
+        assert lease_b.acquire() is True
+        assert lease_a.acquire() is False
+
+    def test_release(self, session_factory):
+        """A released lease should be free at once."""
+        lease_a = RowLease(session_factory, "host:1")
+        lease_b = RowLease(session_factory, "host:2")
+        lease_a.acquire()
+
+        lease_b.release()  # not the holder: no effect
+        assert lease_b.acquire() is False
+        lease_a.release()
+        assert lease_b.acquire() is True
+
+
+class TestAdvisoryLockKey:
+    """Tests for _advisory_lock_key."""
+
+    def test_stable_signed_64_bit(self):
+        """Keys should be stable per name and fit a PostgreSQL bigint."""
+        key = _advisory_lock_key("scheduler")
+
+        assert key == _advisory_lock_key("scheduler")
+        assert key != _advisory_lock_key("other")
+        assert -(2**63) <= key < 2**63
+
+
+class TestJobRunner:
+    """Tests for JobRunner."""
+
+    def test_leader_job_runs_once(self, session_factory):
+        """Of several workers, only the leader should run a leader job."""
+        calls = []
+        job = _job(lambda: calls.append(1))
+        runners = [_runner(session_factory, f"host:{pid}") for pid in (1, 2, 3)]
+
+        for runner in runners:
+            runner.run(job)
+
+        assert calls == [1]
+        assert [runner.is_leader for runner in runners] == [True, False, False]
+        with session_factory() as db:
+            runs = db.scalars(select(JobRun)).all()
+        assert len(runs) == 1
+        assert runs[0].worker == "host:1"
+        assert runs[0].status == "success"
+        assert runs[0].duration_ms >= 0
+
+    def test_per_worker_job_runs_everywhere(self, session_factory):
+        """Jobs that are not leader-only should run in every worker."""
+        calls = []
+        job = _job(lambda: calls.append(1), leader_only=False)
+
+        _runner(session_factory, "host:1").run(job)
+        _runner(session_factory, "host:2").run(job)
+
+        assert calls == [1, 1]
+        with session_factory() as db:
+            assert db.scalars(select(JobRun)).all() == []
+
+    def test_failure_is_recorded_not_raised(self, session_factory):
+        """A failing job should be logged and recorded as failed."""
+
+        def fail() -> None:
+            raise RuntimeError("disk full")
+
+        runner = _runner(session_factory, "host:1")
+
+        runner.run(_job(fail))
+
+        runs = runner.recent_runs(["test_job"])["test_job"]
+        assert runs[0]["status"] == "failed"
+        assert runs[0]["error"] == "RuntimeError: disk full"
+
+    def test_history_is_capped_and_newest_first(self, session_factory, monkeypatch):
+        """Only the latest JOB_RUN_HISTORY_LIMIT runs should be kept."""
+        monkeypatch.setattr(settings, "JOB_RUN_HISTORY_LIMIT", 3)
+        runner = _runner(session_factory, "host:1")
+        for _ in range(5):
+            runner.run(_job(lambda: None))
+        runner.run(_job(lambda: None, job_id="other_job"))
+
+        with session_factory() as db:
+            ids = db.scalars(select(JobRun.id).where(JobRun.job_id == "test_job")).all()
+        runs = runner.recent_runs(["test_job", "other_job", "never_ran"], limit=2)
+
+        assert sorted(ids) == [3, 4, 5]
+        assert len(runs["test_job"]) == 2
+        assert runs["test_job"][0]["started_at"] >= runs["test_job"][1]["started_at"]
+        assert len(runs["other_job"]) == 1
+        assert runs["never_ran"] == []
+
+    def test_shutdown_hands_over_leadership(self, session_factory):
+        """After the leader shuts down, another worker should lead."""
+        leader = _runner(session_factory, "host:1")
+        follower = _runner(session_factory, "host:2")
+        leader.heartbeat()
+        assert follower.heartbeat() is False
+
+        leader.shutdown()
+
+        assert follower.heartbeat() is True
+
+    def test_for_engine_uses_lease_row_on_sqlite(self, session_factory):
+        """SQLite databases should use the lease row."""
+        engine = session_factory.kw["bind"]
+
+        runner = JobRunner.for_engine(engine, session_factory)
+
+        assert isinstance(runner.lease, RowLease)
+
+
+class TestScheduler:
+    """Tests for the scheduler job registry and status."""
+
+    def test_registry_covers_maintenance_jobs(self):
+        """Every periodic job should be registered, leader-only but the flush."""
+        jobs = {job.id: job for job in scheduler_module.build_job_registry()}
+
+        assert set(jobs) == {
+            "retention_cleanup",
+            "vote_counts_sync",
+            "comment_like_counts_sync",
+            "tag_stats_sync",
+            "avatar_sweep",
+            "security_monitoring",
+            "penalty_expiry",
+            "trusted_device_cleanup",
+            "password_reset_cleanup",
+            "share_counts_flush",
+        }
+        assert [job_id for job_id, job in jobs.items() if not job.leader_only] == [
+            "share_counts_flush"
+        ]
+
+    def test_status_reports_leader_and_runs(self, session_factory, monkeypatch):
+        """Status should show leadership and recorded runs per job."""
+        monkeypatch.setattr(scheduler_module, "engine", session_factory.kw["bind"])
+        monkeypatch.setattr(scheduler_module, "SessionLocal", session_factory)
+        monkeypatch.setattr(scheduler_module, "share_counts_flush_job", lambda: None)
+
+        scheduler_module.setup_scheduler()
+        try:
+            runner = scheduler_module.runner
+            runner.run(
+                Job(
+                    "penalty_expiry",
+                    "Penalty Expiry",
+                    lambda: None,
+                    IntervalTrigger(hours=1),
+                )
+            )
+            status = scheduler_module.get_scheduler_status()
+        finally:
+            scheduler_module.shutdown_scheduler()
+
+        jobs = {job["id"]: job for job in status["jobs"]}
+        assert status["running"] is True
+        assert status["is_leader"] is True
+        assert "leader_heartbeat" in jobs
+        assert jobs["penalty_expiry"]["leader_only"] is True
+        assert jobs["penalty_expiry"]["recent_runs"][0]["status"] == "success"
+        assert jobs["share_counts_flush"]["recent_runs"] == []
+        assert scheduler_module.get_scheduler_status() == {
+            "running": False,
+            "jobs": [],
+        }
@@ -0,0 +1,206 @@
+"""Tests for Prometheus metrics collection."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from core import metrics
+from helpers.request_middleware import RequestContextMiddleware
+from repositories.database import InstrumentedQueuePool
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def _sample(name: str, **labels: str) -> float:
+    """Read a sample from the default registry (0 when absent)."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def instrumented_engine(tmp_path):
+    """File SQLite engine with metrics hooks and a timed pool."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'metrics.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=InstrumentedQueuePool,
+    )
+    metrics.instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestRequestMetrics:
+    """Tests for per-request latency and DB metrics."""
+
+    def test_route_template_and_db_queries(self, instrumented_engine) -> None:
+        """Requests should be labelled by route template with their query count."""
+        app = FastAPI()
+        app.add_middleware(RequestContextMiddleware)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: int) -> dict:
+            with instrumented_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            return {"id": item_id}
+
+        labels = {"route": "/items/{item_id}"}
+        requests_before = _sample(
+            "http_request_duration_seconds_count",
+            method="GET",
+            status="2xx",
+            **labels,
+        )
+        queries_before = _sample("db_queries_per_request_sum", **labels)
+
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+
+        assert (
+            _sample(
+                "http_request_duration_seconds_count",
+                method="GET",
+                status="2xx",
+                **labels,
+            )
+            == requests_before + 2
+        )
+        assert _sample("db_queries_per_request_sum", **labels) == queries_before + 4
+
+    def test_unmatched_route(self) -> None:
+        """Unknown paths should share one label instead of one per path."""
+        app = FastAPI()
+        app.add_middleware(RequestContextMiddleware)
+        before = _sample(
+            "http_request_duration_seconds_count",
+            method="GET",
+            route=metrics.UNMATCHED_ROUTE,
+            status="4xx",
+        )
+
+        TestClient(app).get("/no/such/path")
+
+        assert (
+            _sample(
+                "http_request_duration_seconds_count",
+                method="GET",
+                route=metrics.UNMATCHED_ROUTE,
+                status="4xx",
+            )
+            == before + 1
+        )
+
+    def test_queries_outside_requests_ignored(self, instrumented_engine) -> None:
+        """Queries from background jobs should not fail or be attributed."""
+        with instrumented_engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+
+    def test_failed_statement(self, instrumented_engine) -> None:
+        """A failing statement should not leave its start time behind."""
+        with instrumented_engine.connect() as conn:
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            assert not conn.info.get("metrics_query_start")
+
+
+class TestPoolMetrics:
+    """Tests for connection pool metrics."""
+
+    def test_checkout_time_and_checked_out(self, instrumented_engine) -> None:
+        """Checkouts should be timed and counted while held."""
+        checkouts_before = _sample("db_pool_checkout_seconds_count")
+        held_before = _sample("db_pool_checked_out_connections")
+
+        with instrumented_engine.connect():
+            assert _sample("db_pool_checked_out_connections") == held_before + 1
+
+        assert _sample("db_pool_checked_out_connections") == held_before
+        assert _sample("db_pool_checkout_seconds_count") == checkouts_before + 1
+
+
+class TestCacheAndQueueMetrics:
+    """Tests for cache, queue and search metrics."""
+
+    def test_record_cache(self) -> None:
+        """Hits and misses should be counted separately."""
+        hits = _sample("cache_requests_total", cache="test_cache", result="hit")
+        misses = _sample("cache_requests_total", cache="test_cache", result="miss")
+
+        metrics.record_cache("test_cache", True)
+        metrics.record_cache("test_cache", True)
+        metrics.record_cache("test_cache", False)
+
+        assert (
+            _sample("cache_requests_total", cache="test_cache", result="hit")
+            == hits + 2
+        )
+        assert (
+            _sample("cache_requests_total", cache="test_cache", result="miss")
+            == misses + 1
+        )
+
+    def test_set_queue_depth(self) -> None:
+        """Queue depth should report the latest value."""
+        metrics.set_queue_depth("test_queue", 7)
+
+        assert _sample("background_queue_depth", queue="test_queue") == 7
+
+    def test_search_timer(self) -> None:
+        """Decorated search calls should be observed."""
+        before = _sample("search_duration_seconds_count", operation="test_search")
+
+        @metrics.search_timer("test_search")
+        def search() -> list:
+            return []
+
+        search()
+        search()
+
+        assert (
+            _sample("search_duration_seconds_count", operation="test_search")
+            == before + 2
+        )
+
+
+class TestMultiprocess:
+    """Tests for aggregation across gunicorn workers."""
+
+    def test_render_aggregates_workers(self, tmp_path) -> None:
+        """Samples written by separate processes should be summed."""
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        worker = (
+            "from core import metrics\n"
+            "metrics.record_cache('shared', True)\n"
+            "metrics.set_queue_depth('shared', 2)\n"
+        )
+        for _ in range(3):
+            subprocess.run(
+                [sys.executable, "-c", worker], cwd=BACKEND_DIR, env=env, check=True
+            )
+
+        scrape = (
+            "from core import metrics\n"
+            "body, content_type = metrics.render_metrics()\n"
+            "print(body.decode())\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", scrape],
+            cwd=BACKEND_DIR,
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        assert 'cache_requests_total{cache="shared",result="hit"} 3.0' in output
+        # Workers still alive (not marked dead): their live gauges add up
+        assert 'background_queue_depth{queue="shared"} 6.0' in output
@@ -0,0 +1,208 @@
+"""Tests for SQL statement tracking and N+1 detection."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from core.query_tracking import (
+    QueryTracker,
+    RepeatedQueryError,
+    count_queries,
+    fingerprint,
+    track_engine,
+)
+from helpers.request_middleware import RequestContextMiddleware
+from models.config import settings
+
+
+@pytest.fixture
+def tracked_engine():
+    """In-memory engine with per-request tracking attached."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    track_engine(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    yield engine
+    engine.dispose()
+
+
+def _make_app(engine) -> FastAPI:
+    """App with one N+1 endpoint and one batched endpoint."""
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/n-plus-one")
+    def n_plus_one() -> list:
+        with engine.connect() as conn:
+            ids = [row[0] for row in conn.execute(text("SELECT id FROM items"))]
+            return [
+                conn.execute(
+                    text("SELECT name FROM items WHERE id = :id"), {"id": item_id}
+                ).scalar()
+                for item_id in ids
+            ]
+
+    @app.get("/batched")
+    def batched() -> list:
+        with engine.connect() as conn:
+            return list(conn.execute(text("SELECT name FROM items")).scalars())
+
+    return app
+
+
+@pytest.fixture
+def warnings_log():
+    """Capture warning log lines."""
+    lines: list[str] = []
+    handler_id = logger.add(lambda message: lines.append(str(message)), level="WARNING")
+    yield lines
+    logger.remove(handler_id)
+
+
+class TestFingerprint:
+    """Tests for statement normalization."""
+
+    def test_parameters_collapse(self) -> None:
+        """Lookups differing only by parameters should share a fingerprint."""
+        assert fingerprint("SELECT * FROM ideas WHERE id = ?") == fingerprint(
+            "SELECT  *\n FROM ideas WHERE id = ?"
+        )
+        assert fingerprint("SELECT * FROM ideas WHERE id = %(id_1)s") == fingerprint(
+            "SELECT * FROM ideas WHERE id = %(id_2)s"
+        )
+
+    def test_literals_collapse(self) -> None:
+        """Inlined numbers and strings should be replaced."""
+        assert (
+            fingerprint("SELECT * FROM tags WHERE name = 'a' LIMIT 5")
+            == "SELECT * FROM tags WHERE name = ? LIMIT ?"
+        )
+
+    def test_in_lists_collapse(self) -> None:
+        """IN lists of any length should share a fingerprint."""
+        assert fingerprint("SELECT * FROM ideas WHERE id IN (?, ?)") == fingerprint(
+            "SELECT * FROM ideas WHERE id IN (?, ?, ?, ?)"
+        )
+
+    def test_identifiers_kept(self) -> None:
+        """Digits inside identifiers should not be replaced."""
+        assert "anon_1" in fingerprint("SELECT anon_1.id FROM (SELECT 1) AS anon_1")
+
+
+class TestQueryTracker:
+    """Tests for QueryTracker."""
+
+    def test_repeated(self) -> None:
+        """Only fingerprints at or above the threshold should be reported."""
+        tracker = QueryTracker()
+        for item_id in range(4):
+            tracker.record(f"SELECT * FROM tags WHERE id = {item_id}")
+        tracker.record("SELECT * FROM ideas")
+
+        assert tracker.count == 5
+        assert tracker.repeated(3) == [("SELECT * FROM tags WHERE id = ?", 4)]
+        assert tracker.repeated(5) == []
+
+    def test_raise_at(self) -> None:
+        """The statement reaching raise_at should raise."""
+        tracker = QueryTracker(raise_at=2)
+        tracker.record("SELECT 1")
+
+        with pytest.raises(RepeatedQueryError):
+            tracker.record("SELECT 2")
+
+
+class TestRequestTracking:
+    """Tests for per-request N+1 detection."""
+
+    def test_off_by_default(self, tracked_engine, warnings_log) -> None:
+        """Nothing should be logged when QUERY_REPEAT_ACTION is off."""
+        TestClient(_make_app(tracked_engine)).get("/n-plus-one")
+
+        assert not any("N+1" in line for line in warnings_log)
+
+    def test_log(self, tracked_engine, warnings_log, monkeypatch) -> None:
+        """Repeated statements should be logged with the route."""
+        monkeypatch.setattr(settings, "QUERY_REPEAT_ACTION", "log")
+        monkeypatch.setattr(settings, "QUERY_REPEAT_THRESHOLD", 3)
+
+        response = TestClient(_make_app(tracked_engine)).get("/n-plus-one")
+
+        assert response.status_code == 200
+        lines = [line for line in warnings_log if "Possible N+1" in line]
+        assert len(lines) == 1
+        assert "GET /n-plus-one: 3x SELECT name FROM items WHERE id = ?" in lines[0]
+
+    def test_log_batched_clean(self, tracked_engine, warnings_log, monkeypatch) -> None:
+        """A single batched query should not be flagged."""
+        monkeypatch.setattr(settings, "QUERY_REPEAT_ACTION", "log")
+        monkeypatch.setattr(settings, "QUERY_REPEAT_THRESHOLD", 3)
+
+        TestClient(_make_app(tracked_engine)).get("/batched")
+
+        assert not any("Possible N+1" in line for line in warnings_log)
+
+    def test_raise(self, tracked_engine, monkeypatch) -> None:
+        """In raise mode the offending request should fail."""
+        monkeypatch.setattr(settings, "QUERY_REPEAT_ACTION", "raise")
+        monkeypatch.setattr(settings, "QUERY_REPEAT_THRESHOLD", 3)
+        client = TestClient(_make_app(tracked_engine))
+
+        with pytest.raises(RepeatedQueryError):
+            client.get("/n-plus-one")
+
+    def test_raise_only_logs_in_production(
+        self, tracked_engine, warnings_log, monkeypatch
+    ) -> None:
+        """Production should never fail requests over repeated queries."""
+        monkeypatch.setattr(settings, "QUERY_REPEAT_ACTION", "raise")
+        monkeypatch.setattr(settings, "QUERY_REPEAT_THRESHOLD", 3)
+        monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+
+        response = TestClient(_make_app(tracked_engine)).get("/n-plus-one")
+
+        assert response.status_code == 200
+        assert any("Possible N+1" in line for line in warnings_log)
+
+
+class TestCountQueries:
+    """Tests for count_queries and the query budget helpers."""
+
+    def test_counts_statements_in_block(self, tracked_engine) -> None:
+        """Statements inside the block should be counted, others not."""
+        with tracked_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with count_queries(tracked_engine) as queries:
+                conn.execute(text("SELECT 2"))
+                conn.execute(text("SELECT 3"))
+            conn.execute(text("SELECT 4"))
+
+        assert queries.count == 2
+
+    def test_counts_requests_from_test_client(self, tracked_engine) -> None:
+        """Statements run by the app's thread should be included."""
+        client = TestClient(_make_app(tracked_engine))
+
+        with count_queries(tracked_engine) as queries:
+            client.get("/n-plus-one")
+
+        assert queries.count == 4
+        assert queries.repeated(3)
+
+    def test_query_counter_fixture(self, db_session, query_counter) -> None:
+        """The fixture should count statements on the test database."""
+        with query_counter() as queries:
+            db_session.execute(text("SELECT 1"))
+
+        assert queries.count == 1
+
+    @pytest.mark.query_budget(1)
+    def test_query_budget_marker(self, db_session) -> None:
+        """A test within its budget should pass."""
+        db_session.execute(text("SELECT 1"))
@@ -0,0 +1,143 @@
+"""Tests for the local Pwned Passwords store."""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from helpers.pwned_passwords import (
+    PwnedPasswordStore,
+    import_pwned_dump,
+    sha1_hex,
+)
+from models.config import settings
+from services.password_reset_service import PasswordResetService
+
+BREACHED = {"password123": 250_000, "Tr0ub4dor&3": 12, "rare-one": 1}
+
+
+def _fixture_dump() -> list[str]:
+    """A small dump: the breached passwords plus filler hashes, sorted."""
+    lines = [f"{sha1_hex(pw)}:{count}" for pw, count in BREACHED.items()]
+    lines += [
+        f"{hashlib.sha1(str(i).encode()).hexdigest().upper()}:{i + 1}"
+        for i in range(200)
+    ]
+    return sorted(lines)
+
+
+@pytest.fixture
+def store_path(tmp_path) -> str:
+    """Store file imported from the fixture dump."""
+    path = str(tmp_path / "pwned.db")
+    import_pwned_dump(_fixture_dump(), path, batch_size=50)
+    return path
+
+
+class TestImportPwnedDump:
+    """Tests for import_pwned_dump."""
+
+    def test_counts_lines(self, tmp_path):
+        """Valid, below-minimum and malformed lines should be counted."""
+        lines = _fixture_dump() + ["not a hash", "ABC:12\n", ""]
+
+        counts = import_pwned_dump(lines, str(tmp_path / "pwned.db"), min_count=2)
+
+        assert counts == {"imported": 201, "skipped": 2, "invalid": 3}
+
+    def test_replaces_previous_store(self, store_path):
+        """A new import should replace the old store entirely."""
+        import_pwned_dump([f"{sha1_hex('only-this')}:7"], store_path)
+        store = PwnedPasswordStore(store_path)
+
+        assert store.lookup(sha1_hex("only-this")) == 7
+        assert store.lookup(sha1_hex("password123")) == 0
+
+    def test_failed_import_keeps_previous_store(self, store_path):
+        """An error mid-import should leave the old store in place."""
+
+        def broken_dump():
+            yield f"{sha1_hex('new')}:1"
+            raise OSError("download truncated")
+
+        with pytest.raises(OSError):
+            import_pwned_dump(broken_dump(), store_path)
+
+        assert PwnedPasswordStore(store_path).lookup(sha1_hex("rare-one")) == 1
+
+
+class TestPwnedPasswordStore:
+    """Tests for PwnedPasswordStore lookups."""
+
+    def test_lookup_counts(self, store_path):
+        """Breached hashes should return their count, others 0."""
+        store = PwnedPasswordStore(store_path)
+
+        for password, count in BREACHED.items():
+            assert store.lookup(sha1_hex(password)) == count
+        assert store.lookup(sha1_hex("never-breached-passphrase")) == 0
+
+    def test_repeated_lookups_served_from_lru(self, store_path):
+        """A repeated hash should not query the file again."""
+        store = PwnedPasswordStore(store_path, cache_size=8)
+
+        store.lookup(sha1_hex("password123"))
+        store.lookup(sha1_hex("password123"))
+
+        info = store.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_missing_store_returns_none(self, tmp_path):
+        """Without an imported file the store should be unavailable."""
+        store = PwnedPasswordStore(str(tmp_path / "missing.db"))
+
+        assert not store.available
+        assert store.lookup(sha1_hex("password123")) is None
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_unreadable_store_returns_none(self, tmp_path):
+        """A corrupt file should be logged and treated as unavailable."""
+        path = tmp_path / "corrupt.db"
+        path.write_bytes(b"not a database" * 100)
+
+        assert PwnedPasswordStore(str(path)).lookup(sha1_hex("x")) is None
+
+
+class TestCheckPasswordPwned:
+    """Tests for PasswordResetService.check_password_pwned."""
+
+    def test_served_locally(self, store_path, monkeypatch):
+        """With a store imported, the HIBP API should never be called."""
+        monkeypatch.setattr(settings, "PWNED_PASSWORDS_DB_PATH", store_path)
+
+        with patch("services.password_reset_service.httpx.get") as mock_get:
+            assert PasswordResetService.check_password_pwned("password123") == 250_000
+            assert PasswordResetService.check_password_pwned("unseen-Pa55!") == 0
+
+        mock_get.assert_not_called()
+
+    def test_remote_fallback_without_store(self, tmp_path, monkeypatch):
+        """Without a store, the HIBP range API should be queried by prefix."""
+        monkeypatch.setattr(
+            settings, "PWNED_PASSWORDS_DB_PATH", str(tmp_path / "missing.db")
+        )
+        sha1_hash = sha1_hex("password123")
+
+        with patch("services.password_reset_service.httpx.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.text = f"{sha1_hash[5:]}:42\r\nABC:1"
+            assert PasswordResetService.check_password_pwned("password123") == 42
+
+        assert mock_get.call_args.args[0].endswith(f"/range/{sha1_hash[:5]}")
+
+    def test_fallback_disabled(self, tmp_path, monkeypatch):
+        """With the fallback off and no store, the check should be skipped."""
+        monkeypatch.setattr(
+            settings, "PWNED_PASSWORDS_DB_PATH", str(tmp_path / "missing.db")
+        )
+        monkeypatch.setattr(settings, "PWNED_PASSWORDS_REMOTE_FALLBACK", False)
+
+        with patch("services.password_reset_service.httpx.get") as mock_get:
+            assert PasswordResetService.check_password_pwned("password123") is None
+
+        mock_get.assert_not_called()
@@ -0,0 +1,138 @@
+"""
+Unit tests for lean JSON serialization helpers.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+import models.schemas as schemas
+from helpers.serialization import dump_json, lean_json_response
+from models.config import settings
+from repositories.db_models import IdeaStatus, VoteType
+
+
+def _idea_row(**overrides) -> schemas.IdeaWithScoreRow:
+    """Build an IdeaWithScore-shaped row."""
+    row: schemas.IdeaWithScoreRow = {
+        "id": 1,
+        "title": "Bike lanes",
+        "description": "More bike lanes downtown",
+        "category_id": 2,
+        "user_id": 3,
+        "status": IdeaStatus.APPROVED,
+        "admin_comment": None,
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "validated_at": None,
+        "author_username": "alice",
+        "author_display_name": "Alice",
+        "category_name_en": "Transport",
+        "category_name_fr": "Transport FR",
+        "upvotes": 5,
+        "downvotes": 1,
+        "score": 4,
+        "user_vote": VoteType.UPVOTE,
+        "comment_count": 2,
+        "tags": [
+            {
+                "display_name": "Bikes",
+                "id": 7,
+                "name": "bikes",
+                "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            }
+        ],
+        "quality_counts": {
+            "counts": [{"quality_id": 1, "quality_key": "urgent", "count": 2}],
+            "total_votes_with_qualities": 2,
+        },
+        "language": "en",
+        "edit_count": 0,
+        "last_edit_at": None,
+        "previous_status": None,
+    }
+    row.update(overrides)  # type: ignore[typeddict-item]
+    return row
+
+
+class TestDumpJson:
+    """Tests for dump_json."""
+
+    def test_rows_match_model_serialization(self):
+        """Rows should serialize exactly like the validated models."""
+        rows = [_idea_row(), _idea_row(id=2, quality_counts=None, tags=[])]
+        models = [schemas.IdeaWithScore.model_validate(row) for row in rows]
+
+        lean = dump_json(rows, List[schemas.IdeaWithScoreRow])
+        full = schemas.IdeaWithScore.model_validate(rows[0]).model_dump_json()
+
+        assert json.loads(lean)[0] == json.loads(full)
+        assert (
+            lean
+            == b"[" + b",".join(m.model_dump_json().encode() for m in models) + b"]"
+        )
+
+    def test_comment_rows_match_model_serialization(self):
+        """Comment rows should serialize exactly like Comment models."""
+        row: schemas.CommentRow = {
+            "content": "Great idea",
+            "id": 1,
+            "idea_id": 2,
+            "user_id": 3,
+            "is_moderated": False,
+            "created_at": datetime(2025, 1, 2, tzinfo=timezone.utc),
+            "author_username": "bob",
+            "author_display_name": "Bob",
+            "is_deleted": None,
+            "deletion_reason": None,
+            "is_hidden": None,
+            "like_count": 3,
+            "user_has_liked": None,
+            "language": "fr",
+        }
+
+        lean = dump_json([row], List[schemas.CommentRow])
+
+        assert lean == b"[" + schemas.Comment(**row).model_dump_json().encode() + b"]"
+
+    def test_drift_detected_outside_production(self):
+        """Rows that no longer match the response model should fail."""
+        row = _idea_row()
+        del row["author_username"]  # type: ignore[misc]
+
+        with pytest.raises(ValidationError):
+            dump_json(
+                [row], List[schemas.IdeaWithScoreRow], List[schemas.IdeaWithScore]
+            )
+
+    def test_validation_skipped_in_production(self, monkeypatch):
+        """Production should not pay for response validation."""
+        monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+        row = _idea_row()
+        row["score"] = "not a number"  # type: ignore[typeddict-item]
+
+        with pytest.warns(UserWarning):
+            body = dump_json(
+                [row], List[schemas.IdeaWithScoreRow], List[schemas.IdeaWithScore]
+            )
+
+        assert json.loads(body)[0]["score"] == "not a number"
+
+
+class TestLeanJsonResponse:
+    """Tests for lean_json_response."""
+
+    def test_response(self):
+        """Should return a JSON response with the serialized body."""
+        response = lean_json_response(
+            [_idea_row()],
+            List[schemas.IdeaWithScoreRow],
+            List[schemas.IdeaWithScore],
+            headers={"X-Test": "1"},
+        )
+
+        assert response.media_type == "application/json"
+        assert response.headers["X-Test"] == "1"
+        assert json.loads(response.body)[0]["author_username"] == "alice"
@@ -0,0 +1,26 @@
+"""Tests for UploadStaticFiles (cache headers of uploaded files)."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from helpers.http_cache import IMMUTABLE_CACHE_CONTROL, UploadStaticFiles
+
+
+def test_avatar_variants_are_immutable(tmp_path):
+    """Content-addressed variants should be cacheable forever, others not."""
+    digest = "ef" + "2" * 62
+    variant = tmp_path / "avatars" / "ef" / digest / "32.webp"
+    variant.parent.mkdir(parents=True)
+    variant.write_bytes(b"webp")
+    (tmp_path / "avatars" / "legacy.jpg").write_bytes(b"jpeg")
+    app = FastAPI()
+    app.mount("/data/uploads", UploadStaticFiles(directory=tmp_path), name="uploads")
+    client = TestClient(app)
+
+    hashed = client.get(f"/data/uploads/avatars/ef/{digest}/32.webp")
+    legacy = client.get("/data/uploads/avatars/legacy.jpg")
+
+    assert hashed.status_code == 200
+    assert hashed.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert legacy.status_code == 200
+    assert "cache-control" not in legacy.headers
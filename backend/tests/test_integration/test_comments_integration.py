@@ -9,11 +9,13 @@ Tests the complete comment flow:
 5. Comment sorting
 """
 
+import pytest
 from fastapi.testclient import TestClient
 
 import repositories.db_models as db_models
 
 
+@pytest.mark.query_budget(9)
 def test_create_comment(
     client: TestClient, test_idea: db_models.Idea, auth_headers: dict
 ):
@@ -55,6 +57,7 @@ def test_create_comment_nonexistent_idea(client: TestClient, auth_headers: dict)
     assert response.status_code == 404
 
 
+@pytest.mark.query_budget(3)
 def test_get_comments_for_idea(
     client: TestClient, test_idea: db_models.Idea, test_comment: db_models.Comment
 ):
@@ -68,6 +71,41 @@ def test_get_comments_for_idea(
     assert test_comment.id in comment_ids
 
 
+@pytest.fixture
+def idea_with_comments(
+    db_session, test_idea: db_models.Idea, test_user, other_user
+) -> db_models.Idea:
+    """An idea commented by several users, with likes on the comments."""
+    comments = [
+        db_models.Comment(
+            idea_id=test_idea.id,
+            user_id=(test_user if i % 2 else other_user).id,
+            content=f"Comment {i}",
+        )
+        for i in range(6)
+    ]
+    db_session.add_all(comments)
+    db_session.flush()
+    db_session.add_all(
+        db_models.CommentLike(comment_id=comment.id, user_id=test_user.id)
+        for comment in comments
+    )
+    db_session.commit()
+    return test_idea
+
+
+@pytest.mark.query_budget(5)
+def test_get_comments_has_no_per_comment_queries(
+    client: TestClient, idea_with_comments: db_models.Idea, auth_headers: dict
+):
+    """Listing comments should cost the same for any number of comments."""
+    response = client.get(
+        f"/api/comments/{idea_with_comments.id}", headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 6
+
+
 def test_get_comments_with_pagination(client: TestClient, test_idea: db_models.Idea):
     """Test getting comments with pagination."""
     response = client.get(f"/api/comments/{test_idea.id}?skip=0&limit=10")
@@ -10,6 +10,7 @@ Tests the complete tag flow:
 6. Get popular tags
 """
 
+import pytest
 from fastapi.testclient import TestClient
 
 import repositories.db_models as db_models
@@ -23,6 +24,7 @@ def test_get_all_tags(client: TestClient, test_tag: db_models.Tag):
     assert isinstance(data, list)
 
 
+@pytest.mark.query_budget(1)
 def test_search_tags(client: TestClient, test_tag: db_models.Tag):
     """Test searching tags by name."""
     response = client.get(f"/api/tags/search?q={test_tag.name[:4]}")
@@ -69,6 +71,7 @@ def test_get_tag_by_name_nonexistent(client: TestClient):
     assert response.status_code == 404
 
 
+@pytest.mark.query_budget(1)
 def test_get_popular_tags(client: TestClient):
     """Test getting popular tags."""
     response = client.get("/api/tags/popular?limit=20")
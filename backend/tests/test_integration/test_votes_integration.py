@@ -34,6 +34,7 @@ def other_user_idea(
     return idea
 
 
+@pytest.mark.query_budget(9)
 def test_vote_upvote(
     client: TestClient, other_user_idea: db_models.Idea, auth_headers: dict
 ):
@@ -84,6 +85,7 @@ def test_vote_nonexistent_idea(client: TestClient, auth_headers: dict):
     assert response.status_code == 404
 
 
+@pytest.mark.query_budget(19)
 def test_toggle_vote(
     client: TestClient, other_user_idea: db_models.Idea, auth_headers: dict
 ):
@@ -105,6 +107,7 @@ def test_toggle_vote(
     assert data["vote_type"] == "downvote"
 
 
+@pytest.mark.query_budget(15)
 def test_remove_vote(
     client: TestClient, other_user_idea: db_models.Idea, auth_headers: dict
 ):
@@ -123,6 +126,7 @@ def test_remove_vote(
     assert data["message"] == "Vote removed successfully"
 
 
+@pytest.mark.query_budget(14)
 def test_get_my_vote(
     client: TestClient, other_user_idea: db_models.Idea, auth_headers: dict
 ):
@@ -153,6 +157,7 @@ def test_get_my_vote_no_vote(
     assert response.json() is None
 
 
+@pytest.mark.query_budget(16)
 def test_vote_with_qualities(
     client: TestClient,
     other_user_idea: db_models.Idea,
@@ -197,6 +202,7 @@ def test_get_vote_qualities(
     assert isinstance(data, list)
 
 
+@pytest.mark.query_budget(23)
 def test_update_vote_qualities(
     client: TestClient,
     other_user_idea: db_models.Idea,
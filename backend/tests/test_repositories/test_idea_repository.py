@@ -2,6 +2,8 @@
 
 from datetime import datetime, timezone
 
+from sqlalchemy import event
+
 import repositories.db_models as db_models
 from repositories.idea_repository import IdeaRepository
 
@@ -294,3 +296,53 @@ class TestIdeaRepositoryCommentCount:
         # Should only count the visible comment
         assert len(results) == 1
         assert results[0].comment_count == 1
+
+
+class TestIdeaScoreHydration:
+    """Scores restricted to the requested ideas."""
+
+    def test_by_ids_scores_and_order(
+        self, db_session, test_user, test_idea, create_votes
+    ):
+        """Scores are per idea and the requested order is preserved."""
+        other = db_models.Idea(
+            title="Second idea",
+            description="Second approved idea for score hydration tests.",
+            category_id=test_idea.category_id,
+            user_id=test_user.id,
+            status=db_models.IdeaStatus.APPROVED,
+        )
+        db_session.add(other)
+        db_session.commit()
+        create_votes(test_idea.id, upvotes=2, downvotes=1)
+
+        repo = IdeaRepository(db_session)
+        results = repo.get_ideas_by_ids_with_scores([other.id, test_idea.id])
+
+        assert [r.id for r in results] == [other.id, test_idea.id]
+        assert (results[0].upvotes, results[0].score) == (0, 0)
+        assert (results[1].upvotes, results[1].downvotes) == (2, 1)
+        assert results[1].score == 1
+
+    def test_hydrate_reuses_loaded_idea(self, db_session, test_idea, create_votes):
+        """Hydration reads aggregates without selecting the idea again."""
+        voters = create_votes(test_idea.id, upvotes=1)
+        db_session.refresh(test_idea)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = IdeaRepository(db_session).hydrate_idea_with_score(
+                test_idea, current_user_id=voters[0].id
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result.id == test_idea.id
+        assert result.upvotes == 1
+        assert result.user_vote == db_models.VoteType.UPVOTE
+        assert not any("ideas.title" in sql for sql in statements)
@@ -436,3 +436,47 @@ class TestPasswordResetRepository:
         repo.increment_reset_token_attempts(token.id)
         db_session.refresh(token)
         assert token.reset_token_attempts == 1
+
+    def test_create_token_stores_code_index(self, db_session, test_user):
+        """Create token stores the keyed lookup index of the code."""
+        repo = PasswordResetRepository(db_session)
+        token, plain_code = repo.create_token(user_id=test_user.id)
+
+        assert token.code_index == PasswordResetRepository.code_index(
+            test_user.id, plain_code
+        )
+        assert token.code_index != PasswordResetRepository.code_index(
+            test_user.id + 1, plain_code
+        )
+
+    def test_get_valid_code_checks_one_hash(self, db_session, test_user, monkeypatch):
+        """Only the token matching the code index is bcrypt-checked."""
+        repo = PasswordResetRepository(db_session)
+        codes = [repo.create_token(user_id=test_user.id) for _ in range(3)]
+        db_session.commit()
+        checked = []
+        verify = PasswordResetRepository.verify_code_hash
+
+        def counting_verify(code, code_hash):
+            checked.append(code_hash)
+            return verify(code, code_hash)
+
+        monkeypatch.setattr(
+            PasswordResetRepository, "verify_code_hash", staticmethod(counting_verify)
+        )
+        token, plain_code = codes[1]
+
+        assert repo.get_valid_code(test_user.id, plain_code).id == token.id
+        assert checked == [token.code_hash]
+
+    def test_get_valid_code_without_code_index(self, db_session, test_user):
+        """Tokens created before code_index existed are still verified."""
+        repo = PasswordResetRepository(db_session)
+        token, plain_code = repo.create_token(user_id=test_user.id)
+        token.code_index = None
+        db_session.commit()
+
+        result = repo.get_valid_code(test_user.id, plain_code)
+
+        assert result is not None
+        assert result.id == token.id
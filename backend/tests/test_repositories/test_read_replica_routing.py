@@ -0,0 +1,246 @@
+"""Tests for read-replica routing.
+
+Primary and replica are the same SQLite file behind two URLs; the replica
+URL opens it read-only, so any write routed to it would fail.
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+import repositories.database as database
+import repositories.db_models as db_models
+from helpers.read_your_writes import READ_YOUR_WRITES_COOKIE, ReadYourWritesMiddleware
+from models.config import Settings
+from repositories.database import (
+    Base,
+    ReplicaSet,
+    RoutingSession,
+    create_sqlite_engine,
+    force_primary_reads,
+    reset_primary_reads,
+)
+
+
+class _StatementCounter:
+    """Count statements executed on an engine."""
+
+    def __init__(self, engine: Engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+@pytest.fixture
+def replica_setup(tmp_path: Path, monkeypatch):
+    """Primary engine, read-only replica engine and a session factory."""
+    path = tmp_path / "routing.db"
+    primary = create_sqlite_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=primary)
+    replica = create_sqlite_engine(f"sqlite:///file:{path}?mode=ro&uri=true")
+    replica_set = ReplicaSet(
+        [replica], max_lag_seconds=5.0, check_interval_seconds=60.0
+    )
+    monkeypatch.setattr(database, "replicas", replica_set)
+    make_session = sessionmaker(
+        class_=RoutingSession, autocommit=False, autoflush=False, bind=primary
+    )
+    yield primary, replica, replica_set, make_session
+    primary.dispose()
+    replica.dispose()
+
+
+def _read_session(make_session):
+    session = make_session()
+    session.info["read_only"] = True
+    return session
+
+
+def _add_category(session) -> None:
+    session.add(
+        db_models.Category(
+            name_en="Parks", name_fr="Parcs", description_en="", description_fr=""
+        )
+    )
+
+
+class TestRoutingSession:
+    """Statement routing between primary and replica."""
+
+    def test_read_only_session_reads_from_replica(self, replica_setup):
+        """SELECTs from a read-only session should hit the replica."""
+        primary, replica, _, make_session = replica_setup
+        primary_count = _StatementCounter(primary)
+        replica_count = _StatementCounter(replica)
+
+        session = _read_session(make_session)
+        try:
+            session.execute(select(db_models.Category)).all()
+        finally:
+            session.close()
+
+        assert replica_count.count > 0
+        assert primary_count.count == 0
+
+    def test_session_keeps_one_replica(self, replica_setup, tmp_path, monkeypatch):
+        """Every read of a session should go to the replica chosen first."""
+        _, replica, _, make_session = replica_setup
+        other = create_sqlite_engine(
+            f"sqlite:///file:{tmp_path / 'routing.db'}?mode=ro&uri=true"
+        )
+        monkeypatch.setattr(
+            database,
+            "replicas",
+            ReplicaSet(
+                [replica, other], max_lag_seconds=5.0, check_interval_seconds=60.0
+            ),
+        )
+        replica_count = _StatementCounter(replica)
+        other_count = _StatementCounter(other)
+
+        session = _read_session(make_session)
+        try:
+            for _ in range(4):
+                session.execute(select(db_models.Category)).all()
+        finally:
+            session.close()
+            other.dispose()
+
+        # The chosen replica also ran its health check
+        assert sorted([replica_count.count, other_count.count]) == [0, 5]
+
+    def test_default_session_uses_primary(self, replica_setup):
+        """Sessions not flagged read-only should never touch replicas."""
+        _, replica, _, make_session = replica_setup
+        replica_count = _StatementCounter(replica)
+
+        session = make_session()
+        try:
+            session.execute(select(db_models.Category)).all()
+        finally:
+            session.close()
+
+        assert replica_count.count == 0
+
+    def test_writes_go_to_primary_and_pin_session(self, replica_setup):
+        """A flush should use the primary and later reads should stay there."""
+        _, replica, _, make_session = replica_setup
+        session = _read_session(make_session)
+        try:
+            _add_category(session)
+            session.commit()
+
+            replica_count = _StatementCounter(replica)
+            assert session.execute(select(db_models.Category)).scalars().all()
+            assert replica_count.count == 0
+        finally:
+            session.close()
+
+    def test_force_primary_reads(self, replica_setup):
+        """Read-your-writes context should bypass replicas."""
+        _, replica, _, make_session = replica_setup
+        replica_count = _StatementCounter(replica)
+
+        token = force_primary_reads()
+        session = _read_session(make_session)
+        try:
+            session.execute(select(db_models.Category)).all()
+        finally:
+            session.close()
+            reset_primary_reads(token)
+
+        assert replica_count.count == 0
+
+    @pytest.mark.parametrize("lag", [30.0, None])
+    def test_lagging_or_down_replica_falls_back(self, replica_setup, monkeypatch, lag):
+        """Replicas that lag too much or are unreachable should be skipped."""
+        primary, replica, replica_set, make_session = replica_setup
+        monkeypatch.setattr(ReplicaSet, "measure_lag", staticmethod(lambda e: lag))
+        primary_count = _StatementCounter(primary)
+        replica_count = _StatementCounter(replica)
+
+        session = _read_session(make_session)
+        try:
+            session.execute(select(db_models.Category)).all()
+        finally:
+            session.close()
+
+        assert replica_set.choose() is None
+        assert replica_count.count == 0
+        assert primary_count.count > 0
+
+
+class TestReplicaSet:
+    """Replica health checks."""
+
+    def test_lag_is_cached_per_interval(self, replica_setup, monkeypatch):
+        """Lag should only be measured once per check interval."""
+        _, _, replica_set, _ = replica_setup
+        calls = []
+
+        def measure(engine):
+            calls.append(engine)
+            return 0.0
+
+        monkeypatch.setattr(ReplicaSet, "measure_lag", staticmethod(measure))
+
+        for _ in range(5):
+            assert replica_set.choose() is not None
+
+        assert len(calls) == 1
+
+    def test_sqlite_replica_reports_no_lag(self, replica_setup):
+        """Non-PostgreSQL replicas are healthy when reachable."""
+        _, replica, _, _ = replica_setup
+        assert ReplicaSet.measure_lag(replica) == 0.0
+
+    def test_replica_urls_parsed_from_comma_string(self):
+        """DATABASE_REPLICA_URLS should accept a comma-separated string."""
+        assert Settings.parse_replica_urls(
+            "postgresql://r1/db, postgresql://r2/db"
+        ) == [
+            "postgresql://r1/db",
+            "postgresql://r2/db",
+        ]
+
+
+class TestReadYourWritesMiddleware:
+    """Cookie-based primary pinning after writes."""
+
+    @pytest.fixture
+    def rw_client(self):
+        app = FastAPI()
+        app.add_middleware(ReadYourWritesMiddleware)
+
+        @app.get("/read")
+        async def read() -> dict:
+            return {"primary": database._force_primary.get()}
+
+        @app.post("/write")
+        async def write() -> dict:
+            return {}
+
+        @app.post("/fail", status_code=400)
+        async def fail() -> dict:
+            return {}
+
+        return TestClient(app)
+
+    def test_successful_write_sets_cookie(self, rw_client):
+        response = rw_client.post("/write")
+        assert READ_YOUR_WRITES_COOKIE in response.cookies
+
+    def test_failed_write_does_not_set_cookie(self, rw_client):
+        response = rw_client.post("/fail")
+        assert READ_YOUR_WRITES_COOKIE not in response.cookies
+
+    def test_reads_pinned_after_write(self, rw_client):
+        assert rw_client.get("/read").json() == {"primary": False}
+        rw_client.post("/write")
+        assert rw_client.get("/read").json() == {"primary": True}
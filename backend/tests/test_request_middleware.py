@@ -0,0 +1,131 @@
+"""Tests for the request context middleware.
+
+Covers correlation IDs, timing headers, Cache-Control defaults, streaming
+passthrough and access log sampling.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from core.correlation import get_correlation_id
+from helpers.request_middleware import RequestContextMiddleware
+from models.config import settings
+
+
+def _make_app() -> FastAPI:
+    """Build a minimal app wrapped by the middleware."""
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/ping")
+    def ping() -> dict:
+        return {"correlation_id": get_correlation_id()}
+
+    @app.get("/cached")
+    def cached() -> JSONResponse:
+        return JSONResponse({}, headers={"Cache-Control": "public, max-age=15"})
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    @app.get("/boom")
+    def boom() -> dict:
+        raise RuntimeError("boom")
+
+    return app
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Test client for the minimal app."""
+    return TestClient(_make_app(), raise_server_exceptions=False)
+
+
+@pytest.fixture
+def access_log():
+    """Capture access log lines."""
+    lines: list[str] = []
+    handler_id = logger.add(lambda message: lines.append(str(message)), level="INFO")
+    yield lines
+    logger.remove(handler_id)
+
+
+class TestRequestContextMiddleware:
+    """Tests for RequestContextMiddleware."""
+
+    def test_generates_correlation_id(self, client: TestClient) -> None:
+        """A correlation ID should be generated, used and echoed."""
+        response = client.get("/ping")
+
+        correlation_id = response.headers["X-Correlation-ID"]
+        assert len(correlation_id) == 8
+        assert response.json()["correlation_id"] == correlation_id
+
+    def test_reuses_client_correlation_id(self, client: TestClient) -> None:
+        """The client's correlation ID should be kept."""
+        response = client.get("/ping", headers={"X-Correlation-ID": "abc123de"})
+
+        assert response.headers["X-Correlation-ID"] == "abc123de"
+        assert response.json()["correlation_id"] == "abc123de"
+
+    def test_response_time_header(self, client: TestClient) -> None:
+        """X-Response-Time should be reported in seconds."""
+        response = client.get("/ping")
+
+        assert response.headers["X-Response-Time"].endswith("s")
+
+    def test_default_cache_control(self, client: TestClient) -> None:
+        """Responses without Cache-Control should not be stored."""
+        response = client.get("/ping")
+
+        assert response.headers["Cache-Control"] == "no-store, max-age=0"
+
+    def test_keeps_endpoint_cache_control(self, client: TestClient) -> None:
+        """An endpoint's own Cache-Control should win."""
+        response = client.get("/cached")
+
+        assert response.headers.get_list("Cache-Control") == ["public, max-age=15"]
+
+    def test_streaming_response(self, client: TestClient) -> None:
+        """Streaming bodies should pass through with headers added."""
+        response = client.get("/stream")
+
+        assert response.text == "abc"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    def test_access_log_sampled_out(
+        self, client: TestClient, access_log: list[str], monkeypatch
+    ) -> None:
+        """Requests outside the sample should not be logged."""
+        monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0.0)
+
+        client.get("/ping")
+
+        assert not any("GET /ping" in line for line in access_log)
+
+    def test_access_log_sampled_in(
+        self, client: TestClient, access_log: list[str], monkeypatch
+    ) -> None:
+        """Sampled requests should be logged once with status and duration."""
+        monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 1.0)
+
+        client.get("/ping")
+
+        lines = [line for line in access_log if "GET /ping" in line]
+        assert len(lines) == 1
+        assert "status=200" in lines[0]
+
+    def test_server_errors_always_logged(
+        self, client: TestClient, access_log: list[str], monkeypatch
+    ) -> None:
+        """Server errors should be logged regardless of sampling."""
+        monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0.0)
+
+        response = client.get("/boom")
+
+        assert response.status_code == 500
+        assert any("GET /boom status=500" in line for line in access_log)
@@ -28,6 +28,7 @@ class TestAnalyticsRouterOverview:
         response = client.get("/api/admin/analytics/overview", headers=auth_headers)
         assert response.status_code == 403
 
+    @pytest.mark.query_budget(9)
     def test_overview_returns_metrics(self, client, admin_auth_headers):
         """Overview endpoint returns expected data structure."""
         response = client.get(
@@ -98,6 +99,7 @@ class TestAnalyticsRouterTrends:
         response = client.get("/api/admin/analytics/trends", headers=admin_auth_headers)
         assert response.status_code == 422
 
+    @pytest.mark.query_budget(5)
     def test_trends_returns_data(self, client, admin_auth_headers):
         """Trends endpoint returns expected data structure."""
         today = date.today()
@@ -190,6 +192,7 @@ class TestAnalyticsRouterCategories:
         assert "generated_at" in data
         assert isinstance(data["categories"], list)
 
+    @pytest.mark.query_budget(5)
     def test_categories_includes_metrics(
         self, client, admin_auth_headers, test_category, test_idea
     ):
@@ -226,6 +229,7 @@ class TestAnalyticsRouterTopContributors:
         )
         assert response.status_code == 403
 
+    @pytest.mark.query_budget(2)
     def test_top_contributors_default(self, client, admin_auth_headers, test_user):
         """Top contributors returns data with default parameters."""
         response = client.get(
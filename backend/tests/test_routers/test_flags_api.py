@@ -2,6 +2,8 @@
 Integration tests for flags API endpoints.
 """
 
+import pytest
+
 from repositories.db_models import Comment
 
 
@@ -134,6 +136,7 @@ class TestFlagsAPI:
 
         assert response.status_code == 400
 
+    @pytest.mark.query_budget(20)
     def test_get_my_flags(
         self, client, auth_headers, test_user, other_user, test_idea, db_session
     ):
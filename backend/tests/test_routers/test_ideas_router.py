@@ -1,9 +1,12 @@
 """Integration tests for ideas API endpoints."""
 
+import pytest
+
 
 class TestIdeasRouter:
     """Test cases for /api/ideas endpoints."""
 
+    @pytest.mark.query_budget(6)
     def test_get_leaderboard_unauthenticated(self, client, test_category, test_idea):
         """Leaderboard is accessible without authentication."""
         response = client.get(
@@ -29,6 +32,7 @@ class TestIdeasRouter:
 
         assert response.status_code == 401
 
+    @pytest.mark.query_budget(34)
     def test_create_idea_success(self, client, auth_headers, test_category):
         """Authenticated user can create idea."""
         response = client.post(
@@ -78,6 +82,7 @@ class TestIdeasRouter:
 
         assert response.status_code == 404
 
+    @pytest.mark.query_budget(6)
     def test_get_my_ideas(self, client, auth_headers, test_user, test_idea):
         """User can see their own ideas."""
         response = client.get(
@@ -96,6 +101,7 @@ class TestIdeasRouter:
 
         assert response.status_code == 401
 
+    @pytest.mark.query_budget(6)
     def test_get_idea_by_id_approved(self, client, test_idea):
         """Can get approved idea by ID."""
         response = client.get(f"/api/ideas/{test_idea.id}")
@@ -130,6 +136,7 @@ class TestIdeasRouter:
 
         assert response.status_code == 404
 
+    @pytest.mark.query_budget(8)
     def test_update_idea(self, client, auth_headers, pending_idea):
         """Owner can update their pending idea."""
         response = client.put(
@@ -152,6 +159,7 @@ class TestIdeasRouter:
 
         assert response.status_code == 403
 
+    @pytest.mark.query_budget(7)
     def test_delete_idea(self, client, auth_headers, pending_idea):
         """Owner can delete their idea."""
         response = client.delete(
@@ -0,0 +1,42 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+from models.config import settings
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_metrics_exposed(self, client) -> None:
+        """Metrics should be served in the Prometheus text format."""
+        client.get("/api/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'route="/api/health"' in response.text
+        assert "db_queries_per_request" in response.text
+
+    def test_metrics_disabled(self, client, monkeypatch) -> None:
+        """Metrics should not be served when disabled."""
+        monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 404
+
+    def test_metrics_token_required(self, client, monkeypatch) -> None:
+        """A configured token should be required."""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+
+        assert client.get("/metrics").status_code == 401
+        assert (
+            client.get(
+                "/metrics", headers={"Authorization": "Bearer wrong"}
+            ).status_code
+            == 401
+        )
+        response = client.get(
+            "/metrics", headers={"Authorization": "Bearer scrape-secret"}
+        )
+        assert response.status_code == 200
@@ -0,0 +1,75 @@
+"""Tests for the admin moderation endpoints."""
+
+import pytest
+
+import repositories.db_models as db_models
+
+FLAGGED_PER_TYPE = 4
+
+
+@pytest.fixture
+def flagged_content(db_session, test_user, other_user, test_category, test_idea):
+    """Flag several comments and ideas, by different authors and reporters."""
+    comments = [
+        db_models.Comment(
+            idea_id=test_idea.id,
+            user_id=other_user.id,
+            content=f"Flagged comment {i}",
+            flag_count=1,
+        )
+        for i in range(FLAGGED_PER_TYPE)
+    ]
+    ideas = [
+        db_models.Idea(
+            title=f"Flagged idea {i}",
+            description="An idea reported by another user.",
+            category_id=test_category.id,
+            user_id=test_user.id,
+            status=db_models.IdeaStatus.APPROVED,
+            flag_count=1,
+        )
+        for i in range(FLAGGED_PER_TYPE)
+    ]
+    db_session.add_all([*comments, *ideas])
+    db_session.flush()
+    db_session.add_all(
+        [
+            db_models.ContentFlag(
+                content_type=db_models.ContentType.COMMENT,
+                content_id=comment.id,
+                reporter_id=test_user.id,
+                reason=db_models.FlagReason.SPAM,
+            )
+            for comment in comments
+        ]
+        + [
+            db_models.ContentFlag(
+                content_type=db_models.ContentType.IDEA,
+                content_id=idea.id,
+                reporter_id=other_user.id,
+                reason=db_models.FlagReason.OFF_TOPIC,
+            )
+            for idea in ideas
+        ]
+    )
+    db_session.commit()
+
+
+class TestModerationQueue:
+    """GET /api/admin/moderation/queue."""
+
+    @pytest.mark.query_budget(8)
+    def test_queue_lists_flagged_content(
+        self, client, admin_auth_headers, flagged_content
+    ):
+        """The queue should load its items without per-item queries."""
+        response = client.get("/api/admin/moderation/queue", headers=admin_auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2 * FLAGGED_PER_TYPE
+        assert {item["content_type"] for item in data["items"]} == {"comment", "idea"}
+
+    def test_queue_requires_admin(self, client, auth_headers):
+        response = client.get("/api/admin/moderation/queue", headers=auth_headers)
+        assert response.status_code == 403
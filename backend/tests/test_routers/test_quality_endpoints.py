@@ -66,6 +66,7 @@ def other_user_auth_headers(other_user: User) -> dict:
 class TestCategoryQualitiesEndpoint:
     """Tests for GET /categories/{id}/qualities."""
 
+    @pytest.mark.query_budget(7)
     def test_returns_qualities_for_category(
         self,
         client: TestClient,
@@ -93,6 +94,7 @@ class TestCategoryQualitiesEndpoint:
 class TestDefaultQualitiesEndpoint:
     """Tests for GET /categories/qualities/defaults."""
 
+    @pytest.mark.query_budget(4)
     def test_returns_default_qualities(
         self,
         client: TestClient,
@@ -117,6 +119,7 @@ class TestDefaultQualitiesEndpoint:
 class TestVoteWithQualitiesEndpoint:
     """Tests for POST /votes/{idea_id} with qualities."""
 
+    @pytest.mark.query_budget(8)
     def test_vote_with_qualities(
         self,
         client: TestClient,
@@ -323,6 +326,7 @@ class TestGetMyVoteEndpoint:
 class TestIdeaQualityCountsEndpoint:
     """Tests for GET /ideas/{idea_id}/quality-counts."""
 
+    @pytest.mark.query_budget(10)
     def test_returns_quality_counts(
         self,
         client: TestClient,
@@ -0,0 +1,247 @@
+"""Tests for ETag / Cache-Control handling on public GET endpoints."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import models.schemas as schemas
+import repositories.db_models as db_models
+from repositories.cache_version_repository import CacheVersionRepository
+from services import CategoryService
+from services.response_cache_service import ResponseCacheService
+
+
+def _versions(db_session) -> dict[str, int]:
+    return {
+        entity: version
+        for entity, (version, _) in CacheVersionRepository(db_session)
+        .get_versions()
+        .items()
+    }
+
+
+class TestLeaderboardCaching:
+    """Anonymous leaderboard responses are versioned and revalidated."""
+
+    @pytest.mark.query_budget(5)
+    def test_anonymous_response_has_etag(self, client, test_idea):
+        response = client.get("/api/ideas/leaderboard")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"].startswith("public, max-age=")
+        assert "stale-while-revalidate" in response.headers["cache-control"]
+        assert "last-modified" in response.headers
+        assert response.json()[0]["id"] == test_idea.id
+
+    def test_if_none_match_returns_304(self, client, test_idea):
+        etag = client.get("/api/ideas/leaderboard").headers["etag"]
+
+        response = client.get("/api/ideas/leaderboard", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_if_modified_since_returns_304(self, client, test_idea):
+        future = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+        response = client.get(
+            "/api/ideas/leaderboard",
+            headers={"If-Modified-Since": format_datetime(future, usegmt=True)},
+        )
+
+        assert response.status_code == 304
+
+    def test_write_changes_etag_and_body(
+        self, client, db_session, test_idea, test_user, test_category
+    ):
+        first = client.get("/api/ideas/leaderboard")
+
+        db_session.add(
+            db_models.Idea(
+                title="Another idea",
+                description="Another approved idea description for the leaderboard.",
+                category_id=test_category.id,
+                user_id=test_user.id,
+                status=db_models.IdeaStatus.APPROVED,
+            )
+        )
+        db_session.commit()
+
+        second = client.get(
+            "/api/ideas/leaderboard", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+        assert len(second.json()) == len(first.json()) + 1
+
+    def test_language_is_part_of_etag(self, client, test_idea):
+        fr = client.get("/api/ideas/leaderboard", headers={"Accept-Language": "fr"})
+        en = client.get("/api/ideas/leaderboard", headers={"Accept-Language": "en"})
+
+        assert fr.headers["etag"] != en.headers["etag"]
+
+    def test_authenticated_response_is_not_cached(
+        self, client, test_idea, auth_headers
+    ):
+        response = client.get("/api/ideas/leaderboard", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert "no-store" in response.headers["cache-control"]
+
+
+class TestIdeaDetailCaching:
+    """Anonymous idea detail responses."""
+
+    @pytest.mark.query_budget(6)
+    def test_idea_detail_304(self, client, test_idea):
+        first = client.get(f"/api/ideas/{test_idea.id}")
+        assert first.status_code == 200
+
+        second = client.get(
+            f"/api/ideas/{test_idea.id}",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert second.status_code == 304
+
+    def test_missing_idea_is_404(self, client, db_session):
+        response = client.get("/api/ideas/99999")
+        assert response.status_code == 404
+
+
+class TestReferenceListCaching:
+    """Category, tag and config lists."""
+
+    def test_categories_etag_changes_on_new_category(
+        self, client, db_session, test_category
+    ):
+        first = client.get("/api/categories/")
+        assert (
+            client.get(
+                "/api/categories/", headers={"If-None-Match": first.headers["etag"]}
+            ).status_code
+            == 304
+        )
+
+        CategoryService.create_category(
+            db_session,
+            schemas.CategoryCreate(
+                name_en="Parks",
+                name_fr="Parcs",
+                description_en="Parks",
+                description_fr="Parcs",
+            ),
+        )
+
+        second = client.get(
+            "/api/categories/", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 200
+        assert len(second.json()) == 2
+
+    def test_tags_list_etag(self, client, db_session):
+        first = client.get("/api/tags/")
+        assert first.status_code == 200
+        assert (
+            client.get(
+                "/api/tags/", headers={"If-None-Match": first.headers["etag"]}
+            ).status_code
+            == 304
+        )
+
+    def test_public_config_etag(self, client):
+        first = client.get("/api/config/public")
+        assert first.status_code == 200
+        assert "platform" in first.json()
+
+        second = client.get(
+            "/api/config/public", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert second.status_code == 304
+
+
+class TestChangeTracking:
+    """Version counters bumped by session events."""
+
+    def test_idea_write_bumps_ideas_version(self, db_session, test_idea):
+        before = _versions(db_session)["ideas"]
+
+        test_idea.title = "Renamed idea"
+        db_session.commit()
+
+        assert _versions(db_session)["ideas"] == before + 1
+
+    def test_bump_waits_for_commit(self, db_session, test_idea):
+        """Flushes must not touch cache_versions before the commit."""
+        before = _versions(db_session)["ideas"]
+
+        test_idea.title = "Pending rename"
+        db_session.flush()
+        assert _versions(db_session)["ideas"] == before
+
+        db_session.rollback()
+        assert _versions(db_session)["ideas"] == before
+
+    def test_bump_commits_with_the_write(self, db_session, test_idea, monkeypatch):
+        """A failed bump must fail the commit rather than leave stale ETags."""
+        before = _versions(db_session)["ideas"]
+
+        def fail(self, entities):
+            raise OperationalError("bump", {}, Exception("locked"))
+
+        monkeypatch.setattr(CacheVersionRepository, "bump", fail)
+        test_idea.title = "Unversioned rename"
+        with pytest.raises(OperationalError):
+            db_session.commit()
+        db_session.rollback()
+        monkeypatch.undo()
+
+        db_session.refresh(test_idea)
+        assert test_idea.title != "Unversioned rename"
+        assert _versions(db_session)["ideas"] == before
+
+    def test_bulk_update_bumps_version(self, db_session, test_idea):
+        before = _versions(db_session)["ideas"]
+
+        db_session.query(db_models.Idea).filter(
+            db_models.Idea.id == test_idea.id
+        ).update({"title": "Bulk renamed"})
+        db_session.commit()
+
+        assert _versions(db_session)["ideas"] > before
+
+    def test_private_user_changes_do_not_bump(self, db_session, test_user):
+        before = _versions(db_session).get("ideas", 0)
+
+        test_user.trust_score = 10
+        db_session.commit()
+        assert _versions(db_session).get("ideas", 0) == before
+
+        test_user.display_name = "New display name"
+        db_session.commit()
+        assert _versions(db_session)["ideas"] == before + 1
+
+    def test_commit_drops_rendered_bodies(self, db_session, test_category):
+        ResponseCacheService.store_rendered("tag", b"[]", ("categories",))
+        ResponseCacheService.store_rendered("other", b"[]", ("tags",))
+
+        test_category.name_en = "Renamed"
+        db_session.commit()
+
+        assert ResponseCacheService.get_rendered("tag") is None
+        assert ResponseCacheService.get_rendered("other") == b"[]"
+
+    def test_rendered_cache_is_bounded(self, monkeypatch):
+        from models.config import settings
+
+        monkeypatch.setattr(settings, "RESPONSE_CACHE_MAX_ENTRIES", 2)
+        for i in range(3):
+            ResponseCacheService.store_rendered(f"e{i}", b"x", ("ideas",))
+
+        assert ResponseCacheService.get_rendered("e0") is None
+        assert ResponseCacheService.get_rendered("e2") == b"x"
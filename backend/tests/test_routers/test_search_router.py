@@ -1,7 +1,13 @@
 """Integration tests for search API endpoints."""
 
+from collections.abc import Generator
 from unittest.mock import patch, Mock
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import repositories.db_models as db_models
 
 from models.search_schemas import (
     SearchResults,
@@ -10,6 +16,7 @@ from models.search_schemas import (
     SearchHighlight,
 )
 from models.schemas import IdeaWithScore
+from services.search.sqlite_fts5_backend import SQLiteFTS5Backend
 
 
 class TestSearchIdeasEndpoint:
@@ -434,3 +441,63 @@ class TestSearchResponseFormat:
         assert "relevance_score" in result_item
         assert result_item["relevance_score"] == 0.95
         assert "highlights" in result_item
+
+
+TAGGED_IDEAS = 5
+
+
+@pytest.fixture
+def tagged_ideas(
+    db_session, test_user, test_category
+) -> Generator[list[db_models.Idea], None, None]:
+    """Approved ideas about solar power, each with its own tag."""
+    ideas = []
+    for i in range(TAGGED_IDEAS):
+        tag = db_models.Tag(name=f"solar-{i}", display_name=f"Solar {i}")
+        idea = db_models.Idea(
+            title=f"Solar panels on building {i}",
+            description="Install solar panels on public buildings.",
+            category_id=test_category.id,
+            user_id=test_user.id,
+            status=db_models.IdeaStatus.APPROVED,
+        )
+        db_session.add_all([tag, idea])
+        db_session.flush()
+        db_session.add(db_models.IdeaTag(idea_id=idea.id, tag_id=tag.id))
+        ideas.append(idea)
+    db_session.commit()
+
+    backend = SQLiteFTS5Backend()
+    backend.ensure_table_exists(db_session)
+    backend.rebuild_index(db_session)
+    yield ideas
+    # The FTS table is not part of the metadata dropped after each test
+    db_session.execute(text(f"DROP TABLE IF EXISTS {backend.FTS_TABLE_NAME}"))
+    db_session.commit()
+
+
+class TestSearchQueryBudgets:
+    """Search endpoints on real data, with statement budgets against N+1."""
+
+    @pytest.mark.query_budget(8)
+    def test_search_ideas(self, client: TestClient, tagged_ideas) -> None:
+        response = client.get("/api/search/ideas?q=solar")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == TAGGED_IDEAS
+
+    @pytest.mark.query_budget(4)
+    def test_autocomplete_tags(self, client: TestClient, tagged_ideas) -> None:
+        response = client.get("/api/search/autocomplete?q=sol")
+
+        assert response.status_code == 200
+        tags = response.json()["tags"]
+        assert len(tags) == TAGGED_IDEAS
+        assert all(tag["idea_count"] == 1 for tag in tags)
+
+    @pytest.mark.query_budget(9)
+    def test_search_with_tags(self, client: TestClient, tagged_ideas) -> None:
+        response = client.get("/api/search/with-tags?q=solar")
+
+        assert response.status_code == 200
+        assert response.json()["ideas"]["total"] == TAGGED_IDEAS
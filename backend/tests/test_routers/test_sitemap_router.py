@@ -0,0 +1,92 @@
+"""Tests for the sitemap endpoints."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import repositories.db_models as db_models
+from models.config import settings
+from services.vote_service import VoteService
+
+_NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+
+
+class TestSitemapIdeas:
+    """JSON idea list."""
+
+    @pytest.mark.query_budget(8)
+    def test_lists_approved_ideas_with_score(
+        self, client, db_session, test_idea, pending_idea, other_user
+    ):
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.UPVOTE
+        )
+
+        response = client.get("/api/sitemap/ideas")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [idea["id"] for idea in data] == [test_idea.id]
+        assert data[0]["score"] == 1
+        assert 0.5 <= data[0]["priority"] <= 0.9
+
+    def test_empty_list(self, client, db_session):
+        response = client.get("/api/sitemap/ideas")
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestSitemapXml:
+    """Sitemap index and shards."""
+
+    def test_index_links_to_shards(self, client, test_idea):
+        response = client.get("/api/sitemap/index.xml")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/xml")
+        root = ET.fromstring(response.content)
+        locs = [loc.text for loc in root.findall("sm:sitemap/sm:loc", _NS)]
+        assert len(locs) == 1
+        assert locs == [f"{settings.APP_URL.rstrip('/')}/api/sitemap/ideas-0.xml"]
+
+    def test_shard_lists_idea(self, client, test_idea):
+        response = client.get("/api/sitemap/ideas-0.xml")
+
+        assert response.status_code == 200
+        root = ET.fromstring(response.content)
+        locs = [loc.text for loc in root.findall("sm:url/sm:loc", _NS)]
+        assert locs[0].endswith(f"/ideas/{test_idea.id}")
+
+    def test_shard_revalidates_until_vote(
+        self, client, db_session, test_idea, other_user
+    ):
+        first = client.get("/api/sitemap/ideas-0.xml")
+        etag = first.headers["etag"]
+        assert (
+            client.get(
+                "/api/sitemap/ideas-0.xml", headers={"If-None-Match": etag}
+            ).status_code
+            == 304
+        )
+
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.UPVOTE
+        )
+
+        second = client.get("/api/sitemap/ideas-0.xml", headers={"If-None-Match": etag})
+        assert second.status_code == 200
+        assert second.headers["etag"] != etag
+
+    def test_other_shard_unaffected_by_vote(
+        self, client, db_session, test_idea, other_user
+    ):
+        etag = client.get("/api/sitemap/ideas-7.xml").headers["etag"]
+
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.UPVOTE
+        )
+
+        response = client.get(
+            "/api/sitemap/ideas-7.xml", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
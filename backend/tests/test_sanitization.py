@@ -5,7 +5,19 @@ Tests all XSS payloads discovered during penetration testing
 to ensure they are properly neutralized.
 """
 
-from helpers.sanitization import sanitize_html, sanitize_plain_text, sanitize_url
+from concurrent.futures import ThreadPoolExecutor
+
+import bleach
+import pytest
+
+from helpers.sanitization import (
+    ALLOWED_ATTRIBUTES,
+    ALLOWED_TAGS,
+    sanitize_html,
+    sanitize_plain_text,
+    sanitize_rows,
+    sanitize_url,
+)
 
 
 class TestSanitizeHtml:
@@ -229,3 +241,59 @@ class TestSanitizeUrl:
     def test_trims_whitespace(self) -> None:
         """Leading/trailing whitespace should be trimmed."""
         assert sanitize_url("  https://example.com  ") == "https://example.com"
+
+
+class TestPrebuiltCleaners:
+    """Tests for the prebuilt cleaners and the no-markup fast path."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "Plain text, no markup at all",
+            "Tom & Jerry",
+            "a < b > c",
+            "&lt;already escaped&gt;",
+            "line one\r\nline two",
+            "nul\x00 and form feed\x0c",
+            "tab\tand newline\n stay",
+            "<p>Hello <b>world</b></p><script>x()</script>",
+            "",
+        ],
+    )
+    def test_matches_bleach_clean(self, content: str) -> None:
+        """Output should be identical to calling bleach.clean directly."""
+        assert sanitize_html(content) == bleach.clean(
+            content, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, strip=True
+        )
+        assert sanitize_plain_text(content) == bleach.clean(
+            content, tags=[], strip=True
+        )
+
+    def test_plain_text_skips_parsing(self) -> None:
+        """Text without markup should come back as the same object."""
+        content = "Une idée pour le quartier: plus d'arbres, moins de voitures."
+        assert sanitize_html(content) is content
+        assert sanitize_plain_text(content) is content
+
+    def test_concurrent_threads(self) -> None:
+        """Threads should not share parser state."""
+        inputs = [f"<p>Item {i}</p><script>alert({i})</script>" for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(sanitize_html, inputs))
+        assert results == [f"<p>Item {i}</p>alert({i})" for i in range(200)]
+
+
+class TestSanitizeRows:
+    """Tests for sanitize_rows (backfill worker function)."""
+
+    def test_returns_only_changes(self) -> None:
+        """Unchanged rows and fields should be left out."""
+        rows = [
+            {"id": 1, "title": "Clean", "body": "<p>Fine</p>"},
+            {"id": 2, "title": "<b>Bold</b>", "body": "<p>Fine</p>"},
+            {"id": 3, "title": None, "body": "<img src=x>Pic"},
+        ]
+
+        updates = sanitize_rows(rows, {"title": "plain", "body": "html"})
+
+        assert updates == [{"id": 2, "title": "Bold"}, {"id": 3, "body": "Pic"}]
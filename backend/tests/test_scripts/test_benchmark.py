@@ -0,0 +1,91 @@
+"""Unit tests for benchmark.py report helpers."""
+
+import pytest
+
+from scripts.benchmark import (
+    DEFAULT_MIX,
+    Sample,
+    compare,
+    percentile,
+    summarize,
+)
+
+
+class TestPercentile:
+    """Tests for percentile."""
+
+    def test_interpolates(self):
+        """Should interpolate between neighbouring values."""
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 100) == 5.0
+        assert percentile(values, 95) == pytest.approx(4.8)
+
+    def test_single_and_empty(self):
+        """Should handle one value and no values."""
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 50) == 0.0
+
+
+class TestSummarize:
+    """Tests for summarize."""
+
+    def test_per_endpoint_stats_and_queries(self):
+        """Should report latency, statuses and queries per request."""
+        samples = [
+            Sample("leaderboard", 200, 0.010),
+            Sample("leaderboard", 200, 0.020),
+            Sample("leaderboard", 200, 0.030),
+            Sample("vote", 200, 0.050),
+            Sample("vote", 403, 0.005),
+        ]
+        before = {"/api/ideas/leaderboard": (100.0, 20.0)}
+        after = {
+            "/api/ideas/leaderboard": (112.0, 23.0),
+            "/api/votes/{idea_id}": (14.0, 2.0),
+        }
+
+        report = summarize(samples, 0.5, DEFAULT_MIX, before, after)
+
+        leaderboard = report["endpoints"]["leaderboard"]
+        assert leaderboard["requests"] == 3
+        assert leaderboard["p50_ms"] == 20.0
+        assert leaderboard["throughput_rps"] == 6.0
+        assert leaderboard["queries_per_request"] == 4.0
+        vote = report["endpoints"]["vote"]
+        assert vote["non_2xx"] == 1
+        assert vote["status_codes"] == {"200": 1, "403": 1}
+        assert vote["queries_per_request"] == 7.0
+        assert "search" not in report["endpoints"]
+        assert report["total"]["requests"] == 5
+        assert report["total"]["non_2xx"] == 1
+
+
+class TestCompare:
+    """Tests for compare."""
+
+    @staticmethod
+    def _report(p95: float, queries: float) -> dict:
+        return {
+            "endpoints": {
+                "leaderboard": {"p95_ms": p95, "queries_per_request": queries}
+            }
+        }
+
+    def test_within_tolerance(self):
+        """Should accept changes inside the allowed regression."""
+        assert compare(self._report(11.0, 4), self._report(10.0, 4), 0.2) == []
+
+    def test_latency_regression(self):
+        """Should report a P95 increase beyond the allowed regression."""
+        regressions = compare(self._report(13.0, 4), self._report(10.0, 4), 0.2)
+
+        assert regressions == ["leaderboard: p95 10.0ms -> 13.0ms"]
+
+    def test_query_count_regression(self):
+        """Should report any increase in queries per request."""
+        regressions = compare(self._report(10.0, 5), self._report(10.0, 4), 0.2)
+
+        assert regressions == ["leaderboard: queries/request 4 -> 5"]
@@ -0,0 +1,250 @@
+"""Tests for the bulk test data generator (bulk_test_data.py)."""
+
+import dataclasses
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from repositories.database import Base
+from repositories.db_models import Comment, Idea, IdeaStatus, User, Vote, VoteType
+from scripts.bulk_test_data import BULK_TABLES, build, timestamp
+from scripts.generate_test_data import DATASET_CONFIGS
+
+TINY = dataclasses.replace(
+    DATASET_CONFIGS["small"],
+    num_regular_users=40,
+    num_category_admins=2,
+    num_global_admins=2,
+    num_ideas=120,
+    num_flagged_comments=20,
+    num_flagged_ideas=5,
+    num_user_penalties=6,
+    num_appeals=2,
+    num_admin_notes=4,
+    num_login_events=50,
+    num_share_events=20,
+    num_security_audit_logs=10,
+    num_official_users=2,
+)
+
+
+@pytest.fixture(scope="module")
+def bulk_db(tmp_path_factory):
+    """A tiny dataset built with one worker."""
+    path = tmp_path_factory.mktemp("bulk") / "bulk.db"
+    counts, password_map = build(TINY, path, seed=11)
+    return path, counts, password_map
+
+
+def _rows(path, table: str) -> list[tuple]:
+    """All rows of a table, with dates removed (they follow the clock)."""
+    with sqlite3.connect(path) as conn:
+        columns = [
+            row[1]
+            for row in conn.execute(f"PRAGMA table_info({table})")
+            if not row[1].endswith("_at") and row[1] != "hashed_password"
+        ]
+        return conn.execute(
+            f"SELECT {', '.join(columns)} FROM {table} ORDER BY id"
+        ).fetchall()
+
+
+class TestTimestamp:
+    """Tests for timestamp."""
+
+    @pytest.mark.parametrize("seconds", [0, 86_399, 1_760_000_000, 1_792_365_307])
+    def test_matches_strftime(self, seconds):
+        """Should format like SQLAlchemy's SQLite DateTime storage."""
+        expected = datetime.fromtimestamp(seconds, timezone.utc).strftime(
+            "%Y-%m-%d %H:%M:%S.%f"
+        )
+
+        assert timestamp(seconds) == expected
+
+
+class TestBuild:
+    """Tests for build."""
+
+    def test_counts_match_tables(self, bulk_db):
+        """Reported counts should match the rows written."""
+        path, counts, password_map = bulk_db
+
+        with sqlite3.connect(path) as conn:
+            for table in ("users", "ideas", "idea_tags", "votes", "comments"):
+                (rows,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+                assert rows == counts[table], table
+            (likes,) = conn.execute("SELECT COUNT(*) FROM comment_likes").fetchone()
+            (flags,) = conn.execute("SELECT COUNT(*) FROM content_flags").fetchone()
+
+        assert counts["users"] == 44
+        assert counts["ideas"] == 120
+        assert counts["votes"] > 0
+        assert likes == counts["comment_likes"]
+        assert flags == counts["flags"]
+        assert len(password_map) == 44
+
+    def test_integrity(self, bulk_db):
+        """Every foreign key should resolve and vote ids should be dense."""
+        path, counts, _ = bulk_db
+
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+            assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+            assert conn.execute("SELECT MIN(id), MAX(id) FROM votes").fetchone() == (
+                1,
+                counts["votes"],
+            )
+
+    def test_denormalized_counters(self, bulk_db):
+        """Vote, like and flag counters should agree with the rows."""
+        path, _, _ = bulk_db
+
+        with sqlite3.connect(path) as conn:
+            wrong_votes = conn.execute(
+                """
+                SELECT COUNT(*) FROM ideas WHERE
+                    upvote_count != (SELECT COUNT(*) FROM votes
+                        WHERE idea_id = ideas.id AND vote_type = 'UPVOTE')
+                    OR downvote_count != (SELECT COUNT(*) FROM votes
+                        WHERE idea_id = ideas.id AND vote_type = 'DOWNVOTE')
+                    OR score != upvote_count - downvote_count
+                """
+            ).fetchone()
+            wrong_likes = conn.execute(
+                """
+                SELECT COUNT(*) FROM comments WHERE like_count != (
+                    SELECT COUNT(*) FROM comment_likes WHERE comment_id = comments.id
+                )
+                """
+            ).fetchone()
+            wrong_flags = conn.execute(
+                """
+                SELECT COUNT(*) FROM comments WHERE flag_count != (
+                    SELECT COUNT(*) FROM content_flags
+                    WHERE content_type = 'COMMENT' AND content_id = comments.id
+                )
+                """
+            ).fetchone()
+            own_votes = conn.execute(
+                "SELECT COUNT(*) FROM votes JOIN ideas ON ideas.id = votes.idea_id "
+                "WHERE votes.user_id = ideas.user_id"
+            ).fetchone()
+
+        assert wrong_votes == (0,)
+        assert wrong_likes == (0,)
+        assert wrong_flags == (0,)
+        assert own_votes == (0,)
+
+    def test_share_counts_roll_up_events(self, bulk_db):
+        """share_counts should hold the per-minute totals of share_events."""
+        path, counts, _ = bulk_db
+
+        with sqlite3.connect(path) as conn:
+            events = conn.execute(
+                """
+                SELECT idea_id, platform,
+                    strftime('%Y-%m-%d %H:%M:00.000000', created_at), COUNT(*)
+                FROM share_events GROUP BY 1, 2, 3 ORDER BY 1, 2, 3
+                """
+            ).fetchall()
+            rollup = conn.execute(
+                "SELECT idea_id, platform, bucket_start, count FROM share_counts "
+                "ORDER BY 1, 2, 3"
+            ).fetchall()
+
+        assert counts["share_events"] == 20
+        assert rollup == events
+        assert counts["share_counts"] == len(rollup)
+
+    def test_tag_stats_match_public_ideas(self, bulk_db):
+        """Every tag should have a counter of its approved, visible ideas."""
+        path, counts, _ = bulk_db
+
+        with sqlite3.connect(path) as conn:
+            (tags,) = conn.execute("SELECT COUNT(*) FROM tags").fetchone()
+            wrong = conn.execute(
+                """
+                SELECT COUNT(*) FROM tag_stats WHERE idea_count != (
+                    SELECT COUNT(*) FROM idea_tags
+                    JOIN ideas ON ideas.id = idea_tags.idea_id
+                    WHERE idea_tags.tag_id = tag_stats.tag_id
+                        AND ideas.status = 'APPROVED' AND ideas.deleted_at IS NULL
+                )
+                """
+            ).fetchone()
+            (counted,) = conn.execute(
+                "SELECT COUNT(*) FROM tag_stats WHERE idea_count > 0"
+            ).fetchone()
+
+        assert counts["tag_stats"] == tags
+        assert wrong == (0,)
+        assert counted > 0
+
+    def test_schema_matches_models(self, bulk_db):
+        """Indexes dropped for loading should all be rebuilt."""
+        path, _, _ = bulk_db
+        expected = {
+            index.name
+            for name in BULK_TABLES
+            for index in Base.metadata.tables[name].indexes
+        }
+
+        with sqlite3.connect(path) as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            (fts_rows,) = conn.execute("SELECT COUNT(*) FROM ideas_fts").fetchone()
+
+        assert expected <= indexes
+        assert fts_rows == 120
+
+    def test_rows_load_through_orm(self, bulk_db):
+        """Enums, booleans, defaults and dates should read back as models."""
+        path, _, password_map = bulk_db
+        engine = create_engine(f"sqlite:///{path}")
+
+        with Session(engine) as session:
+            admin = session.get(User, 1)
+            statuses = set(session.scalars(select(Idea.status).distinct()))
+            vote = session.scalars(select(Vote)).first()
+            comment = session.scalars(select(Comment)).first()
+            pending_comments = session.scalar(
+                select(func.count(Comment.id)).where(Comment.requires_approval)
+            )
+        engine.dispose()
+
+        assert admin.is_global_admin is True
+        assert admin.email in password_map
+        assert admin.totp_enabled is False
+        assert isinstance(admin.created_at, datetime)
+        assert IdeaStatus.APPROVED in statuses
+        assert vote.vote_type in (VoteType.UPVOTE, VoteType.DOWNVOTE)
+        assert vote.created_at > datetime(2000, 1, 1)
+        assert comment.is_moderated is False
+        assert pending_comments >= 0
+
+    def test_same_rows_for_any_worker_count(self, bulk_db, tmp_path):
+        """Chunks merged from worker processes should match in-process ones."""
+        path, counts, _ = bulk_db
+        parallel = tmp_path / "parallel.db"
+
+        parallel_counts, _ = build(TINY, parallel, seed=11, workers=2)
+
+        assert parallel_counts == counts
+        for table in ("ideas", "votes", "vote_qualities", "comments", "comment_likes"):
+            assert _rows(parallel, table) == _rows(path, table), table
+
+    def test_seed_changes_rows(self, bulk_db, tmp_path):
+        """A different seed should give different votes."""
+        path, _, _ = bulk_db
+        other = tmp_path / "other.db"
+
+        build(TINY, other, seed=12)
+
+        assert _rows(other, "votes") != _rows(path, "votes")
@@ -399,7 +399,7 @@ class TestGetAutocomplete:
         mock_backend.get_suggestions.return_value = ["Solar Panel"]
 
         mock_repo = Mock()
-        mock_repo.search_tags.return_value = []
+        mock_repo.search_tags_with_counts.return_value = []
 
         with patch.object(SearchService, "_get_backend", return_value=mock_backend):
             with patch(
@@ -0,0 +1,341 @@
+"""Tests for AvatarService and the avatar image helpers."""
+
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from sqlalchemy.orm import Session
+
+import models.schemas as schemas
+import repositories.db_models as db_models
+from helpers.avatar_images import (
+    avatar_variant_urls,
+    content_hash,
+    render_avatar_variants,
+    variant_digest,
+)
+from models.config import settings
+from models.exceptions import ValidationException
+from services import avatar_service
+from services.avatar_service import AvatarService
+
+
+def _image_bytes(
+    size: tuple[int, int] = (300, 200),
+    image_format: str = "JPEG",
+    color: str = "red",
+    exif: Image.Exif | None = None,
+) -> bytes:
+    """Encode a solid-color test image."""
+    mode = "RGBA" if image_format == "PNG" else "RGB"
+    image = Image.new(mode, size, color)
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, exif=exif or Image.Exif())
+    return buffer.getvalue()
+
+
+def _gps_exif(orientation: int = 1) -> Image.Exif:
+    """EXIF with a camera model, GPS data and an orientation."""
+    exif = Image.Exif()
+    exif[0x0110] = "Phone Camera"  # Model
+    exif[0x0112] = orientation  # Orientation
+    exif[0x8825] = {1: "N", 2: (45.0, 30.0, 0.0)}  # GPSInfo
+    return exif
+
+
+@pytest.fixture
+def upload_root(tmp_path, monkeypatch) -> Path:
+    """Run with avatar paths relative to a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def inline_images(monkeypatch) -> list:
+    """Render images in-process, recording each job."""
+    jobs: list = []
+
+    def run_inline(func, *args):
+        jobs.append(args)
+        return func(*args)
+
+    monkeypatch.setattr(avatar_service, "run_image_task", run_inline)
+    return jobs
+
+
+class TestRenderAvatarVariants:
+    """Tests for render_avatar_variants."""
+
+    def test_renders_square_variants_in_both_formats(self):
+        """Every size should exist as a square WebP and JPEG."""
+        variants = render_avatar_variants(_image_bytes(), [32, 64, 256], 10**7)
+
+        assert sorted(variants) == [
+            "256.jpg",
+            "256.webp",
+            "32.jpg",
+            "32.webp",
+            "64.jpg",
+            "64.webp",
+        ]
+        for name, data in variants.items():
+            size, extension = name.split(".")
+            with Image.open(io.BytesIO(data)) as image:
+                assert image.size == (int(size), int(size))
+                assert image.format == {"webp": "WEBP", "jpg": "JPEG"}[extension]
+
+    def test_strips_metadata_and_applies_orientation(self):
+        """EXIF (GPS included) should be dropped after rotating the pixels."""
+        # 300x200 rotated 90 degrees: the left half (blue) ends up on top
+        image = Image.new("RGB", (300, 200), "red")
+        image.paste((0, 0, 255), (0, 0, 150, 200))
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", exif=_gps_exif(orientation=6))
+
+        variants = render_avatar_variants(buffer.getvalue(), [64], 10**7)
+
+        for data in variants.values():
+            with Image.open(io.BytesIO(data)) as variant:
+                assert not variant.getexif()
+                assert "icc_profile" not in variant.info
+                top = variant.convert("RGB").getpixel((32, 5))
+                bottom = variant.convert("RGB").getpixel((32, 58))
+                assert top[2] > 200 and bottom[0] > 200
+
+    def test_transparency_flattened_for_jpeg(self):
+        """WebP should keep alpha; JPEG should get a white background."""
+        content = _image_bytes((64, 64), "PNG", color=(0, 0, 0, 0))
+
+        variants = render_avatar_variants(content, [32], 10**7)
+
+        with Image.open(io.BytesIO(variants["32.webp"])) as webp:
+            assert webp.convert("RGBA").getpixel((16, 16))[3] == 0
+        with Image.open(io.BytesIO(variants["32.jpg"])) as jpeg:
+            assert min(jpeg.getpixel((16, 16))) > 240
+
+    @pytest.mark.parametrize(
+        ("content", "max_pixels"),
+        [(b"not an image", 10**7), (_image_bytes((300, 200)), 1000)],
+    )
+    def test_rejects_undecodable_or_huge(self, content, max_pixels):
+        """Garbage and oversized images should raise ValueError."""
+        with pytest.raises(ValueError):
+            render_avatar_variants(content, [32], max_pixels)
+
+
+class TestAvatarVariantUrls:
+    """Tests for the variant URL helpers and schemas."""
+
+    def test_urls_derived_from_avatar_url(self):
+        """Per-size URLs should derive from the stored largest variant."""
+        digest = "ab" + "0" * 62
+        avatar_url = f"data/uploads/avatars/ab/{digest}/256.webp"
+
+        urls = avatar_variant_urls(avatar_url, [32, 256])
+
+        assert urls == {
+            "32": {
+                "webp": f"data/uploads/avatars/ab/{digest}/32.webp",
+                "jpeg": f"data/uploads/avatars/ab/{digest}/32.jpg",
+            },
+            "256": {
+                "webp": f"data/uploads/avatars/ab/{digest}/256.webp",
+                "jpeg": f"data/uploads/avatars/ab/{digest}/256.jpg",
+            },
+        }
+        assert variant_digest(f"/{avatar_url}") == digest
+
+    def test_legacy_and_missing_avatars_have_no_variants(self):
+        """Legacy single-file avatars and no avatar should give None."""
+        assert avatar_variant_urls("data/uploads/avatars/x.jpg", [32]) is None
+        assert avatar_variant_urls(None, [32]) is None
+
+    def test_user_schemas_expose_variant_urls(self):
+        """Public user schemas should serialize avatar_urls."""
+        digest = "cd" + "1" * 62
+        user = schemas.UserPublic(
+            id=1,
+            username="someone",
+            display_name="Someone",
+            avatar_url=f"data/uploads/avatars/cd/{digest}/256.webp",
+        )
+
+        dumped = user.model_dump()
+
+        assert set(dumped["avatar_urls"]) == {str(s) for s in settings.AVATAR_SIZES}
+        assert (
+            schemas.UserPublic(
+                id=1, username="someone", display_name="Someone"
+            ).model_dump()["avatar_urls"]
+            is None
+        )
+
+
+class TestStoreAvatar:
+    """Tests for AvatarService.store_avatar."""
+
+    def test_stores_variants_under_content_hash(self, upload_root, inline_images):
+        """Variants should be written under the hash of the upload."""
+        content = _image_bytes()
+        digest = content_hash(content)
+
+        avatar_url = AvatarService.store_avatar(content)
+
+        assert avatar_url == f"data/uploads/avatars/{digest[:2]}/{digest}/256.webp"
+        stored = sorted(p.name for p in (upload_root / avatar_url).parent.iterdir())
+        assert len(stored) == 2 * len(settings.AVATAR_SIZES)
+        assert not list((upload_root / avatar_url).parent.parent.glob(".tmp-*"))
+
+    def test_identical_uploads_render_once(self, upload_root, inline_images):
+        """A second identical upload should reuse the stored variants."""
+        content = _image_bytes()
+
+        first = AvatarService.store_avatar(content)
+        second = AvatarService.store_avatar(content)
+
+        assert first == second
+        assert len(inline_images) == 1
+
+    def test_invalid_image_raises_validation(self, upload_root, inline_images):
+        """Undecodable uploads should be a validation error."""
+        with pytest.raises(ValidationException, match="decode"):
+            AvatarService.store_avatar(b"\x89PNG\r\n\x1a\n broken")
+
+
+class TestReplaceAvatar:
+    """Tests for AvatarService.replace_avatar and sweep_unused_variants."""
+
+    @pytest.fixture
+    def no_grace(self, monkeypatch):
+        """Sweep directories regardless of their age."""
+        monkeypatch.setattr(settings, "AVATAR_SWEEP_GRACE_SECONDS", -60)
+
+    def test_shared_avatar_kept_until_unused(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        other_user: db_models.User,
+        upload_root,
+        inline_images,
+        no_grace,
+    ):
+        """Files shared with another user should survive until the sweep."""
+        shared = AvatarService.store_avatar(_image_bytes(color="red"))
+        test_user.avatar_url = shared
+        other_user.avatar_url = shared
+        db_session.commit()
+
+        new_url = AvatarService.store_avatar(_image_bytes(color="blue"))
+        test_user.avatar_url = new_url
+        db_session.commit()
+        AvatarService.replace_avatar(db_session, test_user.id, shared, new_url)
+
+        assert AvatarService.sweep_unused_variants(db_session) == 0
+        assert (upload_root / shared).exists()
+
+        other_user.avatar_url = new_url
+        db_session.commit()
+        AvatarService.replace_avatar(db_session, other_user.id, shared, new_url)
+
+        assert (upload_root / shared).exists()
+        assert AvatarService.sweep_unused_variants(db_session) == 1
+        assert not (upload_root / shared).parent.exists()
+        assert (upload_root / new_url).exists()
+
+    def test_replacement_keeps_files_of_pending_upload(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        upload_root,
+        inline_images,
+    ):
+        """An identical upload not committed yet should keep its files."""
+        old_url = AvatarService.store_avatar(_image_bytes(color="red"))
+        test_user.avatar_url = old_url
+        db_session.commit()
+
+        # Another user's upload of the same image gets old_url back, but
+        # has not saved it yet when test_user replaces theirs
+        assert AvatarService.store_avatar(_image_bytes(color="red")) == old_url
+        new_url = AvatarService.store_avatar(_image_bytes(color="blue"))
+        test_user.avatar_url = new_url
+        db_session.commit()
+        AvatarService.replace_avatar(db_session, test_user.id, old_url, new_url)
+        AvatarService.sweep_unused_variants(db_session)
+
+        assert (upload_root / old_url).exists()
+
+    def test_legacy_file_deleted_on_replacement(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        upload_root,
+        inline_images,
+    ):
+        """A legacy upload is not shared and should go at once."""
+        legacy = upload_root / "data/uploads/avatars/legacy.png"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(_image_bytes(image_format="PNG"))
+
+        new_url = AvatarService.store_avatar(_image_bytes(color="blue"))
+        AvatarService.replace_avatar(
+            db_session, test_user.id, "data/uploads/avatars/legacy.png", new_url
+        )
+
+        assert not legacy.exists()
+
+
+class TestBackfillVariants:
+    """Tests for AvatarService.backfill_variants."""
+
+    def test_converts_legacy_avatars(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        other_user: db_models.User,
+        admin_user: db_models.User,
+        upload_root,
+        inline_images,
+    ):
+        """Legacy files should be converted once, missing ones counted."""
+        legacy = upload_root / "data/uploads/avatars/legacy.png"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(_image_bytes(image_format="PNG"))
+        test_user.avatar_url = "data/uploads/avatars/legacy.png"
+        other_user.avatar_url = "data/uploads/avatars/gone.jpg"
+        db_session.commit()
+
+        counts = AvatarService.backfill_variants(db_session, batch_size=1)
+        db_session.refresh(test_user)
+
+        assert counts == {
+            "converted": 1,
+            "already_converted": 0,
+            "missing": 1,
+            "failed": 0,
+        }
+        assert variant_digest(test_user.avatar_url) is not None
+        assert (upload_root / test_user.avatar_url).exists()
+        assert not legacy.exists()
+        assert AvatarService.backfill_variants(db_session)["already_converted"] == 1
+
+    def test_dry_run_changes_nothing(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        upload_root,
+        inline_images,
+    ):
+        """A dry run should only count."""
+        legacy = upload_root / "data/uploads/avatars/legacy.jpg"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(_image_bytes())
+        test_user.avatar_url = "data/uploads/avatars/legacy.jpg"
+        db_session.commit()
+
+        counts = AvatarService.backfill_variants(db_session, dry_run=True)
+
+        assert counts["converted"] == 1
+        assert inline_images == []
+        assert legacy.exists()
@@ -1,9 +1,14 @@
 """Tests for CommentLikeService."""
 
+import threading
+
 import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
 
 import repositories.db_models as db_models
 from models.exceptions import BusinessRuleException, CommentNotFoundException
+from repositories.database import Base, create_sqlite_engine
 from services.comment_like_service import CommentLikeService
 
 
@@ -174,6 +179,107 @@ class TestToggleLike:
         assert result3["like_count"] == 1
 
 
+class TestConcurrentToggleLike:
+    """Tests for toggle_like under concurrent clicks."""
+
+    NUM_USERS = 8
+    THREADS_PER_USER = 2
+    TOGGLES_PER_THREAD = 5
+
+    def test_counter_matches_likes_under_contention(self, tmp_path) -> None:
+        """Many threads toggling one comment should never lose an update."""
+        engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'likes.db'}")
+        Base.metadata.create_all(engine)
+        make_session = sessionmaker(bind=engine, info={"writes": True})
+        with make_session() as db:
+            users = [
+                db_models.User(
+                    email=f"liker{i}@example.com",
+                    username=f"liker{i}",
+                    display_name=f"Liker {i}",
+                    hashed_password="not-a-real-hash",  # pragma: allowlist secret
+                )
+                for i in range(self.NUM_USERS + 1)
+            ]
+            category = db_models.Category(
+                name_en="Cat", name_fr="Cat", description_en="", description_fr=""
+            )
+            db.add_all([*users, category])
+            db.flush()
+            idea = db_models.Idea(
+                title="Popular idea",
+                description="An idea with a popular comment.",
+                category_id=category.id,
+                user_id=users[0].id,
+                status=db_models.IdeaStatus.APPROVED,
+            )
+            db.add(idea)
+            db.flush()
+            comment = db_models.Comment(
+                idea_id=idea.id, user_id=users[0].id, content="Popular comment"
+            )
+            db.add(comment)
+            db.commit()
+            comment_id = comment.id
+            liker_ids = [user.id for user in users[1:]]
+
+        errors: list[Exception] = []
+        barrier = threading.Barrier(self.NUM_USERS * self.THREADS_PER_USER)
+
+        def worker(user_id: int) -> None:
+            barrier.wait()
+            for _ in range(self.TOGGLES_PER_THREAD):
+                with make_session() as db:
+                    try:
+                        CommentLikeService.toggle_like(db, comment_id, user_id)
+                    except Exception as e:  # noqa: BLE001 - collected for assert
+                        errors.append(e)
+
+        threads = [
+            threading.Thread(target=worker, args=(user_id,))
+            for user_id in liker_ids
+            for _ in range(self.THREADS_PER_USER)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with make_session() as db:
+            like_count = db.scalar(
+                select(db_models.Comment.like_count).where(
+                    db_models.Comment.id == comment_id
+                )
+            )
+            likes = db.scalar(select(func.count(db_models.CommentLike.id)))
+        engine.dispose()
+
+        assert errors == []
+        assert like_count == likes
+
+
+class TestResyncLikeCounts:
+    """Tests for resync_like_counts method."""
+
+    def test_repairs_drifted_counters(
+        self, db_session, test_user, test_comment, test_user_comment
+    ) -> None:
+        """Counters should be recomputed from comment_likes."""
+        CommentLikeService.toggle_like(db_session, test_comment.id, test_user.id)
+        test_comment.like_count = 7
+        test_user_comment.like_count = 3
+        db_session.commit()
+
+        updated = CommentLikeService.resync_like_counts(db_session)
+        db_session.refresh(test_comment)
+        db_session.refresh(test_user_comment)
+
+        assert updated == 2
+        assert test_comment.like_count == 1
+        assert test_user_comment.like_count == 0
+        assert CommentLikeService.resync_like_counts(db_session) == 0
+
+
 class TestGetUserLikedStatus:
     """Tests for get_user_liked_status method."""
 
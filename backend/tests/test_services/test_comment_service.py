@@ -150,6 +150,19 @@ class TestCommentService:
         # Note: is_moderated may be True if user requires approval
         assert isinstance(requires_approval, bool)
 
+    def test_create_comment_sanitizes_content(self, db_session, test_user, test_idea):
+        """Unsafe HTML is stripped from comment content like idea descriptions."""
+        result, _ = CommentService.create_comment(
+            db=db_session,
+            idea_id=test_idea.id,
+            user_id=test_user.id,
+            content='<p onclick="x()">Nice</p><script>alert(1)</script>',
+            username=test_user.username,
+            display_name=test_user.display_name,
+        )
+
+        assert result.content == "<p>Nice</p>alert(1)"
+
     def test_create_comment_idea_not_found(self, db_session, test_user):
         """Create comment raises exception for non-existent idea."""
         with pytest.raises(IdeaNotFoundException):
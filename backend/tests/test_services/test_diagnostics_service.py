@@ -0,0 +1,98 @@
+"""Tests for the DiagnosticsService index advisor."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import repositories.db_models as db_models
+from repositories.login_event_repository import LoginEventRepository
+from repositories.query_plan_repository import QueryPlanRepository
+from services import diagnostics_service
+from services.diagnostics_service import HOT_QUERIES, DiagnosticsService
+
+
+class TestExplainCall:
+    """Tests for QueryPlanRepository.explain_call."""
+
+    def test_captures_every_statement_without_reading_rows(
+        self, db_session: Session, test_user: db_models.User
+    ):
+        """All SELECTs should be explained while the call sees no rows."""
+        user_id = test_user.id
+        LoginEventRepository(db_session).create_event(
+            event_type=db_models.LoginEventType.LOGIN_SUCCESS,
+            user_id=user_id,
+            ip_address="192.0.2.10",
+        )
+        results: list = []
+
+        def call() -> None:
+            repo = LoginEventRepository(db_session)
+            results.append(repo.get_events_by_user(user_id))
+            results.append(repo.get_events_by_ip("192.0.2.10"))
+
+        plans = QueryPlanRepository.explain_call(db_session, call)
+
+        assert results == [[], []]
+        assert len(plans) == 2
+        assert "ix_login_events_user_created" in " ".join(plans[0].plan)
+        assert "ix_login_events_ip_created" in " ".join(plans[1].plan)
+        # The row itself is still there
+        assert len(LoginEventRepository(db_session).get_events_by_user(user_id)) == 1
+
+
+class TestIndexAdvisor:
+    """Tests for DiagnosticsService.get_index_advice."""
+
+    def test_hot_queries_have_no_full_scans(self, db_session: Session):
+        """Every registered hot query should be served by an index."""
+        advice = DiagnosticsService.get_index_advice(db_session)
+
+        assert advice.database_type == "sqlite"
+        assert {query.name for query in advice.queries} == set(HOT_QUERIES)
+        assert all(query.statements and query.plan for query in advice.queries)
+        assert advice.flagged_count == 0, [
+            (query.name, query.full_scans) for query in advice.queries
+        ]
+
+    def test_flags_unindexed_filter(self, db_session: Session, monkeypatch):
+        """A filter on an unindexed column should be flagged and listed first."""
+        monkeypatch.setattr(
+            diagnostics_service,
+            "HOT_QUERIES",
+            {
+                "indexed": lambda db: LoginEventRepository(db).count_events_in_window(),
+                "unindexed": lambda db: (
+                    db.query(db_models.LoginEvent)
+                    .filter(db_models.LoginEvent.email == "someone@example.com")
+                    .all()
+                ),
+            },
+        )
+
+        advice = DiagnosticsService.get_index_advice(db_session)
+
+        assert advice.flagged_count == 1
+        assert advice.queries[0].name == "unindexed"
+        assert advice.queries[0].full_scans == ["login_events"]
+        assert advice.queries[1].full_scans == []
+
+
+class TestIndexAdvisorEndpoint:
+    """Tests for GET /api/admin/diagnostics/indexes."""
+
+    def test_admin_gets_advice(self, client: TestClient, admin_auth_headers: dict):
+        """Admins should get the plans of the hot queries."""
+        response = client.get(
+            "/api/admin/diagnostics/indexes", headers=admin_auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["flagged_count"] == 0
+        assert len(data["queries"]) == len(HOT_QUERIES)
+
+    def test_requires_admin(self, client: TestClient, auth_headers: dict):
+        """Regular users should be refused."""
+        response = client.get("/api/admin/diagnostics/indexes", headers=auth_headers)
+
+        assert response.status_code == 403
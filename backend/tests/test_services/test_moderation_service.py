@@ -195,6 +195,45 @@ class TestModerationServiceGetModerationQueue:
         assert len(result) == 0
         assert total == 0
 
+    def test_get_moderation_queue_query_count_independent_of_size(
+        self, db_session, test_user, other_user, test_idea, query_counter
+    ):
+        """Test the queue loads content and flags in batches, not per item."""
+
+        def add_flagged_comments(count: int) -> None:
+            for i in range(count):
+                comment = Comment(
+                    idea_id=test_idea.id,
+                    user_id=test_user.id,
+                    content=f"Flagged comment {i}",
+                    is_moderated=False,
+                )
+                db_session.add(comment)
+                db_session.flush()
+                db_session.add(
+                    ContentFlag(
+                        content_type=ContentType.COMMENT,
+                        content_id=comment.id,
+                        reporter_id=other_user.id,
+                        reason=FlagReason.SPAM,
+                        status=FlagStatus.PENDING,
+                    )
+                )
+            db_session.commit()
+
+        add_flagged_comments(2)
+        with query_counter() as small:
+            result, _, _ = ModerationService.get_moderation_queue(db_session)
+        assert len(result) == 2
+
+        add_flagged_comments(8)
+        db_session.expire_all()
+        with query_counter() as large:
+            result, _, _ = ModerationService.get_moderation_queue(db_session)
+        assert len(result) == 10
+
+        assert large.count == small.count
+
 
 class TestModerationServiceReviewFlags:
     """Tests for ModerationService.review_flags"""
@@ -0,0 +1,146 @@
+"""
+Unit tests for ReferenceDataService.
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from repositories.db_models import Category, CategoryQuality, Quality
+from services.reference_data_service import (
+    CategoryRef,
+    QualityRef,
+    ReferenceDataService,
+)
+from services.response_cache_service import ResponseCacheService
+
+
+@pytest.fixture
+def statements(db_session: Session):
+    """Record the SQL statements executed through the test session."""
+    executed: list[str] = []
+    engine = db_session.get_bind()
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    yield executed
+    event.remove(engine, "before_cursor_execute", _before)
+
+
+class TestReferenceSnapshot:
+    """Tests for the reference data snapshot."""
+
+    def test_snapshot_contents(
+        self, db_session: Session, test_category: Category, test_quality: Quality
+    ):
+        """Should hold categories, active qualities and their mapping."""
+        extra = Quality(
+            key="extra",
+            name_en="Extra",
+            name_fr="Extra FR",
+            is_default=False,
+            is_active=True,
+            display_order=2,
+        )
+        db_session.add(extra)
+        db_session.flush()
+        db_session.add(
+            CategoryQuality(
+                category_id=test_category.id, quality_id=extra.id, is_enabled=True
+            )
+        )
+        db_session.commit()
+
+        snapshot = ReferenceDataService.get_snapshot(db_session)
+
+        assert isinstance(snapshot.categories[test_category.id], CategoryRef)
+        assert snapshot.categories[test_category.id].name_en == "Test Category"
+        assert isinstance(snapshot.qualities[test_quality.id], QualityRef)
+        assert snapshot.default_quality_ids == (test_quality.id,)
+        assert snapshot.category_qualities[test_category.id] == (
+            test_quality.id,
+            extra.id,
+        )
+        assert dict(snapshot.quality_keys[test_category.id]) == {
+            "test_quality": test_quality.id,
+            "extra": extra.id,
+        }
+        assert not hasattr(snapshot.categories[test_category.id], "__dict__")
+
+    def test_snapshot_reused_without_queries(
+        self,
+        db_session: Session,
+        test_category: Category,
+        test_quality: Quality,
+        statements: list[str],
+    ):
+        """Warm reads should not query categories or qualities."""
+        first = ReferenceDataService.get_snapshot(db_session)
+        statements.clear()
+
+        second = ReferenceDataService.get_snapshot(db_session)
+
+        assert second is first
+        assert not any("categories" in s or "qualities" in s for s in statements)
+
+    def test_snapshot_swapped_on_version_bump(
+        self, db_session: Session, test_category: Category
+    ):
+        """A committed category write should replace the snapshot."""
+        first = ReferenceDataService.get_snapshot(db_session)
+
+        category = Category(name_en="New", name_fr="Nouveau")
+        db_session.add(category)
+        db_session.commit()
+
+        second = ReferenceDataService.get_snapshot(db_session)
+
+        assert second is not first
+        assert second.version > first.version
+        assert category.id in second.categories
+        # Readers holding the old snapshot keep a consistent view
+        assert category.id not in first.categories
+
+    def test_uncommitted_changes_not_shared(
+        self, db_session: Session, test_category: Category
+    ):
+        """A snapshot built inside a pending write must not be kept."""
+        committed = ReferenceDataService.get_snapshot(db_session)
+
+        category = Category(name_en="Pending", name_fr="En attente")
+        db_session.add(category)
+        db_session.flush()
+        ResponseCacheService._versions_fetched_at = 0.0
+        pending = ReferenceDataService.get_snapshot(db_session)
+        db_session.rollback()
+
+        assert category.id in pending.categories
+        assert ReferenceDataService._snapshot is committed
+
+    def test_get_category_falls_back_to_database(
+        self, db_session: Session, test_category: Category, monkeypatch
+    ):
+        """Categories missing from a stale snapshot should be checked in DB."""
+        stale = ReferenceDataService.get_snapshot(db_session)
+
+        category = Category(name_en="Other", name_fr="Autre")
+        db_session.add(category)
+        db_session.commit()
+        # Simulate another worker that has not seen the version bump yet
+        monkeypatch.setattr(
+            ResponseCacheService,
+            "get_versions",
+            classmethod(
+                lambda cls, db, entities: {"categories": (stale.version, None)}
+            ),
+        )
+
+        assert (
+            category.id not in ReferenceDataService.get_snapshot(db_session).categories
+        )
+        found = ReferenceDataService.get_category(db_session, category.id)
+        assert found is not None
+        assert found.name_en == "Other"
+        assert ReferenceDataService.get_category(db_session, 99999) is None
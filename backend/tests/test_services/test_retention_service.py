@@ -2,10 +2,13 @@
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
 from sqlalchemy.orm import Session
 
 import repositories.db_models as db_models
 from authentication.auth import get_password_hash
+from models.config import settings
+from repositories.retention_repository import RetentionRepository
 from services.retention_service import RetentionMetrics, RetentionService
 
 
@@ -157,6 +160,202 @@ class TestRetentionServiceSoftDeleteCleanup:
         )
 
 
+class TestRetentionServiceBatchedPurge:
+    """Tests for chunked, checkpointed purges."""
+
+    @pytest.fixture(autouse=True)
+    def small_batches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Purge two rows per chunk, without pausing."""
+        monkeypatch.setattr(settings, "RETENTION_PURGE_BATCH_SIZE", 2)
+        monkeypatch.setattr(settings, "RETENTION_PURGE_SLEEP_SECONDS", 0)
+
+    def _old_ideas(
+        self,
+        db_session: Session,
+        user: db_models.User,
+        category: db_models.Category,
+        count: int,
+    ) -> list[int]:
+        """Create ideas soft-deleted past retention."""
+        ideas = [
+            db_models.Idea(
+                title=f"Old deleted idea {i}",
+                description="Should be purged in batches.",
+                category_id=category.id,
+                user_id=user.id,
+                status=db_models.IdeaStatus.APPROVED,
+                deleted_at=datetime.now(timezone.utc) - timedelta(days=35),
+            )
+            for i in range(count)
+        ]
+        db_session.add_all(ideas)
+        db_session.commit()
+        return [idea.id for idea in ideas]
+
+    def test_purges_every_chunk_and_clears_checkpoint(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ) -> None:
+        """All rows should go, chunk by chunk, leaving no checkpoint behind."""
+        self._old_ideas(db_session, test_user, test_category, 5)
+        rates: dict = {}
+
+        deleted_ideas, _ = RetentionService.cleanup_soft_deleted_content(
+            db_session, rates
+        )
+
+        assert deleted_ideas == 5
+        assert db_session.query(db_models.Idea).count() == 0
+        assert rates["ideas"]["deleted"] == 5
+        assert rates["ideas"]["rows_per_second"] >= 0
+        assert RetentionRepository(db_session).get_checkpoint("soft_deleted_ideas") == 0
+
+    def test_resumes_after_checkpoint(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ) -> None:
+        """An interrupted purge should continue after its last chunk."""
+        idea_ids = self._old_ideas(db_session, test_user, test_category, 4)
+        repo = RetentionRepository(db_session)
+        repo.save_checkpoint("soft_deleted_ideas", idea_ids[1])
+        repo.commit()
+
+        deleted_ideas, _ = RetentionService.cleanup_soft_deleted_content(db_session)
+
+        remaining = [idea.id for idea in db_session.query(db_models.Idea).all()]
+        assert deleted_ideas == 2
+        assert remaining == idea_ids[:2]
+        assert repo.get_checkpoint("soft_deleted_ideas") == 0
+
+    def test_rates_add_up_across_purges(
+        self, db_session: Session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Purges sharing a table should add their seconds, not overwrite them."""
+        clock = iter([0.0, 2.0, 10.0, 11.0])
+        monkeypatch.setattr(
+            "services.retention_service.time.perf_counter", lambda: next(clock)
+        )
+        rates: dict = {}
+
+        for purge, count in (("first", 30), ("second", 10)):
+            RetentionService._purge_in_batches(
+                db_session,
+                purge,
+                lambda after_id, limit: [] if after_id else [1],
+                lambda ids, count=count: {"comments": count},
+                rates,
+            )
+
+        assert rates["comments"] == {
+            "deleted": 40,
+            "seconds": 3.0,
+            "rows_per_second": 13.3,
+        }
+
+    def test_cascades_to_vote_qualities_and_comment_likes(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ) -> None:
+        """Qualities of votes and likes of comments should go with the idea."""
+        (idea_id,) = self._old_ideas(db_session, test_user, test_category, 1)
+        quality = db_models.Quality(key="urgent", name_en="Urgent", name_fr="Urgent")
+        vote = db_models.Vote(
+            idea_id=idea_id,
+            user_id=test_user.id,
+            vote_type=db_models.VoteType.UPVOTE,
+        )
+        comment = db_models.Comment(
+            content="Comment on idea", idea_id=idea_id, user_id=test_user.id
+        )
+        db_session.add_all([quality, vote, comment])
+        db_session.flush()
+        db_session.add_all(
+            [
+                db_models.VoteQuality(vote_id=vote.id, quality_id=quality.id),
+                db_models.CommentLike(comment_id=comment.id, user_id=test_user.id),
+            ]
+        )
+        db_session.commit()
+
+        RetentionService.cleanup_soft_deleted_content(db_session)
+
+        assert db_session.query(db_models.VoteQuality).count() == 0
+        assert db_session.query(db_models.CommentLike).count() == 0
+        assert db_session.query(db_models.Comment).count() == 0
+
+    def test_cleanup_orphaned_rows(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ) -> None:
+        """Qualities and likes pointing at deleted rows should be swept."""
+        (idea_id,) = self._old_ideas(db_session, test_user, test_category, 1)
+        quality = db_models.Quality(key="urgent", name_en="Urgent", name_fr="Urgent")
+        vote = db_models.Vote(
+            idea_id=idea_id,
+            user_id=test_user.id,
+            vote_type=db_models.VoteType.UPVOTE,
+        )
+        comment = db_models.Comment(
+            content="Comment on idea", idea_id=idea_id, user_id=test_user.id
+        )
+        db_session.add_all([quality, vote, comment])
+        db_session.flush()
+        db_session.add_all(
+            [
+                db_models.VoteQuality(vote_id=vote.id, quality_id=quality.id),
+                db_models.VoteQuality(vote_id=vote.id + 100, quality_id=quality.id),
+                db_models.CommentLike(comment_id=comment.id, user_id=test_user.id),
+                db_models.CommentLike(
+                    comment_id=comment.id + 100, user_id=test_user.id
+                ),
+            ]
+        )
+        db_session.commit()
+
+        orphans = RetentionService.cleanup_orphaned_rows(db_session)
+
+        assert orphans == {"vote_qualities": 1, "comment_likes": 1}
+        assert db_session.query(db_models.VoteQuality).count() == 1
+        assert db_session.query(db_models.CommentLike).count() == 1
+
+    def test_purges_old_login_events_and_audit_logs(
+        self, db_session: Session, test_user: db_models.User
+    ) -> None:
+        """Login events and audit logs past retention should be deleted."""
+        now = datetime.now(timezone.utc)
+        for days in (100, 120, 130, 10):
+            db_session.add(
+                db_models.LoginEvent(
+                    user_id=test_user.id,
+                    event_type=db_models.LoginEventType.LOGIN_SUCCESS,
+                    created_at=now - timedelta(days=days),
+                )
+            )
+        for days in (6 * 365, 30):
+            db_session.add(
+                db_models.SecurityAuditLog(
+                    event_type="login_failed",
+                    severity="info",
+                    action="login",
+                    created_at=now - timedelta(days=days),
+                )
+            )
+        db_session.commit()
+
+        assert RetentionService.cleanup_old_login_events(db_session) == 3
+        assert RetentionService.cleanup_old_security_audit_logs(db_session) == 1
+        assert db_session.query(db_models.LoginEvent).count() == 1
+        assert db_session.query(db_models.SecurityAuditLog).count() == 1
+
+
 class TestRetentionServiceLoginCodeCleanup:
     """Tests for expired login code cleanup."""
 
@@ -501,3 +700,6 @@ class TestRetentionServiceIntegration:
         # Verify cleanup happened
         assert results["soft_deleted_content"] == (1, 0)
         assert results["expired_login_codes"] == 1
+        assert results["login_events"] == 0
+        assert results["orphans"] == {"vote_qualities": 0, "comment_likes": 0}
+        assert results["purge_rates"]["ideas"]["deleted"] == 1
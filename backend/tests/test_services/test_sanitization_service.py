@@ -0,0 +1,166 @@
+"""Tests for the stored-content sanitization backfill."""
+
+from sqlalchemy import update
+
+from repositories import db_models
+from services import sanitization_service
+from services.sanitization_service import SanitizationService
+
+
+def _add_ideas(db_session, test_user, test_category, titles: list[str]) -> list[int]:
+    """Store ideas with the given raw titles, bypassing write sanitization."""
+    ideas = [
+        db_models.Idea(
+            title=title,
+            description="<p>Plain description</p><script>alert(1)</script>",
+            category_id=test_category.id,
+            user_id=test_user.id,
+            status=db_models.IdeaStatus.APPROVED,
+        )
+        for title in titles
+    ]
+    db_session.add_all(ideas)
+    db_session.commit()
+    return [idea.id for idea in ideas]
+
+
+class TestBackfillExistingContent:
+    """Tests for SanitizationService.backfill_existing_content."""
+
+    def test_sanitizes_ideas_and_comments(
+        self, db_session, test_user, test_category, test_idea
+    ):
+        """Unsafe stored text should be rewritten, batch by batch."""
+        ids = _add_ideas(
+            db_session,
+            test_user,
+            test_category,
+            ["<b>Bold</b> title", "Clean title", "<img src=x onerror=alert(1)>Pic"],
+        )
+        db_session.add(
+            db_models.Comment(
+                idea_id=test_idea.id,
+                user_id=test_user.id,
+                content='<p onclick="x()">Nice</p>',
+            )
+        )
+        db_session.commit()
+
+        result = SanitizationService.backfill_existing_content(db_session, batch_size=2)
+
+        assert result["tables"]["ideas"] == {"scanned": 4, "sanitized": 3, "skipped": 0}
+        assert result["tables"]["comments"] == {
+            "scanned": 1,
+            "sanitized": 1,
+            "skipped": 0,
+        }
+        db_session.expire_all()
+        titles = [db_session.get(db_models.Idea, i).title for i in ids]
+        assert titles == ["Bold title", "Clean title", "Pic"]
+        assert (
+            db_session.get(db_models.Idea, ids[1]).description
+            == "<p>Plain description</p>alert(1)"
+        )
+        assert db_session.query(db_models.Comment).one().content == "<p>Nice</p>"
+
+    def test_rerun_finds_nothing(self, db_session, test_user, test_category):
+        """A second run should leave every row as it is."""
+        _add_ideas(db_session, test_user, test_category, ["<i>Title</i>"])
+        SanitizationService.backfill_existing_content(db_session, tables=["ideas"])
+
+        result = SanitizationService.backfill_existing_content(
+            db_session, tables=["ideas"]
+        )
+
+        assert result["tables"] == {
+            "ideas": {"scanned": 1, "sanitized": 0, "skipped": 0}
+        }
+        assert result["changes"] == []
+
+    def test_dry_run_reports_without_writing(
+        self, db_session, test_user, test_category
+    ):
+        """A dry run should report changes but not store them."""
+        [idea_id] = _add_ideas(db_session, test_user, test_category, ["<u>T</u>"])
+
+        result = SanitizationService.backfill_existing_content(
+            db_session, tables=["ideas"], dry_run=True
+        )
+
+        assert {(c["field"], c["original"]) for c in result["changes"]} == {
+            ("title", "<u>T</u>"),
+            (
+                "description",
+                "<p>Plain description</p><script>alert(1)</script>",
+            ),
+        }
+        db_session.expire_all()
+        assert db_session.get(db_models.Idea, idea_id).title == "<u>T</u>"
+
+    def test_worker_processes(self, db_session, test_user, test_category):
+        """Batches sanitized in worker processes should give the same result."""
+        ids = _add_ideas(
+            db_session, test_user, test_category, [f"<b>{i}</b>" for i in range(7)]
+        )
+
+        result = SanitizationService.backfill_existing_content(
+            db_session, tables=["ideas"], batch_size=2, workers=2
+        )
+
+        assert result["tables"]["ideas"] == {"scanned": 7, "sanitized": 7, "skipped": 0}
+        db_session.expire_all()
+        assert [db_session.get(db_models.Idea, i).title for i in ids] == [
+            str(i) for i in range(7)
+        ]
+
+    def test_keeps_edits_made_while_sanitizing(
+        self, db_session, test_user, test_category, monkeypatch
+    ):
+        """A field edited after its batch was read should not be overwritten."""
+        ids = _add_ideas(db_session, test_user, test_category, ["<b>A</b>", "<b>B</b>"])
+        sanitize_rows = sanitization_service.sanitize_rows
+
+        def sanitize_then_edit(rows, fields):
+            updates = sanitize_rows(rows, fields)
+            db_session.execute(
+                update(db_models.Idea)
+                .where(db_models.Idea.id == ids[0])
+                .values(title="Edited <b>meanwhile</b>", description="<i>New</i>")
+            )
+            return updates
+
+        monkeypatch.setattr(sanitization_service, "sanitize_rows", sanitize_then_edit)
+
+        result = SanitizationService.backfill_existing_content(
+            db_session, tables=["ideas"]
+        )
+
+        db_session.expire_all()
+        assert [db_session.get(db_models.Idea, i).title for i in ids] == [
+            "Edited <b>meanwhile</b>",
+            "B",
+        ]
+        assert db_session.get(db_models.Idea, ids[0]).description == "<i>New</i>"
+        assert result["tables"]["ideas"] == {
+            "scanned": 2,
+            "sanitized": 1,
+            "skipped": 1,
+        }
+        assert {c["id"] for c in result["changes"]} == {ids[1]}
+
+    def test_changes_reported_per_batch_and_capped(
+        self, db_session, test_user, test_category, monkeypatch
+    ):
+        """Every change should reach on_changes; the result keeps a sample."""
+        _add_ideas(
+            db_session, test_user, test_category, [f"<b>{i}</b>" for i in range(5)]
+        )
+        monkeypatch.setattr(sanitization_service, "MAX_CHANGE_RECORDS", 3)
+        batches: list[list[dict]] = []
+
+        result = SanitizationService.backfill_existing_content(
+            db_session, tables=["ideas"], batch_size=2, on_changes=batches.append
+        )
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert result["changes"] == batches[0][:3]
@@ -0,0 +1,75 @@
+"""Tests for SitemapService."""
+
+import xml.etree.ElementTree as ET
+
+import repositories.db_models as db_models
+from models.config import settings
+from services.sitemap_service import SitemapService
+
+_NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+
+
+def _add_ideas(db_session, test_user, test_category, count: int) -> list[int]:
+    ideas = [
+        db_models.Idea(
+            title=f"Sitemap idea {i}",
+            description="An approved idea used for sitemap generation tests.",
+            category_id=test_category.id,
+            user_id=test_user.id,
+            status=db_models.IdeaStatus.APPROVED,
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(ideas)
+    db_session.commit()
+    return [idea.id for idea in ideas]
+
+
+class TestIdeaPriority:
+    """Score to priority mapping."""
+
+    def test_priority_range(self):
+        assert SitemapService.idea_priority(-10) == 0.5
+        assert SitemapService.idea_priority(0) == 0.5
+        assert SitemapService.idea_priority(999) == 0.9
+        assert SitemapService.idea_priority(10**6) == 0.9
+
+    def test_priority_is_monotonic(self):
+        priorities = [SitemapService.idea_priority(s) for s in (1, 10, 100)]
+        assert priorities == sorted(priorities)
+        assert len(set(priorities)) == 3
+
+
+class TestSitemapShards:
+    """Fixed ID-range shards."""
+
+    def test_shards_group_ideas_by_id_range(
+        self, db_session, test_user, test_category, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "SITEMAP_SHARD_SIZE", 2)
+        ids = _add_ideas(db_session, test_user, test_category, 5)
+
+        shards = [shard for shard, _ in SitemapService.get_shards(db_session)]
+
+        assert shards == sorted({idea_id // 2 for idea_id in ids})
+
+    def test_shard_xml_lists_only_its_ideas(
+        self, db_session, test_user, test_category, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "SITEMAP_SHARD_SIZE", 2)
+        monkeypatch.setattr(settings, "SITEMAP_STREAM_BATCH_SIZE", 1)
+        ids = _add_ideas(db_session, test_user, test_category, 5)
+        shard = ids[-1] // 2
+
+        chunks = list(SitemapService.iter_shard_xml(db_session, shard))
+        root = ET.fromstring(b"".join(chunks))
+
+        locs = [loc.text for loc in root.findall("sm:url/sm:loc", _NS)]
+        expected = [i for i in ids if i // 2 == shard]
+        assert locs == [f"{settings.APP_URL.rstrip('/')}/ideas/{i}" for i in expected]
+        # Header, one chunk per idea (batch size 1), footer
+        assert len(chunks) == len(expected) + 2
+
+    def test_pending_ideas_are_excluded(self, db_session, pending_idea, test_idea):
+        ids = [idea.id for idea in SitemapService.iter_sitemap_ideas(db_session)]
+        assert ids == [test_idea.id]
@@ -3,13 +3,18 @@ Unit tests for TagService.
 """
 
 import time
+from datetime import datetime, timezone
 
 import pytest
 from sqlalchemy.orm import Session
 
 import models.schemas as schemas
 import repositories.db_models as db_models
+from models.config import settings
 from models.exceptions import BusinessRuleException, NotFoundException
+from repositories.tag_repository import TagRepository, TagStatRepository
+from services.penalty_service import PenaltyService
+from services.reference_data_service import ReferenceDataService
 from services.tag_service import TagService
 
 
@@ -223,18 +228,29 @@ class TestGetPopularTags:
         db_session.add(db_models.IdeaTag(idea_id=idea.id, tag_id=tag.id))
         db_session.commit()
 
-        # First call - cache miss
+        # First call - snapshot miss
         result1 = TagService.get_popular_tags(db_session, limit=20, min_ideas=1)
 
-        # Verify cached
-        cache_key = TagService._get_cache_key("popular", 20, 1)
-        assert cache_key in TagService._cache
+        # Verify cached in the reference data snapshot
+        assert ReferenceDataService._popular_tags is not None
 
-        # Second call - cache hit
+        # Second call - snapshot hit
         result2 = TagService.get_popular_tags(db_session, limit=20, min_ideas=1)
 
         assert result1 == result2
 
+    def test_get_popular_tags_beyond_snapshot_uses_ttl_cache(
+        self,
+        db_session: Session,
+    ):
+        """Limits larger than the snapshot should use the TTL cache."""
+        limit = settings.REFERENCE_DATA_POPULAR_TAGS + 1
+
+        TagService.get_popular_tags(db_session, limit=limit, min_ideas=1)
+
+        cache_key = TagService._get_cache_key("popular", limit, 1)
+        assert cache_key in TagService._cache
+
 
 class TestGetTagStatistics:
     """Tests for TagService.get_tag_statistics."""
@@ -596,3 +612,168 @@ class TestGetIdeasByTagFull:
         """Should raise NotFoundException for non-existent tag."""
         with pytest.raises(NotFoundException):
             TagService.get_ideas_by_tag_full(db_session, 99999)
+
+
+class TestTagStats:
+    """Tests for the maintained per-tag idea counters (tag_stats)."""
+
+    @staticmethod
+    def _idea(
+        db_session: Session,
+        user: db_models.User,
+        category: db_models.Category,
+        tag_names: list[str],
+        status: db_models.IdeaStatus = db_models.IdeaStatus.APPROVED,
+    ) -> db_models.Idea:
+        idea = db_models.Idea(
+            title="Counted idea",
+            description="Description long enough",
+            category_id=category.id,
+            user_id=user.id,
+            status=status,
+        )
+        db_session.add(idea)
+        db_session.commit()
+        TagService.sync_idea_tags(db_session, idea.id, tag_names)
+        return idea
+
+    @staticmethod
+    def _counts(db_session: Session) -> dict[str, int]:
+        rows = (
+            db_session.query(db_models.Tag.name, db_models.TagStat.idea_count)
+            .join(db_models.TagStat, db_models.TagStat.tag_id == db_models.Tag.id)
+            .all()
+        )
+        return {name: count for name, count in rows if count}
+
+    def test_sync_idea_tags_counts_only_differences(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ):
+        """Retagging a public idea should move its count between tags."""
+        idea = self._idea(db_session, test_user, test_category, ["Parks", "Bikes"])
+        self._idea(db_session, test_user, test_category, ["Parks"])
+        assert self._counts(db_session) == {"parks": 2, "bikes": 1}
+
+        TagService.sync_idea_tags(db_session, idea.id, ["Parks", "Trees"])
+
+        assert self._counts(db_session) == {"parks": 2, "trees": 1}
+
+    def test_status_transitions_and_deletion(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ):
+        """Only approved, non-deleted ideas should be counted."""
+        idea = self._idea(
+            db_session,
+            test_user,
+            test_category,
+            ["Parks"],
+            status=db_models.IdeaStatus.PENDING,
+        )
+        assert self._counts(db_session) == {}
+
+        # Set on an expired instance: the previous status is not loaded
+        idea.status = db_models.IdeaStatus.APPROVED
+        db_session.commit()
+        assert self._counts(db_session) == {"parks": 1}
+
+        db_session.refresh(idea)
+        idea.deleted_at = datetime.now(timezone.utc)
+        db_session.commit()
+        assert self._counts(db_session) == {}
+
+        db_session.refresh(idea)
+        idea.deleted_at = None
+        db_session.commit()
+        assert self._counts(db_session) == {"parks": 1}
+
+        db_session.delete(idea)
+        db_session.commit()
+        assert self._counts(db_session) == {}
+
+    def test_popular_and_autocomplete_read_counters(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ):
+        """Popular tags and suggestions should report the counters."""
+        for _ in range(2):
+            self._idea(db_session, test_user, test_category, ["Parks"])
+        self._idea(db_session, test_user, test_category, ["Parking"])
+        TagService.create_tag(db_session, schemas.TagCreate(display_name="Parkour"))
+
+        popular = TagRepository(db_session).get_popular_tags(limit=10)
+        suggestions = TagRepository(db_session).search_tags_with_counts("park")
+
+        assert [(tag.name, count) for tag, count in popular] == [
+            ("parks", 2),
+            ("parking", 1),
+        ]
+        assert sorted((tag.name, count) for tag, count in suggestions) == [
+            ("parking", 1),
+            ("parkour", 0),
+            ("parks", 2),
+        ]
+
+    def test_resync_repairs_drift(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ):
+        """A bulk statement bypassing the ORM should be repaired by resync."""
+        idea = self._idea(db_session, test_user, test_category, ["Parks"])
+        db_session.query(db_models.Idea).filter(db_models.Idea.id == idea.id).update(
+            {"status": db_models.IdeaStatus.REJECTED}, synchronize_session=False
+        )
+        db_session.commit()
+        assert self._counts(db_session) == {"parks": 1}
+
+        assert TagService.resync_tag_stats(db_session) == 1
+        assert self._counts(db_session) == {}
+        assert TagService.resync_tag_stats(db_session) == 0
+
+    def test_remove_ideas_before_bulk_delete(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        test_category: db_models.Category,
+    ):
+        """Ideas removed in bulk should be taken out of the counters."""
+        first = self._idea(db_session, test_user, test_category, ["Parks", "Bikes"])
+        second = self._idea(db_session, test_user, test_category, ["Parks"])
+
+        TagStatRepository(db_session).remove_ideas([first.id, second.id])
+        db_session.commit()
+
+        assert self._counts(db_session) == {}
+
+    def test_ban_removes_ideas_from_counters(
+        self,
+        db_session: Session,
+        test_user: db_models.User,
+        admin_user: db_models.User,
+        test_category: db_models.Category,
+    ):
+        """Banning a user should take their ideas out of the counters."""
+        self._idea(db_session, test_user, test_category, ["Parks"])
+        self._idea(db_session, admin_user, test_category, ["Bikes"])
+
+        PenaltyService.issue_penalty(
+            db=db_session,
+            user_id=test_user.id,
+            penalty_type=db_models.PenaltyType.PERMANENT_BAN,
+            reason="Severe violation - permanent ban",
+            issued_by=admin_user.id,
+            bulk_delete_content=True,
+        )
+
+        assert self._counts(db_session) == {"bikes": 1}
+        popular = TagRepository(db_session).get_popular_tags(limit=10)
+        assert [tag.name for tag, _ in popular] == ["bikes"]
@@ -670,24 +670,43 @@ class TestUploadAvatar:
         assert "Invalid file type" in str(exc_info.value)
 
     @patch.dict("sys.modules", {"magic": MagicMock()})
-    @patch("builtins.open", create=True)
-    @patch("pathlib.Path.mkdir")
     def test_upload_avatar_success(
         self,
-        mock_mkdir,
-        mock_open,
         db_session: Session,
         test_user: db_models.User,
+        tmp_path,
+        monkeypatch,
     ):
-        """Should upload avatar successfully."""
+        """Should store pre-sized variants and replace the old avatar."""
+        import io
         import sys
 
+        from PIL import Image
+
+        from services import avatar_service
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            avatar_service, "run_image_task", lambda func, *args: func(*args)
+        )
         sys.modules["magic"].from_buffer.return_value = "image/jpeg"
+        old_avatar = tmp_path / "data/uploads/avatars/old.jpg"
+        old_avatar.parent.mkdir(parents=True)
+        old_avatar.write_bytes(b"old")
+        test_user.avatar_url = "data/uploads/avatars/old.jpg"
+        db_session.commit()
 
+        buffer = io.BytesIO()
+        Image.new("RGB", (120, 80), "green").save(buffer, "JPEG")
         mock_file = MagicMock()
-        mock_file.file.read.return_value = b"fake jpeg content"
+        mock_file.file.read.return_value = buffer.getvalue()
 
         result = UserService.upload_avatar(db_session, test_user.id, mock_file)
 
         assert result.message == "Avatar uploaded successfully"
-        assert result.avatar_url is not None
+        assert result.avatar_url.endswith("/256.webp")
+        assert (tmp_path / result.avatar_url).exists()
+        assert result.avatar_urls is not None
+        assert (tmp_path / result.avatar_urls["32"]["jpeg"]).exists()
+        assert test_user.avatar_url == result.avatar_url
+        assert not old_avatar.exists()
@@ -146,3 +146,63 @@ class TestVoteService:
                 idea_id=test_idea.id,
                 user_id=other_user.id,
             )
+
+
+class TestVoteCounters:
+    """Denormalized vote counters on ideas."""
+
+    def test_vote_updates_counters(self, db_session, other_user, test_idea):
+        """Voting and switching votes keeps counters and score in sync."""
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.UPVOTE
+        )
+        db_session.refresh(test_idea)
+        assert (test_idea.upvote_count, test_idea.downvote_count) == (1, 0)
+        assert test_idea.score == 1
+
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.DOWNVOTE
+        )
+        db_session.refresh(test_idea)
+        assert (test_idea.upvote_count, test_idea.downvote_count) == (0, 1)
+        assert test_idea.score == -1
+
+    def test_remove_vote_updates_counters(self, db_session, other_user, test_idea):
+        """Removing a vote decrements the counters."""
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.UPVOTE
+        )
+        VoteService.remove_vote(db_session, test_idea.id, other_user.id)
+
+        db_session.refresh(test_idea)
+        assert test_idea.upvote_count == 0
+        assert test_idea.score == 0
+
+    def test_votes_apply_deltas(self, db_session, other_user, test_idea):
+        """Votes add to the stored counters instead of recounting votes."""
+        test_idea.upvote_count = 5
+        test_idea.score = 5
+        db_session.commit()
+
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.UPVOTE
+        )
+        VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, db_models.VoteType.UPVOTE
+        )
+        db_session.refresh(test_idea)
+        assert (test_idea.upvote_count, test_idea.score) == (6, 6)
+
+        VoteService.remove_vote(db_session, test_idea.id, other_user.id)
+        db_session.refresh(test_idea)
+        assert (test_idea.upvote_count, test_idea.score) == (5, 5)
+
+    def test_resync_repairs_drift(self, db_session, test_idea, create_votes):
+        """Votes written directly are picked up by the resync job."""
+        create_votes(test_idea.id, upvotes=3, downvotes=1)
+
+        assert VoteService.resync_vote_counts(db_session) >= 1
+
+        db_session.refresh(test_idea)
+        assert (test_idea.upvote_count, test_idea.downvote_count) == (3, 1)
+        assert test_idea.score == 2
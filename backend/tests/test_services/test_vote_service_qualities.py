@@ -3,6 +3,7 @@ Unit tests for VoteService quality handling.
 """
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from models.exceptions import BusinessRuleException, VoteNotFoundException
@@ -233,6 +234,88 @@ class TestVoteOnIdeaWithQualities:
         assert vote_qualities[0].quality_id == test_quality.id
 
 
+class TestVoteWritePath:
+    """Single-transaction upsert path of vote_on_idea."""
+
+    def test_quality_keys_are_resolved(
+        self,
+        db_session: Session,
+        test_idea: Idea,
+        other_user: User,
+        test_quality: Quality,
+    ):
+        """Quality keys map to IDs; unknown keys are ignored."""
+        vote = VoteService.vote_on_idea(
+            db_session,
+            test_idea.id,
+            other_user.id,
+            VoteType.UPVOTE,
+            quality_keys=[test_quality.key, "unknown_key"],
+        )
+
+        assert VoteService.get_vote_qualities(
+            db_session, test_idea.id, other_user.id
+        ) == [test_quality.id]
+        assert vote.vote_type == VoteType.UPVOTE
+
+    def test_repeat_vote_keeps_single_row(
+        self,
+        db_session: Session,
+        test_idea: Idea,
+        other_user: User,
+    ):
+        """Voting again updates the existing row in place."""
+        first = VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, VoteType.UPVOTE
+        )
+        second = VoteService.vote_on_idea(
+            db_session, test_idea.id, other_user.id, VoteType.DOWNVOTE
+        )
+
+        assert second.id == first.id
+        assert db_session.query(Vote).filter(Vote.idea_id == test_idea.id).count() == 1
+
+    def test_vote_commits_once_without_reference_queries(
+        self,
+        db_session: Session,
+        test_idea: Idea,
+        other_user: User,
+        test_quality: Quality,
+    ):
+        """A warm vote commits once and does not reload qualities."""
+        VoteService.vote_on_idea(
+            db_session,
+            test_idea.id,
+            other_user.id,
+            VoteType.UPVOTE,
+            quality_ids=[test_quality.id],
+        )
+        commits: list[None] = []
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(db_session, "after_commit", lambda s: commits.append(None))
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            VoteService.vote_on_idea(
+                db_session,
+                test_idea.id,
+                other_user.id,
+                VoteType.UPVOTE,
+                quality_ids=[test_quality.id],
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(commits) == 1
+        assert not any("FROM categories" in sql for sql in statements)
+        assert not any("FROM category_qualities" in sql for sql in statements)
+        assert any("ON CONFLICT" in sql for sql in statements)
+
+
 class TestUpdateVoteQualities:
     """Tests for update_vote_qualities method."""
 
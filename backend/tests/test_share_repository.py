@@ -1,9 +1,25 @@
 """Tests for ShareRepository."""
 
+from datetime import datetime, timedelta, timezone
+
 import repositories.db_models as db_models
 from repositories.share_repository import ShareRepository
 
 
+def _add_shares(
+    repo: ShareRepository,
+    idea_id: int,
+    platform: db_models.SharePlatform,
+    count: int = 1,
+    minutes_ago: int = 0,
+) -> None:
+    """Write shares into the rollup the way ShareService flushes them."""
+    bucket = (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).replace(
+        second=0, microsecond=0
+    )
+    repo.upsert_share_counts({(idea_id, platform, bucket): count})
+
+
 class TestShareRepository:
     """Test suite for ShareRepository."""
 
@@ -38,9 +54,9 @@ class TestShareRepository:
         repo = ShareRepository(db_session)
 
         # Create multiple shares
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.FACEBOOK)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.FACEBOOK)
 
         counts = repo.get_share_counts_by_idea(test_idea.id)
 
@@ -62,8 +78,8 @@ class TestShareRepository:
         repo = ShareRepository(db_session)
 
         # Create shares
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.FACEBOOK)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.FACEBOOK)
         db_session.commit()
 
         count = repo.get_recent_share_count(test_idea.id, days=7)
@@ -96,8 +112,8 @@ class TestShareRepository:
         db_session.refresh(idea2)
 
         # Create shares for idea1
-        repo.create_share_event(idea1.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(idea1.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, idea1.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, idea1.id, db_models.SharePlatform.TWITTER)
         # No shares for idea2
 
         counts = repo.get_share_counts_by_idea_batch([idea1.id, idea2.id])
@@ -119,8 +135,8 @@ class TestShareRepository:
         """Should return total share count."""
         repo = ShareRepository(db_session)
 
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.FACEBOOK)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.FACEBOOK)
 
         total = repo.get_total_shares()
 
@@ -131,7 +147,7 @@ class TestShareRepository:
         repo = ShareRepository(db_session)
 
         # Create share
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
         db_session.commit()
 
         total_7_days = repo.get_total_shares(days=7)
@@ -142,10 +158,10 @@ class TestShareRepository:
         """Should return platform distribution."""
         repo = ShareRepository(db_session)
 
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.FACEBOOK)
-        repo.create_share_event(test_idea.id, db_models.SharePlatform.LINKEDIN)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.FACEBOOK)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.LINKEDIN)
 
         distribution = repo.get_platform_distribution()
 
@@ -179,11 +195,11 @@ class TestShareRepository:
         db_session.refresh(idea2)
 
         # Idea1 gets more shares
-        repo.create_share_event(idea1.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(idea1.id, db_models.SharePlatform.TWITTER)
-        repo.create_share_event(idea1.id, db_models.SharePlatform.FACEBOOK)
+        _add_shares(repo, idea1.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, idea1.id, db_models.SharePlatform.TWITTER)
+        _add_shares(repo, idea1.id, db_models.SharePlatform.FACEBOOK)
         # Idea2 gets fewer shares
-        repo.create_share_event(idea2.id, db_models.SharePlatform.LINKEDIN)
+        _add_shares(repo, idea2.id, db_models.SharePlatform.LINKEDIN)
 
         top_ideas = repo.get_top_shared_ideas(limit=2)
 
@@ -217,7 +233,49 @@ class TestShareRepository:
         for platform in platforms:
             share = repo.create_share_event(test_idea.id, platform)
             assert share.platform == platform
+            _add_shares(repo, test_idea.id, platform)
 
         counts = repo.get_share_counts_by_idea(test_idea.id)
         assert counts["total_shares"] == 5
         assert len(counts["by_platform"]) == 5
+
+    def test_upsert_share_counts_accumulates(self, db_session, test_idea):
+        """Flushing the same bucket twice should add counts, not overwrite."""
+        repo = ShareRepository(db_session)
+
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER, count=3)
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER, count=4)
+
+        assert db_session.query(db_models.ShareCount).count() == 1
+        assert repo.get_share_counts_by_idea(test_idea.id)["total_shares"] == 7
+
+    def test_upsert_share_counts_skips_missing_ideas(self, db_session, test_idea):
+        """Counts for deleted ideas should be dropped on flush."""
+        repo = ShareRepository(db_session)
+        bucket = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+        written = repo.upsert_share_counts(
+            {
+                (test_idea.id, db_models.SharePlatform.TWITTER, bucket): 2,
+                (99999, db_models.SharePlatform.TWITTER, bucket): 5,
+            }
+        )
+
+        assert written == 2
+        assert repo.get_total_shares() == 2
+
+    def test_get_total_shares_excludes_old_buckets(self, db_session, test_idea):
+        """Days filter should apply to the bucket start."""
+        repo = ShareRepository(db_session)
+
+        _add_shares(repo, test_idea.id, db_models.SharePlatform.TWITTER)
+        _add_shares(
+            repo,
+            test_idea.id,
+            db_models.SharePlatform.TWITTER,
+            count=5,
+            minutes_ago=60 * 24 * 10,
+        )
+
+        assert repo.get_total_shares() == 6
+        assert repo.get_total_shares(days=7) == 1
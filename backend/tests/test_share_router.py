@@ -2,6 +2,8 @@
 
 from fastapi import status
 
+from services.share_service import ShareService
+
 
 class TestShareRouter:
     """Test suite for share API endpoints."""
@@ -61,12 +63,14 @@ class TestShareRouter:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_get_share_analytics_success(self, client, test_idea):
+    def test_get_share_analytics_success(self, client, db_session, test_idea):
         """Should return share analytics for an idea."""
         # Create some shares first
         client.post(f"/api/shares/{test_idea.id}", json={"platform": "twitter"})
         client.post(f"/api/shares/{test_idea.id}", json={"platform": "twitter"})
         client.post(f"/api/shares/{test_idea.id}", json={"platform": "facebook"})
+        # Analytics read the rollup as of the last scheduled flush
+        ShareService.flush_share_buffer(db_session)
 
         response = client.get(f"/api/shares/{test_idea.id}/analytics")
 
@@ -112,11 +116,14 @@ class TestAdminShareRouter:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_get_admin_analytics_success(self, client, admin_auth_headers, test_idea):
+    def test_get_admin_analytics_success(
+        self, client, db_session, admin_auth_headers, test_idea
+    ):
         """Should return admin analytics for admins."""
         # Create some shares
         client.post(f"/api/shares/{test_idea.id}", json={"platform": "twitter"})
         client.post(f"/api/shares/{test_idea.id}", json={"platform": "facebook"})
+        ShareService.flush_share_buffer(db_session)
 
         response = client.get(
             "/api/admin/analytics/shares",
@@ -3,6 +3,7 @@
 import pytest
 
 import repositories.db_models as db_models
+from models.config import settings
 from models.exceptions import IdeaNotFoundException
 from models.schemas import SharePlatform
 from services.share_service import ShareService
@@ -11,8 +12,10 @@ from services.share_service import ShareService
 class TestShareService:
     """Test suite for ShareService."""
 
-    def test_record_share_success(self, db_session, test_idea):
+    def test_record_share_success(self, db_session, test_idea, monkeypatch):
         """Should record a share event successfully."""
+        monkeypatch.setattr(settings, "SHARE_EVENT_LOG_SAMPLE_RATE", 1.0)
+
         response = ShareService.record_share(
             db=db_session,
             idea_id=test_idea.id,
@@ -25,6 +28,48 @@ class TestShareService:
         assert response.id is not None
         assert response.created_at is not None
 
+    def test_record_share_buffers_without_raw_event(self, db_session, test_idea):
+        """Unsampled shares should only be counted in the buffer."""
+        response = ShareService.record_share(
+            db=db_session,
+            idea_id=test_idea.id,
+            platform=SharePlatform.TWITTER,
+        )
+
+        assert response.id is None
+        assert db_session.query(db_models.ShareEvent).count() == 0
+        assert db_session.query(db_models.ShareCount).count() == 0
+
+        assert ShareService.flush_share_buffer(db_session) == 1
+        assert ShareService.flush_share_buffer(db_session) == 0
+        row = db_session.query(db_models.ShareCount).one()
+        assert row.idea_id == test_idea.id
+        assert row.count == 1
+
+    def test_record_share_aggregates_per_minute(self, db_session, test_idea):
+        """Repeated shares in the same minute should collapse into one row."""
+        for _ in range(5):
+            ShareService.record_share(db_session, test_idea.id, SharePlatform.TWITTER)
+        ShareService.record_share(db_session, test_idea.id, SharePlatform.FACEBOOK)
+
+        ShareService.flush_share_buffer(db_session)
+
+        rows = db_session.query(db_models.ShareCount).all()
+        by_platform = {row.platform.value: row.count for row in rows}
+        assert by_platform == {"twitter": 5, "facebook": 1}
+
+    def test_record_share_flushes_when_buffer_full(
+        self, db_session, test_idea, monkeypatch
+    ):
+        """Reaching SHARE_BUFFER_MAX_KEYS should trigger an inline flush."""
+        monkeypatch.setattr(settings, "SHARE_BUFFER_MAX_KEYS", 2)
+
+        ShareService.record_share(db_session, test_idea.id, SharePlatform.TWITTER)
+        assert db_session.query(db_models.ShareCount).count() == 0
+
+        ShareService.record_share(db_session, test_idea.id, SharePlatform.FACEBOOK)
+        assert db_session.query(db_models.ShareCount).count() == 2
+
     def test_record_share_without_referrer(self, db_session, test_idea):
         """Should record a share event without referrer URL."""
         response = ShareService.record_share(
@@ -69,6 +114,7 @@ class TestShareService:
         ShareService.record_share(db_session, test_idea.id, SharePlatform.TWITTER)
         ShareService.record_share(db_session, test_idea.id, SharePlatform.TWITTER)
         ShareService.record_share(db_session, test_idea.id, SharePlatform.FACEBOOK)
+        ShareService.flush_share_buffer(db_session)
 
         analytics = ShareService.get_idea_share_analytics(db_session, test_idea.id)
 
@@ -119,6 +165,7 @@ class TestShareService:
         ShareService.record_share(db_session, idea1.id, SharePlatform.TWITTER)
         ShareService.record_share(db_session, idea1.id, SharePlatform.TWITTER)
         ShareService.record_share(db_session, idea2.id, SharePlatform.FACEBOOK)
+        ShareService.flush_share_buffer(db_session)
 
         top_ideas = ShareService.get_top_shared_ideas(db_session, limit=5)
 
@@ -140,6 +187,7 @@ class TestShareService:
         ShareService.record_share(db_session, test_idea.id, SharePlatform.TWITTER)
         ShareService.record_share(db_session, test_idea.id, SharePlatform.FACEBOOK)
         ShareService.record_share(db_session, test_idea.id, SharePlatform.TWITTER)
+        ShareService.flush_share_buffer(db_session)
 
         analytics = ShareService.get_admin_share_analytics(db_session)
 
@@ -6,7 +6,11 @@ import { useTranslation } from 'react-i18next';
 import { captureException, captureMessage, isSentryEnabled } from '@/lib/sentry-utils';
 import { useAuthStore } from '@/store/authStore';
 import { adminAPI } from '@/lib/api';
-import type { DatabaseDiagnosticsResponse, SystemResourcesResponse } from '@/types';
+import type {
+  DatabaseDiagnosticsResponse,
+  IndexAdvisorResponse,
+  SystemResourcesResponse,
+} from '@/types';
 import { Button } from '@/components/Button';
 import { Card } from '@/components/Card';
 import { PageContainer, PageHeader } from '@/components/PageContainer';
@@ -54,6 +58,11 @@ export default function DiagnosticsPage() {
     message: '',
   });
   const [dbInfo, setDbInfo] = useState<DatabaseDiagnosticsResponse | null>(null);
+  const [indexStatus, setIndexStatus] = useState<DiagnosticStatus>({
+    status: 'idle',
+    message: '',
+  });
+  const [indexInfo, setIndexInfo] = useState<IndexAdvisorResponse | null>(null);
   const [systemStatus, setSystemStatus] = useState<DiagnosticStatus>({
     status: 'idle',
     message: '',
@@ -217,6 +226,28 @@ export default function DiagnosticsPage() {
     }
   };
 
+  // Index advisor
+  const checkIndexes = async () => {
+    setIndexStatus({ status: 'loading', message: t('admin.diagnostics.checking') });
+    setIndexInfo(null);
+    try {
+      const result = await adminAPI.diagnostics.getIndexAdvice();
+      setIndexInfo(result);
+      setIndexStatus({
+        status: result.flagged_count === 0 ? 'success' : 'error',
+        message:
+          result.flagged_count === 0
+            ? t('admin.diagnostics.indexesOk')
+            : t('admin.diagnostics.indexesFlagged', { count: result.flagged_count }),
+      });
+    } catch (error) {
+      setIndexStatus({
+        status: 'error',
+        message: error instanceof Error ? error.message : 'Failed to check indexes',
+      });
+    }
+  };
+
   // System resources check
   const checkSystemResources = async () => {
     setSystemStatus({ status: 'loading', message: t('admin.diagnostics.checking') });
@@ -579,6 +610,60 @@ export default function DiagnosticsPage() {
               {t('admin.diagnostics.dbNote')}
             </p>
           </Card>
+
+          {/* Index Advisor */}
+          <Card className="p-4 sm:p-6 overflow-hidden">
+            <h2 className="text-lg font-semibold mb-2">{t('admin.diagnostics.indexTests')}</h2>
+            <p className="text-sm text-gray-600 dark:text-gray-400 mb-4">
+              {t('admin.diagnostics.indexDescription')}
+            </p>
+
+            <div className="space-y-3">
+              <Button
+                onClick={checkIndexes}
+                variant="primary"
+                className="w-full"
+                disabled={indexStatus.status === 'loading'}
+              >
+                {indexStatus.status === 'loading'
+                  ? t('admin.diagnostics.checking')
+                  : t('admin.diagnostics.checkIndexes')}
+              </Button>
+            </div>
+
+            {indexStatus.message && (
+              <div className={`mt-4 p-3 rounded-lg text-sm ${getStatusColor(indexStatus.status)}`}>
+                {indexStatus.message}
+              </div>
+            )}
+
+            {indexInfo && (
+              <ul className="mt-4 space-y-2 max-h-80 overflow-y-auto">
+                {indexInfo.queries.map((query) => (
+                  <li
+                    key={query.name}
+                    className="pt-2 border-t border-gray-200 dark:border-gray-700 text-xs"
+                  >
+                    <div className="flex items-center justify-between gap-2">
+                      <span className="font-mono truncate">{query.name}</span>
+                      {query.full_scans.length > 0 && (
+                        <span className="shrink-0 px-2 py-0.5 rounded-full font-medium bg-red-100 text-red-800 dark:bg-red-900/30 dark:text-red-300">
+                          {t('admin.diagnostics.fullScan')}: {query.full_scans.join(', ')}
+                        </span>
+                      )}
+                    </div>
+                    <pre className="mt-1 font-mono text-gray-500 dark:text-gray-400 whitespace-pre-wrap break-all">
+                      {query.plan.join('\n')}
+                    </pre>
+                  </li>
+                ))}
+              </ul>
+            )}
+
+            <p className="text-xs text-gray-500 dark:text-gray-400 mt-4">
+              {t('admin.diagnostics.indexNote')}
+            </p>
+          </Card>
         </div>
 
         {/* Right Column: Info Widgets */}
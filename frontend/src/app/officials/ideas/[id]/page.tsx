@@ -5,6 +5,7 @@ import { useParams, useRouter } from 'next/navigation';
 import { useTranslation } from 'react-i18next';
 import { useLocalizedField } from '@/hooks/useLocalizedField';
 import { officialsAPI } from '@/lib/api';
+import { RichTextDisplay } from '@/components/RichTextDisplay';
 import type { OfficialsIdeaDetail } from '@/types';
 import {
   ArrowLeft,
@@ -156,9 +157,12 @@ export default function OfficialsIdeaDetailPage() {
         </div>
 
         {/* Description */}
-        <p className="text-gray-700 dark:text-gray-300 whitespace-pre-wrap mb-6">
-          {idea.description}
-        </p>
+        <div className="mb-6">
+          <RichTextDisplay
+            content={idea.description}
+            className="text-gray-700 dark:text-gray-300"
+          />
+        </div>
 
         {/* Vote stats */}
         <div className="flex items-center gap-6 p-4 bg-gray-50 dark:bg-gray-700/50 rounded-lg mb-6">
@@ -266,9 +270,10 @@ export default function OfficialsIdeaDetailPage() {
                         {new Date(comment.created_at).toLocaleDateString()}
                       </span>
                     </div>
-                    <p className="text-gray-700 dark:text-gray-300 text-sm whitespace-pre-wrap">
-                      {comment.content}
-                    </p>
+                    <RichTextDisplay
+                      content={comment.content}
+                      className="text-sm text-gray-700 dark:text-gray-300"
+                    />
                   </div>
                   <div className="flex items-center gap-1 px-2 py-1 bg-rose-100 dark:bg-rose-900/30 rounded-full shrink-0">
                     <Heart className="w-4 h-4 text-rose-600 dark:text-rose-400" />
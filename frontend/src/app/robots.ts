@@ -7,7 +7,8 @@ export default function robots(): MetadataRoute.Robots {
     rules: [
       {
         userAgent: '*',
-        allow: '/',
+        // Idea sitemaps are served by the API (sharded, see sitemap index)
+        allow: ['/', '/api/sitemap/'],
         disallow: [
           '/admin/', // Admin panel
           '/admin',
@@ -21,7 +22,7 @@ export default function robots(): MetadataRoute.Robots {
       },
       {
         userAgent: 'Googlebot',
-        allow: '/',
+        allow: ['/', '/api/sitemap/'],
         disallow: ['/admin/', '/my-ideas', '/profile'],
       },
       {
@@ -34,7 +35,7 @@ export default function robots(): MetadataRoute.Robots {
         crawlDelay: 10,
       },
     ],
-    sitemap: `${BASE_URL}/sitemap.xml`,
+    sitemap: [`${BASE_URL}/sitemap.xml`, `${BASE_URL}/api/sitemap/index.xml`],
     host: BASE_URL,
   };
 }
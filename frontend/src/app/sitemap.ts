@@ -3,6 +3,9 @@ import { MetadataRoute } from 'next';
 const BASE_URL = process.env.NEXT_PUBLIC_SITE_URL || 'https://idees-montreal.ca';
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api';
 
+// Idea pages are listed by the API's sharded sitemaps (/api/sitemap/index.xml,
+// advertised in robots.ts), which stay under the 50,000 URL limit per file.
+
 // Static pages that don't change often
 // Note: Only include pages that should be indexed (no noindex pages)
 const staticPages = [
@@ -13,44 +16,11 @@ const staticPages = [
   { path: '/contact', priority: 0.4, changeFrequency: 'monthly' as const },
 ];
 
-interface SitemapIdea {
-  id: number;
-  updated_at: string;
-  score: number;
-}
-
 interface SitemapTag {
   name: string;
   idea_count: number;
 }
 
-// Fetch approved ideas for sitemap
-async function getApprovedIdeas(): Promise<SitemapIdea[]> {
-  try {
-    // Fetch all approved ideas from leaderboard
-    const response = await fetch(`${API_URL}/ideas/leaderboard?limit=1000`, {
-      next: { revalidate: 3600 }, // Revalidate every hour
-    });
-
-    if (!response.ok) {
-      console.error('Failed to fetch ideas for sitemap');
-      return [];
-    }
-
-    const ideas = await response.json();
-    return ideas.map(
-      (idea: { id: number; updated_at?: string; created_at: string; score: number }) => ({
-        id: idea.id,
-        updated_at: idea.updated_at || idea.created_at,
-        score: idea.score,
-      })
-    );
-  } catch (error) {
-    console.error('Error fetching ideas for sitemap:', error);
-    return [];
-  }
-}
-
 // Fetch popular tags for sitemap
 async function getPopularTags(): Promise<SitemapTag[]> {
   try {
@@ -75,7 +45,7 @@ async function getPopularTags(): Promise<SitemapTag[]> {
 }
 
 export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
-  const [ideas, tags] = await Promise.all([getApprovedIdeas(), getPopularTags()]);
+  const tags = await getPopularTags();
 
   const now = new Date();
 
@@ -93,22 +63,6 @@ export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
     },
   }));
 
-  // Idea pages - higher score ideas get higher priority
-  const maxScore = Math.max(...ideas.map((i) => i.score), 1);
-  const ideaEntries: MetadataRoute.Sitemap = ideas.map((idea) => ({
-    url: `${BASE_URL}/ideas/${idea.id}`,
-    lastModified: new Date(idea.updated_at),
-    changeFrequency: 'weekly' as const,
-    // Priority based on score (0.5-0.9 range)
-    priority: 0.5 + (idea.score / maxScore) * 0.4,
-    alternates: {
-      languages: {
-        'fr-CA': `${BASE_URL}/ideas/${idea.id}`,
-        'en-CA': `${BASE_URL}/ideas/${idea.id}`,
-      },
-    },
-  }));
-
   // Tag pages - more ideas = higher priority
   const maxTagCount = Math.max(...tags.map((t) => t.idea_count), 1);
   const tagEntries: MetadataRoute.Sitemap = tags
@@ -126,5 +80,5 @@ export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
       },
     }));
 
-  return [...staticEntries, ...ideaEntries, ...tagEntries];
+  return [...staticEntries, ...tagEntries];
 }
@@ -22,10 +22,13 @@ export function UserAvatar({ user, size = 'sm', className = '' }: UserAvatarProp
   const sizeClass = sizeClasses[size];
   const px = sizePx[size];
 
-  if (user.avatar_url) {
+  // 64px variant covers both sizes on 2x screens; legacy avatars have none
+  const avatarPath = user.avatar_urls?.['64']?.webp ?? user.avatar_url;
+
+  if (avatarPath) {
     return (
       <Image
-        src={getAvatarUrl(user.avatar_url)}
+        src={getAvatarUrl(avatarPath)}
         alt={user.display_name || user.username}
         width={px}
         height={px}
@@ -58,6 +58,7 @@ import type {
   ConsentStatus,
   ConsentLogEntry,
   DatabaseDiagnosticsResponse,
+  IndexAdvisorResponse,
   SystemResourcesResponse,
   SharePlatform,
   ShareAnalyticsResponse,
@@ -1029,6 +1030,14 @@ export const adminAPI = {
       return response.data;
     },
 
+    /**
+     * Explain the hot queries and flag full table scans (index advisor)
+     */
+    getIndexAdvice: async (): Promise<IndexAdvisorResponse> => {
+      const response = await api.get<IndexAdvisorResponse>('/admin/diagnostics/indexes');
+      return response.data;
+    },
+
     /**
      * Get system resource usage (disk, docker, database size, memory)
      */
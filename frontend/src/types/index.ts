@@ -4,6 +4,8 @@ export interface User {
   username: string;
   display_name: string;
   avatar_url?: string;
+  // Pre-sized variants by size in px ("32", "64", "128", "256"), then format
+  avatar_urls?: Record<string, { webp: string; jpeg: string }> | null;
   is_global_admin: boolean;
   is_active: boolean;
   is_official: boolean;
@@ -778,6 +780,19 @@ export interface DatabaseDiagnosticsResponse {
   error: string | null;
 }
 
+export interface QueryPlanInfo {
+  name: string;
+  statements: string[];
+  plan: string[];
+  full_scans: string[];
+}
+
+export interface IndexAdvisorResponse {
+  database_type: string;
+  queries: QueryPlanInfo[];
+  flagged_count: number;
+}
+
 export interface DiskUsageInfo {
   total_gb: number;
   used_gb: number;
@@ -5,26 +5,82 @@ Exploit-DB and SearchSploit Cross-Reference.
 Checks discovered CVEs against Exploit-DB for known exploits,
 providing exploitability assessment for prioritization.
 
+Lookups are answered from Exploit-DB's own index (files_exploits.csv,
+shipped with the exploitdb package), parsed once per run. Without the
+index, searchsploit is run for each CVE, several processes at a time.
+
 Usage:
     SCAN_DIR=/app/results/cve python exploitdb_check.py
+    EXPLOITDB_CSV=/path/to/files_exploits.csv python exploitdb_check.py
 """
 
+import csv
 import json
 import os
 import subprocess
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 SCAN_DIR = os.environ.get("SCAN_DIR", "/app/results/cve")
+EXPLOITDB_CSV_PATHS = [
+    os.environ.get("EXPLOITDB_CSV", ""),
+    "/usr/share/exploitdb/files_exploits.csv",
+    "/opt/exploitdb/files_exploits.csv",
+]
+# searchsploit processes run at once when there is no index
+SEARCHSPLOIT_WORKERS = int(os.environ.get("SEARCHSPLOIT_WORKERS", "8"))
+CVE_PATTERN = re.compile(r"CVE-\d{4}-\d{4,}")
+
+
+def load_exploit_index(csv_path: Path) -> List[Dict]:
+    """
+    Parse Exploit-DB's files_exploits.csv.
+
+    Args:
+        csv_path: Path to files_exploits.csv
+
+    Returns:
+        One dict per exploit, shaped like searchsploit's JSON results,
+        with the CVE IDs from its "codes" column
+    """
+    exploits = []
+    with open(csv_path, newline="", encoding="utf-8", errors="replace") as f:
+        for row in csv.DictReader(f):
+            exploits.append({
+                "title": row.get("description", ""),
+                "path": str(csv_path.parent / row.get("file", "")),
+                "type": row.get("type", ""),
+                "platform": row.get("platform", ""),
+                "date": row.get("date_published", ""),
+                "author": row.get("author", ""),
+                "cve_ids": CVE_PATTERN.findall(row.get("codes", "")),
+            })
+    return exploits
 
 
 class ExploitDBChecker:
-    def __init__(self):
+    def __init__(self, index_path: Optional[Path] = None):
         self.scan_dir = Path(SCAN_DIR)
         self.exploits_found = []
-        self.searchsploit_available = self._check_searchsploit()
+        self.index_path = index_path or self._find_index()
+        self.exploits = load_exploit_index(self.index_path) if self.index_path else []
+        self.exploits_by_cve: Dict[str, List[Dict]] = {}
+        for exploit in self.exploits:
+            for cve_id in exploit["cve_ids"]:
+                self.exploits_by_cve.setdefault(cve_id, []).append(exploit)
+        self.searchsploit_available = (
+            not self.index_path and self._check_searchsploit()
+        )
+
+    def _find_index(self) -> Optional[Path]:
+        """Locate files_exploits.csv."""
+        for candidate in EXPLOITDB_CSV_PATHS:
+            if candidate and Path(candidate).is_file():
+                return Path(candidate)
+        return None
 
     def _check_searchsploit(self) -> bool:
         """Check if searchsploit is available."""
@@ -87,13 +143,47 @@ class ExploitDBChecker:
 
         return exploits
 
+    def find_exploits(self, cve_id: str) -> List[Dict]:
+        """Find exploits for a CVE in the index, or with searchsploit."""
+        if not self.index_path:
+            return self.check_searchsploit(cve_id)
+
+        return [
+            {
+                "cve_id": cve_id,
+                "title": exploit["title"],
+                "path": exploit["path"],
+                "type": exploit["type"],
+                "platform": exploit["platform"],
+                "date": exploit["date"],
+                "author": exploit["author"]
+            }
+            for exploit in self.exploits_by_cve.get(cve_id, [])
+        ]
+
     def check_keyword_search(self, package_name: str, version: str = "") -> List[Dict]:
         """Search for exploits by package name and version."""
+        search_term = f"{package_name} {version}".strip()
+
+        if self.index_path:
+            # Same rule as searchsploit: every term in the title, any case
+            terms = search_term.lower().split()
+            return [
+                {
+                    "search_term": search_term,
+                    "title": exploit["title"],
+                    "path": exploit["path"],
+                    "type": exploit["type"],
+                    "platform": exploit["platform"]
+                }
+                for exploit in self.exploits
+                if all(term in exploit["title"].lower() for term in terms)
+            ]
+
         if not self.searchsploit_available:
             return []
 
         exploits = []
-        search_term = f"{package_name} {version}".strip()
 
         try:
             result = subprocess.run(
@@ -201,7 +291,7 @@ class ExploitDBChecker:
                 "summary": {"high_priority": []}
             }
 
-        if not self.searchsploit_available:
+        if not self.index_path and not self.searchsploit_available:
             print("[!] searchsploit not available - install exploitdb package")
             return {
                 "check_date": datetime.now().isoformat(),
@@ -214,20 +304,26 @@ class ExploitDBChecker:
                 "note": "searchsploit not available"
             }
 
-        print(f"[*] Checking {len(cve_ids)} CVEs against Exploit-DB...")
+        if self.index_path:
+            print(f"[*] Checking {len(cve_ids)} CVEs against {self.index_path} "
+                  f"({len(self.exploits)} exploits)...")
+        else:
+            print(f"[*] Checking {len(cve_ids)} CVEs with searchsploit "
+                  f"({SEARCHSPLOIT_WORKERS} at a time)...")
 
         all_exploits = []
         exploitable_cves = set()
 
-        for i, cve_id in enumerate(cve_ids):
-            print(f"    [{i+1}/{len(cve_ids)}] {cve_id}", end="")
-            exploits = self.check_searchsploit(cve_id)
-            if exploits:
-                all_exploits.extend(exploits)
-                exploitable_cves.add(cve_id)
-                print(f" - Found {len(exploits)} exploit(s)!")
-            else:
-                print("")
+        # Index lookups are in-process; searchsploit runs get one thread each
+        workers = 1 if self.index_path else SEARCHSPLOIT_WORKERS
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i, (cve_id, exploits) in enumerate(
+                zip(cve_ids, pool.map(self.find_exploits, cve_ids))
+            ):
+                if exploits:
+                    all_exploits.extend(exploits)
+                    exploitable_cves.add(cve_id)
+                    print(f"    [{i+1}/{len(cve_ids)}] {cve_id} - Found {len(exploits)} exploit(s)!")
 
         # Also check common vulnerable packages
         print("\n[*] Checking vulnerable packages by name...")
@@ -235,14 +331,16 @@ class ExploitDBChecker:
         unique_packages = list({(p["name"], p["version"]) for p in packages if p["name"]})
 
         package_exploits = []
-        checked = 0
-        for name, version in unique_packages[:50]:  # Limit to prevent too many queries
-            if name and len(name) > 2:  # Skip very short names
-                exploits = self.check_keyword_search(name, version)
+        # Skip very short names; without the index, limit searchsploit runs
+        to_search = [(name, version) for name, version in unique_packages if len(name) > 2]
+        if not self.index_path:
+            to_search = to_search[:50]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            found = pool.map(lambda package: self.check_keyword_search(*package), to_search)
+            for (name, version), exploits in zip(to_search, found):
                 if exploits:
                     package_exploits.extend(exploits)
                     print(f"    [!] {name} {version}: {len(exploits)} potential exploit(s)")
-                checked += 1
 
         # Identify high priority (high CVSS + exploit available)
         high_priority = []
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Concurrent, rate-limited HTTP fetching for the CVE tooling.
+
+The correlate scripts hand a list of calls to an AsyncFetcher, which runs
+them on one httpx.AsyncClient with a bounded number in flight. Each
+upstream gets a token bucket sized to its published quota:
+
+- NVD: 5 requests per rolling 30 seconds without an API key, 50 with one
+- OSV: no published quota; a generous bucket keeps bursts polite
+
+A 429/503 answer (and NVD's 403 "rate limited") pauses the whole bucket
+for the Retry-After the server sent, or a default, before the call is
+retried, so concurrent calls back off together instead of each one
+hammering the API.
+
+Base URLs can be pointed at a local stub server with OSV_API_URL and
+NVD_API_URL.
+"""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+    print("[!] httpx library not available - API lookups will be disabled")
+
+
+class TokenBucket:
+    """Async token bucket: `rate` calls per `per` seconds, bursts of `burst`."""
+
+    def __init__(self, rate: float, per: float, burst: int = 1):
+        """
+        Initialize the bucket (full).
+
+        A burst of 1 spaces calls evenly (per / rate seconds apart), which
+        never exceeds a rolling-window quota of `rate` per `per` seconds.
+
+        Args:
+            rate: Calls allowed per period
+            per: Period in seconds
+            burst: Calls that may start back to back
+        """
+        self.fill_rate = rate / per
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` (an upstream Retry-After)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a call may start."""
+        # A lock belongs to one event loop; each fetch_json_many runs its own
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock, self._loop = asyncio.Lock(), loop
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    self.updated = time.monotonic()
+                    continue
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.fill_rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+
+def nvd_bucket(api_key: Optional[str]) -> TokenBucket:
+    """Token bucket for NVD's quota with or without an API key."""
+    return TokenBucket(50, 30) if api_key else TokenBucket(5, 30)
+
+
+def osv_bucket() -> TokenBucket:
+    """Token bucket for OSV.dev."""
+    return TokenBucket(25, 1, burst=25)
+
+
+def parse_retry_after(value: Optional[str], default: float) -> float:
+    """
+    Seconds to wait from a Retry-After header.
+
+    Args:
+        value: Header value (delta seconds or an HTTP date), or None
+        default: Wait used when the header is missing or invalid
+
+    Returns:
+        Seconds to wait (never negative)
+    """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class AsyncFetcher:
+    """Run many HTTP calls to one upstream concurrently within its quota."""
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        max_concurrency: int = 8,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        retry_statuses: Tuple[int, ...] = (429, 503),
+        default_retry_after: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize fetcher.
+
+        Args:
+            bucket: Rate limiter of the upstream
+            max_concurrency: Calls in flight at once
+            timeout: Per-call timeout in seconds
+            max_retries: Retries of a rate-limited or failed call
+            retry_statuses: Statuses meaning "slow down and retry"
+            default_retry_after: Pause when the server sends no Retry-After
+            headers: Headers sent with every call
+        """
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_statuses = retry_statuses
+        self.default_retry_after = default_retry_after
+        self.headers = headers or {}
+        self.request_count = 0
+
+    async def _fetch(
+        self,
+        client: "httpx.AsyncClient",
+        semaphore: asyncio.Semaphore,
+        call: Dict[str, Any],
+    ) -> Tuple[int, Any]:
+        """Run one call, retrying after rate limiting and network errors."""
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.bucket.acquire()
+                self.request_count += 1
+                try:
+                    response = await client.request(
+                        call.get("method", "GET"),
+                        call["url"],
+                        params=call.get("params"),
+                        json=call.get("json"),
+                    )
+                except httpx.HTTPError as e:
+                    if attempt == self.max_retries:
+                        print(f"[!] Request to {call['url']} failed: {e}")
+                        return 0, None
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+
+                if response.status_code in self.retry_statuses and attempt < self.max_retries:
+                    wait = parse_retry_after(
+                        response.headers.get("Retry-After"), self.default_retry_after
+                    )
+                    print(f"[!] Rate limited by {response.url.host}, waiting {wait:.0f}s...")
+                    self.bucket.pause(wait)
+                    continue
+
+                if response.status_code != 200:
+                    return response.status_code, None
+                try:
+                    return 200, response.json()
+                except ValueError:
+                    return 200, None
+        return 0, None
+
+    async def _fetch_all(self, calls: List[Dict[str, Any]]) -> List[Tuple[int, Any]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
+            return await asyncio.gather(
+                *(self._fetch(client, semaphore, call) for call in calls)
+            )
+
+    def fetch_json_many(self, calls: List[Dict[str, Any]]) -> List[Tuple[int, Any]]:
+        """
+        Run calls concurrently and decode their JSON answers.
+
+        Args:
+            calls: Dicts with "url" and optionally "method" (default GET),
+                "params" and "json"
+
+        Returns:
+            One (status, data) per call, in order. data is the decoded
+            body of a 200 answer, else None; status is 0 when the call
+            never got an answer.
+        """
+        if not calls:
+            return []
+        return asyncio.run(self._fetch_all(calls))
@@ -6,6 +6,10 @@ https://www.cisa.gov/known-exploited-vulnerabilities-catalog
 This module downloads and parses the CISA KEV catalog, which contains
 vulnerabilities that are known to be actively exploited in the wild.
 Findings matching KEV entries should be treated as highest priority.
+
+The catalog is kept in the local vulnerability store (vuln_store.py) and
+re-downloaded once it is older than the TTL; each CVE is checked with an
+indexed lookup.
 """
 
 import json
@@ -13,7 +17,9 @@ import os
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Optional
+
+from vuln_store import VulnStore
 
 try:
     import requests
@@ -29,40 +35,32 @@ KEV_CATALOG_URL = "https://www.cisa.gov/sites/default/files/feeds/known_exploite
 class KEVCorrelator:
     """Correlate findings with CISA KEV catalog."""
 
-    def __init__(self, cache_dir: Optional[Path] = None, cache_ttl_hours: int = 24):
+    def __init__(self, store: Optional[VulnStore] = None, cache_ttl_hours: int = 24):
         """
         Initialize KEV correlator.
 
         Args:
-            cache_dir: Directory for caching the KEV catalog
-            cache_ttl_hours: How long to cache the catalog (default: 24 hours)
+            store: Local vulnerability store (default: the shared store file)
+            cache_ttl_hours: How long to keep the catalog (default: 24 hours)
         """
-        self.cache_dir = cache_dir or Path("/tmp/kev_cache")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "kev_catalog.json"
+        self.store = store or VulnStore()
         self.cache_ttl_hours = cache_ttl_hours
-        self.kev_cves: Set[str] = set()
-        self.kev_data: Dict[str, Dict] = {}  # CVE -> full KEV entry
         self._load_catalog()
 
-    def _is_cache_valid(self) -> bool:
-        """Check if cached catalog is still valid."""
-        if not self.cache_file.exists():
-            return False
-        mtime = datetime.fromtimestamp(self.cache_file.stat().st_mtime)
-        age_hours = (datetime.now() - mtime).total_seconds() / 3600
-        return age_hours < self.cache_ttl_hours
-
     def _load_catalog(self):
-        """Load KEV catalog, downloading if necessary."""
-        if self._is_cache_valid():
-            self._parse_catalog()
-        else:
-            self._download_catalog()
-            self._parse_catalog()
+        """Download the KEV catalog if the stored copy is missing or stale."""
+        refreshed_at = self.store.source_refreshed_at("kev")
+        if refreshed_at is not None:
+            age_hours = (datetime.now().timestamp() - refreshed_at) / 3600
+            if age_hours < self.cache_ttl_hours or self.store.offline:
+                return
+        if self.store.offline:
+            print("[!] KEV catalog not in the store (offline mode) - import it with vuln_store.py")
+            return
+        self._download_catalog()
 
     def _download_catalog(self):
-        """Download the KEV catalog from CISA."""
+        """Download the KEV catalog from CISA into the store."""
         if not HAS_REQUESTS:
             print("[!] Cannot download KEV catalog - requests library not available")
             return
@@ -71,44 +69,13 @@ class KEVCorrelator:
             print("[*] Downloading KEV catalog from CISA...")
             response = requests.get(KEV_CATALOG_URL, timeout=60)
             if response.status_code == 200:
-                with open(self.cache_file, "w") as f:
-                    f.write(response.text)
-                print(f"[+] KEV catalog saved to {self.cache_file}")
+                count = self.store.replace_kev(response.json())
+                print(f"[+] Loaded {count} CVEs from KEV catalog into {self.store.path}")
             else:
                 print(f"[!] Failed to download KEV catalog: HTTP {response.status_code}")
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"[!] Failed to download KEV catalog: {e}")
 
-    def _parse_catalog(self):
-        """Parse the KEV catalog and extract CVE IDs."""
-        if not self.cache_file.exists():
-            print("[!] KEV catalog not found")
-            return
-
-        try:
-            with open(self.cache_file) as f:
-                catalog = json.load(f)
-
-            for vuln in catalog.get("vulnerabilities", []):
-                cve_id = vuln.get("cveID", "")
-                if cve_id.startswith("CVE-"):
-                    self.kev_cves.add(cve_id)
-                    self.kev_data[cve_id] = {
-                        "vendor": vuln.get("vendorProject", ""),
-                        "product": vuln.get("product", ""),
-                        "name": vuln.get("vulnerabilityName", ""),
-                        "description": vuln.get("shortDescription", ""),
-                        "date_added": vuln.get("dateAdded", ""),
-                        "due_date": vuln.get("dueDate", ""),
-                        "notes": vuln.get("notes", ""),
-                        "known_ransomware": vuln.get("knownRansomwareCampaignUse", "Unknown") == "Known"
-                    }
-
-            print(f"[+] Loaded {len(self.kev_cves)} CVEs from KEV catalog")
-
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[!] Failed to parse KEV catalog: {e}")
-
     def is_kev(self, cve_id: str) -> bool:
         """
         Check if a CVE is in the KEV catalog.
@@ -119,7 +86,7 @@ class KEVCorrelator:
         Returns:
             True if CVE is in KEV catalog
         """
-        return cve_id.upper() in self.kev_cves
+        return self.store.get_kev(cve_id) is not None
 
     def get_kev_info(self, cve_id: str) -> Optional[Dict]:
         """
@@ -131,7 +98,7 @@ class KEVCorrelator:
         Returns:
             KEV entry dict or None
         """
-        return self.kev_data.get(cve_id.upper())
+        return self.store.get_kev(cve_id)
 
     def correlate_findings(self, findings: List[Dict]) -> List[Dict]:
         """
@@ -152,7 +119,12 @@ class KEVCorrelator:
 
         for finding in findings:
             cve_ids = self._extract_cve_ids(finding)
-            kev_cves = [cve for cve in cve_ids if self.is_kev(cve)]
+            kev_entries = {}
+            for cve in cve_ids:
+                info = self.get_kev_info(cve)
+                if info is not None:
+                    kev_entries[cve] = info
+            kev_cves = list(kev_entries)
             is_kev = len(kev_cves) > 0
 
             annotated = finding.copy()
@@ -161,7 +133,7 @@ class KEVCorrelator:
 
             if is_kev:
                 # Get KEV details for first matching CVE
-                kev_info = self.get_kev_info(kev_cves[0])
+                kev_info = kev_entries[kev_cves[0]]
                 annotated["kev_warning"] = "ACTIVELY EXPLOITED IN THE WILD!"
                 annotated["kev_info"] = kev_info
 
@@ -198,16 +170,13 @@ class KEVCorrelator:
 
     def generate_summary(self) -> Dict:
         """Generate summary of KEV catalog."""
-        ransomware_cves = [
-            cve for cve, info in self.kev_data.items()
-            if info.get("known_ransomware")
-        ]
+        total, ransomware = self.store.kev_counts()
 
         return {
-            "total_kevs": len(self.kev_cves),
-            "ransomware_kevs": len(ransomware_cves),
-            "catalog_date": self.cache_file.stat().st_mtime if self.cache_file.exists() else None,
-            "sample_cves": list(self.kev_cves)[:10]
+            "total_kevs": total,
+            "ransomware_kevs": ransomware,
+            "catalog_date": self.store.source_refreshed_at("kev"),
+            "sample_cves": self.store.sample_kev_cves(10)
         }
 
 
@@ -8,143 +8,86 @@ Enriches scan results with authoritative NVD data including:
 - Vulnerability descriptions
 - Reference links
 
+CVE data is served from the local vulnerability store (vuln_store.py),
+filled by earlier runs or an imported NVD feed; only CVEs it does not
+know (or that are older than its TTL) are fetched from the NVD API,
+concurrently within NVD's quota (5 requests per 30 seconds, 50 with
+NVD_API_KEY) through http_fetch.py.
+
 Usage:
     SCAN_DIR=/app/results/cve python nvd_correlate.py
+    VULN_STORE_OFFLINE=1 python nvd_correlate.py  # store only, no API calls
 """
 
 import json
 import os
 import re
-import requests
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-NVD_API_URL = "https://services.nvd.nist.gov/rest/json/cves/2.0"
+from http_fetch import HAS_HTTPX, AsyncFetcher, nvd_bucket
+from vuln_store import VulnStore
+
+NVD_API_URL = os.environ.get("NVD_API_URL", "https://services.nvd.nist.gov/rest/json/cves/2.0")
 SCAN_DIR = os.environ.get("SCAN_DIR", "/app/results/cve")
-CACHE_DIR = Path(SCAN_DIR) / "nvd_cache"
 
 
 class NVDCorrelator:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        store: Optional[VulnStore] = None,
+        fetcher: Optional[AsyncFetcher] = None
+    ):
         self.api_key = api_key or os.environ.get("NVD_API_KEY")
-        self.cache_dir = CACHE_DIR
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        # Rate limit: 5 requests per 30 seconds without key, 50 with key
-        self.rate_limit_delay = 0.6 if not self.api_key else 0.1
+        self.store = store or VulnStore()
+        headers = {"Accept": "application/json"}
+        if self.api_key:
+            headers["apiKey"] = self.api_key
+        # NVD answers 403 when the rate limit is exceeded
+        self.fetcher = fetcher or AsyncFetcher(
+            nvd_bucket(self.api_key),
+            max_concurrency=4,
+            retry_statuses=(403, 429, 503),
+            headers=headers
+        )
         self.cve_data = {}
 
     def lookup_cve(self, cve_id: str) -> Optional[Dict]:
-        """Lookup CVE details from NVD with caching."""
-        # Check cache first
-        cache_file = self.cache_dir / f"{cve_id}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                pass  # Cache corrupted, re-fetch
-
-        # Rate limit
-        time.sleep(self.rate_limit_delay)
-
-        try:
-            headers = {"Accept": "application/json"}
-            if self.api_key:
-                headers["apiKey"] = self.api_key
-
-            response = requests.get(
-                NVD_API_URL,
-                params={"cveId": cve_id},
-                headers=headers,
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("vulnerabilities"):
-                    cve_data = data["vulnerabilities"][0]["cve"]
-
-                    result = self._parse_cve_data(cve_id, cve_data)
-
-                    # Cache result
-                    with open(cache_file, "w") as f:
-                        json.dump(result, f, indent=2)
-
-                    return result
-
-            elif response.status_code == 404:
+        """Lookup CVE details from the local store, then from NVD."""
+        return self.lookup_cves([cve_id]).get(cve_id)
+
+    def lookup_cves(self, cve_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Lookup several CVEs: from the local store, the rest concurrently from NVD.
+
+        Args:
+            cve_ids: CVE IDs to look up
+
+        Returns:
+            Dict mapping each CVE ID to its details, or None if unknown
+        """
+        results = {cve_id: self.store.get_cve(cve_id) for cve_id in cve_ids}
+        missing = [cve_id for cve_id, data in results.items() if data is None]
+        if not missing or self.store.offline or not HAS_HTTPX:
+            return results
+
+        print(f"    Fetching {len(missing)} CVE(s) from NVD...")
+        answers = self.fetcher.fetch_json_many([
+            {"url": NVD_API_URL, "params": {"cveId": cve_id}} for cve_id in missing
+        ])
+
+        for cve_id, (status, data) in zip(missing, answers):
+            if status == 200 and data and data.get("vulnerabilities"):
+                self.store.put_nvd_cve(data["vulnerabilities"][0]["cve"])
+                results[cve_id] = self.store.get_cve(cve_id)
+            elif status in (200, 404):
                 print(f"    [!] CVE not found in NVD: {cve_id}")
-            elif response.status_code == 403:
-                print(f"    [!] Rate limited by NVD API, waiting...")
-                time.sleep(30)
-                return self.lookup_cve(cve_id)  # Retry
-            else:
-                print(f"    [!] NVD API error {response.status_code} for {cve_id}")
-
-        except requests.exceptions.Timeout:
-            print(f"    [!] Timeout looking up {cve_id}")
-        except Exception as e:
-            print(f"    [!] Error looking up {cve_id}: {e}")
-
-        return None
-
-    def _parse_cve_data(self, cve_id: str, cve_data: Dict) -> Dict:
-        """Parse NVD CVE data into standardized format."""
-        # Extract CVSS scores
-        cvss = self._extract_cvss(cve_data)
-
-        # Extract description
-        descriptions = cve_data.get("descriptions", [])
-        description = ""
-        for desc in descriptions:
-            if desc.get("lang") == "en":
-                description = desc.get("value", "")
-                break
-
-        # Extract CWE
-        cwe_ids = []
-        for weakness in cve_data.get("weaknesses", []):
-            for desc in weakness.get("description", []):
-                if desc.get("value", "").startswith("CWE-"):
-                    cwe_ids.append(desc["value"])
-
-        # Extract references
-        references = [
-            {"url": ref.get("url"), "source": ref.get("source")}
-            for ref in cve_data.get("references", [])
-        ]
-
-        return {
-            "id": cve_id,
-            "description": description[:500] if description else "",  # Truncate
-            "published": cve_data.get("published", ""),
-            "lastModified": cve_data.get("lastModified", ""),
-            "cvss": cvss,
-            "cwe_ids": cwe_ids,
-            "references": references[:10],  # Limit references
-            "nvd_url": f"https://nvd.nist.gov/vuln/detail/{cve_id}"
-        }
+            elif status:
+                print(f"    [!] NVD API error {status} for {cve_id}")
 
-    def _extract_cvss(self, cve_data: Dict) -> Dict:
-        """Extract CVSS information, preferring v3.1."""
-        metrics = cve_data.get("metrics", {})
-
-        for version in ["cvssMetricV31", "cvssMetricV30", "cvssMetricV2"]:
-            if version in metrics and metrics[version]:
-                cvss_data = metrics[version][0]
-                cvss = cvss_data.get("cvssData", {})
-                return {
-                    "version": cvss.get("version", ""),
-                    "score": cvss.get("baseScore", 0),
-                    "severity": cvss.get("baseSeverity", ""),
-                    "vector": cvss.get("vectorString", ""),
-                    "exploitabilityScore": cvss_data.get("exploitabilityScore", 0),
-                    "impactScore": cvss_data.get("impactScore", 0)
-                }
-
-        return {"score": 0, "severity": "UNKNOWN"}
+        return results
 
     def parse_trivy_results(self, json_file: Path) -> List[str]:
         """Extract CVE IDs from Trivy JSON results."""
@@ -274,12 +217,8 @@ class NVDCorrelator:
 
         print("[*] Looking up CVE details from NVD...")
 
-        enriched_cves = []
-        for i, cve_id in enumerate(sorted(all_cves)):
-            print(f"    [{i+1}/{len(all_cves)}] {cve_id}")
-            cve_data = self.lookup_cve(cve_id)
-            if cve_data:
-                enriched_cves.append(cve_data)
+        found = self.lookup_cves(sorted(all_cves))
+        enriched_cves = [cve_data for cve_data in found.values() if cve_data]
 
         # Sort by CVSS score
         enriched_cves.sort(
@@ -6,25 +6,24 @@ https://osv.dev/docs/
 This module provides a client for querying the OSV (Open Source Vulnerabilities)
 database, which aggregates vulnerability data from multiple sources including
 GitHub Security Advisories, PyPI, npm, and more.
+
+Answers are kept in the local vulnerability store (vuln_store.py): packages
+are resolved from it first, from an imported OSV dump if there is one, and
+only the remaining ones are queried. Queries go out concurrently through
+http_fetch.py: packages in querybatch chunks, then the advisories those
+answers name that the store does not have yet.
 """
 
 import json
 import os
-import time
-import hashlib
-from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
-    print("[!] requests library not available - OSV queries will be disabled")
+from http_fetch import HAS_HTTPX, AsyncFetcher, osv_bucket
+from vuln_store import VulnStore
 
 
-OSV_API_URL = "https://api.osv.dev/v1"
+OSV_API_URL = os.environ.get("OSV_API_URL", "https://api.osv.dev/v1")
+OSV_BATCH_SIZE = 1000  # querybatch limit
 
 
 class OSVClient:
@@ -32,52 +31,28 @@ class OSVClient:
 
     def __init__(
         self,
-        cache_dir: Optional[Path] = None,
-        cache_ttl_hours: int = 24,
-        rate_limit_delay: float = 0.1
+        store: Optional[VulnStore] = None,
+        fetcher: Optional[AsyncFetcher] = None
     ):
         """
         Initialize OSV client.
 
         Args:
-            cache_dir: Directory for caching results (default: /tmp/osv_cache)
-            cache_ttl_hours: Cache time-to-live in hours (default: 24)
-            rate_limit_delay: Delay between requests in seconds (default: 0.1)
+            store: Local vulnerability store (default: the shared store file)
+            fetcher: HTTP fetcher (default: OSV rate limits, 8 in flight)
         """
-        self.cache_dir = cache_dir or Path("/tmp/osv_cache")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_ttl = timedelta(hours=cache_ttl_hours)
-        self.rate_limit_delay = rate_limit_delay
-        self.request_count = 0
-
-    def _cache_key(self, package: str, version: str, ecosystem: str) -> str:
-        """Generate cache key for a package query."""
-        key = f"{ecosystem}:{package}:{version}"
-        return hashlib.md5(key.encode()).hexdigest()
-
-    def _get_cached(self, cache_key: str) -> Optional[List[Dict]]:
-        """Get cached vulnerability data if valid."""
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    cached = json.load(f)
-                cached_time = datetime.fromisoformat(cached.get("cached_at", ""))
-                if datetime.now() - cached_time < self.cache_ttl:
-                    return cached.get("vulns", [])
-            except (json.JSONDecodeError, ValueError, KeyError):
-                # Invalid cache, will refresh
-                pass
-        return None
-
-    def _set_cached(self, cache_key: str, vulns: List[Dict]):
-        """Cache vulnerability data."""
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        with open(cache_file, "w") as f:
-            json.dump({
-                "cached_at": datetime.now().isoformat(),
-                "vulns": vulns
-            }, f)
+        self.store = store or VulnStore()
+        self.fetcher = fetcher or AsyncFetcher(osv_bucket(), timeout=60)
+
+    @property
+    def online(self) -> bool:
+        """Whether missing answers may be fetched from the API."""
+        return HAS_HTTPX and not self.store.offline
+
+    @property
+    def request_count(self) -> int:
+        """API calls made so far."""
+        return self.fetcher.request_count
 
     def query_package(
         self,
@@ -96,39 +71,30 @@ class OSVClient:
         Returns:
             List of vulnerability dictionaries
         """
-        if not HAS_REQUESTS:
-            return []
-
-        cache_key = self._cache_key(package, version, ecosystem)
-        cached = self._get_cached(cache_key)
+        cached = self.store.get_package_vulns(ecosystem, package, version)
         if cached is not None:
             return cached
+        if not self.online:
+            return []
 
-        try:
-            response = requests.post(
-                f"{OSV_API_URL}/query",
-                json={
-                    "package": {"name": package, "ecosystem": ecosystem},
-                    "version": version
-                },
-                timeout=30
-            )
-            self.request_count += 1
-            time.sleep(self.rate_limit_delay)
-
-            if response.status_code == 200:
-                data = response.json()
-                vulns = data.get("vulns", [])
-                self._set_cached(cache_key, vulns)
-                return vulns
-            elif response.status_code == 404:
-                # Package not found, cache empty result
-                self._set_cached(cache_key, [])
-                return []
-            else:
-                print(f"[!] OSV API error for {package}@{version}: HTTP {response.status_code}")
-        except requests.RequestException as e:
-            print(f"[!] OSV query failed for {package}@{version}: {e}")
+        [(status, data)] = self.fetcher.fetch_json_many([{
+            "method": "POST",
+            "url": f"{OSV_API_URL}/query",
+            "json": {
+                "package": {"name": package, "ecosystem": ecosystem},
+                "version": version
+            }
+        }])
+
+        if status == 200 and data is not None:
+            vulns = data.get("vulns", [])
+            self.store.put_package_vulns(ecosystem, package, version, vulns)
+            return vulns
+        elif status == 404:
+            # Package not found, cache empty result
+            self.store.put_package_vulns(ecosystem, package, version, [])
+        elif status:
+            print(f"[!] OSV API error for {package}@{version}: HTTP {status}")
 
         return []
 
@@ -140,6 +106,11 @@ class OSVClient:
         """
         Query OSV for multiple packages.
 
+        Packages the local store can answer are not queried; the rest go
+        out in concurrent querybatch chunks. The batch endpoint only returns
+        advisory ids, so advisories missing from the store (or updated
+        since) are then fetched in full, also concurrently.
+
         Args:
             packages: List of {"name": "pkg", "version": "1.0"} dicts
             ecosystem: Package ecosystem
@@ -147,9 +118,6 @@ class OSVClient:
         Returns:
             Dict mapping "pkg@version" to vulnerability list
         """
-        if not HAS_REQUESTS:
-            return {}
-
         results = {}
 
         # OSV batch endpoint
@@ -158,48 +126,56 @@ class OSVClient:
             name = pkg.get("name")
             version = pkg.get("version")
             if name and version:
-                cache_key = self._cache_key(name, version, ecosystem)
-                cached = self._get_cached(cache_key)
+                cached = self.store.get_package_vulns(ecosystem, name, version)
                 if cached is not None:
                     results[f"{name}@{version}"] = cached
-                else:
+                elif self.online:
                     queries.append({
                         "package": {"name": name, "ecosystem": ecosystem},
                         "version": version
                     })
+                else:
+                    results[f"{name}@{version}"] = []
 
         if not queries:
             return results
 
-        # Batch query (max 1000 per request)
-        for i in range(0, len(queries), 1000):
-            batch = queries[i:i+1000]
-            try:
-                response = requests.post(
-                    f"{OSV_API_URL}/querybatch",
-                    json={"queries": batch},
-                    timeout=60
-                )
-                self.request_count += 1
-                time.sleep(self.rate_limit_delay)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    for j, result in enumerate(data.get("results", [])):
-                        query = batch[j]
-                        name = query["package"]["name"]
-                        version = query["version"]
-                        vulns = result.get("vulns", [])
-
-                        key = f"{name}@{version}"
-                        results[key] = vulns
-
-                        # Cache individual results
-                        cache_key = self._cache_key(name, version, ecosystem)
-                        self._set_cached(cache_key, vulns)
-
-            except requests.RequestException as e:
-                print(f"[!] OSV batch query failed: {e}")
+        chunks = [
+            queries[i:i + OSV_BATCH_SIZE]
+            for i in range(0, len(queries), OSV_BATCH_SIZE)
+        ]
+        answers = self.fetcher.fetch_json_many([
+            {"method": "POST", "url": f"{OSV_API_URL}/querybatch", "json": {"queries": chunk}}
+            for chunk in chunks
+        ])
+
+        answered = []
+        for chunk, (status, data) in zip(chunks, answers):
+            if status != 200 or data is None:
+                print(f"[!] OSV batch query failed: HTTP {status}")
+                continue
+            for query, result in zip(chunk, data.get("results", [])):
+                answered.append((query, result.get("vulns", [])))
+
+        # Fetch every advisory the store lacks once, however many packages name it
+        missing = {
+            v["id"]
+            for _, entries in answered
+            for v in entries
+            if not self.store.has_advisory(v["id"], v.get("modified", ""))
+        }
+        self._fetch_advisories(sorted(missing))
+
+        for query, entries in answered:
+            name = query["package"]["name"]
+            version = query["version"]
+            vulns = [self.store.get_advisory(v["id"]) for v in entries]
+
+            key = f"{name}@{version}"
+            results[key] = [v for v in vulns if v]
+
+            # Store individual results
+            self.store.put_package_vulns(ecosystem, name, version, results[key])
 
         return results
 
@@ -213,23 +189,29 @@ class OSVClient:
         Returns:
             Vulnerability details dict or None
         """
-        if not HAS_REQUESTS:
-            return None
-
-        try:
-            response = requests.get(
-                f"{OSV_API_URL}/vulns/{vuln_id}",
-                timeout=30
-            )
-            self.request_count += 1
-            time.sleep(self.rate_limit_delay)
-
-            if response.status_code == 200:
-                return response.json()
-        except requests.RequestException as e:
-            print(f"[!] OSV detail query failed for {vuln_id}: {e}")
-
-        return None
+        stored = self.store.get_advisory(vuln_id)
+        if stored is not None or not self.online:
+            return stored
+        return self._fetch_advisory(vuln_id)
+
+    def _fetch_advisory(self, vuln_id: str) -> Optional[Dict]:
+        """Fetch an advisory from the API and store it."""
+        return self._fetch_advisories([vuln_id]).get(vuln_id)
+
+    def _fetch_advisories(self, vuln_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch advisories from the API concurrently and store them."""
+        answers = self.fetcher.fetch_json_many([
+            {"url": f"{OSV_API_URL}/vulns/{vuln_id}"} for vuln_id in vuln_ids
+        ])
+
+        fetched = {}
+        for vuln_id, (status, details) in zip(vuln_ids, answers):
+            if status == 200 and details:
+                fetched[vuln_id] = details
+            elif status:
+                print(f"[!] OSV detail query failed for {vuln_id}: HTTP {status}")
+        self.store.put_advisories(list(fetched.values()))
+        return fetched
 
     def extract_severity(self, vuln: Dict) -> Dict[str, Any]:
         """
@@ -1,39 +1,37 @@
 #!/usr/bin/env python3
 """
 Correlate SBOM packages with CVE databases for vulnerability assessment.
-Uses OSV.dev API for real-time vulnerability lookups.
+Uses OSV.dev vulnerability data through the local vulnerability store.
+
+Packages are resolved from the store (earlier answers or an imported OSV
+dump, see vuln_store.py); the rest are sent in one OSV querybatch request
+per ecosystem. With the dumps imported, --offline correlates a full SBOM
+without network access.
 
 OpenCitiVibes Penetration Testing - Phase 2
 """
 
+import argparse
 import json
 import os
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
-    print("Warning: requests library not available. Install with: pip install requests", file=sys.stderr)
+from osv_client import OSVClient
+from vuln_store import VulnStore
 
 SCAN_DIR = Path(os.environ.get("SCAN_DIR", "/app/results"))
-OSV_API_URL = "https://api.osv.dev/v1/query"
 
 
 class SBOMCorrelator:
     """Correlate SBOM packages with vulnerability databases."""
 
-    def __init__(self, sbom_dir: Path, cache_dir: Path):
+    def __init__(self, sbom_dir: Path, store: Optional[VulnStore] = None):
         self.sbom_dir = sbom_dir
-        self.cache_dir = cache_dir
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.client = OSVClient(store)
         self.results = []
-        self.rate_limit_delay = 0.2  # 200ms between requests
 
     def load_sbom_packages(self) -> List[Dict]:
         """Load packages from all SBOM files."""
@@ -61,60 +59,26 @@ class SBOMCorrelator:
 
         return packages
 
-    def query_osv(self, package: Dict) -> List[Dict]:
-        """Query OSV.dev for vulnerabilities."""
-        if not HAS_REQUESTS:
-            return []
+    def query_osv(self, packages: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Look up vulnerabilities for all packages, batched per ecosystem.
 
-        cache_key = f"{package['name']}_{package['version']}".replace("/", "_").replace("@", "_")
-        cache_file = self.cache_dir / f"osv_{cache_key}.json"
+        Args:
+            packages: Packages with name and version
 
-        # Check cache first
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    cached = json.load(f)
-                # Cache is valid for 24 hours
-                cached_time = datetime.fromisoformat(cached.get("cached_at", "2000-01-01"))
-                if (datetime.now() - cached_time).total_seconds() < 86400:
-                    return cached.get("vulns", [])
-            except:
-                pass
-
-        # Determine ecosystem from package type or purl
-        ecosystem = self._detect_ecosystem(package)
-
-        try:
-            response = requests.post(
-                OSV_API_URL,
-                json={
-                    "package": {
-                        "name": package["name"],
-                        "ecosystem": ecosystem
-                    },
-                    "version": package["version"]
-                },
-                timeout=30
-            )
-            time.sleep(self.rate_limit_delay)
-
-            if response.status_code == 200:
-                data = response.json()
-                vulns = data.get("vulns", [])
-
-                # Cache the result
-                with open(cache_file, "w") as f:
-                    json.dump({
-                        "cached_at": datetime.now().isoformat(),
-                        "vulns": vulns
-                    }, f)
-
-                return vulns
-
-        except Exception as e:
-            print(f"OSV query failed for {package['name']}: {e}", file=sys.stderr)
-
-        return []
+        Returns:
+            Dict mapping "ecosystem:name@version" to vulnerability list
+        """
+        by_ecosystem: Dict[str, List[Dict]] = {}
+        for package in packages:
+            by_ecosystem.setdefault(self._detect_ecosystem(package), []).append(package)
+
+        vulns = {}
+        for ecosystem, ecosystem_packages in by_ecosystem.items():
+            answers = self.client.query_batch(ecosystem_packages, ecosystem)
+            for key, package_vulns in answers.items():
+                vulns[f"{ecosystem}:{key}"] = package_vulns
+        return vulns
 
     def _detect_ecosystem(self, package: Dict) -> str:
         """Detect package ecosystem from type or purl."""
@@ -192,14 +156,15 @@ class SBOMCorrelator:
         total_vulns = 0
         checked = 0
 
-        for i, pkg in enumerate(packages):
-            if not pkg["name"] or not pkg["version"]:
-                continue
+        to_check = [pkg for pkg in packages if pkg["name"] and pkg["version"]]
+        all_vulns = self.query_osv(to_check)
 
+        for i, pkg in enumerate(to_check):
             checked += 1
-            print(f"[{i+1}/{len(packages)}] Checking {pkg['name']}@{pkg['version']}...", end=" ")
+            print(f"[{i+1}/{len(to_check)}] Checking {pkg['name']}@{pkg['version']}...", end=" ")
 
-            vulns = self.query_osv(pkg)
+            key = f"{self._detect_ecosystem(pkg)}:{pkg['name']}@{pkg['version']}"
+            vulns = all_vulns.get(key, [])
 
             if vulns:
                 total_vulns += len(vulns)
@@ -262,19 +227,30 @@ class SBOMCorrelator:
 
 
 def main():
-    sbom_dir = SCAN_DIR / "sbom"
-    cache_dir = SCAN_DIR / "cve_cache"
+    parser = argparse.ArgumentParser(description="Correlate SBOM packages with OSV")
+    parser.add_argument("--sbom-dir", type=Path, default=SCAN_DIR / "sbom", help="SBOM directory")
+    parser.add_argument(
+        "--output", type=Path, default=SCAN_DIR / "sbom_cve_correlation.json", help="Output JSON file"
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Resolve from the local store only (no API calls)"
+    )
+    args = parser.parse_args()
+
+    sbom_dir = args.sbom_dir
 
     if not sbom_dir.exists():
         print(f"SBOM directory not found: {sbom_dir}")
         print("Run generate-sbom.sh first")
         sys.exit(1)
 
-    correlator = SBOMCorrelator(sbom_dir, cache_dir)
+    store = VulnStore(offline=True) if args.offline else None
+    correlator = SBOMCorrelator(sbom_dir, store)
     results = correlator.correlate_all()
 
     # Write results
-    output_file = SCAN_DIR / "sbom_cve_correlation.json"
+    output_file = args.output
+    output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, "w") as f:
         json.dump(results, f, indent=2)
 
@@ -0,0 +1,83 @@
+"""
+Tests for the Exploit-DB index lookup of exploitdb_check.py.
+
+Run from this directory: python -m pytest -q test_exploitdb_check.py
+"""
+
+import csv
+import importlib
+
+import pytest
+
+import exploitdb_check
+
+CSV_COLUMNS = [
+    "id", "file", "description", "date_published", "author", "type",
+    "platform", "codes",
+]
+
+
+@pytest.fixture
+def exploit_csv(tmp_path):
+    """A files_exploits.csv with three exploits, two sharing a CVE."""
+    path = tmp_path / "exploitdb" / "files_exploits.csv"
+    path.parent.mkdir()
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerow({
+            "id": "1", "file": "exploits/python/webapps/1.py",
+            "description": "Example 1.0 - RCE", "date_published": "2024-01-02",
+            "author": "alice", "type": "webapps", "platform": "python",
+            "codes": "CVE-2024-1234;OSVDB-1",
+        })
+        writer.writerow({
+            "id": "2", "file": "exploits/linux/local/2.c",
+            "description": "Example - LPE", "date_published": "2024-02-03",
+            "author": "bob", "type": "local", "platform": "linux",
+            "codes": "CVE-2024-1234;CVE-2024-56789",
+        })
+        writer.writerow({
+            "id": "3", "file": "exploits/php/webapps/3.txt",
+            "description": "No CVE", "date_published": "2023-05-06",
+            "author": "carol", "type": "webapps", "platform": "php",
+            "codes": "",
+        })
+    return path
+
+
+@pytest.fixture
+def env_index(exploit_csv, monkeypatch):
+    """Reload the module with EXPLOITDB_CSV pointing at the fixture index."""
+    monkeypatch.setenv("EXPLOITDB_CSV", str(exploit_csv))
+    yield importlib.reload(exploitdb_check)
+    monkeypatch.undo()
+    importlib.reload(exploitdb_check)
+
+
+def test_load_exploit_index(exploit_csv):
+    exploits = exploitdb_check.load_exploit_index(exploit_csv)
+
+    assert [e["cve_ids"] for e in exploits] == [
+        ["CVE-2024-1234"],
+        ["CVE-2024-1234", "CVE-2024-56789"],
+        [],
+    ]
+    assert exploits[0]["path"] == str(
+        exploit_csv.parent / "exploits/python/webapps/1.py"
+    )
+    assert exploits[1]["platform"] == "linux"
+
+
+def test_checker_finds_index_from_env(env_index, exploit_csv):
+    """EXPLOITDB_CSV should be searched first and answer CVE lookups."""
+    checker = env_index.ExploitDBChecker()
+
+    assert checker.index_path == exploit_csv
+    assert checker.searchsploit_available is False
+    assert [e["author"] for e in checker.find_exploits("CVE-2024-1234")] == [
+        "alice",
+        "bob",
+    ]
+    assert checker.find_exploits("CVE-2024-56789")[0]["cve_id"] == "CVE-2024-56789"
+    assert checker.find_exploits("CVE-2020-0001") == []
@@ -0,0 +1,121 @@
+"""
+Tests for the rate-limited fetcher of http_fetch.py.
+
+Run from this directory: python -m pytest -q test_http_fetch.py
+"""
+
+import asyncio
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from http_fetch import HAS_HTTPX, AsyncFetcher, TokenBucket, parse_retry_after
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers 429 to the first request of each path, then 200 with JSON."""
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.server.requests.count(self.path) == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP server answering like a rate-limited API."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_token_bucket_spaces_calls():
+    """A burst of 1 should start calls per / rate seconds apart."""
+    bucket = TokenBucket(20, 1)
+
+    async def starts():
+        times = []
+        for _ in range(4):
+            await bucket.acquire()
+            times.append(time.monotonic())
+        return times
+
+    times = asyncio.run(starts())
+
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert all(gap >= 0.04 for gap in gaps)
+    assert times[-1] - times[0] < 1
+
+
+def test_token_bucket_allows_burst():
+    """Calls within the burst should not wait."""
+    bucket = TokenBucket(1, 60, burst=3)
+
+    async def burst():
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(burst()) < 0.1
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("12", 12.0), ("1.5", 1.5), ("-3", 0.0), (None, 7.0), ("soon", 7.0)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value, 7.0) == expected
+
+
+def test_parse_retry_after_http_date():
+    """An HTTP date should give the seconds left until it."""
+    wait = parse_retry_after(formatdate(time.time() + 30, usegmt=True), 7.0)
+
+    assert 28 <= wait <= 31
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True), 7.0) == 0.0
+
+
+@pytest.mark.skipif(not HAS_HTTPX, reason="httpx not installed")
+def test_fetcher_retries_after_429(stub_server):
+    """A 429 should pause the bucket for Retry-After, then retry the call."""
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    fetcher = AsyncFetcher(TokenBucket(100, 1, burst=10), default_retry_after=60)
+
+    started = time.monotonic()
+    results = fetcher.fetch_json_many([{"url": f"{base}/a"}, {"url": f"{base}/b"}])
+
+    assert results == [(200, {"path": "/a"}), (200, {"path": "/b"})]
+    assert sorted(stub_server.requests) == ["/a", "/a", "/b", "/b"]
+    assert fetcher.request_count == 4
+    # Retry-After: 0 was honoured instead of the 60s default
+    assert time.monotonic() - started < 10
+
+
+@pytest.mark.skipif(not HAS_HTTPX, reason="httpx not installed")
+def test_fetcher_gives_up_after_max_retries(stub_server):
+    """A call still rate limited after its retries should return the status."""
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    fetcher = AsyncFetcher(TokenBucket(100, 1, burst=10), max_retries=0)
+
+    assert fetcher.fetch_json_many([{"url": f"{base}/c"}]) == [(429, None)]
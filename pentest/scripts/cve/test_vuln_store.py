@@ -0,0 +1,151 @@
+"""
+Tests for the offline OSV matching of vuln_store.py.
+
+Run from this directory: python -m pytest -q test_vuln_store.py
+"""
+
+import json
+
+import pytest
+
+from vuln_store import VulnStore, _version_key, version_affected
+
+# Two affected intervals (1.0 <= v < 1.5 and 2.0 <= v <= 2.3), listed out
+# of order as some advisories do
+MULTI_INTERVAL = {
+    "id": "GHSA-test-0001",
+    "modified": "2026-01-01T00:00:00Z",
+    "summary": "Two affected intervals",
+    "affected": [
+        {
+            "package": {"ecosystem": "PyPI", "name": "Example_Pkg"},
+            "ranges": [
+                {
+                    "type": "ECOSYSTEM",
+                    "events": [
+                        {"introduced": "2.0"},
+                        {"last_affected": "2.3"},
+                        {"introduced": "1.0"},
+                        {"fixed": "1.5"},
+                    ],
+                }
+            ],
+            "versions": [],
+        },
+        {
+            "package": {"ecosystem": "npm", "name": "example-js"},
+            "ranges": [
+                {
+                    "type": "SEMVER",
+                    "events": [
+                        {"introduced": "0"},
+                        {"fixed": "1.2.0-rc.1"},
+                        {"introduced": "2.0.0"},
+                        {"fixed": "2.4.1"},
+                    ],
+                }
+            ],
+        },
+    ],
+}
+
+# One range with an unparsable bound, one enumerated version
+INVALID_BOUND = {
+    "id": "GHSA-test-0002",
+    "modified": "2026-01-01T00:00:00Z",
+    "summary": "Unparsable range bound",
+    "affected": [
+        {
+            "package": {"ecosystem": "PyPI", "name": "example-pkg"},
+            "ranges": [
+                {
+                    "type": "ECOSYSTEM",
+                    "events": [{"introduced": "0"}, {"fixed": "not a version"}],
+                }
+            ],
+            "versions": ["0.9"],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store with the fixture advisories imported as an OSV dump."""
+    dump = tmp_path / "osv.json"
+    dump.write_text(json.dumps([MULTI_INTERVAL, INVALID_BOUND]))
+    vuln_store = VulnStore(tmp_path / "store.db", offline=True)
+    vuln_store.import_osv_dump(dump)
+    yield vuln_store
+    vuln_store.close()
+
+
+def _ids(advisories):
+    return sorted(advisory["id"] for advisory in advisories)
+
+
+@pytest.mark.parametrize(
+    "version,expected",
+    [
+        ("0.5", []),
+        ("0.9", ["GHSA-test-0002"]),
+        ("1.0", ["GHSA-test-0001"]),
+        ("1.4.9", ["GHSA-test-0001"]),
+        ("1.5", []),
+        ("1.9", []),
+        ("2.0rc1", []),
+        ("2.0", ["GHSA-test-0001"]),
+        ("2.3", ["GHSA-test-0001"]),
+        ("2.3.post1", []),
+        ("2.4", []),
+    ],
+)
+def test_pypi_multi_interval_with_last_affected(store, version, expected):
+    assert _ids(store.get_package_vulns("PyPI", "example-pkg", version)) == expected
+
+
+@pytest.mark.parametrize(
+    "version,expected",
+    [
+        ("1.1.9", True),
+        ("1.2.0-beta", True),
+        ("1.2.0-rc.1", False),
+        ("1.2.0", False),
+        ("v2.0.0", True),
+        ("2.4.0+build.5", True),
+        ("2.4.1", False),
+    ],
+)
+def test_semver_multi_interval(store, version, expected):
+    vulns = store.get_package_vulns("npm", "example-js", version)
+    assert bool(vulns) is expected
+
+
+def test_invalid_installed_version_is_affected(store):
+    """An unparsable installed version should be reported, not missed."""
+    assert _ids(store.get_package_vulns("PyPI", "example-pkg", "dev-build")) == [
+        "GHSA-test-0001"
+    ]
+    assert store.get_package_vulns("npm", "example-js", "latest")
+
+
+def test_invalid_bound_skips_range():
+    """A range with an unparsable bound should not match anything."""
+    ranges = INVALID_BOUND["affected"][0]["ranges"]
+
+    assert version_affected("PyPI", "0.9", ["0.9"], ranges) is True
+    assert version_affected("PyPI", "0.1", [], ranges) is False
+    assert version_affected("PyPI", "dev-build", [], ranges) is False
+
+
+@pytest.mark.parametrize(
+    "ecosystem,version",
+    [("PyPI", "1.0-final-x"), ("npm", "1.x"), ("npm", "")],
+)
+def test_version_key_rejects_invalid(ecosystem, version):
+    assert _version_key(ecosystem, version) is None
+
+
+def test_version_key_orders_prerelease_first():
+    assert _version_key("npm", "1.2.0-rc.1") < _version_key("npm", "1.2.0")
+    assert _version_key("PyPI", "1.2rc1") < _version_key("PyPI", "1.2")
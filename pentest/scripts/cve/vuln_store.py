@@ -0,0 +1,759 @@
+#!/usr/bin/env python3
+"""
+Local vulnerability store shared by the CVE tooling.
+
+One SQLite file replaces the per-script JSON caches. Every lookup the
+correlate scripts make is a primary-key or indexed probe in it:
+
+- osv_packages / osv_package_advisories: answered OSV queries per
+  (ecosystem, package, version), with the time they were fetched
+- advisories / advisory_aliases: OSV advisory records (CVE <-> GHSA ids)
+- osv_affected: affected versions and ranges from offline OSV dumps, so
+  package lookups resolve without the API once an ecosystem is imported
+- cves / cvss: NVD CVE metadata and CVSS vectors (one row per version)
+- kev: CISA Known Exploited Vulnerabilities entries
+- sources: when each feed (KEV catalog, dump imports) was last loaded
+
+API answers are refreshed after a TTL (default 24 hours). Offline mode
+(VULN_STORE_OFFLINE=1) never calls the APIs and serves stale entries.
+
+Usage:
+    python vuln_store.py import --osv PyPI.zip --osv npm.zip \\
+        --nvd nvdcve-2.0-2024.json.gz --kev known_exploited_vulnerabilities.json
+    python vuln_store.py stats
+
+Dumps: OSV ecosystem archives (https://osv-vulnerabilities.storage.googleapis.com/<ecosystem>/all.zip),
+NVD 2.0 JSON feeds (.json or .json.gz) and the CISA KEV catalog JSON.
+
+Store location: $VULN_STORE_DB (default: $RESULTS_DIR/vuln_store.db).
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sqlite3
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Version = None  # type: ignore[assignment,misc]
+    InvalidVersion = ValueError  # type: ignore[assignment,misc]
+
+
+DEFAULT_DB_PATH = Path(
+    os.environ.get(
+        "VULN_STORE_DB",
+        Path(os.environ.get("RESULTS_DIR", "/app/results")) / "vuln_store.db",
+    )
+)
+OFFLINE = os.environ.get("VULN_STORE_OFFLINE", "") == "1"
+
+# CVSS metric keys in NVD records, most preferred first
+NVD_CVSS_METRICS = ["cvssMetricV31", "cvssMetricV30", "cvssMetricV2"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS advisories (
+    id TEXT PRIMARY KEY,
+    summary TEXT,
+    modified TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS advisory_aliases (
+    alias TEXT NOT NULL,
+    advisory_id TEXT NOT NULL,
+    PRIMARY KEY (alias, advisory_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS osv_packages (
+    ecosystem TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (ecosystem, name, version)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS osv_package_advisories (
+    ecosystem TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    advisory_id TEXT NOT NULL,
+    PRIMARY KEY (ecosystem, name, version, advisory_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS osv_affected (
+    ecosystem TEXT NOT NULL,
+    name TEXT NOT NULL,
+    advisory_id TEXT NOT NULL,
+    versions TEXT NOT NULL,
+    ranges TEXT NOT NULL,
+    PRIMARY KEY (ecosystem, name, advisory_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cves (
+    id TEXT PRIMARY KEY,
+    description TEXT,
+    published TEXT,
+    last_modified TEXT,
+    cwe_ids TEXT NOT NULL,
+    refs TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cvss (
+    cve_id TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    version TEXT,
+    vector TEXT,
+    score REAL,
+    severity TEXT,
+    exploitability_score REAL,
+    impact_score REAL,
+    PRIMARY KEY (cve_id, metric)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS kev (
+    cve_id TEXT PRIMARY KEY,
+    vendor TEXT,
+    product TEXT,
+    name TEXT,
+    description TEXT,
+    date_added TEXT,
+    due_date TEXT,
+    notes TEXT,
+    known_ransomware INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL,
+    entries INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def normalize_package(ecosystem: str, name: str) -> str:
+    """Normalize a package name the way its ecosystem compares names."""
+    if ecosystem == "PyPI":
+        # PEP 503: case-insensitive, runs of -_. are equivalent
+        return re.sub(r"[-_.]+", "-", name).lower()
+    return name
+
+
+# Semver-like versions (npm, Go, crates...): 1.2.3, v1.2.3-rc.1+build
+_SEMVER_LIKE = re.compile(r"^v?(\d+(?:\.\d+)*)(?:-([0-9A-Za-z.-]+))?(?:\+.*)?$")
+
+
+def _version_key(ecosystem: str, version: str) -> Optional[Tuple]:
+    """
+    Sort key for a version string (PEP 440 for PyPI, else semver-like).
+
+    Returns:
+        The key, or None if the version cannot be parsed
+    """
+    if ecosystem == "PyPI" and Version is not None:
+        try:
+            return (Version(version),)
+        except InvalidVersion:
+            return None
+    match = _SEMVER_LIKE.match(version)
+    if match is None:
+        return None
+    numbers = tuple(int(part) for part in match.group(1).split("."))
+    prerelease = match.group(2) or ""
+    # A prerelease sorts before its release
+    return (numbers, not prerelease, prerelease)
+
+
+def _range_events(ecosystem: str, events: List[Dict]) -> Optional[List[Tuple]]:
+    """
+    Parse and sort the events of an OSV range.
+
+    Returns:
+        (key, kind) pairs in version order, "introduced: 0" first, or None
+        if a bound cannot be parsed (the range cannot be evaluated)
+    """
+    parsed = []
+    for event in events:
+        for kind in ("introduced", "fixed", "last_affected"):
+            if kind in event:
+                break
+        else:
+            continue  # "limit" and unknown events do not change the result
+        if kind == "introduced" and event[kind] == "0":
+            parsed.append(((), kind))
+            continue
+        key = _version_key(ecosystem, event[kind])
+        if key is None:
+            return None
+        parsed.append((key, kind))
+    parsed.sort(key=lambda pair: pair[0])
+    return parsed
+
+
+def version_affected(
+    ecosystem: str, version: str, versions: List[str], ranges: List[Dict]
+) -> bool:
+    """
+    Check a version against the affected data of an OSV advisory.
+
+    Ranges may hold several introduced/fixed intervals, in any order.
+    A range with a bound that does not parse is skipped. An installed
+    version that does not parse is reported as affected by any range
+    that could be evaluated, rather than silently missed.
+
+    Args:
+        ecosystem: Package ecosystem
+        version: Installed version
+        versions: Enumerated affected versions
+        ranges: OSV ranges (ECOSYSTEM and SEMVER types are evaluated)
+
+    Returns:
+        True if the version is affected
+    """
+    if version in versions:
+        return True
+    key = _version_key(ecosystem, version)
+    for version_range in ranges:
+        if version_range.get("type") not in ("ECOSYSTEM", "SEMVER"):
+            continue
+        events = _range_events(ecosystem, version_range.get("events", []))
+        if not events:
+            continue
+        if key is None:
+            return True
+        affected = False
+        for bound, kind in events:
+            if kind == "introduced":
+                if key >= bound:
+                    affected = True
+            elif kind == "fixed":
+                if key >= bound:
+                    affected = False
+            elif key > bound:  # last_affected
+                affected = False
+        if affected:
+            return True
+    return False
+
+
+def parse_nvd_cvss(cve_data: Dict) -> List[Dict]:
+    """Extract the primary CVSS metric of each version from an NVD record."""
+    rows = []
+    metrics = cve_data.get("metrics", {})
+    for metric in NVD_CVSS_METRICS:
+        if metrics.get(metric):
+            cvss_data = metrics[metric][0]
+            cvss = cvss_data.get("cvssData", {})
+            rows.append({
+                "metric": metric,
+                "version": cvss.get("version", ""),
+                "score": cvss.get("baseScore", 0),
+                # v2 keeps its severity next to cvssData
+                "severity": cvss.get("baseSeverity", cvss_data.get("baseSeverity", "")),
+                "vector": cvss.get("vectorString", ""),
+                "exploitabilityScore": cvss_data.get("exploitabilityScore", 0),
+                "impactScore": cvss_data.get("impactScore", 0),
+            })
+    return rows
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, gunzipping .gz files."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _iter_osv_records(path: Path) -> Iterator[Dict]:
+    """Yield advisories from an OSV dump: zip archive, directory or JSON file."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                if member.endswith(".json"):
+                    yield json.loads(archive.read(member))
+    elif path.is_dir():
+        for json_file in sorted(path.rglob("*.json")):
+            yield _read_json(json_file)
+    else:
+        data = _read_json(path)
+        yield from data if isinstance(data, list) else [data]
+
+
+class VulnStore:
+    """SQLite-backed cache of OSV, NVD and KEV vulnerability data."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_hours: float = 24,
+        offline: Optional[bool] = None,
+    ):
+        """
+        Open (and create if needed) a vulnerability store.
+
+        Args:
+            path: SQLite file (default: $VULN_STORE_DB)
+            ttl_hours: Age after which API answers are refreshed
+            offline: Never query upstream APIs (default: $VULN_STORE_OFFLINE)
+        """
+        self.path = Path(path or DEFAULT_DB_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_hours * 3600
+        self.offline = OFFLINE if offline is None else offline
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the store."""
+        self.conn.close()
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.ttl_seconds
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def source_refreshed_at(self, name: str) -> Optional[float]:
+        """Get when a source was last loaded (epoch seconds), if ever."""
+        row = self.conn.execute(
+            "SELECT refreshed_at FROM sources WHERE name = ?", (name,)
+        ).fetchone()
+        return row["refreshed_at"] if row else None
+
+    def is_source_fresh(self, name: str) -> bool:
+        """Check whether a source was loaded within the TTL."""
+        refreshed_at = self.source_refreshed_at(name)
+        return refreshed_at is not None and self._is_fresh(refreshed_at)
+
+    def _mark_source(self, name: str, entries: int):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sources (name, refreshed_at, entries) VALUES (?, ?, ?)",
+            (name, time.time(), entries),
+        )
+
+    # ------------------------------------------------------------------
+    # OSV advisories and package lookups
+    # ------------------------------------------------------------------
+
+    def _put_advisory(self, vuln: Dict):
+        vuln_id = vuln.get("id")
+        if not vuln_id:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO advisories (id, summary, modified, data) VALUES (?, ?, ?, ?)",
+            (vuln_id, vuln.get("summary", ""), vuln.get("modified", ""), json.dumps(vuln)),
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO advisory_aliases (alias, advisory_id) VALUES (?, ?)",
+            [(alias, vuln_id) for alias in [vuln_id, *vuln.get("aliases", [])]],
+        )
+
+    def put_advisories(self, vulns: Iterable[Dict]):
+        """Store full OSV advisory records."""
+        with self.conn:
+            for vuln in vulns:
+                self._put_advisory(vuln)
+
+    def get_advisory(self, vuln_id: str) -> Optional[Dict]:
+        """Get a stored OSV advisory by its id."""
+        row = self.conn.execute(
+            "SELECT data FROM advisories WHERE id = ?", (vuln_id,)
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def get_advisories_for_alias(self, alias: str) -> List[Dict]:
+        """Get the OSV advisories known under an id or alias (e.g. a CVE)."""
+        rows = self.conn.execute(
+            "SELECT a.data FROM advisory_aliases aa "
+            "JOIN advisories a ON a.id = aa.advisory_id WHERE aa.alias = ?",
+            (alias,),
+        )
+        return [json.loads(row["data"]) for row in rows]
+
+    def has_advisory(self, vuln_id: str, modified: str = "") -> bool:
+        """Check whether an advisory is stored, at least as recent as modified."""
+        row = self.conn.execute(
+            "SELECT modified FROM advisories WHERE id = ?", (vuln_id,)
+        ).fetchone()
+        return row is not None and (row["modified"] or "") >= modified
+
+    def put_package_vulns(
+        self, ecosystem: str, name: str, version: str, vulns: List[Dict]
+    ):
+        """
+        Record the OSV answer for a package version.
+
+        Args:
+            ecosystem: Package ecosystem
+            name: Package name
+            version: Package version
+            vulns: Advisories affecting it. Full records are stored; id-only
+                records (querybatch answers) just link to the advisory.
+        """
+        name = normalize_package(ecosystem, name)
+        with self.conn:
+            for vuln in vulns:
+                if len(vuln) > 2:  # more than id/modified
+                    self._put_advisory(vuln)
+            self.conn.execute(
+                "DELETE FROM osv_package_advisories WHERE ecosystem = ? AND name = ? AND version = ?",
+                (ecosystem, name, version),
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO osv_package_advisories VALUES (?, ?, ?, ?)",
+                [(ecosystem, name, version, v["id"]) for v in vulns if v.get("id")],
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO osv_packages VALUES (?, ?, ?, ?)",
+                (ecosystem, name, version, time.time()),
+            )
+
+    def get_package_vulns(
+        self, ecosystem: str, name: str, version: str
+    ) -> Optional[List[Dict]]:
+        """
+        Resolve the advisories affecting a package version locally.
+
+        API answers within the TTL (any age when offline) are served
+        first; otherwise an imported OSV dump of the ecosystem is matched.
+
+        Args:
+            ecosystem: Package ecosystem
+            name: Package name
+            version: Package version
+
+        Returns:
+            Advisory records (empty if not vulnerable), or None if the
+            store cannot answer and the API must be queried
+        """
+        name = normalize_package(ecosystem, name)
+        row = self.conn.execute(
+            "SELECT fetched_at FROM osv_packages WHERE ecosystem = ? AND name = ? AND version = ?",
+            (ecosystem, name, version),
+        ).fetchone()
+        if row and (self.offline or self._is_fresh(row["fetched_at"])):
+            rows = self.conn.execute(
+                "SELECT a.data FROM osv_package_advisories pa "
+                "JOIN advisories a ON a.id = pa.advisory_id "
+                "WHERE pa.ecosystem = ? AND pa.name = ? AND pa.version = ?",
+                (ecosystem, name, version),
+            )
+            return [json.loads(r["data"]) for r in rows]
+
+        if self.source_refreshed_at(f"osv-dump:{ecosystem}") is None:
+            return None
+        rows = self.conn.execute(
+            "SELECT af.versions, af.ranges, a.data FROM osv_affected af "
+            "JOIN advisories a ON a.id = af.advisory_id "
+            "WHERE af.ecosystem = ? AND af.name = ?",
+            (ecosystem, name),
+        )
+        return [
+            json.loads(r["data"])
+            for r in rows
+            if version_affected(
+                ecosystem, version, json.loads(r["versions"]), json.loads(r["ranges"])
+            )
+        ]
+
+    def import_osv_dump(self, path: Path) -> Dict[str, int]:
+        """
+        Import an OSV dump, replacing the affected data of its ecosystems.
+
+        Args:
+            path: Ecosystem all.zip, directory of advisory JSON files, or a
+                single JSON file (one advisory or a list)
+
+        Returns:
+            Number of advisories imported per ecosystem
+        """
+        affected_rows: Dict[str, List[Tuple]] = {}
+        with self.conn:
+            for vuln in _iter_osv_records(Path(path)):
+                if vuln.get("withdrawn"):
+                    continue
+                self._put_advisory(vuln)
+                for affected in vuln.get("affected", []):
+                    package = affected.get("package", {})
+                    ecosystem = package.get("ecosystem")
+                    if not ecosystem or not package.get("name"):
+                        continue
+                    affected_rows.setdefault(ecosystem, []).append((
+                        ecosystem,
+                        normalize_package(ecosystem, package["name"]),
+                        vuln["id"],
+                        json.dumps(affected.get("versions", [])),
+                        json.dumps(affected.get("ranges", [])),
+                    ))
+            for ecosystem, rows in affected_rows.items():
+                self.conn.execute("DELETE FROM osv_affected WHERE ecosystem = ?", (ecosystem,))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO osv_affected VALUES (?, ?, ?, ?, ?)", rows
+                )
+                self._mark_source(f"osv-dump:{ecosystem}", len(rows))
+        return {ecosystem: len(rows) for ecosystem, rows in affected_rows.items()}
+
+    # ------------------------------------------------------------------
+    # NVD CVE metadata and CVSS
+    # ------------------------------------------------------------------
+
+    def _put_nvd_cve(self, cve_data: Dict, fetched_at: float):
+        cve_id = cve_data.get("id")
+        if not cve_id:
+            return
+        description = next(
+            (d.get("value", "") for d in cve_data.get("descriptions", []) if d.get("lang") == "en"),
+            "",
+        )
+        cwe_ids = [
+            desc["value"]
+            for weakness in cve_data.get("weaknesses", [])
+            for desc in weakness.get("description", [])
+            if desc.get("value", "").startswith("CWE-")
+        ]
+        references = [
+            {"url": ref.get("url"), "source": ref.get("source")}
+            for ref in cve_data.get("references", [])
+        ]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cves VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                cve_id,
+                description,
+                cve_data.get("published", ""),
+                cve_data.get("lastModified", ""),
+                json.dumps(cwe_ids),
+                json.dumps(references),
+                fetched_at,
+            ),
+        )
+        self.conn.execute("DELETE FROM cvss WHERE cve_id = ?", (cve_id,))
+        self.conn.executemany(
+            "INSERT INTO cvss VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    cve_id,
+                    row["metric"],
+                    row["version"],
+                    row["vector"],
+                    row["score"],
+                    row["severity"],
+                    row["exploitabilityScore"],
+                    row["impactScore"],
+                )
+                for row in parse_nvd_cvss(cve_data)
+            ],
+        )
+
+    def put_nvd_cve(self, cve_data: Dict):
+        """Store an NVD CVE record (the "cve" object of an API answer)."""
+        with self.conn:
+            self._put_nvd_cve(cve_data, time.time())
+
+    def get_cve(self, cve_id: str) -> Optional[Dict]:
+        """
+        Get stored NVD data for a CVE.
+
+        Args:
+            cve_id: CVE identifier
+
+        Returns:
+            Dict with id, description, published, lastModified, cvss (the
+            preferred version), cwe_ids, references and nvd_url; None if
+            unknown or older than the TTL (unless offline)
+        """
+        row = self.conn.execute("SELECT * FROM cves WHERE id = ?", (cve_id,)).fetchone()
+        if row is None or not (self.offline or self._is_fresh(row["fetched_at"])):
+            return None
+
+        cvss = {"score": 0, "severity": "UNKNOWN"}
+        metrics = {
+            m["metric"]: m
+            for m in self.conn.execute("SELECT * FROM cvss WHERE cve_id = ?", (cve_id,))
+        }
+        for metric in NVD_CVSS_METRICS:
+            if metric in metrics:
+                m = metrics[metric]
+                cvss = {
+                    "version": m["version"],
+                    "score": m["score"],
+                    "severity": m["severity"],
+                    "vector": m["vector"],
+                    "exploitabilityScore": m["exploitability_score"],
+                    "impactScore": m["impact_score"],
+                }
+                break
+
+        description = row["description"] or ""
+        return {
+            "id": cve_id,
+            "description": description[:500],  # Truncate
+            "published": row["published"],
+            "lastModified": row["last_modified"],
+            "cvss": cvss,
+            "cwe_ids": json.loads(row["cwe_ids"]),
+            "references": json.loads(row["refs"])[:10],  # Limit references
+            "nvd_url": f"https://nvd.nist.gov/vuln/detail/{cve_id}",
+        }
+
+    def import_nvd_dump(self, path: Path) -> int:
+        """
+        Import an NVD 2.0 JSON feed (or a saved API answer).
+
+        Args:
+            path: Feed file, .json or .json.gz
+
+        Returns:
+            Number of CVEs imported
+        """
+        data = _read_json(Path(path))
+        count = 0
+        now = time.time()
+        with self.conn:
+            for item in data.get("vulnerabilities", []):
+                self._put_nvd_cve(item.get("cve", {}), now)
+                count += 1
+            self._mark_source("nvd-dump", count)
+        return count
+
+    # ------------------------------------------------------------------
+    # CISA KEV
+    # ------------------------------------------------------------------
+
+    def replace_kev(self, catalog: Dict) -> int:
+        """
+        Replace the KEV entries with a catalog.
+
+        Args:
+            catalog: Parsed CISA KEV JSON ({"vulnerabilities": [...]})
+
+        Returns:
+            Number of KEV entries stored
+        """
+        rows = [
+            (
+                vuln["cveID"].upper(),
+                vuln.get("vendorProject", ""),
+                vuln.get("product", ""),
+                vuln.get("vulnerabilityName", ""),
+                vuln.get("shortDescription", ""),
+                vuln.get("dateAdded", ""),
+                vuln.get("dueDate", ""),
+                vuln.get("notes", ""),
+                int(vuln.get("knownRansomwareCampaignUse", "Unknown") == "Known"),
+            )
+            for vuln in catalog.get("vulnerabilities", [])
+            if vuln.get("cveID", "").upper().startswith("CVE-")
+        ]
+        with self.conn:
+            self.conn.execute("DELETE FROM kev")
+            self.conn.executemany("INSERT OR REPLACE INTO kev VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._mark_source("kev", len(rows))
+        return len(rows)
+
+    def import_kev_catalog(self, path: Path) -> int:
+        """Import a downloaded CISA KEV catalog file."""
+        return self.replace_kev(_read_json(Path(path)))
+
+    def get_kev(self, cve_id: str) -> Optional[Dict]:
+        """Get the KEV entry of a CVE, or None if it is not known exploited."""
+        row = self.conn.execute(
+            "SELECT * FROM kev WHERE cve_id = ?", (cve_id.upper(),)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "vendor": row["vendor"],
+            "product": row["product"],
+            "name": row["name"],
+            "description": row["description"],
+            "date_added": row["date_added"],
+            "due_date": row["due_date"],
+            "notes": row["notes"],
+            "known_ransomware": bool(row["known_ransomware"]),
+        }
+
+    def kev_counts(self) -> Tuple[int, int]:
+        """Get the number of KEV entries and of those with ransomware use."""
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(known_ransomware), 0) FROM kev"
+        ).fetchone()
+        return row[0], row[1]
+
+    def sample_kev_cves(self, limit: int = 10) -> List[str]:
+        """Get some KEV CVE ids, most recently added first."""
+        rows = self.conn.execute(
+            "SELECT cve_id FROM kev ORDER BY date_added DESC LIMIT ?", (limit,)
+        )
+        return [row["cve_id"] for row in rows]
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Get row counts per table and source refresh times."""
+        tables = [
+            "advisories",
+            "osv_packages",
+            "osv_affected",
+            "cves",
+            "cvss",
+            "kev",
+        ]
+        counts = {
+            table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # nosec B608
+            for table in tables
+        }
+        sources = {
+            row["name"]: {
+                "refreshed_at": time.strftime(
+                    "%Y-%m-%dT%H:%M:%S", time.localtime(row["refreshed_at"])
+                ),
+                "entries": row["entries"],
+            }
+            for row in self.conn.execute("SELECT * FROM sources ORDER BY name")
+        }
+        return {"path": str(self.path), "tables": counts, "sources": sources}
+
+
+def main():
+    """CLI: import offline dumps or show store statistics."""
+    parser = argparse.ArgumentParser(description="Local vulnerability store")
+    parser.add_argument("--db", type=Path, help=f"Store file (default: {DEFAULT_DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = sub.add_parser("import", help="Import offline OSV/NVD/KEV dumps")
+    import_parser.add_argument(
+        "--osv", type=Path, action="append", default=[], help="OSV dump (zip, dir or JSON)"
+    )
+    import_parser.add_argument(
+        "--nvd", type=Path, action="append", default=[], help="NVD 2.0 JSON feed (.json/.gz)"
+    )
+    import_parser.add_argument("--kev", type=Path, help="CISA KEV catalog JSON")
+    sub.add_parser("stats", help="Show store statistics")
+
+    args = parser.parse_args()
+    store = VulnStore(args.db)
+
+    if args.command == "import":
+        started = time.time()
+        for osv_path in args.osv:
+            for ecosystem, count in store.import_osv_dump(osv_path).items():
+                print(f"[+] OSV {ecosystem}: {count} affected entries from {osv_path.name}")
+        for nvd_path in args.nvd:
+            print(f"[+] NVD: {store.import_nvd_dump(nvd_path)} CVEs from {nvd_path.name}")
+        if args.kev:
+            print(f"[+] KEV: {store.import_kev_catalog(args.kev)} entries")
+        print(f"[*] Import finished in {time.time() - started:.1f}s")
+    else:
+        print(json.dumps(store.stats(), indent=2))
+
+    store.close()
+
+
+if __name__ == "__main__":
+    main()